@@ -0,0 +1,12 @@
+-- Migration 002: materialized best-per-element power index on player_stats
+--
+-- Required before deploying the PlayerStats.best_by_element column.
+-- Nullable with no backfill: NULL means "power index not built", and
+-- PowerCalculationService rebuilds a player's index (totals and
+-- best_by_element) from maiden rows on first read.
+--
+-- Apply:
+--   psql -U your_user -d your_db -f migrations/002_add_player_stats_best_by_element.sql
+
+ALTER TABLE player_stats
+    ADD COLUMN IF NOT EXISTS best_by_element JSONB NULL;
@@ -11,6 +11,7 @@ Responsibilities
 - Bot-level lifecycle (via injected BotLifecycle)
 - Feature loading (via FeatureLoader)
 - Global error handling for prefix commands
+- Per-command UnitOfWork binding (shared player row reads)
 - Discord event handlers (on_ready, on_guild_join, etc.)
 
 Non-Responsibilities
@@ -47,6 +48,7 @@ from discord.ext import commands
 from src.bot.lifecycle import BotLifecycle, StartupMetrics
 from src.bot.loader import load_all_features
 from src.core.config.config import Config
+from src.core.database.unit_of_work import UnitOfWork
 from src.core.event import initialize_event_system, shutdown_event_system
 from src.core.logging.logger import LogContext, get_logger
 from src.modules.shared.exceptions import (
@@ -398,6 +400,16 @@ class LumenBot(commands.Bot):
     # Command Execution Tracking
     # --------------------------------------------------------------- #
 
+    async def invoke(self, ctx: commands.Context) -> None:
+        """
+        Run a command inside its own UnitOfWork.
+
+        Player rows read by the services the command calls are shared for
+        the duration of the command (see src.core.database.unit_of_work).
+        """
+        async with UnitOfWork():
+            await super().invoke(ctx)
+
     async def on_command_completion(self, ctx: commands.Context) -> None:
         """Track successful command execution."""
         self.lifecycle.metrics.commands_executed += 1
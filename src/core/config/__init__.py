@@ -25,6 +25,7 @@ The config subsystem is organized into specialized modules:
 - **manager.py**: Dynamic configuration with database backing
 - **validator.py**: Schema-based configuration validation
 - **metrics.py**: Performance metrics and health monitoring
+- **snapshot.py**: Flattened read snapshots and compiled key accessors
 - **errors.py**: Domain-specific exception hierarchy
 
 All modules follow LES 2025 standards with proper separation of concerns,
@@ -154,7 +155,7 @@ Dependencies
 Performance Characteristics
 ---------------------------
 - Static config: O(1) access, loaded once at startup
-- Dynamic config: O(1) cache access, periodic DB refresh
+- Dynamic config: O(1) flattened snapshot lookup, periodic DB refresh
 - Validation: O(n) where n = total fields in config tree
 - Typical cache hit rate: 95-99%
 - Average GET latency: <5ms (cached)
@@ -192,6 +193,9 @@ from src.core.config.metrics import (
     get_metrics_snapshot,
 )
 
+# Read snapshots and accessors
+from src.core.config.snapshot import ConfigAccessor, ConfigSnapshot
+
 __all__ = [
     # Static configuration
     "Config",
@@ -214,5 +218,8 @@ __all__ = [
     "ConfigMetrics",
     "get_health_snapshot",
     "get_metrics_snapshot",
+    # Snapshots
+    "ConfigAccessor",
+    "ConfigSnapshot",
 ]
 
@@ -48,7 +48,11 @@ Key Design Decisions
   3. Database (`core.config_cache_ttl_seconds`) – highest precedence.
 - A custom recursive `ConfigSchema` type enforces nested structure and types
   per top-level key without external dependencies.
-- Reads include time-aware stale detection relative to TTL, tracked in metrics.
+- Reads are served from an immutable `ConfigSnapshot` flattened by full dot
+  path, rebuilt atomically on every refresh/write; a read is one dict lookup.
+- Stale detection relative to TTL is evaluated once per snapshot rebuild
+  (each refresh tick), not per read, and tracked in metrics.
+- `accessor(key)` returns a pre-bound `ConfigAccessor` for hot paths.
 
 Dependencies
 ------------
@@ -59,6 +63,7 @@ Dependencies
 - `src.core.logging.logger.get_logger` – structured logging interface.
 - `src.core.config.validator` – configuration validation and schema management.
 - `src.core.config.metrics` – metrics tracking and health snapshots.
+- `src.core.config.snapshot` – flattened read snapshots and key accessors.
 """
 
 from __future__ import annotations
@@ -76,6 +81,7 @@ from src.core.config.metrics import (
     get_health_snapshot,
     get_metrics_snapshot,
 )
+from src.core.config.snapshot import MISSING, ConfigAccessor, ConfigSnapshot
 from src.core.config.validator import get_schema_for_top_key
 from src.core.logging.logger import get_logger
 from src.database.models.core.game_config import GameConfig
@@ -140,6 +146,9 @@ class ConfigManager:
         self._cache: Dict[str, Any] = {}
         self._cache_timestamps: Dict[str, datetime] = {}
 
+        # Immutable flattened read view of `_cache`; swapped on every rebuild.
+        self._snapshot: ConfigSnapshot = ConfigSnapshot.empty()
+
         # Initialization & lifecycle state.
         self._initialized: bool = False
         self._refresh_task: Optional[asyncio.Task[None]] = None
@@ -256,6 +265,7 @@ class ConfigManager:
 
         # Copy defaults into cache as initial in-memory state.
         self._cache = dict(self._defaults)
+        self._rebuild_snapshot_locked()
 
         logger.info(
             "YAML configs loaded",
@@ -298,6 +308,25 @@ class ConfigManager:
                 },
             )
 
+    def _rebuild_snapshot_locked(self) -> None:
+        """
+        Rebuild the flattened read snapshot from `_cache` and `_defaults`.
+
+        The new snapshot is swapped in with a single assignment, so readers
+        see either the previous or the new view, never a partial one. Stale
+        top-level keys are computed here, once per rebuild.
+
+        NOTE: Must be called only when `_cache_lock` is already held OR in
+        single-threaded initialization scenarios.
+        """
+        self._snapshot = ConfigSnapshot.build(
+            cache=self._cache,
+            defaults=self._defaults,
+            cache_timestamps=self._cache_timestamps,
+            now=datetime.now(timezone.utc),
+            ttl_seconds=self._cache_ttl_seconds,
+        )
+
     # =========================================================================
     # INITIALIZATION / REFRESH
     # =========================================================================
@@ -391,6 +420,7 @@ class ConfigManager:
 
                         # Allow DB overrides to set cache TTL.
                         self._refresh_cache_ttl_from_cache_locked()
+                        self._rebuild_snapshot_locked()
 
                 self._initialized = True
 
@@ -413,6 +443,7 @@ class ConfigManager:
                 async with self._cache_lock:
                     if not self._cache:
                         self._cache = dict(self._defaults)
+                    self._rebuild_snapshot_locked()
 
                 self._initialized = True  # Mark as initialized in degraded mode.
 
@@ -434,6 +465,8 @@ class ConfigManager:
         - Runs forever until cancelled via `shutdown()`.
         - Uses `_cache_ttl_seconds` as the sleep interval (TTL from YAML/DB).
         - Validates incoming configs against schemas where available.
+        - Rebuilds the read snapshot each tick (also after a failed tick, so
+          stale detection keeps advancing while the database is unreachable).
         - Never raises to the task loop; all errors are logged and counted.
         """
         from src.core.database.service import DatabaseService
@@ -484,6 +517,7 @@ class ConfigManager:
 
                             # DB overrides can update TTL.
                             self._refresh_cache_ttl_from_cache_locked()
+                            self._rebuild_snapshot_locked()
 
                         logger.debug(
                             "ConfigManager cache refreshed from database",
@@ -505,6 +539,9 @@ class ConfigManager:
                         },
                         exc_info=True,
                     )
+                    # Keep serving the last good values, but re-evaluate staleness.
+                    async with self._cache_lock:
+                        self._rebuild_snapshot_locked()
         except asyncio.CancelledError:
             logger.info("ConfigManager background refresh loop terminated")
 
@@ -621,16 +658,8 @@ class ConfigManager:
     # =========================================================================
 
     def _get_from_defaults(self, key: str) -> Any:
-        """Traverse default config using dot notation; returns `None` if missing."""
-        value: Any = self._defaults
-        for k in key.split("."):
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return None
-            else:
-                return None
-        return value
+        """Look up a default by full dot path; returns `None` if missing."""
+        return self._snapshot.defaults.get(key)
 
     def is_stale(self, key: str) -> bool:
         """
@@ -675,7 +704,8 @@ class ConfigManager:
         Notes
         -----
         - This method is **read-only** and never touches the database.
-        - Time-aware stale detection is performed per read; stale reads are
+        - Resolution is a single lookup in the flattened snapshot.
+        - Staleness is evaluated once per refresh; reads of stale keys are
           counted in metrics and may be inspected via `get_metrics()`.
 
         Examples
@@ -693,35 +723,26 @@ class ConfigManager:
                 "falling back to defaults only"
             )
             self._cache = dict(self._defaults)
+            self._rebuild_snapshot_locked()
             self._initialized = True
             self._metrics.fallback_to_defaults += 1
 
+        snapshot = self._snapshot
+
         try:
-            parts = key.split(".")
-            value: Any = self._cache
-
-            for part in parts:
-                if isinstance(value, dict):
-                    value = value.get(part)
-                    if value is None:
-                        self._metrics.cache_misses += 1
-                        fallback = self._get_from_defaults(key)
-                        if fallback is not None:
-                            self._metrics.fallback_to_defaults += 1
-                            return fallback
-                        return default
-                else:
-                    self._metrics.cache_misses += 1
-                    fallback = self._get_from_defaults(key)
-                    if fallback is not None:
-                        self._metrics.fallback_to_defaults += 1
-                        return fallback
-                    return default
+            value = snapshot.values.get(key, MISSING)
+
+            if value is MISSING:
+                self._metrics.cache_misses += 1
+                fallback = snapshot.defaults.get(key)
+                if fallback is not None:
+                    self._metrics.fallback_to_defaults += 1
+                    return fallback
+                return default
 
             self._metrics.cache_hits += 1
 
-            # Time-aware stale detection.
-            if self.is_stale(key):
+            if key in snapshot.stale_paths:
                 self._metrics.stale_reads += 1
                 logger.debug(
                     "Stale configuration read detected",
@@ -732,28 +753,27 @@ class ConfigManager:
                     },
                 )
 
-            return value if value is not None else default
-
-        except Exception as exc:
-            self._metrics.errors += 1
-            logger.error(
-                "Error resolving configuration value",
-                extra={
-                    "config_key": key,
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                },
-                exc_info=True,
-            )
-            fallback = self._get_from_defaults(key)
-            if fallback is not None:
-                self._metrics.fallback_to_defaults += 1
-                return fallback
-            return default
+            return value
         finally:
             elapsed_ms = (time.perf_counter() - start_time) * 1000
             self._metrics.total_get_time_ms += elapsed_ms
 
+    def accessor(self, key: str, default: Any = None) -> ConfigAccessor:
+        """
+        Return a pre-bound accessor for a configuration key path.
+
+        The accessor resolves in O(1) through the current snapshot on each
+        call, so it always reflects the latest refresh. Intended for hot
+        paths that read the same key repeatedly.
+
+        Examples
+        --------
+        >>> defense = config_manager.accessor("combat.pve.defense_effectiveness", 0.7)
+        >>> defense()
+        0.7
+        """
+        return ConfigAccessor(self, key, default)
+
     def get_all_keys(self) -> List[str]:
         """Return a list of all top-level configuration keys currently in cache."""
         return list(self._cache.keys())
@@ -901,6 +921,7 @@ class ConfigManager:
                 # DB-level TTL override might have changed.
                 if top_key == "core":
                     self._refresh_cache_ttl_from_cache_locked()
+                self._rebuild_snapshot_locked()
 
             elapsed_ms = (time.perf_counter() - start_time) * 1000
             self._metrics.total_set_time_ms += elapsed_ms
@@ -1000,6 +1021,7 @@ class ConfigManager:
         """
         self._cache.clear()
         self._cache_timestamps.clear()
+        self._snapshot = ConfigSnapshot.empty()
         self._initialized = False
         logger.info("ConfigManager cache cleared")
 
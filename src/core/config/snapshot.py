@@ -0,0 +1,173 @@
+"""
+Flattened configuration snapshots and compiled key accessors for Lumen (2025).
+
+Purpose
+-------
+Provides an immutable, flattened view of the ConfigManager cache keyed by full
+dot-notation path, so configuration reads are a single dictionary lookup
+instead of a split-and-walk over nested dictionaries.
+
+Responsibilities
+----------------
+- Flatten nested configuration dictionaries into full-path keys
+- Hold cache and default values as read-only mappings
+- Precompute stale key paths once per rebuild (not per read)
+- Provide `ConfigAccessor` handles bound to a single key path
+
+Non-Responsibilities
+--------------------
+- Loading configuration from YAML or the database (handled by ConfigManager)
+- Deciding when to rebuild (handled by ConfigManager refresh/write paths)
+- Metrics recording (handled by ConfigManager)
+
+LES 2025 Compliance
+-------------------
+- **Immutability**: Snapshots are frozen; refreshes swap in a new snapshot
+- **Type Safety**: Slotted classes with complete type hints
+- **Separation of Concerns**: Pure data structure with no I/O
+
+Architecture Notes
+------------------
+- Every path is flattened, including intermediate dict nodes, so
+  `get("combat.pve")` and `get("combat.pve.min_damage")` are both O(1)
+- `None` leaves are omitted to preserve the "fall back to defaults" read
+  semantics of the nested walk
+- Snapshot replacement is a single attribute assignment, which is atomic
+  with respect to the event loop
+- Accessors hold no value themselves; they read the manager's current
+  snapshot on every call and therefore always see the latest refresh
+
+Dependencies
+------------
+- Standard library only
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Mapping
+
+if TYPE_CHECKING:
+    from src.core.config.manager import ConfigManager
+
+
+# Sentinel distinguishing "absent" from a stored falsy value.
+MISSING: Any = object()
+
+
+def flatten_config(tree: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a nested configuration mapping into full dot-path keys.
+
+    Intermediate dictionaries are kept as values under their own path.
+    `None` values are skipped so lookups fall back to defaults.
+
+    Example
+    -------
+    >>> flatten_config({"combat": {"pve": {"min_damage": 1}}})
+    {'combat': {...}, 'combat.pve': {...}, 'combat.pve.min_damage': 1}
+    """
+    flat: Dict[str, Any] = {}
+    stack = [("", tree)]
+
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            if value is None:
+                continue
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                stack.append((f"{path}.", value))
+
+    return flat
+
+
+class ConfigSnapshot:
+    """
+    Immutable flattened view of configuration at one refresh.
+
+    Attributes
+    ----------
+    values:
+        Flattened cache (YAML defaults + DB overrides), keyed by full path.
+    defaults:
+        Flattened YAML defaults, used as read fallback.
+    stale_paths:
+        Full paths whose top-level entry was older than the TTL at build time.
+    """
+
+    __slots__ = ("values", "defaults", "stale_paths")
+
+    def __init__(
+        self,
+        values: Mapping[str, Any],
+        defaults: Mapping[str, Any],
+        stale_paths: FrozenSet[str] = frozenset(),
+    ) -> None:
+        self.values: Mapping[str, Any] = MappingProxyType(dict(values))
+        self.defaults: Mapping[str, Any] = MappingProxyType(dict(defaults))
+        self.stale_paths: FrozenSet[str] = stale_paths
+
+    @classmethod
+    def build(
+        cls,
+        cache: Mapping[str, Any],
+        defaults: Mapping[str, Any],
+        cache_timestamps: Mapping[str, datetime],
+        now: datetime,
+        ttl_seconds: int,
+    ) -> ConfigSnapshot:
+        """
+        Build a snapshot from the nested cache and defaults.
+
+        Staleness is evaluated here, once, against `now`.
+        """
+        values = flatten_config(cache)
+
+        stale_tops = {
+            top_key
+            for top_key, timestamp in cache_timestamps.items()
+            if (now - timestamp).total_seconds() > ttl_seconds
+        }
+        stale_paths = frozenset(
+            path for path in values if path.split(".", 1)[0] in stale_tops
+        ) if stale_tops else frozenset()
+
+        return cls(values, flatten_config(defaults), stale_paths)
+
+    @classmethod
+    def empty(cls) -> ConfigSnapshot:
+        """Snapshot with no values (before YAML is loaded)."""
+        return cls({}, {})
+
+
+class ConfigAccessor:
+    """
+    Pre-bound handle for a single configuration key path.
+
+    Resolves through the manager's current snapshot on every call, so
+    values always reflect the latest refresh without re-parsing the key.
+
+    Example
+    -------
+    >>> defense = config_manager.accessor("combat.pve.defense_effectiveness", 0.7)
+    >>> effective_def = int(boss_def * defense())
+    """
+
+    __slots__ = ("_manager", "key", "default")
+
+    def __init__(self, manager: ConfigManager, key: str, default: Any = None) -> None:
+        self._manager = manager
+        self.key = key
+        self.default = default
+
+    def get(self) -> Any:
+        """Resolve the current value (or default)."""
+        return self._manager.get(self.key, self.default)
+
+    __call__ = get
+
+    def __repr__(self) -> str:
+        return f"ConfigAccessor({self.key!r}, default={self.default!r})"
@@ -22,6 +22,14 @@ from src.core.database.health_monitor import (
     DatabaseHealthMonitorConfig,
 )
 from src.core.database.metrics import AbstractDatabaseMetricsBackend, DatabaseMetrics
+from src.core.database.outbox import TransactionOutbox, current_outbox
+from src.core.database.unit_of_work import (
+    PlayerAggregate,
+    UnitOfWork,
+    current_unit_of_work,
+    load_player_row,
+    prefetch_player_aggregate,
+)
 from src.core.database.service import (
     DatabaseInitializationError,
     DatabaseNotInitializedError,
@@ -48,4 +56,13 @@ __all__ = [
     # Metrics
     "DatabaseMetrics",
     "AbstractDatabaseMetricsBackend",
+    # Transactional outbox
+    "TransactionOutbox",
+    "current_outbox",
+    # Per-command unit of work
+    "UnitOfWork",
+    "PlayerAggregate",
+    "current_unit_of_work",
+    "load_player_row",
+    "prefetch_player_aggregate",
 ]
@@ -18,6 +18,8 @@ Responsibilities
 - Track all database operations: lifecycle, transactions, queries, retries
 - Record connection pool metrics for capacity planning
 - Maintain backend independence for infrastructure code
+- Keep in-process latency histograms (queries, commits, rollbacks, health
+  checks) for health endpoints, independent of the configured backend
 
 Non-Responsibilities
 --------------------
@@ -50,6 +52,12 @@ Architecture Notes
 5. Retries (attempts, give-ups with error types)
 6. Connection pool (size, checked out/in, overflow)
 
+**Latency Histograms**:
+- Durations are also recorded into fixed-memory LatencyHistograms
+  (src.core.histogram) so p50/p95/p99 are available via
+  get_latency_summary() even with no backend configured
+- Recording is O(1); summaries are computed on read
+
 **Connection Pool Metrics**:
 Critical for:
 - Capacity planning (is pool_size sufficient?)
@@ -122,8 +130,9 @@ Create a class implementing AbstractDatabaseMetricsBackend:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
+from src.core.histogram import LatencyHistogram, LatencySummary
 from src.core.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -382,6 +391,12 @@ class DatabaseMetrics:
     """
 
     _backend: Optional[AbstractDatabaseMetricsBackend] = None
+    _latency: Dict[str, LatencyHistogram] = {
+        "query": LatencyHistogram(),
+        "transaction_commit": LatencyHistogram(),
+        "transaction_rollback": LatencyHistogram(),
+        "health_check": LatencyHistogram(),
+    }
 
     # ------------------------------------------------------------------------
     # Backend Configuration
@@ -482,6 +497,7 @@ class DatabaseMetrics:
     @classmethod
     def record_health_check(cls, *, success: bool, duration_ms: float) -> None:
         """Record health check result."""
+        cls._latency["health_check"].record(duration_ms)
         if cls._backend:
             cls._backend.record_health_check(success=success, duration_ms=duration_ms)
         else:
@@ -506,6 +522,7 @@ class DatabaseMetrics:
     @classmethod
     def record_transaction_committed(cls, *, duration_ms: float) -> None:
         """Record successful transaction commit."""
+        cls._latency["transaction_commit"].record(duration_ms)
         if cls._backend:
             cls._backend.record_transaction_committed(duration_ms=duration_ms)
         else:
@@ -522,6 +539,7 @@ class DatabaseMetrics:
         error_type: str,
     ) -> None:
         """Record transaction rollback."""
+        cls._latency["transaction_rollback"].record(duration_ms)
         if cls._backend:
             cls._backend.record_transaction_rolled_back(
                 duration_ms=duration_ms,
@@ -549,6 +567,7 @@ class DatabaseMetrics:
         extra_tags: Optional[dict[str, Any]] = None,
     ) -> None:
         """Record query execution."""
+        cls._latency["query"].record(duration_ms)
         if cls._backend:
             cls._backend.record_query(
                 operation=operation,
@@ -651,4 +670,30 @@ class DatabaseMetrics:
                 checked_in=checked_in,
                 overflow=overflow,
                 total_connections=total_connections,
-            )
\ No newline at end of file
+            )
+
+    # ------------------------------------------------------------------------
+    # Latency Summary
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def get_latency_summary(cls) -> dict[str, LatencySummary]:
+        """
+        In-process latency distribution per category.
+
+        Returns
+        -------
+        dict[str, LatencySummary]
+            For each of query / transaction_commit / transaction_rollback /
+            health_check: count, avg, min, max, p50, p95, p99 (ms).
+        """
+        return {
+            category: histogram.summary()
+            for category, histogram in cls._latency.items()
+        }
+
+    @classmethod
+    def reset_latency(cls) -> None:
+        """Clear all latency histograms (useful for testing)."""
+        for histogram in cls._latency.values():
+            histogram.reset()
@@ -0,0 +1,157 @@
+"""
+Transactional event outbox for Lumen (2025).
+
+Purpose
+-------
+Defer domain event publication until the surrounding database transaction
+has committed. Events emitted inside `DatabaseService.get_transaction()`
+are buffered in a transaction-scoped outbox and published after commit,
+or discarded on rollback, so listener latency never extends row-lock
+hold times and listeners never observe uncommitted state.
+
+Responsibilities
+----------------
+- Hold the active outbox for the current task in a ContextVar
+- Buffer deferred publish callables in emission order
+- Run them after commit, isolating listener failures
+- Discard them on rollback
+
+Non-Responsibilities
+--------------------
+- Transaction management (handled by DatabaseService)
+- Event routing or listener execution (handled by EventBus)
+- Durable (cross-process) outbox storage
+
+Lumen 2025 Compliance
+---------------------
+- Strict layering: infrastructure only, no business logic
+- Observability: structured logs for flush failures and discards
+- Error isolation: a failing publish never affects the committed transaction
+
+Architecture Notes
+------------------
+- Mirrors LogContext: a ContextVar holds the per-task state, set and reset
+  by `get_transaction()` around its `yield`
+- Nested transactions install their own outbox; each flushes after its own
+  commit
+- Tasks spawned inside a transaction inherit the ContextVar; once the
+  outbox is closed (flushed or discarded), `current_outbox()` returns None
+  so late emitters publish immediately instead of being lost
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from src.core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+PublishCallable = Callable[[], Awaitable[None]]
+
+
+class TransactionOutbox:
+    """
+    Buffer of deferred event publications for one database transaction.
+
+    Example
+    -------
+    >>> outbox = current_outbox()
+    >>> if outbox is not None:
+    ...     outbox.add("resource.added", lambda: bus.publish("resource.added", data))
+    ... else:
+    ...     await bus.publish("resource.added", data)
+    """
+
+    __slots__ = ("_entries", "_closed")
+
+    def __init__(self) -> None:
+        self._entries: List[Tuple[str, PublishCallable]] = []
+        self._closed: bool = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def is_open(self) -> bool:
+        return not self._closed
+
+    def add(self, event_type: str, publish: PublishCallable) -> None:
+        """Queue a publish callable to run after commit."""
+        self._entries.append((event_type, publish))
+
+    async def flush(self) -> int:
+        """
+        Run all queued publishes in order (called after commit).
+
+        Failures are logged and skipped; the transaction is already
+        committed, so one failing listener must not block the rest.
+
+        Returns
+        -------
+        int
+            Number of publishes that completed successfully.
+        """
+        self._closed = True
+        entries, self._entries = self._entries, []
+
+        published = 0
+        for event_type, publish in entries:
+            try:
+                await publish()
+                published += 1
+            except Exception as exc:
+                logger.error(
+                    "Failed to publish event from transaction outbox",
+                    extra={
+                        "event_type": event_type,
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                    },
+                    exc_info=True,
+                )
+
+        return published
+
+    def discard(self) -> int:
+        """Drop all queued publishes (called on rollback)."""
+        self._closed = True
+        discarded = len(self._entries)
+        self._entries = []
+
+        if discarded:
+            logger.debug(
+                "Transaction outbox discarded on rollback",
+                extra={"discarded_events": discarded},
+            )
+
+        return discarded
+
+
+# ============================================================================
+# Context Management
+# ============================================================================
+
+_current_outbox: ContextVar[Optional[TransactionOutbox]] = ContextVar(
+    "transaction_outbox",
+    default=None,
+)
+
+
+def current_outbox() -> Optional[TransactionOutbox]:
+    """Return the open outbox of the enclosing transaction, if any."""
+    outbox = _current_outbox.get()
+    if outbox is None or not outbox.is_open:
+        return None
+    return outbox
+
+
+def bind_outbox(outbox: TransactionOutbox) -> Token[Optional[TransactionOutbox]]:
+    """Install an outbox for the current context (used by DatabaseService)."""
+    return _current_outbox.set(outbox)
+
+
+def unbind_outbox(token: Token[Optional[TransactionOutbox]]) -> None:
+    """Restore the previous outbox (used by DatabaseService)."""
+    _current_outbox.reset(token)
@@ -15,7 +15,8 @@ Responsibilities
 - Support pessimistic row locking via `with_for_update=True`
 - Expose health checks for infrastructure monitoring
 - Record detailed metrics for engine lifecycle, transactions, and connection pool usage
-- Configure statement timeouts for PostgreSQL connections
+- Configure statement timeouts for PostgreSQL connections (at connect time;
+  per-transaction only when a caller overrides the default)
 - Provide idempotent initialization with async lock protection
 
 Non-Responsibilities
@@ -42,12 +43,17 @@ Architecture Notes
 - Automatic commit on success, rollback on any exception
 - Never manually call `session.commit()` inside service code
 - Use pessimistic locks: `await session.get(Model, pk, with_for_update=True)`
+- Each transaction installs a TransactionOutbox: events emitted inside it
+  are published after commit and discarded on rollback
 
 **Connection Pooling**:
 - QueuePool for production (configurable pool_size and max_overflow)
 - NullPool for testing environments (no connection reuse)
 - Automatic connection recycling via pool_recycle
 - Pool timeout protection via pool_timeout
+- The default statement timeout is a connection startup parameter
+  (libpq `options` for psycopg, `server_settings` for asyncpg), so sessions
+  and transactions do not spend a round trip on `SET LOCAL`
 
 **Health Checks**:
 - Lightweight `SELECT 1` query for fast liveness probes
@@ -128,6 +134,8 @@ from src.core.config.config import Config
 from src.core.logging.logger import get_logger
 from src.core.database.metrics import DatabaseMetrics
 from src.core.database.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from src.core.database.outbox import TransactionOutbox, bind_outbox, unbind_outbox
+from src.core.database.unit_of_work import current_unit_of_work
 
 logger = get_logger(__name__)
 
@@ -173,14 +181,33 @@ class _DatabaseConfigSnapshot:
 
     @property
     def is_postgres(self) -> bool:
-        """Check if the configured database is PostgreSQL."""
-        return self.url.startswith(("postgresql://", "postgresql+asyncpg://"))
+        """Check if the configured database is PostgreSQL (any driver)."""
+        return self.url_scheme.split("+", 1)[0] in ("postgresql", "postgres")
 
     @property
     def url_scheme(self) -> str:
         """Extract the URL scheme for logging/metrics."""
         return self.url.split(":", 1)[0] if ":" in self.url else "unknown"
 
+    @property
+    def connect_args(self) -> dict[str, Any]:
+        """
+        Driver connect arguments that set the default statement timeout for
+        every pooled connection at startup.
+        """
+        if not self.is_postgres:
+            return {}
+
+        if self.url_scheme.endswith("+asyncpg"):
+            return {
+                "server_settings": {
+                    "statement_timeout": str(self.statement_timeout_ms)
+                }
+            }
+
+        # psycopg / psycopg2: libpq startup options
+        return {"options": f"-c statement_timeout={self.statement_timeout_ms}"}
+
 
 # ============================================================================
 # DatabaseService - Core Infrastructure
@@ -324,6 +351,11 @@ class DatabaseService:
                     "poolclass": config.pool_class,
                 }
 
+                # Default statement timeout applied once per connection
+                connect_args = config.connect_args
+                if connect_args:
+                    engine_kwargs["connect_args"] = connect_args
+
                 # Add pool-specific arguments only for QueuePool
                 if config.pool_class == QueuePool:
                     engine_kwargs.update(
@@ -631,9 +663,35 @@ class DatabaseService:
             raise DatabaseNotInitializedError("DatabaseService is not initialized")
         return cls._config_snapshot
 
+    @staticmethod
+    async def _apply_statement_timeout(
+        session: AsyncSession,
+        config: _DatabaseConfigSnapshot,
+        statement_timeout_ms: Optional[int],
+    ) -> None:
+        """
+        Apply a per-session statement timeout override.
+
+        The configured default is set on every connection at startup (see
+        `_DatabaseConfigSnapshot.connect_args`), so nothing is sent unless
+        the caller asks for a different value.
+        """
+        if (
+            statement_timeout_ms is None
+            or not config.is_postgres
+            or int(statement_timeout_ms) == config.statement_timeout_ms
+        ):
+            return
+
+        await session.execute(
+            text(f"SET LOCAL statement_timeout = {int(statement_timeout_ms)}")
+        )
+
     @classmethod
     @asynccontextmanager
-    async def get_session(cls) -> AsyncGenerator[AsyncSession, None]:
+    async def get_session(
+        cls, *, statement_timeout_ms: Optional[int] = None
+    ) -> AsyncGenerator[AsyncSession, None]:
         """
         Create a database session without automatic commit.
 
@@ -646,7 +704,13 @@ class DatabaseService:
         --------
         - Session is automatically closed on exit
         - No automatic commit or rollback
-        - PostgreSQL statement timeout is configured if applicable
+        - PostgreSQL statement timeout comes from the connection; a
+          different `statement_timeout_ms` is applied with `SET LOCAL`
+
+        Parameters
+        ----------
+        statement_timeout_ms : Optional[int]
+            Override the configured statement timeout for this session.
 
         Yields
         ------
@@ -671,14 +735,9 @@ class DatabaseService:
             config = cls._get_config_snapshot()
 
             try:
-                # Configure statement timeout for PostgreSQL
-                if config.is_postgres:
-                    await session.execute(
-                        text(
-                            f"SET LOCAL statement_timeout = "
-                            f"{config.statement_timeout_ms}"
-                        )
-                    )
+                await cls._apply_statement_timeout(
+                    session, config, statement_timeout_ms
+                )
 
                 logger.debug("Database session opened (read-only)")
                 yield session
@@ -693,12 +752,20 @@ class DatabaseService:
 
     @classmethod
     @asynccontextmanager
-    async def get_transaction(cls) -> AsyncGenerator[AsyncSession, None]:
+    async def get_transaction(
+        cls, *, statement_timeout_ms: Optional[int] = None
+    ) -> AsyncGenerator[AsyncSession, None]:
         """
         Create a database session wrapped in an atomic transaction.
 
         This is the **primary interface for all state mutations** in Lumen.
 
+        Parameters
+        ----------
+        statement_timeout_ms : Optional[int]
+            Override the configured statement timeout for this transaction
+            (costs one `SET LOCAL` round trip; the default costs none).
+
         Behavior
         --------
         **On Success**:
@@ -738,6 +805,11 @@ class DatabaseService:
         - Never manually call `session.commit()` or `session.rollback()`
         - Use `with_for_update=True` for pessimistic locking
         - Keep transactions short to avoid blocking other operations
+        - Events emitted via BaseService.emit_event / AuditLogger inside the
+          block are buffered in a TransactionOutbox and published only after
+          commit (after the session and its row locks are released)
+        - A commit clears the enclosing command's UnitOfWork identity map,
+          so later reads in the command see the committed rows
         """
         cls._ensure_initialized()
         assert cls._session_factory is not None  # Type checker assertion
@@ -757,15 +829,14 @@ class DatabaseService:
             committed = False
             DatabaseMetrics.record_transaction_started()
 
+            # Events emitted inside the transaction publish after commit
+            outbox = TransactionOutbox()
+            outbox_token = bind_outbox(outbox)
+
             try:
-                # Configure statement timeout for PostgreSQL
-                if config.is_postgres:
-                    await session.execute(
-                        text(
-                            f"SET LOCAL statement_timeout = "
-                            f"{config.statement_timeout_ms}"
-                        )
-                    )
+                await cls._apply_statement_timeout(
+                    session, config, statement_timeout_ms
+                )
 
                 logger.debug("Database transaction started")
                 yield session
@@ -775,6 +846,11 @@ class DatabaseService:
                 committed = True
                 duration_ms = (time.perf_counter() - start) * 1000.0
 
+                # Rows cached earlier in the command may now be stale
+                uow = current_unit_of_work()
+                if uow is not None:
+                    uow.clear()
+
                 # Record success in circuit breaker (P2.2)
                 await cls._circuit_breaker.record_success()
 
@@ -857,6 +933,17 @@ class DatabaseService:
                 await session.close()
                 logger.debug("Database transaction session closed")
 
+                try:
+                    unbind_outbox(outbox_token)
+                except ValueError:
+                    # Generator finalized outside its original context
+                    pass
+
+                if committed:
+                    await outbox.flush()
+                else:
+                    outbox.discard()
+
     # ========================================================================
     # Pessimistic Locking Helper
     # ========================================================================
@@ -0,0 +1,303 @@
+"""
+Per-command unit of work for Lumen (2025).
+
+Purpose
+-------
+Carry a read-through identity map of player rows for the duration of one
+command, so the services a command calls (currencies, progression, stats,
+leader skills) share rows instead of each opening a session and selecting
+the same player again.
+
+Responsibilities
+----------------
+- Hold the active unit of work for the current task in a ContextVar
+- Cache player rows (and known-missing rows) keyed by (model, player_id)
+- Load the player aggregate (core, progression, stats, currencies) in one
+  round trip, explicitly via `prefetch_player_aggregate()` or on the first
+  miss inside a unit of work
+- Drop cached rows whenever a transaction commits
+
+Non-Responsibilities
+--------------------
+- Locked reads and writes (always go through `get_transaction()`)
+- Cross-command or cross-process caching
+- Transaction management (handled by DatabaseService)
+
+Lumen 2025 Compliance
+---------------------
+- Strict layering: infrastructure only, no business logic
+- Observability: hit/miss/prefetch counters logged when the unit closes
+- Graceful degradation: without a bound unit of work every read goes
+  straight to the database, exactly as before
+
+Architecture Notes
+------------------
+- Mirrors LogContext: a ContextVar holds the per-task state, set and reset
+  by `UnitOfWork.__enter__/__exit__` around a command (see LumenBot.invoke)
+- Cached rows are detached snapshots (sessions use expire_on_commit=False);
+  callers read column attributes only, never relationships
+- Any commit inside the command clears the map, so a read after a write
+  always reloads; reads never observe a row older than the command's last
+  commit
+- Tasks spawned inside the command inherit the ContextVar; once the unit is
+  closed, `current_unit_of_work()` returns None and reads go to the database
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import Load, lazyload
+
+from src.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.database.models.core.player.player_core import PlayerCore
+    from src.database.models.core.player.player_currencies import PlayerCurrencies
+    from src.database.models.core.player.player_progression import PlayerProgression
+    from src.database.models.core.player.player_stats import PlayerStats
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class PlayerAggregate:
+    """
+    Player rows loaded together by `prefetch_player_aggregate()`.
+
+    Any component may be None if its row does not exist (e.g. the player is
+    not registered).
+    """
+
+    player_id: int
+    core: Optional[PlayerCore]
+    progression: Optional[PlayerProgression]
+    stats: Optional[PlayerStats]
+    currencies: Optional[PlayerCurrencies]
+
+
+class UnitOfWork:
+    """
+    Identity map of player rows read during one command.
+
+    Example
+    -------
+    >>> async with UnitOfWork():
+    ...     await prefetch_player_aggregate(player_id)
+    ...     level = await progression_service.get_player_level(player_id)  # no query
+    """
+
+    __slots__ = ("_rows", "_closed", "_token", "hits", "misses", "prefetches", "clears")
+
+    def __init__(self) -> None:
+        self._rows: Dict[Tuple[type, int], Any] = {}
+        self._closed: bool = False
+        self._token: Optional[Token[Optional[UnitOfWork]]] = None
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.prefetches: int = 0
+        self.clears: int = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def is_open(self) -> bool:
+        return not self._closed
+
+    def lookup(self, model: Type[T], player_id: int) -> Tuple[bool, Optional[T]]:
+        """
+        Cached row for a player.
+
+        Returns
+        -------
+        (found, row)
+            found is False on a miss; row is None when the row is known not
+            to exist.
+        """
+        row = self._rows.get((model, player_id), _MISSING)
+        if row is _MISSING:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, row
+
+    def contains(self, model: type, player_id: int) -> bool:
+        """True if the row (or its absence) is cached; not counted as a lookup."""
+        return (model, player_id) in self._rows
+
+    def put(self, model: Type[T], player_id: int, row: Optional[T]) -> None:
+        """Cache a row (None records that the row does not exist)."""
+        self._rows[(model, player_id)] = row
+
+    def clear(self) -> None:
+        """Drop every cached row (called after each commit)."""
+        if self._rows:
+            self._rows.clear()
+            self.clears += 1
+
+    def close(self) -> None:
+        self._closed = True
+        self._rows.clear()
+
+    def __enter__(self) -> "UnitOfWork":
+        self._token = _current_unit_of_work.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+        if self._token is not None:
+            try:
+                _current_unit_of_work.reset(self._token)
+            except ValueError:
+                # Exited outside the context it was entered in
+                pass
+            self._token = None
+
+        if self.hits or self.prefetches:
+            logger.debug(
+                "Unit of work closed",
+                extra={
+                    "identity_map_hits": self.hits,
+                    "identity_map_misses": self.misses,
+                    "aggregate_prefetches": self.prefetches,
+                    "commit_clears": self.clears,
+                },
+            )
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+
+# ============================================================================
+# Context Management
+# ============================================================================
+
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar(
+    "unit_of_work",
+    default=None,
+)
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """Return the open unit of work of the enclosing command, if any."""
+    uow = _current_unit_of_work.get()
+    if uow is None or not uow.is_open:
+        return None
+    return uow
+
+
+# ============================================================================
+# Player Aggregate Loading
+# ============================================================================
+
+
+# PlayerAggregate field for each model returned by _aggregate_models()
+_AGGREGATE_FIELDS = ("core", "progression", "stats", "currencies")
+
+
+def _aggregate_models() -> Tuple[type, type, type, type]:
+    from src.database.models.core.player.player_core import PlayerCore
+    from src.database.models.core.player.player_currencies import PlayerCurrencies
+    from src.database.models.core.player.player_progression import PlayerProgression
+    from src.database.models.core.player.player_stats import PlayerStats
+
+    return PlayerCore, PlayerProgression, PlayerStats, PlayerCurrencies
+
+
+def _key_column(model: type) -> Any:
+    """PlayerCore is keyed by discord_id; player components by player_id."""
+    player_core = _aggregate_models()[0]
+    return model.discord_id if model is player_core else model.player_id
+
+
+async def prefetch_player_aggregate(player_id: int) -> PlayerAggregate:
+    """
+    Load core, progression, stats and currencies for a player in one query.
+
+    Inside a unit of work the rows (including missing ones) are added to
+    the identity map; fully cached aggregates are returned without a query.
+    Relationship eager loads configured on the models are suppressed, so
+    the player's maiden collection is not loaded.
+    """
+    from src.core.database.service import DatabaseService
+
+    models = _aggregate_models()
+    uow = current_unit_of_work()
+
+    if uow is not None:
+        if all(uow.contains(model, player_id) for model in models):
+            return PlayerAggregate(
+                player_id, *(uow.lookup(model, player_id)[1] for model in models)
+            )
+
+    player_core, progression, stats, currencies = models
+    stmt = (
+        select(player_core, progression, stats, currencies)
+        .select_from(player_core)
+        .outerjoin(progression, progression.player_id == player_core.discord_id)
+        .outerjoin(stats, stats.player_id == player_core.discord_id)
+        .outerjoin(currencies, currencies.player_id == player_core.discord_id)
+        .where(player_core.discord_id == player_id)
+        .options(*(Load(model).lazyload("*") for model in models))
+    )
+
+    async with DatabaseService.get_session() as session:
+        row = (await session.execute(stmt)).one_or_none()
+
+    rows = tuple(row) if row is not None else (None, None, None, None)
+
+    if uow is not None:
+        uow.prefetches += 1
+        for model, loaded in zip(models, rows):
+            uow.put(model, player_id, loaded)
+
+    return PlayerAggregate(player_id, *rows)
+
+
+async def load_player_row(model: Type[T], player_id: int) -> Optional[T]:
+    """
+    Read-through load of one per-player row (PlayerCore or a component).
+
+    - Cached in the current unit of work: returned without a query
+    - Aggregate model missed inside a unit of work: the whole aggregate is
+      prefetched in one query, so the next service hits
+    - Otherwise: single-row read (cached if a unit of work is bound)
+
+    Never use the result for writes; lock the row in a transaction instead.
+    """
+    from src.core.database.service import DatabaseService
+
+    uow = current_unit_of_work()
+    if uow is not None:
+        found, row = uow.lookup(model, player_id)
+        if found:
+            return row
+
+        models = _aggregate_models()
+        if model in models:
+            aggregate = await prefetch_player_aggregate(player_id)
+            return getattr(aggregate, _AGGREGATE_FIELDS[models.index(model)])
+
+    stmt = (
+        select(model)
+        .where(_key_column(model) == player_id)
+        .options(lazyload("*"))
+    )
+    async with DatabaseService.get_session() as session:
+        row = (await session.execute(stmt)).scalar_one_or_none()
+
+    if uow is not None:
+        uow.put(model, player_id, row)
+    return row
@@ -11,6 +11,7 @@ from .bus import EventBus
 from .context import apply_event_log_context
 from .types import (
     CallbackType,
+    DispatchPlan,
     EventListener,
     EventPayload,
     ListenerPriority,
@@ -27,6 +28,7 @@ __all__ = [
     "ListenerPriority",
     "EventListener",
     "CallbackType",
+    "DispatchPlan",
     "apply_event_log_context",
     "initialize_event_system",
     "shutdown_event_system",
@@ -61,6 +61,7 @@ Lumen 2025 Compliance
 from __future__ import annotations
 
 import inspect
+import time
 from typing import Any, Optional
 
 from src.core.logging.logger import get_logger
@@ -443,10 +444,10 @@ class EventBus:
             },
         )
 
-        # Atomically extract listeners and prune once=True listeners.
-        listeners = self._registry.extract_listeners_for_event(event_name=event_name)
+        # Atomically fetch the cached dispatch plan and prune once=True listeners.
+        plan = self._registry.extract_dispatch_plan(event_name)
 
-        if not listeners:
+        if not plan:
             logger.debug(
                 "EventBus: no listeners for event",
                 extra={"event_name": event_name},
@@ -457,20 +458,24 @@ class EventBus:
             "EventBus: executing listeners",
             extra={
                 "event_name": event_name,
-                "listener_count": len(listeners),
+                "listener_count": len(plan),
             },
         )
 
+        start = time.perf_counter()
         results = await self._scheduler.execute(
             event_name=event_name,
             payload=data,
-            listeners=listeners,
+            plan=plan,
             metrics=self._metrics if self._metrics_enabled else None,
             logger=logger,
             critical_timeout=self._critical_timeout,
             high_timeout=self._high_timeout,
         )
 
+        if self._metrics_enabled:
+            self._metrics.record_latency(event_name, (time.perf_counter() - start) * 1000)
+
         return results
 
     # ------------------------------------------------------------------ #
@@ -11,6 +11,7 @@ Responsibilities
 - Record event publishes by event name
 - Record listener errors by event name
 - Track total listener count
+- Record publish (dispatch) latency per event name in streaming histograms
 - Provide immutable snapshots of metrics
 - Generate formatted metric summaries
 
@@ -25,11 +26,14 @@ Design Decisions
 - **Defaultdict usage**: Simplifies counting without key existence checks
 - **Dataclass pattern**: Clean, typed data structures
 - **Separation**: Recorder (mutable) vs Metrics (immutable snapshot)
+- **Streaming latency**: LatencyHistogram per event name (O(1) record,
+  fixed memory); snapshots hold copies, percentiles computed on read
 
 Dependencies
 ------------
 - dataclasses (Python stdlib)
 - collections.defaultdict (Python stdlib)
+- src.core.histogram.LatencyHistogram
 - typing (Python stdlib)
 
 Lumen 2025 Compliance
@@ -48,6 +52,8 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
 
+from src.core.histogram import LatencyHistogram
+
 
 @dataclass(frozen=True)
 class EventMetrics:
@@ -65,6 +71,8 @@ class EventMetrics:
         Mapping of event names to error counts.
     total_listeners:
         Current total number of registered listeners.
+    publish_latency:
+        Mapping of event names to copies of their publish latency histograms.
 
     Examples
     --------
@@ -81,6 +89,7 @@ class EventMetrics:
     events_published: dict[str, int] = field(default_factory=dict)
     listener_errors: dict[str, int] = field(default_factory=dict)
     total_listeners: int = 0
+    publish_latency: dict[str, LatencyHistogram] = field(default_factory=dict)
 
     def get_summary(self) -> dict[str, Any]:
         """
@@ -96,6 +105,8 @@ class EventMetrics:
             - errors_by_event: Dict mapping event names to error counts
             - total_listeners: Current listener count
             - error_rate: Percentage of events that had errors (0-100)
+            - publish_latency_ms: Latency summary across all events
+            - publish_latency_by_event: Latency summary per event name
 
         Examples
         --------
@@ -121,6 +132,13 @@ class EventMetrics:
             "errors_by_event": dict(self.listener_errors),
             "total_listeners": self.total_listeners,
             "error_rate": round(error_rate, 2),
+            "publish_latency_ms": LatencyHistogram.merged(
+                self.publish_latency.values()
+            ).summary(),
+            "publish_latency_by_event": {
+                name: histogram.summary()
+                for name, histogram in self.publish_latency.items()
+            },
         }
 
 
@@ -153,6 +171,7 @@ class EventMetricsRecorder:
         self._events_published: defaultdict[str, int] = defaultdict(int)
         self._listener_errors: defaultdict[str, int] = defaultdict(int)
         self._total_listeners: int = 0
+        self._publish_latency: defaultdict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
 
     def record_publish(self, event_name: str) -> None:
         """
@@ -191,6 +210,26 @@ class EventMetricsRecorder:
         """
         self._listener_errors[event_name] += 1
 
+    def record_latency(self, event_name: str, latency_ms: float) -> None:
+        """
+        Record how long publishing an event took (awaited listener tiers).
+
+        Parameters
+        ----------
+        event_name:
+            The name of the event that was published.
+        latency_ms:
+            Publish duration in milliseconds.
+
+        Examples
+        --------
+        >>> recorder = EventMetricsRecorder()
+        >>> recorder.record_latency("player.level_up", 4.2)
+        >>> recorder.snapshot().publish_latency["player.level_up"].count
+        1
+        """
+        self._publish_latency[event_name].record(latency_ms)
+
     @property
     def total_listeners(self) -> int:
         """
@@ -299,4 +338,8 @@ class EventMetricsRecorder:
             events_published=dict(self._events_published),
             listener_errors=dict(self._listener_errors),
             total_listeners=self._total_listeners,
+            publish_latency={
+                name: histogram.copy()
+                for name, histogram in self._publish_latency.items()
+            },
         )
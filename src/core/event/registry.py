@@ -13,6 +13,8 @@ Responsibilities
 - Retrieve all listeners matching an event name (exact + wildcard)
 - Maintain deterministic listener ordering by priority and identifier
 - Atomically prune once=True listeners during retrieval
+- Index wildcard patterns by their literal dot-separated segment prefix
+- Cache a pre-sorted, tier-partitioned DispatchPlan per event name
 - Prevent duplicate listener registration
 - Provide introspection (counts, all event keys)
 
@@ -31,6 +33,15 @@ Design Decisions
 - **Atomic once-pruning**: extract_listeners_for_event() atomically retrieves
   and prunes once=True listeners to minimize race conditions.
 - **Separation of exact/wildcard**: Different storage structures for efficiency.
+- **Segment trie for wildcards**: Each wildcard pattern is indexed under the
+  dot-separated segments that precede its first "*" (e.g. "player.*.updated"
+  under ["player"], "*.created" at the root). A lookup walks the event's
+  segments and only tests patterns found along that path, so cost no longer
+  grows with unrelated wildcard subscriptions. Candidates are still verified
+  with EventRouter, preserving exact matching semantics.
+- **Dispatch plan cache**: extract_dispatch_plan() memoizes one DispatchPlan
+  per event name. The cache is invalidated only when listeners change:
+  subscribe, unsubscribe, clear, or once=True pruning.
 
 Dependencies
 ------------
@@ -49,10 +60,30 @@ Lumen 2025 Compliance
 
 from __future__ import annotations
 
-from src.core.event.types import EventListener
+from src.core.event.types import DispatchPlan, EventListener
 from src.core.event.router import EventRouter
 
 
+class _PatternTrieNode:
+    """Trie node keyed by literal event-name segments."""
+
+    __slots__ = ("children", "patterns")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PatternTrieNode] = {}
+        self.patterns: list[tuple[str, EventListener]] = []
+
+
+def _literal_segments(pattern: str) -> list[str]:
+    """Return the dot-separated segments before the first wildcard segment."""
+    segments: list[str] = []
+    for segment in pattern.split("."):
+        if "*" in segment:
+            break
+        segments.append(segment)
+    return segments
+
+
 class ListenerRegistry:
     """
     Registry for event listeners (exact and wildcard).
@@ -91,6 +122,16 @@ class ListenerRegistry:
         # List of (wildcard_pattern, listener) tuples
         self._wildcard_listeners: list[tuple[str, EventListener]] = []
 
+        # Segment trie over wildcard patterns (rebuilt on wildcard changes)
+        self._wildcard_index: _PatternTrieNode = _PatternTrieNode()
+
+        # Event name -> (plan, matched once=True wildcard entries)
+        self._plan_cache: dict[
+            str, tuple[DispatchPlan, tuple[tuple[str, EventListener], ...]]
+        ] = {}
+
+        self._router = EventRouter()
+
     # ------------------------------------------------------------------ #
     # Modification
     # ------------------------------------------------------------------ #
@@ -148,6 +189,8 @@ class ListenerRegistry:
             self._wildcard_listeners.sort(
                 key=lambda pl: (pl[1].priority.value, pl[1].identifier)
             )
+            self._rebuild_wildcard_index()
+            self._plan_cache.clear()
             return True
 
         # Exact patterns
@@ -162,6 +205,7 @@ class ListenerRegistry:
 
         # Sort by (priority, identifier) for deterministic ordering
         listeners.sort(key=lambda lst: (lst.priority.value, lst.identifier))
+        self._plan_cache.pop(event_name, None)
         return True
 
     def remove_listener(self, event_name: str, identifier: str) -> bool:
@@ -211,7 +255,12 @@ class ListenerRegistry:
             for pattern, lst in self._wildcard_listeners
             if not (pattern == event_name and lst.identifier == identifier)
         ]
-        removed = removed or (len(self._wildcard_listeners) < original_wc_count)
+        if len(self._wildcard_listeners) < original_wc_count:
+            removed = True
+            self._rebuild_wildcard_index()
+
+        if removed:
+            self._plan_cache.clear()
 
         return removed
 
@@ -235,6 +284,8 @@ class ListenerRegistry:
         total = self.get_total_listener_count()
         self._listeners.clear()
         self._wildcard_listeners.clear()
+        self._wildcard_index = _PatternTrieNode()
+        self._plan_cache.clear()
         return total
 
     # ------------------------------------------------------------------ #
@@ -273,45 +324,114 @@ class ListenerRegistry:
         >>> for listener in listeners:
         ...     await listener.callback(payload)
         """
-        router = EventRouter()
-        result: list[EventListener] = []
+        return list(self.extract_dispatch_plan(event_name).listeners)
+
+    def extract_dispatch_plan(self, event_name: str) -> DispatchPlan:
+        """
+        Return the cached dispatch plan for an event and prune once=True listeners.
+
+        The plan is built on first use (exact listeners + trie-indexed wildcard
+        candidates verified by EventRouter) and reused on later publishes until
+        the listener set changes. If the plan contains once=True listeners they
+        are pruned from the registry here, which invalidates the cache.
+
+        Parameters
+        ----------
+        event_name:
+            The event name to match against.
 
-        # Process exact listeners
-        exact_list = self._listeners.get(event_name, [])
-        kept_exact: list[EventListener] = []
+        Returns
+        -------
+        DispatchPlan:
+            Sorted, tier-partitioned listeners for this event.
 
-        for listener in exact_list:
-            result.append(listener)
-            # Keep non-once listeners
-            if not listener.once:
-                kept_exact.append(listener)
+        Examples
+        --------
+        >>> plan = registry.extract_dispatch_plan("player.level_up")
+        >>> [lst.identifier for lst in plan.critical]
+        ['progression.on_level_up@player.level_up']
+        """
+        plan, once_wildcards = self._get_or_build_plan(event_name)
+
+        if plan.has_once:
+            self._prune_once(event_name, once_wildcards)
 
-        # Update exact listeners (remove once=True)
-        if kept_exact:
-            self._listeners[event_name] = kept_exact
-        elif event_name in self._listeners:
-            # Remove key if no listeners remain
-            del self._listeners[event_name]
+        return plan
 
-        # Process wildcard listeners
-        new_wildcards: list[tuple[str, EventListener]] = []
+    # ------------------------------------------------------------------ #
+    # Plan Building & Indexing
+    # ------------------------------------------------------------------ #
 
+    def _get_or_build_plan(
+        self, event_name: str
+    ) -> tuple[DispatchPlan, tuple[tuple[str, EventListener], ...]]:
+        """Return cached plan for an event name, building it on a miss."""
+        cached = self._plan_cache.get(event_name)
+        if cached is not None:
+            return cached
+
+        matched: list[EventListener] = list(self._listeners.get(event_name, ()))
+        once_wildcards: list[tuple[str, EventListener]] = []
+
+        for pattern, listener in self._wildcard_candidates(event_name):
+            if self._router.matches(event_name, pattern):
+                matched.append(listener)
+                if listener.once:
+                    once_wildcards.append((pattern, listener))
+
+        cached = (DispatchPlan.from_listeners(matched), tuple(once_wildcards))
+        self._plan_cache[event_name] = cached
+        return cached
+
+    def _wildcard_candidates(self, event_name: str) -> list[tuple[str, EventListener]]:
+        """Collect wildcard entries indexed along the event's segment path."""
+        node = self._wildcard_index
+        candidates = list(node.patterns)
+
+        for segment in event_name.split("."):
+            node = node.children.get(segment)  # type: ignore[assignment]
+            if node is None:
+                break
+            candidates.extend(node.patterns)
+
+        return candidates
+
+    def _rebuild_wildcard_index(self) -> None:
+        """Rebuild the segment trie from `_wildcard_listeners`."""
+        root = _PatternTrieNode()
         for pattern, listener in self._wildcard_listeners:
-            if router.matches(event_name, pattern):
-                result.append(listener)
-                # Only keep if not once=True
-                if not listener.once:
-                    new_wildcards.append((pattern, listener))
-            else:
-                # Keep non-matching wildcard listeners
-                new_wildcards.append((pattern, listener))
+            node = root
+            for segment in _literal_segments(pattern):
+                node = node.children.setdefault(segment, _PatternTrieNode())
+            node.patterns.append((pattern, listener))
+        self._wildcard_index = root
 
-        self._wildcard_listeners = new_wildcards
+    def _prune_once(
+        self,
+        event_name: str,
+        once_wildcards: tuple[tuple[str, EventListener], ...],
+    ) -> None:
+        """Remove once=True listeners that matched this event."""
+        exact_list = self._listeners.get(event_name)
+        if exact_list is not None:
+            kept_exact = [lst for lst in exact_list if not lst.once]
+            if kept_exact:
+                self._listeners[event_name] = kept_exact
+            else:
+                # Remove key if no listeners remain
+                del self._listeners[event_name]
 
-        # Sort combined results by (priority, identifier)
-        # This ensures deterministic execution order
-        result.sort(key=lambda lst: (lst.priority.value, lst.identifier))
-        return result
+        if once_wildcards:
+            fired = {(pattern, id(listener)) for pattern, listener in once_wildcards}
+            self._wildcard_listeners = [
+                (pattern, lst)
+                for pattern, lst in self._wildcard_listeners
+                if (pattern, id(lst)) not in fired
+            ]
+            self._rebuild_wildcard_index()
+            self._plan_cache.clear()
+        else:
+            self._plan_cache.pop(event_name, None)
 
     # ------------------------------------------------------------------ #
     # Introspection
@@ -338,19 +458,8 @@ class ListenerRegistry:
         >>> count = registry.get_listener_count_for_event("player.level_up")
         >>> print(f"Event has {count} listeners")
         """
-        router = EventRouter()
-
-        # Count exact listeners
-        count = len(self._listeners.get(event_name, []))
-
-        # Count matching wildcard listeners
-        count += sum(
-            1
-            for pattern, _ in self._wildcard_listeners
-            if router.matches(event_name, pattern)
-        )
-
-        return count
+        plan, _ = self._get_or_build_plan(event_name)
+        return len(plan)
 
     def get_total_listener_count(self) -> int:
         """
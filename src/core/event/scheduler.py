@@ -30,6 +30,9 @@ Design Decisions
 - **Background task tracking**: LOW-tier tasks are tracked in a set to prevent
   premature GC while maintaining fire-and-forget semantics
 - **Sync callback support**: Sync callbacks are executed in thread pool executor
+- **Pre-partitioned plans**: When given a DispatchPlan (cached per event name
+  by ListenerRegistry), tiers are read directly instead of re-partitioned
+  on every publish
 
 Execution Model (Tiered Concurrency)
 ------------------------------------
@@ -60,7 +63,7 @@ Execution Model (Tiered Concurrency)
 Dependencies
 ------------
 - asyncio (Python stdlib)
-- src.core.event.types (EventListener, ListenerPriority, EventPayload)
+- src.core.event.types (EventListener, DispatchPlan, EventPayload)
 - src.core.event.metrics (EventMetricsRecorder)
 - src.core.event.errors (handle_listener_error)
 - logging.Logger (for structured logging)
@@ -82,7 +85,7 @@ import asyncio
 from logging import Logger
 from typing import Any, Optional
 
-from src.core.event.types import EventListener, EventPayload, ListenerPriority
+from src.core.event.types import DispatchPlan, EventListener, EventPayload
 from src.core.event.metrics import EventMetricsRecorder
 from src.core.event.errors import handle_listener_error
 
@@ -118,11 +121,12 @@ class EventScheduler:
         *,
         event_name: str,
         payload: EventPayload,
-        listeners: list[EventListener],
+        listeners: Optional[list[EventListener]] = None,
         metrics: Optional[EventMetricsRecorder],
         logger: Logger,
         critical_timeout: Optional[float],
         high_timeout: Optional[float],
+        plan: Optional[DispatchPlan] = None,
     ) -> list[Any]:
         """
         Execute listeners with tiered concurrency.
@@ -135,6 +139,7 @@ class EventScheduler:
             Event payload dictionary.
         listeners:
             List of listeners to execute (already sorted by priority).
+            Ignored when `plan` is given.
         metrics:
             Optional metrics recorder to update.
         logger:
@@ -143,6 +148,8 @@ class EventScheduler:
             Timeout in seconds for CRITICAL listeners (None = no timeout).
         high_timeout:
             Timeout in seconds for HIGH listeners (None = no timeout).
+        plan:
+            Optional pre-partitioned DispatchPlan. Preferred over `listeners`.
 
         Returns
         -------
@@ -162,13 +169,14 @@ class EventScheduler:
         ...     high_timeout=5.0,
         ... )
         """
-        # Partition listeners by priority
-        critical = [
-            lst for lst in listeners if lst.priority == ListenerPriority.CRITICAL
-        ]
-        high = [lst for lst in listeners if lst.priority == ListenerPriority.HIGH]
-        normal = [lst for lst in listeners if lst.priority == ListenerPriority.NORMAL]
-        low = [lst for lst in listeners if lst.priority == ListenerPriority.LOW]
+        # Partition listeners by priority (plans arrive pre-partitioned)
+        if plan is None:
+            plan = DispatchPlan.from_listeners(listeners or ())
+
+        critical = plan.critical
+        high = plan.high
+        normal = plan.normal
+        low = plan.low
 
         results: list[Any] = []
 
@@ -12,6 +12,7 @@ Responsibilities
 - Define ListenerPriority enumeration
 - Define CallbackType union for async/sync callbacks
 - Define EventListener dataclass
+- Define DispatchPlan (pre-sorted, priority-partitioned listeners per event)
 - Provide factory method for creating EventListener instances
 
 Architecture Compliance
@@ -28,6 +29,8 @@ Design Decisions
 - **EventListener with slots**: Memory-efficient dataclass for listener metadata
 - **Factory pattern**: from_callback() provides clean listener creation with
   auto-generated identifiers
+- **DispatchPlan as immutable tuples**: Built once per event name by the
+  registry and reused across publishes until listeners change
 
 Priority Levels
 ---------------
@@ -58,7 +61,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Awaitable, Callable, Optional, Union
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
 
 # Type alias for event payload
 # Simple dict structure that should be JSON-serializable for best observability
@@ -212,4 +215,71 @@ class EventListener:
             priority=priority,
             identifier=identifier,
             once=once,
-        )
\ No newline at end of file
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class DispatchPlan:
+    """
+    Pre-computed execution plan for a single event name.
+
+    Holds every matching listener (exact + wildcard) sorted by
+    (priority, identifier), plus the same listeners partitioned by
+    priority tier so the scheduler never re-partitions per publish.
+
+    Attributes
+    ----------
+    listeners:
+        All matching listeners in deterministic execution order.
+    critical, high, normal, low:
+        Listeners partitioned by ListenerPriority tier.
+    has_once:
+        True if any listener is once=True (registry must prune on dispatch).
+
+    Examples
+    --------
+    >>> plan = DispatchPlan.from_listeners([listener_a, listener_b])
+    >>> len(plan)
+    2
+    """
+
+    listeners: tuple[EventListener, ...]
+    critical: tuple[EventListener, ...]
+    high: tuple[EventListener, ...]
+    normal: tuple[EventListener, ...]
+    low: tuple[EventListener, ...]
+    has_once: bool
+
+    @classmethod
+    def from_listeners(cls, listeners: Iterable[EventListener]) -> DispatchPlan:
+        """
+        Build a plan from unsorted listeners.
+
+        Parameters
+        ----------
+        listeners:
+            Listeners matching one event name, in any order.
+
+        Returns
+        -------
+        DispatchPlan:
+            Sorted and tier-partitioned plan.
+        """
+        ordered = tuple(
+            sorted(listeners, key=lambda lst: (lst.priority.value, lst.identifier))
+        )
+        return cls(
+            listeners=ordered,
+            critical=tuple(
+                lst for lst in ordered if lst.priority == ListenerPriority.CRITICAL
+            ),
+            high=tuple(lst for lst in ordered if lst.priority == ListenerPriority.HIGH),
+            normal=tuple(
+                lst for lst in ordered if lst.priority == ListenerPriority.NORMAL
+            ),
+            low=tuple(lst for lst in ordered if lst.priority == ListenerPriority.LOW),
+            has_once=any(lst.once for lst in ordered),
+        )
+
+    def __len__(self) -> int:
+        return len(self.listeners)
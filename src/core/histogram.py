@@ -0,0 +1,222 @@
+"""
+Streaming latency histogram for Lumen (2025).
+
+Purpose
+-------
+Fixed-memory, log-bucketed (HDR-style) latency histogram shared by every
+in-process metrics collector (Redis, database, event bus, audit). Replaces
+bounded sample deques that were sorted on every percentile read.
+
+Responsibilities
+----------------
+- O(1) record of a latency sample
+- O(buckets) quantile queries (several percentiles in one pass)
+- Mergeable copies, so collectors can snapshot under a lock and compute
+  percentiles after releasing it
+- Exact count / sum / min / max alongside the bucketed distribution
+
+Non-Responsibilities
+--------------------
+- Locking (owned by the collector that holds the histogram)
+- Exporting to external monitoring systems
+- Time-windowing (histograms are cumulative until reset)
+
+LES 2025 Compliance
+-------------------
+- **Performance**: constant-time record, fixed memory per histogram
+- **Type Safety**: slotted class with complete type hints
+- **Separation of Concerns**: pure data structure, standard library only
+
+Architecture Notes
+------------------
+- Samples are stored in integer microseconds. Values below
+  `SUB_BUCKETS` µs are counted exactly; above that, each power-of-two
+  range is split into `SUB_BUCKETS / 2` linear sub-buckets, bounding the
+  relative error of any reported quantile to 1 / (SUB_BUCKETS / 2) (~3%)
+- Reported quantiles are the upper bound of the containing bucket,
+  clamped to the exact recorded min/max
+- Samples above `MAX_TRACKABLE_MS` are clamped into the top bucket (the
+  exact maximum is still tracked)
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Sequence, TypedDict
+
+# 2**6 sub-buckets -> 32 linear buckets per power of two (~3% precision)
+_SUB_BUCKET_BITS = 6
+SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_HALF_SUB_BUCKETS = SUB_BUCKETS >> 1
+
+# Microsecond resolution, one hour range
+_UNITS_PER_MS = 1000
+MAX_TRACKABLE_MS = 3_600_000
+_MAX_UNITS = MAX_TRACKABLE_MS * _UNITS_PER_MS
+
+
+class LatencySummary(TypedDict):
+    """Shape of `LatencyHistogram.summary()`."""
+
+    count: int
+    avg_ms: float
+    min_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def _bucket_index(units: int) -> int:
+    """Bucket index for a non-negative integer sample (microseconds)."""
+    if units < SUB_BUCKETS:
+        return units
+    shift = units.bit_length() - _SUB_BUCKET_BITS
+    return SUB_BUCKETS + (shift - 1) * _HALF_SUB_BUCKETS + (units >> shift) - _HALF_SUB_BUCKETS
+
+
+def _bucket_upper_units(index: int) -> int:
+    """Largest sample (microseconds) that maps to a bucket index."""
+    if index < SUB_BUCKETS:
+        return index
+    offset = index - SUB_BUCKETS
+    shift = offset // _HALF_SUB_BUCKETS + 1
+    sub = offset % _HALF_SUB_BUCKETS + _HALF_SUB_BUCKETS
+    return ((sub + 1) << shift) - 1
+
+
+_BUCKET_COUNT = _bucket_index(_MAX_UNITS) + 1
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram (milliseconds in, milliseconds out).
+
+    Example
+    -------
+    >>> histogram = LatencyHistogram()
+    >>> histogram.record(12.5)
+    >>> p50, p99 = histogram.percentiles(50, 99)
+    >>> snapshot = histogram.copy()      # cheap O(buckets) copy
+    >>> snapshot.merge(other_histogram)
+    """
+
+    __slots__ = ("_counts", "count", "total_ms", "min_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self._counts: List[int] = [0] * _BUCKET_COUNT
+        self.count: int = 0
+        self.total_ms: float = 0.0
+        self.min_ms: float = float("inf")
+        self.max_ms: float = 0.0
+
+    # ========================================================================
+    # RECORDING
+    # ========================================================================
+
+    def record(self, value_ms: float) -> None:
+        """Record one latency sample in milliseconds (O(1))."""
+        if value_ms < 0:
+            value_ms = 0.0
+        units = int(value_ms * _UNITS_PER_MS)
+        if units > _MAX_UNITS:
+            units = _MAX_UNITS
+
+        self._counts[_bucket_index(units)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms < self.min_ms:
+            self.min_ms = value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's samples into this one."""
+        if other.count == 0:
+            return
+        counts = self._counts
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                counts[index] += bucket_count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def copy(self) -> LatencyHistogram:
+        """Independent copy (for snapshotting under a collector's lock)."""
+        clone = LatencyHistogram.__new__(LatencyHistogram)
+        clone._counts = self._counts.copy()
+        clone.count = self.count
+        clone.total_ms = self.total_ms
+        clone.min_ms = self.min_ms
+        clone.max_ms = self.max_ms
+        return clone
+
+    @classmethod
+    def merged(cls, histograms: Iterable[LatencyHistogram]) -> LatencyHistogram:
+        """New histogram holding the union of several histograms."""
+        result = cls()
+        for histogram in histograms:
+            result.merge(histogram)
+        return result
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentiles(self, *percents: float) -> Sequence[float]:
+        """
+        Values at several percentiles (0-100) in one pass over the buckets.
+
+        Returns 0.0 for every percentile when empty.
+        """
+        if self.count == 0:
+            return [0.0] * len(percents)
+
+        order = sorted(range(len(percents)), key=lambda i: percents[i])
+        ranks = [max(1, -(-self.count * percents[i] // 100)) for i in order]
+        results: List[float] = [0.0] * len(percents)
+
+        position = 0
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count:
+                continue
+            cumulative += bucket_count
+            while position < len(ranks) and cumulative >= ranks[position]:
+                value = _bucket_upper_units(index) / _UNITS_PER_MS
+                results[order[position]] = min(max(value, self.min_ms), self.max_ms)
+                position += 1
+            if position == len(ranks):
+                break
+
+        return results
+
+    def quantile(self, percent: float) -> float:
+        """Value at a single percentile (0-100)."""
+        return self.percentiles(percent)[0]
+
+    def summary(self, digits: int = 2) -> LatencySummary:
+        """Count, mean, min, max and p50/p95/p99 for status endpoints."""
+        p50, p95, p99 = self.percentiles(50, 95, 99)
+        return {
+            "count": self.count,
+            "avg_ms": round(self.mean_ms, digits),
+            "min_ms": round(self.min_ms, digits) if self.count else 0.0,
+            "max_ms": round(self.max_ms, digits),
+            "p50_ms": round(p50, digits),
+            "p95_ms": round(p95, digits),
+            "p99_ms": round(p99, digits),
+        }
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self.__init__()
+
+    def __repr__(self) -> str:
+        return f"LatencyHistogram(count={self.count}, max_ms={self.max_ms:.2f})"
+
@@ -48,6 +48,7 @@ Payload (EventPayload):
     "player_id": int,          # Discord ID of player
     "transaction_type": str,   # Type of transaction (fusion_attempt, etc.)
     "details": dict,           # Structured transaction data
+    "details_json": bytes,     # UTF-8 JSON of details (only when validated)
     "context": str,            # Command/subsystem origin
     "meta": dict,              # Optional metadata (guild_id, trace_id, etc.)
 }
@@ -74,6 +75,14 @@ Design Decisions
 **Validation-First**:
     TransactionValidator is used before publishing to ensure schema consistency.
     ValidationError is explicitly raised for the caller to handle.
+    Validation scrubs and serializes details in one pass; the JSON bytes ride
+    along as "details_json" so the audit consumer stores them as-is.
+
+**Publish After Commit**:
+    Inside DatabaseService.get_transaction(), validation still runs inline
+    (so ValidationError reaches the caller) but the publish is queued in the
+    transaction outbox and runs after commit; rolled-back changes are never
+    audited as if they happened.
 
 **Non-Blocking by Default**:
     Audit publishing failures are logged but don't crash gameplay unless the
@@ -145,6 +154,7 @@ Metrics:
     metrics = AuditLogger.get_metrics()
     print(metrics["error_rate"])  # Percentage
     print(metrics["avg_log_time_ms"])  # Milliseconds
+    print(metrics["log_time_ms"]["p99_ms"])  # Streaming histogram percentile
     
     AuditLogger.reset_metrics()  # Clear counters
 """
@@ -153,11 +163,13 @@ from __future__ import annotations
 
 import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Mapping, Optional
 
+from src.core.database.outbox import current_outbox
 from src.core.event import EventPayload, event_bus
+from src.core.histogram import LatencyHistogram
 from src.modules.shared.exceptions import ValidationError
 from src.core.logging.logger import get_logger
 from src.core.validation import TransactionValidator
@@ -187,6 +199,8 @@ class AuditMetrics:
         Count of publish failures (EventBus errors)
     total_log_time_ms : float
         Cumulative time spent in audit logging operations
+    log_latency : LatencyHistogram
+        Per-event log() latency distribution (fixed memory, O(1) record)
     """
 
     events_emitted: int = 0
@@ -194,6 +208,7 @@ class AuditMetrics:
     validation_errors: int = 0
     publish_errors: int = 0
     total_log_time_ms: float = 0.0
+    log_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
 
     def as_dict(self) -> Dict[str, Any]:
         """
@@ -219,6 +234,7 @@ class AuditMetrics:
             "error_rate_percent": round(error_rate, 2),
             "avg_log_time_ms": round(avg_time_ms, 3),
             "total_log_time_ms": round(self.total_log_time_ms, 2),
+            "log_time_ms": self.log_latency.summary(digits=3),
         }
 
 
@@ -298,12 +314,15 @@ class AuditLogger:
 
         try:
             # Validation / normalization
+            details_json: Optional[bytes] = None
             if validate:
-                sanitized_details = TransactionValidator.validate_transaction(
+                validated = TransactionValidator.validate_and_serialize(
                     transaction_type=transaction_type,
                     details=dict(details),
                     allow_unknown_types=True,
                 )
+                sanitized_details = validated.details
+                details_json = validated.details_json
                 validated_context: str = TransactionValidator.validate_context(context)
             else:
                 sanitized_details = dict(details)
@@ -318,14 +337,22 @@ class AuditLogger:
                 "context": validated_context,
                 "meta": dict(meta) if meta is not None else {},
             }
-
-            # Emit to EventBus (audit consumer will persist)
-            await event_bus.publish(cls.EVENT_NAME, payload)
+            if details_json is not None:
+                payload["details_json"] = details_json
+
+            # Emit to EventBus (audit consumer will persist); inside a
+            # transaction, publish after commit via the outbox
+            outbox = current_outbox()
+            if outbox is not None:
+                outbox.add(cls.EVENT_NAME, lambda: event_bus.publish(cls.EVENT_NAME, payload))
+            else:
+                await event_bus.publish(cls.EVENT_NAME, payload)
 
             # Track success metrics
             elapsed_ms = (time.perf_counter() - start_time) * 1000
             _metrics.events_emitted += 1
             _metrics.total_log_time_ms += elapsed_ms
+            _metrics.log_latency.record(elapsed_ms)
 
             logger.info(
                 "Audit event emitted",
@@ -5,7 +5,7 @@ Purpose
 -------
 Provides production-grade Redis infrastructure with:
 - Connection pooling and lifecycle management
-- Distributed locking with ownership tracking
+- Distributed locking with ownership tracking and release notifications
 - Circuit breaking and automatic retry
 - Health monitoring with degradation detection
 - Comprehensive metrics collection
@@ -26,6 +26,9 @@ Resilience (Unified Circuit Breaker + Retry):
     CircuitState - Circuit breaker state enum
     CircuitBreakerOpenError - Exception when circuit is open
 
+Locking:
+    RedisLockNotifier - Wakes contended lock waiters on release (pub/sub)
+
 Health Monitoring:
     RedisHealthMonitor - Background health monitoring
     HealthState - Health state enum (HEALTHY, DEGRADED, UNHEALTHY)
@@ -36,9 +39,15 @@ Metrics:
 Rate Limiting:
     RedisRateLimiter - Distributed rate limiting
     RateLimitExceededError - Exception when rate limit exceeded
+    RateLimitDecision - Token bucket outcome (allowed, remaining, retry_after)
 
 Batch Operations:
     RedisBatchOperations - Efficient batch operations (MGET, MSET, pipelines)
+    RedisAutoPipeline - Opt-in per-tick coalescing of concurrent KV commands
+
+Lua Scripts:
+    RedisScriptRegistry - Shared EVALSHA registry with NOSCRIPT reload
+    RedisScript - Registered script and its SHA1
 
 Architecture Notes
 ------------------
@@ -83,15 +92,22 @@ Lumen 2025 Compliance
 
 from __future__ import annotations
 
+from src.core.redis.autopipeline import RedisAutoPipeline
 from src.core.redis.batch import RedisBatchOperations
 from src.core.redis.health_monitor import HealthState, RedisHealthMonitor
+from src.core.redis.lock_notifier import RedisLockNotifier
 from src.core.redis.metrics import RedisMetrics
-from src.core.redis.rate_limiter import RateLimitExceededError, RedisRateLimiter
+from src.core.redis.rate_limiter import (
+    RateLimitDecision,
+    RateLimitExceededError,
+    RedisRateLimiter,
+)
 from src.core.redis.resilience import (
     CircuitBreakerOpenError,
     CircuitState,
     RedisResilience,
 )
+from src.core.redis.scripts import RedisScript, RedisScriptRegistry
 from src.core.redis.service import RedisService
 
 __all__ = [
@@ -101,6 +117,8 @@ __all__ = [
     "RedisResilience",
     "CircuitState",
     "CircuitBreakerOpenError",
+    # Locking
+    "RedisLockNotifier",
     # Health monitoring
     "RedisHealthMonitor",
     "HealthState",
@@ -109,6 +127,11 @@ __all__ = [
     # Rate limiting
     "RedisRateLimiter",
     "RateLimitExceededError",
+    "RateLimitDecision",
     # Batch operations
     "RedisBatchOperations",
+    "RedisAutoPipeline",
+    # Lua scripts
+    "RedisScriptRegistry",
+    "RedisScript",
 ]
\ No newline at end of file
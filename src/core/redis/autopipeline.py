@@ -0,0 +1,209 @@
+"""
+Redis Auto-Pipelining for Lumen (2025)
+
+Purpose
+-------
+Coalesce independent Redis commands issued by concurrent coroutines in the
+same event-loop tick into a single pipeline round trip, resolving each
+caller's future individually.
+
+Responsibilities
+----------------
+- Queue commands submitted by RedisService KV operations
+- Flush the queue once per event-loop tick (or when the batch is full)
+- Execute the batch as one non-transactional pipeline
+- Resolve each caller's future with its own result or error
+- Track batch counts for status reporting
+
+Non-Responsibilities
+--------------------
+- No retry or circuit breaking (callers still run through RedisResilience)
+- No per-operation metrics (recorded by RedisService per caller)
+- No MULTI/EXEC atomicity (commands in a batch are independent)
+
+Lumen 2025 Compliance
+---------------------
+- Strict layering: pure infrastructure
+- Config-driven: enabled flag and batch size via ConfigManager
+- Observability: structured logs for batch failures, counters in status
+- Graceful degradation: a failed batch fails only its callers' futures
+
+Configuration Keys
+------------------
+- core.redis.auto_pipeline.enabled        : bool (default False)
+- core.redis.auto_pipeline.max_batch_size : int (default 100)
+
+Architecture Notes
+------------------
+- The first submit in a tick schedules a flush with `loop.call_soon`, so
+  every coroutine that becomes runnable in the same iteration joins the
+  batch before it is sent
+- A batch of one is sent directly on the client (no pipeline overhead)
+- `pipeline.execute(raise_on_error=False)` returns per-command errors in
+  place, so one failing command does not fail its neighbours
+- A transport error fails every future in the batch; each caller's
+  RedisResilience then retries it independently (into a later batch)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, List, Set, Tuple
+
+from src.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import Redis as AsyncRedis
+
+
+logger = get_logger(__name__)
+
+# (command name, args, kwargs, caller future)
+_PendingCommand = Tuple[str, Tuple[Any, ...], dict, "asyncio.Future[Any]"]
+
+
+class RedisAutoPipeline:
+    """
+    Per-tick command coalescer over the pooled Redis client.
+
+    Example
+    -------
+    >>> pipeline = RedisAutoPipeline(RedisService.client, max_batch_size=100)
+    >>> value = await pipeline.submit("get", "player:1")
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], AsyncRedis],
+        max_batch_size: int = 100,
+    ) -> None:
+        """
+        Initialize the auto-pipeline.
+
+        Parameters
+        ----------
+        client_factory : Callable[[], AsyncRedis]
+            Returns the pooled client at flush time (so shutdown is honoured).
+        max_batch_size : int
+            Commands per pipeline; a full batch is flushed immediately.
+        """
+        self._client_factory = client_factory
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: List[_PendingCommand] = []
+        self._flush_scheduled: bool = False
+        self._inflight: Set[asyncio.Task[None]] = set()
+
+        self._batches_sent: int = 0
+        self._commands_sent: int = 0
+        self._batch_failures: int = 0
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # SUBMISSION
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def submit(self, command: str, *args: Any, **kwargs: Any) -> asyncio.Future[Any]:
+        """
+        Queue a client command for the current tick's pipeline.
+
+        Parameters
+        ----------
+        command : str
+            redis-py client method name (e.g., "get", "incrby").
+
+        Returns
+        -------
+        asyncio.Future[Any]
+            Resolved with the command's result (or its error).
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append((command, args, kwargs, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+
+        return future
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # FLUSHING
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _flush(self) -> None:
+        """Hand the pending commands to a send task."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: List[_PendingCommand]) -> None:
+        """Execute one batch and resolve each caller's future."""
+        self._batches_sent += 1
+        self._commands_sent += len(batch)
+
+        try:
+            client = self._client_factory()
+
+            if len(batch) == 1:
+                command, args, kwargs, future = batch[0]
+                result = await getattr(client, command)(*args, **kwargs)
+                self._resolve(future, result)
+                return
+
+            pipe = client.pipeline(transaction=False)
+            for command, args, kwargs, _ in batch:
+                getattr(pipe, command)(*args, **kwargs)
+            results = await pipe.execute(raise_on_error=False)
+
+        except Exception as exc:
+            self._batch_failures += 1
+            logger.warning(
+                "Redis auto-pipeline batch failed",
+                extra={
+                    "batch_size": len(batch),
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                },
+            )
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, _, _, future), result in zip(batch, results):
+            self._resolve(future, result)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future[Any], result: Any) -> None:
+        if future.done():
+            return  # Caller was cancelled
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # STATUS
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def get_status(self) -> dict[str, Any]:
+        """Batch counters for observability."""
+        return {
+            "max_batch_size": self._max_batch_size,
+            "batches_sent": self._batches_sent,
+            "commands_sent": self._commands_sent,
+            "batch_failures": self._batch_failures,
+            "avg_batch_size": (
+                round(self._commands_sent / self._batches_sent, 2)
+                if self._batches_sent
+                else 0.0
+            ),
+            "pending": len(self._pending),
+            "inflight_batches": len(self._inflight),
+        }
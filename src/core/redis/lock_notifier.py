@@ -0,0 +1,274 @@
+"""
+Redis Lock Release Notifier for Lumen (2025)
+
+Purpose
+-------
+Wake coroutines waiting on a contended distributed lock as soon as the
+holder releases it, instead of letting them sleep out a fixed retry
+interval.
+
+Responsibilities
+----------------
+- Hold one pattern subscription to lock release channels per process
+- Register per-key waiters and resolve them when a release is published
+- Wake local waiters directly when this process releases a lock
+- Reconnect the subscription with backoff after failures
+- Report wake-up counters and subscription state for status
+
+Non-Responsibilities
+--------------------
+- No lock acquisition or release (owned by RedisService.acquire_lock)
+- No fairness or FIFO ordering (woken waiters race the next SET NX)
+- No metrics beyond status counters (lock metrics live in RedisMetrics)
+
+Lumen 2025 Compliance
+---------------------
+- Strict layering: pure infrastructure
+- Config-driven: enabled flag and fallback interval via ConfigManager
+- Observability: structured logs for subscription changes, counters in status
+- Graceful degradation: while unsubscribed, waiters fall back to jittered
+  polling; a missed notification only costs one fallback interval
+
+Configuration Keys
+------------------
+- core.redis.lock.notify.enabled               : bool (default True)
+- core.redis.lock.notify.fallback_interval_sec : float (default 0.5)
+
+Architecture Notes
+------------------
+- The release script PUBLISHes `lock:released:{lock_key}` when it deletes
+  the lock; the notifier PSUBSCRIBEs to `lock:released:*` on a dedicated
+  pub/sub connection, so waiting never occupies a pooled connection
+- A waiter registers its future *before* each acquisition attempt, so a
+  release that lands between a failed SET NX and the wait is not lost
+- Lock expiry (holder crashed) publishes nothing; the fallback interval
+  bounds how long a waiter sleeps in that case
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set
+
+from src.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import Redis as AsyncRedis
+
+
+logger = get_logger(__name__)
+
+
+class RedisLockNotifier:
+    """
+    Per-process lock release listener with per-key waiter futures.
+
+    Example
+    -------
+    >>> notifier = RedisLockNotifier(RedisService.client)
+    >>> await notifier.start()
+    >>> waiter = notifier.register(lock_key)
+    >>> try:
+    >>>     if not await try_acquire():
+    >>>         await notifier.wait(waiter, timeout=0.5)
+    >>> finally:
+    >>>     notifier.unregister(lock_key, waiter)
+    """
+
+    CHANNEL_PREFIX = "lock:released:"
+
+    def __init__(
+        self,
+        client_factory: Callable[[], AsyncRedis],
+        reconnect_delay_seconds: float = 1.0,
+    ) -> None:
+        """
+        Initialize the notifier.
+
+        Parameters
+        ----------
+        client_factory : Callable[[], AsyncRedis]
+            Returns the pooled client the pub/sub connection is created from.
+        reconnect_delay_seconds : float
+            Initial delay before resubscribing after a failure (doubles up
+            to 30s).
+        """
+        self._client_factory = client_factory
+        self._reconnect_delay = max(0.1, reconnect_delay_seconds)
+        self._waiters: Dict[str, Set[asyncio.Future[None]]] = {}
+        self._listener_task: Optional[asyncio.Task[None]] = None
+        self._subscribed = asyncio.Event()
+        self._is_running: bool = False
+
+        self._notifications_received: int = 0
+        self._waiters_woken: int = 0
+        self._reconnects: int = 0
+
+    @classmethod
+    def channel_for(cls, lock_key: str) -> str:
+        """Release channel for a lock key."""
+        return f"{cls.CHANNEL_PREFIX}{lock_key}"
+
+    @property
+    def is_subscribed(self) -> bool:
+        """True while the release subscription is live."""
+        return self._subscribed.is_set()
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # LIFECYCLE
+    # ═══════════════════════════════════════════════════════════════════════
+
+    async def start(self, ready_timeout: float = 2.0) -> None:
+        """
+        Start the listener task and wait briefly for the subscription.
+
+        Not waiting long is deliberate: if the subscription is slow, lock
+        waiters simply poll until it is up.
+        """
+        if self._is_running:
+            return
+
+        self._is_running = True
+        self._listener_task = asyncio.create_task(self._listen_loop())
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout=ready_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Redis lock release subscription not ready; waiters will poll",
+                extra={"ready_timeout_seconds": ready_timeout},
+            )
+
+    async def stop(self) -> None:
+        """Stop the listener and wake every waiter so it re-polls."""
+        if not self._is_running:
+            return
+
+        self._is_running = False
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        self._subscribed.clear()
+        for lock_key in list(self._waiters):
+            self.notify_local(lock_key)
+
+    async def _listen_loop(self) -> None:
+        """Hold the pattern subscription, reconnecting with backoff."""
+        delay = self._reconnect_delay
+        pattern = f"{self.CHANNEL_PREFIX}*"
+
+        while self._is_running:
+            pubsub = None
+            try:
+                pubsub = self._client_factory().pubsub(ignore_subscribe_messages=True)
+                await pubsub.psubscribe(pattern)
+                self._subscribed.set()
+                delay = self._reconnect_delay
+                logger.debug(
+                    "Redis lock release subscription active",
+                    extra={"pattern": pattern},
+                )
+
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    channel = message.get("channel")
+                    if isinstance(channel, bytes):
+                        channel = channel.decode("utf-8")
+                    self._notifications_received += 1
+                    self.notify_local(channel[len(self.CHANNEL_PREFIX):])
+
+                raise ConnectionError("pub/sub stream ended")
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as exc:
+                self._reconnects += 1
+                logger.warning(
+                    "Redis lock release subscription lost; waiters will poll",
+                    extra={
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                        "retry_in_seconds": delay,
+                    },
+                )
+
+            finally:
+                self._subscribed.clear()
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # WAITERS
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def register(self, lock_key: str) -> asyncio.Future[None]:
+        """Register interest in the next release of a lock key."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(lock_key, set()).add(future)
+        return future
+
+    def unregister(self, lock_key: str, future: asyncio.Future[None]) -> None:
+        """Drop a waiter (after acquisition, timeout or cancellation)."""
+        waiters = self._waiters.get(lock_key)
+        if waiters is None:
+            return
+        waiters.discard(future)
+        if not waiters:
+            del self._waiters[lock_key]
+
+    def notify_local(self, lock_key: str) -> None:
+        """Wake every waiter currently registered for a lock key."""
+        waiters = self._waiters.pop(lock_key, None)
+        if not waiters:
+            return
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+                self._waiters_woken += 1
+
+    async def wait(self, future: asyncio.Future[None], timeout: float) -> bool:
+        """
+        Wait for a release notification or the timeout.
+
+        Returns
+        -------
+        bool
+            True if woken by a release, False on timeout.
+        """
+        if timeout <= 0:
+            return future.done()
+        done, _ = await asyncio.wait({future}, timeout=timeout)
+        return bool(done)
+
+    @staticmethod
+    def jittered(interval: float) -> float:
+        """Interval scaled by a random factor in [0.5, 1.5)."""
+        return interval * (0.5 + random.random())
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # STATUS
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def get_status(self) -> dict[str, Any]:
+        """Subscription state and wake-up counters."""
+        return {
+            "subscribed": self.is_subscribed,
+            "waiting_keys": len(self._waiters),
+            "waiters": sum(len(waiters) for waiters in self._waiters.values()),
+            "notifications_received": self._notifications_received,
+            "waiters_woken": self._waiters_woken,
+            "reconnects": self._reconnects,
+        }
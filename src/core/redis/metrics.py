@@ -18,7 +18,7 @@ Responsibilities
 - Collect connection pool utilization metrics
 - Aggregate error rates by operation type
 - Provide queryable metrics API
-- Calculate percentile statistics (p50, p95, p99)
+- Calculate percentile statistics (p50, p95, p99) from streaming histograms
 - Expose metrics for external monitoring systems
 
 Non-Responsibilities
@@ -42,12 +42,13 @@ Configuration Keys
 ------------------
 - core.redis.metrics.slow_operation_ms   : int (default 100)
 - core.redis.metrics.long_hold_ms        : int (default 1000)
-- core.redis.metrics.retention_samples   : int (default 1000)
 
 Architecture Notes
 ------------------
-- Uses collections.defaultdict and deque for efficient aggregation
-- Metrics kept in memory with configurable retention windows
+- Uses collections.defaultdict for aggregation
+- Latencies recorded into fixed-memory LatencyHistograms (O(1) record);
+  percentiles are computed from copies taken under the lock, so reads
+  never hold `_lock` for the percentile walk
 - Designed for low overhead (<1ms per metric record)
 - Supports histogram buckets for latency distribution
 - Thread-safe via threading.Lock (not asyncio.Lock for performance)
@@ -57,11 +58,13 @@ Architecture Notes
 from __future__ import annotations
 
 import time
+import copy
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from threading import Lock
 from typing import Any, Dict, Optional
 
+from src.core.histogram import LatencyHistogram
 from src.core.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -82,7 +85,7 @@ class OperationMetrics:
     total_latency_ms: float = 0.0
     min_latency_ms: float = float("inf")
     max_latency_ms: float = 0.0
-    latencies: deque = field(default_factory=lambda: deque(maxlen=1000))
+    latencies: LatencyHistogram = field(default_factory=LatencyHistogram)
 
     def record(self, latency_ms: float, success: bool) -> None:
         """Record a single operation."""
@@ -96,7 +99,13 @@ class OperationMetrics:
         self.total_latency_ms += latency_ms
         self.min_latency_ms = min(self.min_latency_ms, latency_ms)
         self.max_latency_ms = max(self.max_latency_ms, latency_ms)
-        self.latencies.append(latency_ms)
+        self.latencies.record(latency_ms)
+
+    def snapshot(self) -> OperationMetrics:
+        """Independent copy for computing percentiles outside the lock."""
+        clone = copy.copy(self)
+        clone.latencies = self.latencies.copy()
+        return clone
 
     @property
     def avg_latency_ms(self) -> float:
@@ -111,25 +120,37 @@ class OperationMetrics:
     @property
     def p50_latency_ms(self) -> float:
         """Calculate 50th percentile latency."""
-        return self._percentile(50)
+        return self.latencies.quantile(50)
 
     @property
     def p95_latency_ms(self) -> float:
         """Calculate 95th percentile latency."""
-        return self._percentile(95)
+        return self.latencies.quantile(95)
 
     @property
     def p99_latency_ms(self) -> float:
         """Calculate 99th percentile latency."""
-        return self._percentile(99)
-
-    def _percentile(self, p: int) -> float:
-        """Calculate percentile from latency samples."""
-        if not self.latencies:
-            return 0.0
-        sorted_latencies = sorted(self.latencies)
-        idx = int(len(sorted_latencies) * (p / 100.0))
-        return sorted_latencies[min(idx, len(sorted_latencies) - 1)]
+        return self.latencies.quantile(99)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summary including p50/p95/p99 (single histogram pass)."""
+        p50, p95, p99 = self.latencies.percentiles(50, 95, 99)
+        return {
+            "total_count": self.total_count,
+            "success_count": self.success_count,
+            "failure_count": self.failure_count,
+            "success_rate_pct": round(self.success_rate, 2),
+            "avg_latency_ms": round(self.avg_latency_ms, 2),
+            "min_latency_ms": (
+                round(self.min_latency_ms, 2)
+                if self.min_latency_ms != float("inf")
+                else 0.0
+            ),
+            "max_latency_ms": round(self.max_latency_ms, 2),
+            "p50_latency_ms": round(p50, 2),
+            "p95_latency_ms": round(p95, 2),
+            "p99_latency_ms": round(p99, 2),
+        }
 
 
 @dataclass
@@ -143,14 +164,14 @@ class LockMetrics:
     total_hold_time_ms: float = 0.0
     timeouts: int = 0
     contentions: int = 0
-    wait_times: deque = field(default_factory=lambda: deque(maxlen=1000))
-    hold_times: deque = field(default_factory=lambda: deque(maxlen=1000))
+    wait_times: LatencyHistogram = field(default_factory=LatencyHistogram)
+    hold_times: LatencyHistogram = field(default_factory=LatencyHistogram)
 
     def record_acquisition(self, wait_ms: float, success: bool) -> None:
         """Record lock acquisition attempt."""
         self.acquisition_attempts += 1
         self.total_wait_time_ms += wait_ms
-        self.wait_times.append(wait_ms)
+        self.wait_times.record(wait_ms)
 
         if success:
             self.acquisition_successes += 1
@@ -165,7 +186,7 @@ class LockMetrics:
     def record_hold(self, hold_ms: float) -> None:
         """Record lock hold duration."""
         self.total_hold_time_ms += hold_ms
-        self.hold_times.append(hold_ms)
+        self.hold_times.record(hold_ms)
 
     @property
     def avg_wait_time_ms(self) -> float:
@@ -175,7 +196,7 @@ class LockMetrics:
     @property
     def avg_hold_time_ms(self) -> float:
         """Calculate average hold time."""
-        return self.total_hold_time_ms / len(self.hold_times) if self.hold_times else 0.0
+        return self.total_hold_time_ms / self.hold_times.count if self.hold_times.count else 0.0
 
     @property
     def success_rate(self) -> float:
@@ -186,6 +207,28 @@ class LockMetrics:
             else 0.0
         )
 
+    def snapshot(self) -> LockMetrics:
+        """Independent copy for computing percentiles outside the lock."""
+        clone = copy.copy(self)
+        clone.wait_times = self.wait_times.copy()
+        clone.hold_times = self.hold_times.copy()
+        return clone
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summary including wait/hold p99."""
+        return {
+            "acquisition_attempts": self.acquisition_attempts,
+            "acquisition_successes": self.acquisition_successes,
+            "acquisition_failures": self.acquisition_failures,
+            "success_rate_pct": round(self.success_rate, 2),
+            "avg_wait_time_ms": round(self.avg_wait_time_ms, 2),
+            "avg_hold_time_ms": round(self.avg_hold_time_ms, 2),
+            "p99_wait_time_ms": round(self.wait_times.quantile(99), 2),
+            "p99_hold_time_ms": round(self.hold_times.quantile(99), 2),
+            "timeouts": self.timeouts,
+            "contentions": self.contentions,
+        }
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 # REDIS METRICS COLLECTOR
@@ -420,67 +463,45 @@ class RedisMetrics:
         """
         with cls._lock:
             uptime_seconds = time.time() - cls._start_time
+            operations = {name: m.snapshot() for name, m in cls._operations.items()}
+            global_locks = cls._global_lock_metrics.snapshot()
+            health_checks = list(cls._health_checks)
+            pool_stats = cls._connection_pool_stats.copy()
+
+        # Percentile walks run on the copies, outside the lock
+        operations_summary = {
+            op_name: metrics.as_dict() for op_name, metrics in operations.items()
+        }
+        lock_summary = global_locks.as_dict()
+
+        # Health check summary
+        total_checks = len(health_checks)
+        successful_checks = sum(1 for check in health_checks if check["success"])
+        avg_latency = (
+            sum(check["latency_ms"] for check in health_checks) / total_checks
+            if total_checks > 0
+            else 0.0
+        )
 
-            # Aggregate operation metrics
-            operations_summary = {}
-            for op_name, metrics in cls._operations.items():
-                operations_summary[op_name] = {
-                    "total_count": metrics.total_count,
-                    "success_count": metrics.success_count,
-                    "failure_count": metrics.failure_count,
-                    "success_rate_pct": round(metrics.success_rate, 2),
-                    "avg_latency_ms": round(metrics.avg_latency_ms, 2),
-                    "min_latency_ms": (
-                        round(metrics.min_latency_ms, 2)
-                        if metrics.min_latency_ms != float("inf")
-                        else 0.0
-                    ),
-                    "max_latency_ms": round(metrics.max_latency_ms, 2),
-                    "p50_latency_ms": round(metrics.p50_latency_ms, 2),
-                    "p95_latency_ms": round(metrics.p95_latency_ms, 2),
-                    "p99_latency_ms": round(metrics.p99_latency_ms, 2),
-                }
-
-            # Global lock metrics
-            lock_summary = {
-                "acquisition_attempts": cls._global_lock_metrics.acquisition_attempts,
-                "acquisition_successes": cls._global_lock_metrics.acquisition_successes,
-                "acquisition_failures": cls._global_lock_metrics.acquisition_failures,
-                "success_rate_pct": round(cls._global_lock_metrics.success_rate, 2),
-                "avg_wait_time_ms": round(cls._global_lock_metrics.avg_wait_time_ms, 2),
-                "avg_hold_time_ms": round(cls._global_lock_metrics.avg_hold_time_ms, 2),
-                "timeouts": cls._global_lock_metrics.timeouts,
-                "contentions": cls._global_lock_metrics.contentions,
-            }
-
-            # Health check summary
-            total_checks = len(cls._health_checks)
-            successful_checks = sum(1 for check in cls._health_checks if check["success"])
-            avg_latency = (
-                sum(check["latency_ms"] for check in cls._health_checks) / total_checks
+        health_summary = {
+            "total_checks": total_checks,
+            "successful_checks": successful_checks,
+            "failed_checks": total_checks - successful_checks,
+            "success_rate_pct": (
+                round((successful_checks / total_checks * 100), 2)
                 if total_checks > 0
                 else 0.0
-            )
-
-            health_summary = {
-                "total_checks": total_checks,
-                "successful_checks": successful_checks,
-                "failed_checks": total_checks - successful_checks,
-                "success_rate_pct": (
-                    round((successful_checks / total_checks * 100), 2)
-                    if total_checks > 0
-                    else 0.0
-                ),
-                "avg_latency_ms": round(avg_latency, 2),
-            }
-
-            return {
-                "uptime_seconds": round(uptime_seconds, 2),
-                "operations": operations_summary,
-                "locks": lock_summary,
-                "health": health_summary,
-                "connection_pool": cls._connection_pool_stats.copy(),
-            }
+            ),
+            "avg_latency_ms": round(avg_latency, 2),
+        }
+
+        return {
+            "uptime_seconds": round(uptime_seconds, 2),
+            "operations": operations_summary,
+            "locks": lock_summary,
+            "health": health_summary,
+            "connection_pool": pool_stats,
+        }
 
     @classmethod
     def get_operation_metrics(cls, operation: str) -> Dict[str, Any]:
@@ -501,23 +522,9 @@ class RedisMetrics:
             metrics = cls._operations.get(operation)
             if not metrics:
                 return {}
+            metrics = metrics.snapshot()
 
-            return {
-                "total_count": metrics.total_count,
-                "success_count": metrics.success_count,
-                "failure_count": metrics.failure_count,
-                "success_rate_pct": round(metrics.success_rate, 2),
-                "avg_latency_ms": round(metrics.avg_latency_ms, 2),
-                "min_latency_ms": (
-                    round(metrics.min_latency_ms, 2)
-                    if metrics.min_latency_ms != float("inf")
-                    else 0.0
-                ),
-                "max_latency_ms": round(metrics.max_latency_ms, 2),
-                "p50_latency_ms": round(metrics.p50_latency_ms, 2),
-                "p95_latency_ms": round(metrics.p95_latency_ms, 2),
-                "p99_latency_ms": round(metrics.p99_latency_ms, 2),
-            }
+        return metrics.as_dict()
 
     @classmethod
     def get_lock_metrics(cls, lock_key: Optional[str] = None) -> Dict[str, Any]:
@@ -541,17 +548,9 @@ class RedisMetrics:
                 metrics = cls._locks.get(lock_key)
                 if not metrics:
                     return {}
+            metrics = metrics.snapshot()
 
-            return {
-                "acquisition_attempts": metrics.acquisition_attempts,
-                "acquisition_successes": metrics.acquisition_successes,
-                "acquisition_failures": metrics.acquisition_failures,
-                "success_rate_pct": round(metrics.success_rate, 2),
-                "avg_wait_time_ms": round(metrics.avg_wait_time_ms, 2),
-                "avg_hold_time_ms": round(metrics.avg_hold_time_ms, 2),
-                "timeouts": metrics.timeouts,
-                "contentions": metrics.contentions,
-            }
+        return metrics.as_dict()
 
     # ═════════════════════════════════════════════════════════════════════════
     # RESET & MAINTENANCE
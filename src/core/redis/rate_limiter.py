@@ -19,6 +19,8 @@ Responsibilities
 - Expose a small, clear async API for:
   - `check_limit` → bool allow/deny
   - `check_or_raise` → raises `RateLimitExceededError` on deny
+  - `acquire` → token bucket decision (allowed / remaining / retry_after)
+    in a single EVALSHA round trip
   - `get_remaining` → remaining tokens/requests in current bucket/window
   - `reset_limit` → clear all limit state for a logical key
   - `get_status` → configuration + runtime snapshot for observability
@@ -43,7 +45,8 @@ Design Decisions
   - Access to the async Redis client.
   - Access to `RedisResilience` (circuit breaker).
 - Token Bucket implementation:
-  - Single Lua script for atomic refill + consume.
+  - Single Lua script for atomic refill + consume, registered with the
+    shared `RedisScriptRegistry` and invoked by EVALSHA.
   - TTL for bucket key is configurable (`bucket_ttl_seconds`).
 - Fixed Window implementation:
   - Uses `INCRBY` to support multi-token operations.
@@ -63,6 +66,7 @@ Dependencies
 from __future__ import annotations
 
 import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, Callable, Awaitable, Any
 
 from src.core.config import ConfigManager
@@ -99,6 +103,26 @@ class RateLimitExceededError(Exception):
         self.tokens = tokens
 
 
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """
+    Outcome of a single token bucket acquisition.
+
+    Attributes
+    ----------
+    allowed : bool
+        Whether the requested tokens were consumed.
+    remaining : int
+        Whole tokens left in the bucket after this call.
+    retry_after : float
+        Seconds until the request could succeed (0.0 when allowed).
+    """
+
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
 # ════════════════════════════════════════════════════════════════════════
 # Redis Rate Limiter
 # ════════════════════════════════════════════════════════════════════════
@@ -133,8 +157,10 @@ class RedisRateLimiter:
     #   5: ttl_seconds (expiration for bucket key)
     #
     # Returns:
-    #   1 -> allowed (requested tokens consumed)
-    #   0 -> denied  (not enough tokens available after refill)
+    #   { allowed, remaining, retry_after_ms }
+    #   allowed        -> 1 if the requested tokens were consumed, else 0
+    #   remaining      -> whole tokens left in the bucket after this call
+    #   retry_after_ms -> wait until enough tokens exist (0 when allowed)
     #
     _LUA_TOKEN_BUCKET = """
     local key = KEYS[1]
@@ -169,20 +195,28 @@ class RedisRateLimiter:
     end
 
     local allowed = 0
+    local retry_after_ms = 0
 
     if new_tokens >= requested then
         new_tokens = new_tokens - requested
         allowed = 1
+    elseif refill_rate > 0 then
+        retry_after_ms = math.ceil(((requested - new_tokens) / refill_rate) * 1000)
+    else
+        retry_after_ms = ttl_seconds * 1000
     end
 
-    redis.call('HMSET', key, 'tokens', new_tokens, 'last_refill', now)
+    redis.call('HSET', key, 'tokens', new_tokens, 'last_refill', now,
+        'max_tokens', max_tokens, 'refill_rate', refill_rate)
     if ttl_seconds and ttl_seconds > 0 then
         redis.call('EXPIRE', key, ttl_seconds)
     end
 
-    return allowed
+    return { allowed, math.floor(new_tokens), retry_after_ms }
     """
 
+    _TOKEN_BUCKET_SCRIPT = "rate_limit_token_bucket"
+
     # ════════════════════════════════════════════════════════════════════
     # Initialization
     # ════════════════════════════════════════════════════════════════════
@@ -201,6 +235,7 @@ class RedisRateLimiter:
         """
         self._redis_service: type[RedisService] = redis_service
         self._config_manager = config_manager
+        redis_service.get_script_registry().register(self._TOKEN_BUCKET_SCRIPT, self._LUA_TOKEN_BUCKET)
 
         # Core behavior configuration
         algorithm = self._get_config_str("core.redis.rate_limiter.algorithm", "token_bucket").strip().lower()
@@ -601,6 +636,81 @@ class RedisRateLimiter:
             )
             return None
 
+    async def acquire(
+        self,
+        key: str,
+        rate: int,
+        period_seconds: int,
+        tokens: int = 1,
+    ) -> RateLimitDecision:
+        """
+        Consume from a token bucket and return the full decision in one round trip.
+
+        Always uses the token bucket algorithm regardless of the configured
+        default, because only the bucket can report `remaining` and
+        `retry_after` atomically with the consume.
+
+        Unlike `check_limit`, infrastructure failures are raised rather than
+        mapped through `fallback_mode`, so callers can apply their own
+        degradation policy.
+
+        Raises
+        ------
+        Exception
+            Any Redis / resilience failure from the script call.
+        """
+        return await self._eval_token_bucket(
+            key=key,
+            rate=rate,
+            period_seconds=period_seconds,
+            tokens=tokens,
+        )
+
+    async def peek_bucket(self, key: str) -> Optional[dict[str, float]]:
+        """
+        Read a token bucket without consuming, refilled to the current time.
+
+        Uses the `max_tokens` / `refill_rate` stored by the last `acquire`,
+        so callers do not need to know the limit.
+
+        Returns
+        -------
+        Optional[dict[str, float]]
+            `tokens`, `max_tokens` and `seconds_until_full`, or None if the
+            bucket does not exist (or predates stored limit parameters).
+        """
+        client: AsyncRedis = self._redis_service.client()
+        tokens_raw, last_refill_raw, max_raw, rate_raw = await client.hmget(  # type: ignore[misc]
+            self._token_bucket_key(key),
+            ["tokens", "last_refill", "max_tokens", "refill_rate"],
+        )
+        if None in (tokens_raw, last_refill_raw, max_raw, rate_raw):
+            return None
+
+        max_tokens = float(max_raw)
+        refill_rate = float(rate_raw)
+        elapsed = max(0.0, self._now() - float(last_refill_raw))
+        tokens = min(max_tokens, float(tokens_raw) + elapsed * refill_rate)
+        seconds_until_full = (max_tokens - tokens) / refill_rate if refill_rate > 0 else 0.0
+
+        return {
+            "tokens": tokens,
+            "max_tokens": max_tokens,
+            "seconds_until_full": seconds_until_full,
+        }
+
+    async def reset_bucket(self, key: str) -> bool:
+        """
+        Delete only the token bucket for a logical key.
+
+        Returns
+        -------
+        bool
+            True if a bucket existed.
+        """
+        client: AsyncRedis = self._redis_service.client()
+        return bool(await client.delete(self._token_bucket_key(key)))
+
     def get_status(self) -> dict[str, Any]:
         """
         Return a configuration snapshot for observability / diagnostics.
@@ -632,44 +742,67 @@ class RedisRateLimiter:
         period_seconds: int,
         tokens: int,
     ) -> bool:
+        """Token bucket allow/deny (see `_eval_token_bucket`)."""
+        decision = await self._eval_token_bucket(
+            key=key,
+            rate=rate,
+            period_seconds=period_seconds,
+            tokens=tokens,
+        )
+        return decision.allowed
+
+    async def _eval_token_bucket(
+        self,
+        key: str,
+        rate: int,
+        period_seconds: int,
+        tokens: int,
+    ) -> RateLimitDecision:
         """
         Token bucket algorithm using a single atomic Lua script.
 
         The bucket is represented as a Redis hash:
         - `tokens`: current token count
         - `last_refill`: timestamp of last refill/consume operation
+        - `max_tokens` / `refill_rate`: parameters of the last call, so
+          read-only status queries can refill virtually without the caller
+          knowing the limit
+
+        The script runs via the shared script registry (EVALSHA, reloaded
+        transparently on NOSCRIPT after a restart or failover).
         """
         client: AsyncRedis = self._redis_service.client()
         resilience: RedisResilience = self._redis_service.get_resilience()
+        scripts = self._redis_service.get_script_registry()
 
         # Refill rate in tokens per second
         refill_rate = rate / period_seconds if period_seconds > 0 else 0
         now = self._now()
         bucket_key = self._token_bucket_key(key)
         start_time = time.monotonic()
+        # A bucket must outlive its own refill period, or expiry hands back tokens early
+        ttl_seconds = max(self._bucket_ttl_seconds, period_seconds)
+        args = (rate, refill_rate, tokens, now, ttl_seconds)
 
         async def operation() -> Any:
-            return await client.eval(  # type: ignore[misc]
-                self._LUA_TOKEN_BUCKET,
-                1,
-                bucket_key,
-                rate,
-                refill_rate,
-                tokens,
-                now,
-                self._bucket_ttl_seconds,
+            return await scripts.execute(
+                client, self._TOKEN_BUCKET_SCRIPT, keys=[bucket_key], args=args
             )
 
         try:
-            result = await resilience.execute(
+            allowed_raw, remaining_raw, retry_after_ms = await resilience.execute(
                 operation=operation,
                 operation_name=f"RATELIMIT_TOKEN_BUCKET:{bucket_key}",
                 max_attempts=self._max_attempts,
             )
-            allowed = bool(result)
+            decision = RateLimitDecision(
+                allowed=bool(int(allowed_raw)),
+                remaining=max(0, int(remaining_raw)),
+                retry_after=max(0, int(retry_after_ms)) / 1000,
+            )
             latency_ms = self._record_metric("RATELIMIT_TOKEN_BUCKET", start_time, success=True)
 
-            if not allowed:
+            if not decision.allowed:
                 logger.info(
                     "Rate limit exceeded (token bucket)",
                     extra={
@@ -678,6 +811,7 @@ class RedisRateLimiter:
                         "rate": rate,
                         "period_seconds": period_seconds,
                         "tokens_requested": tokens,
+                        "retry_after": decision.retry_after,
                         "latency_ms": round(latency_ms, 2),
                     },
                 )
@@ -690,11 +824,12 @@ class RedisRateLimiter:
                         "rate": rate,
                         "period_seconds": period_seconds,
                         "tokens_requested": tokens,
+                        "remaining": decision.remaining,
                         "latency_ms": round(latency_ms, 2),
                     },
                 )
 
-            return allowed
+            return decision
 
         except Exception as exc:
             latency_ms = self._record_metric("RATELIMIT_TOKEN_BUCKET", start_time, success=False)
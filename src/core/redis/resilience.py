@@ -43,7 +43,7 @@ Lumen 2025 Compliance
 - Strict layering: pure infrastructure resilience
 - Config-driven: all thresholds and timings via ConfigManager
 - Observability: structured logging for all state changes
-- Concurrency safety: asyncio.Lock for state management
+- Concurrency safety: asyncio.Lock for state transitions
 - Domain exceptions: clear, typed exceptions for failures
 - Zero business logic
 
@@ -61,13 +61,21 @@ Retry Policy:
 - core.redis.resilience.retry.backoff_multiplier    : float (default 2.0)
 - core.redis.resilience.retry.jitter                : bool (default True)
 
+Observability:
+- core.redis.resilience.success_log_interval        : int (default 1000)
+
 Architecture Notes
 ------------------
 - Single entry point: execute() handles both circuit breaking and retry
 - Circuit breaker checks occur BEFORE retry attempts
 - Failures during retry update circuit breaker state
 - Successes reset both retry counter and circuit breaker
-- Thread-safe state management via asyncio.Lock
+- CLOSED fast path: the state check and success accounting are plain
+  attribute reads/writes with no lock and no per-call log record. On a
+  single event loop these cannot interleave (there is no await between
+  read and write), so the lock only guards state transitions
+- Per-call outcomes are counted; a debug summary is logged once every
+  `success_log_interval` successes instead of once per call
 - Exponential backoff with jitter to prevent thundering herd
 """
 
@@ -131,8 +139,9 @@ class RedisResilience:
 
     Thread Safety
     -------------
-    All state mutations are protected by asyncio.Lock to ensure safe
-    concurrent access from multiple coroutines.
+    State transitions are serialized by asyncio.Lock. The CLOSED-state
+    success path touches only plain counters without awaiting, which is
+    atomic with respect to the event loop.
 
     Example
     -------
@@ -171,6 +180,15 @@ class RedisResilience:
         self._opened_at: Optional[float] = None
         self._lock: asyncio.Lock = asyncio.Lock()
 
+        # Counter-based observability (replaces per-call debug logs)
+        self._total_successes: int = 0
+        self._total_failures: int = 0
+        self._total_rejections: int = 0
+        self._success_log_interval = max(
+            1,
+            self._get_config_int("core.redis.resilience.success_log_interval", 1000),
+        )
+
         # Load circuit breaker configuration
         self._circuit_failure_threshold = self._get_config_int(
             "core.redis.resilience.circuit.failure_threshold", 5
@@ -254,8 +272,9 @@ class RedisResilience:
         Exception
             The last exception if all retries are exhausted
         """
-        # Check circuit breaker before attempting operation
-        if not await self._can_execute():
+        # Check circuit breaker before attempting operation (lock-free when CLOSED)
+        if self._circuit_state is not CircuitState.CLOSED and not await self._can_execute():
+            self._total_rejections += 1
             raise CircuitBreakerOpenError(
                 f"Redis circuit breaker is OPEN, operation '{operation_name}' rejected"
             )
@@ -269,7 +288,10 @@ class RedisResilience:
                 result = await operation()
 
                 # Success - record and return
-                await self._record_success()
+                if self._circuit_state is CircuitState.CLOSED:
+                    self._record_closed_success()
+                else:
+                    await self._record_success()
 
                 if attempt > 1:
                     logger.info(
@@ -383,11 +405,34 @@ class RedisResilience:
 
             return False
 
+    def _record_closed_success(self) -> None:
+        """
+        Record a success while CLOSED (fast path: no lock, no await).
+
+        A CLOSED success can never cause a transition, so only counters
+        change. A debug summary is logged every `success_log_interval`.
+        """
+        self._success_count += 1
+        self._failure_count = 0  # Reset failure count on success
+        self._total_successes += 1
+
+        if self._total_successes % self._success_log_interval == 0:
+            logger.debug(
+                "Redis resilience success summary",
+                extra={
+                    "circuit_state": self._circuit_state.value,
+                    "total_successes": self._total_successes,
+                    "total_failures": self._total_failures,
+                    "total_rejections": self._total_rejections,
+                },
+            )
+
     async def _record_success(self) -> None:
         """Record successful operation and update circuit state."""
         async with self._lock:
             self._success_count += 1
             self._failure_count = 0  # Reset failure count on success
+            self._total_successes += 1
 
             logger.debug(
                 "Redis resilience recorded success",
@@ -407,6 +452,7 @@ class RedisResilience:
         async with self._lock:
             self._failure_count += 1
             self._success_count = 0  # Reset success count on failure
+            self._total_failures += 1
             self._last_failure_time = time.time()
 
             logger.debug(
@@ -592,6 +638,10 @@ class RedisResilience:
                 if self._opened_at and self._circuit_state == CircuitState.OPEN
                 else None
             ),
+            # Lifetime outcome counters
+            "total_successes": self._total_successes,
+            "total_failures": self._total_failures,
+            "total_rejections": self._total_rejections,
             # Retry configuration
             "retry_max_attempts": self._retry_max_attempts,
             "retry_initial_delay_seconds": self._retry_initial_delay,
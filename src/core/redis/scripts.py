@@ -0,0 +1,203 @@
+"""
+Redis Lua Script Registry for Lumen (2025)
+
+Purpose
+-------
+Single home for every Lua script used by core.redis. Scripts are uploaded
+once with SCRIPT LOAD and invoked by SHA1 with EVALSHA, so the script body
+is never sent (or re-hashed by Redis) on the hot path.
+
+Responsibilities
+----------------
+- Register named scripts and precompute their SHA1 digests
+- Preload all registered scripts after connecting (SCRIPT LOAD)
+- Execute scripts via EVALSHA
+- Transparently reload and retry on NOSCRIPT (restart, failover, FLUSH)
+- Report reload counts for status
+
+Non-Responsibilities
+--------------------
+- No resilience or retries beyond the NOSCRIPT reload (callers wrap
+  execution in RedisResilience)
+- No metrics (callers record per-operation metrics)
+- No script semantics (owned by the registering component)
+
+Lumen 2025 Compliance
+---------------------
+- Strict layering: pure infrastructure
+- Observability: structured logs for preload and reloads
+- Graceful degradation: a failed preload is non-fatal; the first call
+  reloads on NOSCRIPT
+
+Architecture Notes
+------------------
+- Owned by RedisService (`RedisService.get_script_registry()`); components
+  register their scripts at construction time
+- Registration is idempotent for identical source; re-registering a name
+  with different source is a programming error (ValueError)
+- SHA1 is computed locally, so EVALSHA works even if preload was skipped
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any, Dict, Sequence
+
+from redis.exceptions import NoScriptError
+
+from src.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import Redis as AsyncRedis
+
+
+logger = get_logger(__name__)
+
+
+class RedisScript:
+    """A registered Lua script and its SHA1 digest."""
+
+    __slots__ = ("name", "source", "sha")
+
+    def __init__(self, name: str, source: str) -> None:
+        self.name = name
+        self.source = source
+        self.sha = hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def __repr__(self) -> str:
+        return f"RedisScript({self.name!r}, sha={self.sha[:12]})"
+
+
+class RedisScriptRegistry:
+    """
+    Named Lua scripts executed by EVALSHA with NOSCRIPT recovery.
+
+    Example
+    -------
+    >>> registry = RedisService.get_script_registry()
+    >>> registry.register("unlock", UNLOCK_LUA)
+    >>> released = await registry.execute(client, "unlock", keys=[key], args=[token])
+    """
+
+    def __init__(self) -> None:
+        self._scripts: Dict[str, RedisScript] = {}
+        self._noscript_reloads: int = 0
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # REGISTRATION
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def register(self, name: str, source: str) -> RedisScript:
+        """
+        Register a script under a unique name.
+
+        Raises
+        ------
+        ValueError
+            If the name is already registered with different source.
+        """
+        existing = self._scripts.get(name)
+        if existing is not None:
+            if existing.source != source:
+                raise ValueError(f"Redis script '{name}' already registered with different source")
+            return existing
+
+        script = RedisScript(name, source)
+        self._scripts[name] = script
+        return script
+
+    def get(self, name: str) -> RedisScript:
+        """Look up a registered script (KeyError if unknown)."""
+        return self._scripts[name]
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # LOADING & EXECUTION
+    # ═══════════════════════════════════════════════════════════════════════
+
+    async def load_all(self, client: AsyncRedis) -> int:
+        """
+        Upload every registered script (SCRIPT LOAD).
+
+        Non-fatal: failures are logged and recovered on first use.
+
+        Returns
+        -------
+        int
+            Number of scripts loaded.
+        """
+        loaded = 0
+        for script in self._scripts.values():
+            try:
+                sha = await client.script_load(script.source)  # type: ignore[misc]
+                if isinstance(sha, bytes):
+                    sha = sha.decode("ascii")
+                if sha != script.sha:
+                    logger.warning(
+                        "Redis returned unexpected SHA for Lua script",
+                        extra={"script": script.name, "expected": script.sha, "actual": sha},
+                    )
+                loaded += 1
+            except Exception as exc:
+                logger.warning(
+                    "Failed to preload Redis Lua script (will load on first use)",
+                    extra={
+                        "script": script.name,
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                    },
+                )
+
+        logger.debug(
+            "Redis Lua scripts preloaded",
+            extra={"loaded": loaded, "registered": len(self._scripts)},
+        )
+        return loaded
+
+    async def execute(
+        self,
+        client: AsyncRedis,
+        name: str,
+        keys: Sequence[Any] = (),
+        args: Sequence[Any] = (),
+    ) -> Any:
+        """
+        Run a registered script by SHA, reloading once on NOSCRIPT.
+
+        Parameters
+        ----------
+        client : AsyncRedis
+            Client to execute on.
+        name : str
+            Registered script name.
+        keys : Sequence[Any]
+            KEYS for the script.
+        args : Sequence[Any]
+            ARGV for the script.
+
+        Returns
+        -------
+        Any
+            Raw script result.
+        """
+        script = self._scripts[name]
+        try:
+            return await client.evalsha(script.sha, len(keys), *keys, *args)  # type: ignore[misc]
+        except NoScriptError:
+            self._noscript_reloads += 1
+            logger.info(
+                "Redis Lua script missing from cache; reloading",
+                extra={"script": script.name, "sha": script.sha},
+            )
+            await client.script_load(script.source)  # type: ignore[misc]
+            return await client.evalsha(script.sha, len(keys), *keys, *args)  # type: ignore[misc]
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # STATUS
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def get_status(self) -> dict[str, Any]:
+        """Registered scripts and NOSCRIPT reload count."""
+        return {
+            "scripts": {name: script.sha for name, script in self._scripts.items()},
+            "noscript_reloads": self._noscript_reloads,
+        }
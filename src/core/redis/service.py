@@ -15,10 +15,12 @@ Provide a robust, observable, resilience-aware Redis abstraction with:
 Responsibilities
 ----------------
 - Initialize and manage a singleton Redis connection pool
-- Provide atomic distributed locking via SET NX + Lua unlock
+- Provide atomic distributed locking via Lua acquire (SET NX) + Lua unlock
 - Track lock ownership for debugging (lock holders, durations, metadata)
+  in the same script call, indexed by expiry for SCAN-free listing
 - Expose simple KV and JSON operations (get/set/delete/expire/incr/decr/exists/ttl)
-- Route all KV / JSON operations through RedisResilience
+- Expose sorted set and hash operations (zadd/zrevrange/zrevrank/hset/hmget/hdel)
+- Route all KV / JSON / sorted set operations through RedisResilience
 - Emit metrics for operations and locks via RedisMetrics
 - Expose health, status, batch operations, rate limiter, and resilience utilities
 
@@ -47,16 +49,35 @@ Configuration Keys
 - core.redis.default_ttl_seconds       : int (default 300)
 - core.redis.lock.default_timeout_sec  : int (default 5)
 - core.redis.lock.wait_timeout_sec     : int (default 5)
-- core.redis.lock.retry_interval_sec   : float (default 0.1)
+- core.redis.lock.retry_interval_sec   : float (default 0.1, polling fallback)
+- core.redis.lock.notify.enabled       : bool (default True)
+- core.redis.lock.notify.fallback_interval_sec : float (default 0.5)
 - core.redis.max_connections           : int (default 50)
+- core.redis.auto_pipeline.enabled     : bool (default False)
+- core.redis.auto_pipeline.max_batch_size : int (default 100)
 
 Architecture Notes
 ------------------
 - Uses redis-py 4+ asyncio client with connection pooling
 - Lock safety guaranteed via unique UUID tokens + Lua compare-and-delete
+- Lock acquisition, ownership hash (lock:tracking:{key}) and the expiry
+  index ZSET (lock:tracking:index) are written in one EVALSHA; release
+  removes all three in one EVALSHA. Listing active locks is a single
+  ZRANGEBYSCORE plus one pipelined HGETALL batch
+- Contended lock waiters are woken on release: the release script
+  PUBLISHes to lock:released:{key} and RedisLockNotifier (one pattern
+  subscription per process) resolves the waiters' futures; same-process
+  releases wake local waiters directly. Waiters still re-poll after a
+  jittered fallback interval (covers expiry and a lost subscription), and
+  use jittered retry_interval_sec polling when notifications are off
+- All Lua runs through RedisScriptRegistry (SCRIPT LOAD once, EVALSHA per
+  call, transparent reload on NOSCRIPT)
 - All operations log start/completion/failure with structured context
 - Health monitor maintains rolling status for monitoring systems
 - Initialization is idempotent and thread-safe via asyncio.Lock
+- Optional auto-pipelining: GET/SET/INCR/EXPIRE issued in the same event
+  loop tick share one pipeline round trip (see autopipeline.py); each call
+  keeps its own resilience execution and metrics
 """
 
 from __future__ import annotations
@@ -75,11 +96,14 @@ from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
 from src.core.config import ConfigManager
 from src.core.config.config import Config
 from src.core.logging.logger import get_logger
+from src.core.redis.autopipeline import RedisAutoPipeline
 from src.core.redis.batch import RedisBatchOperations
 from src.core.redis.health_monitor import RedisHealthMonitor
+from src.core.redis.lock_notifier import RedisLockNotifier
 from src.core.redis.metrics import RedisMetrics
 from src.core.redis.rate_limiter import RedisRateLimiter
 from src.core.redis.resilience import RedisResilience
+from src.core.redis.scripts import RedisScriptRegistry
 
 logger = get_logger(__name__)
 
@@ -97,18 +121,62 @@ class RedisService:
     _health_monitor: Optional[RedisHealthMonitor] = None
     _batch_ops: Optional[RedisBatchOperations] = None
     _rate_limiter: Optional[RedisRateLimiter] = None
+    _auto_pipeline: Optional[RedisAutoPipeline] = None
+    _lock_notifier: Optional[RedisLockNotifier] = None
+    _scripts: RedisScriptRegistry = RedisScriptRegistry()
     _config_manager: Optional[ConfigManager] = None
     _init_lock: asyncio.Lock = asyncio.Lock()
     _is_healthy: bool = False
 
-    # Lua script for atomic lock release (compare token + delete)
+    # Lock ownership tracking: one hash per held lock plus a ZSET index of
+    # lock keys scored by expiry (epoch seconds)
+    _LOCK_TRACKING_PREFIX = "lock:tracking:"
+    _LOCK_INDEX_KEY = "lock:tracking:index"
+    _LOCK_TRACKING_GRACE_SECONDS = 10
+
+    # Lua script for atomic lock acquisition + ownership tracking
+    # KEYS: lock, tracking hash, index
+    # ARGV: token, timeout, now, expires_at, tracking ttl, operation, owner_id
+    _LUA_ACQUIRE_SCRIPT = """
+    if not redis.call("SET", KEYS[1], ARGV[1], "NX", "EX", ARGV[2]) then
+        return 0
+    end
+    redis.call("DEL", KEYS[2])
+    redis.call("HSET", KEYS[2],
+        "token", ARGV[1], "acquired_at", ARGV[3],
+        "expires_at", ARGV[4], "timeout", ARGV[2])
+    if ARGV[6] ~= "" then
+        redis.call("HSET", KEYS[2], "operation", ARGV[6])
+    end
+    if ARGV[7] ~= "" then
+        redis.call("HSET", KEYS[2], "owner_id", ARGV[7])
+    end
+    redis.call("EXPIRE", KEYS[2], ARGV[5])
+    redis.call("ZREMRANGEBYSCORE", KEYS[3], "-inf", ARGV[3])
+    redis.call("ZADD", KEYS[3], ARGV[4], KEYS[1])
+    return 1
+    """
+    _ACQUIRE_SCRIPT = "lock_acquire"
+
+    # Lua script for atomic lock release (compare token + delete + untrack
+    # + notify).
+    # Tracking is only removed if it still belongs to this token, so a
+    # stale release never erases the next holder's metadata.
+    # Waiters are woken by a PUBLISH on the lock's release channel.
+    # KEYS: lock, tracking hash, index   ARGV: token, release channel
     _LUA_UNLOCK_SCRIPT = """
+    local released = 0
     if redis.call("GET", KEYS[1]) == ARGV[1] then
-        return redis.call("DEL", KEYS[1])
-    else
-        return 0
+        released = redis.call("DEL", KEYS[1])
+        redis.call("PUBLISH", ARGV[2], "1")
+    end
+    if redis.call("HGET", KEYS[2], "token") == ARGV[1] then
+        redis.call("DEL", KEYS[2])
+        redis.call("ZREM", KEYS[3], KEYS[1])
     end
+    return released
     """
+    _UNLOCK_SCRIPT = "lock_release"
 
     # ═══════════════════════════════════════════════════════════════════════
     # LIFECYCLE MANAGEMENT
@@ -185,7 +253,24 @@ class RedisService:
                 # Initialize resilience and utilities
                 cls._resilience = RedisResilience(cls._config_manager)
                 cls._batch_ops = RedisBatchOperations(cls._client, cls._config_manager)
+                cls._scripts.register(cls._ACQUIRE_SCRIPT, cls._LUA_ACQUIRE_SCRIPT)
+                cls._scripts.register(cls._UNLOCK_SCRIPT, cls._LUA_UNLOCK_SCRIPT)
                 cls._rate_limiter = RedisRateLimiter(cls, cls._config_manager)
+                if cls._get_config_bool("core.redis.auto_pipeline.enabled", False):
+                    cls._auto_pipeline = RedisAutoPipeline(
+                        cls.client,
+                        max_batch_size=cls._get_config_int(
+                            "core.redis.auto_pipeline.max_batch_size", 100
+                        ),
+                    )
+
+                # Upload registered Lua scripts once (EVALSHA from here on)
+                await cls._scripts.load_all(client)
+
+                # Lock release notifications for contended lock waiters
+                if cls._get_config_bool("core.redis.lock.notify.enabled", True):
+                    cls._lock_notifier = RedisLockNotifier(cls.client)
+                    await cls._lock_notifier.start()
 
                 # Initialize and start health monitor
                 cls._health_monitor = RedisHealthMonitor(cls, cls._config_manager)
@@ -204,6 +289,8 @@ class RedisService:
                         "encoding": encoding,
                         "decode_responses": decode_responses,
                         "max_connections": max_connections,
+                        "auto_pipeline": cls._auto_pipeline is not None,
+                        "lock_notify": cls._lock_notifier is not None,
                         "initialization_time_ms": round(initialization_time_ms, 2),
                     },
                 )
@@ -217,6 +304,12 @@ class RedisService:
                         # Swallow to avoid masking root cause
                         pass
 
+                if cls._lock_notifier is not None:
+                    try:
+                        await cls._lock_notifier.stop()
+                    except Exception:
+                        pass
+
                 if cls._client is not None:
                     try:
                         await cls._client.aclose()  # type: ignore[attr-defined]
@@ -228,6 +321,8 @@ class RedisService:
                 cls._health_monitor = None
                 cls._batch_ops = None
                 cls._rate_limiter = None
+                cls._auto_pipeline = None
+                cls._lock_notifier = None
                 cls._is_healthy = False
 
                 logger.critical(
@@ -254,11 +349,14 @@ class RedisService:
 
         client = cls._client
         health_monitor = cls._health_monitor
+        lock_notifier = cls._lock_notifier
 
         cls._client = None
         cls._resilience = None
         cls._batch_ops = None
         cls._rate_limiter = None
+        cls._auto_pipeline = None
+        cls._lock_notifier = None
         cls._health_monitor = None
         cls._is_healthy = False
 
@@ -274,6 +372,16 @@ class RedisService:
                     exc_info=True,
                 )
 
+        if lock_notifier is not None:
+            try:
+                await lock_notifier.stop()
+            except Exception as exc:
+                logger.error(
+                    "Error during RedisLockNotifier shutdown",
+                    extra={"error": str(exc), "error_type": type(exc).__name__},
+                    exc_info=True,
+                )
+
         if client is not None:
             try:
                 await client.aclose()  # type: ignore[attr-defined]
@@ -397,6 +505,13 @@ class RedisService:
             "resilience": resilience_status,
             "health_monitor": health_monitor_status,
             "metrics": metrics_summary,
+            "scripts": cls._scripts.get_status(),
+            "auto_pipeline": (
+                cls._auto_pipeline.get_status() if cls._auto_pipeline is not None else None
+            ),
+            "lock_notifier": (
+                cls._lock_notifier.get_status() if cls._lock_notifier is not None else None
+            ),
         }
 
     # ═══════════════════════════════════════════════════════════════════════
@@ -425,6 +540,18 @@ class RedisService:
             )
         return cls._client
 
+    @classmethod
+    def _command(cls, command: str, *args: Any, **kwargs: Any) -> Awaitable[Any]:
+        """
+        Issue a client command, via the auto-pipeline when enabled.
+
+        Used as the resilience operation body for pipelinable KV commands,
+        so retries re-submit into a later batch.
+        """
+        if cls._auto_pipeline is not None:
+            return cls._auto_pipeline.submit(command, *args, **kwargs)
+        return getattr(cls.client(), command)(*args, **kwargs)
+
     @classmethod
     def get_resilience(cls) -> RedisResilience:
         """Get the Redis resilience layer instance."""
@@ -446,6 +573,11 @@ class RedisService:
             raise RuntimeError("RedisService rate limiter not initialized")
         return cls._rate_limiter
 
+    @classmethod
+    def get_script_registry(cls) -> RedisScriptRegistry:
+        """Get the shared Lua script registry (EVALSHA + NOSCRIPT reload)."""
+        return cls._scripts
+
     @classmethod
     def get_health_monitor(cls) -> RedisHealthMonitor:
         """Get Redis health monitor instance."""
@@ -571,7 +703,7 @@ class RedisService:
         start_time = time.monotonic()
         try:
             result = await cls.get_resilience().execute( 
-                operation=(lambda: cls.client().get(key)), # type: Callable[[], Awaitable[Any]]
+                operation=(lambda: cls._command("get", key)), # type: Callable[[], Awaitable[Any]]
                 operation_name=f"GET:{key}",
             )
             latency_ms = cls._record_operation_metric("GET", start_time, success=True)
@@ -631,7 +763,7 @@ class RedisService:
         start_time = time.monotonic()
         try:
             result = await cls.get_resilience().execute(
-                operation=(lambda: cls.client().set(key, value, ex=ttl_seconds)),  # type: Callable[[], Awaitable[Any]]
+                operation=(lambda: cls._command("set", key, value, ex=ttl_seconds)),  # type: Callable[[], Awaitable[Any]]
                 operation_name=f"SET:{key}",
             )
             latency_ms = cls._record_operation_metric("SET", start_time, success=True)
@@ -735,7 +867,7 @@ class RedisService:
         start_time = time.monotonic()
         try:
             new_value = await cls.get_resilience().execute(
-                operation=lambda: cls.client().incrby(key, amount),
+                operation=lambda: cls._command("incrby", key, amount),
                 operation_name=f"INCR:{key}",
             )
             latency_ms = cls._record_operation_metric(
@@ -849,7 +981,7 @@ class RedisService:
         start_time = time.monotonic()
         try:
             result = await cls.get_resilience().execute(
-                operation=lambda: cls.client().expire(key, ttl_seconds),
+                operation=lambda: cls._command("expire", key, ttl_seconds),
                 operation_name=f"EXPIRE:{key}",
             )
             latency_ms = cls._record_operation_metric(
@@ -1265,89 +1397,345 @@ class RedisService:
         return await cls.set(key, payload, ttl_seconds=ttl_seconds)
 
     # ═══════════════════════════════════════════════════════════════════════
-    # DISTRIBUTED LOCKING (WITH METRICS)
+    # SORTED SET & HASH OPERATIONS (RESILIENCE + METRICS)
     # ═══════════════════════════════════════════════════════════════════════
 
     @classmethod
-    async def _track_lock_ownership(
+    async def _execute_metered(
         cls,
-        lock_key: str,
-        token: str,
-        timeout: int,
-        operation: Optional[str] = None,
-        owner_id: Optional[str] = None,
-    ) -> None:
+        op: str,
+        key: str,
+        operation: Callable[[], Awaitable[Any]],
+    ) -> Any:
         """
-        Record lock ownership metadata for debugging.
-
-        Stores lock metadata in Redis hash for monitoring and debugging:
-        - lock:tracking:{lock_key} hash with token, acquired_at, expires_at, etc.
+        Run a single Redis command through resilience with metrics and logs.
 
         Parameters
         ----------
-        lock_key : str
-            The lock key.
-        token : str
-            Unique lock token (UUID).
-        timeout : int
-            Lock timeout in seconds.
-        operation : Optional[str]
-            Optional operation name (e.g., "fusion", "summon").
-        owner_id : Optional[str]
-            Optional owner identifier (e.g., player_id, user_id).
-        """
-        client = cls.client()
-        tracking_key = f"lock:tracking:{lock_key}"
+        op : str
+            Metric / log operation name (e.g., "ZADD").
+        key : str
+            Redis key the command targets.
+        operation : Callable[[], Awaitable[Any]]
+            Zero-arg factory issuing the command.
 
+        Returns
+        -------
+        Any
+            Raw command result.
+        """
+        start_time = time.monotonic()
         try:
-            now = time.time()
-            expires_at = now + timeout
-
-            tracking_data: dict[str, str] = {
-                "token": token,
-                "acquired_at": str(now),
-                "expires_at": str(expires_at),
-                "timeout": str(timeout),
-            }
-
-            if operation:
-                tracking_data["operation"] = operation
-
-            if owner_id:
-                tracking_data["owner_id"] = owner_id
-
-            # Store tracking data with same expiration as lock + small buffer
-            await client.hset(tracking_key, mapping=tracking_data)  # type: ignore[misc]
-            await client.expire(tracking_key, timeout + 10)
-
-        except Exception as exc:
-            # Don't fail lock acquisition if tracking fails
-            logger.warning(
-                "Failed to track lock ownership (non-critical)",
+            result = await cls.get_resilience().execute(
+                operation=operation,
+                operation_name=f"{op}:{key}",
+            )
+            latency_ms = cls._record_operation_metric(op, start_time, success=True)
+            logger.debug(
+                f"Redis {op} operation",
                 extra={
-                    "lock_key": lock_key,
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
+                    "key": key,
+                    "latency_ms": round(latency_ms, 2),
                 },
             )
-
-    @classmethod
-    async def _remove_lock_tracking(cls, lock_key: str) -> None:
-        """Remove lock ownership tracking data."""
-        client = cls.client()
-        tracking_key = f"lock:tracking:{lock_key}"
-
-        try:
-            await client.delete(tracking_key)
+            return result
         except Exception as exc:
-            logger.warning(
-                "Failed to remove lock tracking (non-critical)",
+            latency_ms = cls._record_operation_metric(op, start_time, success=False)
+            logger.error(
+                f"Redis {op} operation failed",
                 extra={
-                    "lock_key": lock_key,
+                    "key": key,
+                    "latency_ms": round(latency_ms, 2),
                     "error": str(exc),
                     "error_type": type(exc).__name__,
                 },
+                exc_info=True,
             )
+            raise
+
+    @classmethod
+    async def zadd(
+        cls,
+        key: str,
+        mapping: dict[str, float],
+        nx: bool = False,
+    ) -> int:
+        """
+        Add or update members of a sorted set (O(log N) per member).
+
+        Parameters
+        ----------
+        key : str
+            Sorted set key.
+        mapping : dict[str, float]
+            Member -> score.
+        nx : bool
+            Only add new members; never overwrite existing scores.
+
+        Returns
+        -------
+        int
+            Number of members newly added.
+        """
+        if not mapping:
+            return 0
+        result = await cls._execute_metered(
+            "ZADD", key, lambda: cls.client().zadd(key, mapping, nx=nx)
+        )
+        return int(result or 0)
+
+    @classmethod
+    async def zrevrange(
+        cls,
+        key: str,
+        start: int,
+        stop: int,
+    ) -> list[tuple[str, float]]:
+        """
+        Get members by descending score with their scores.
+
+        Parameters
+        ----------
+        key : str
+            Sorted set key.
+        start : int
+            Zero-based start index (inclusive).
+        stop : int
+            Zero-based stop index (inclusive, -1 for end).
+
+        Returns
+        -------
+        list[tuple[str, float]]
+            (member, score) pairs, highest score first.
+        """
+        result = await cls._execute_metered(
+            "ZREVRANGE",
+            key,
+            lambda: cls.client().zrevrange(key, start, stop, withscores=True),
+        )
+        return [(member, float(score)) for member, score in result or []]
+
+    @classmethod
+    async def zrevrank(cls, key: str, member: str) -> Optional[int]:
+        """
+        Get a member's zero-based rank by descending score (O(log N)).
+
+        Returns
+        -------
+        Optional[int]
+            Rank, or None if the member is not in the set.
+        """
+        result = await cls._execute_metered(
+            "ZREVRANK", key, lambda: cls.client().zrevrank(key, member)
+        )
+        return None if result is None else int(result)
+
+    @classmethod
+    async def zscore(cls, key: str, member: str) -> Optional[float]:
+        """
+        Get a member's score.
+
+        Returns
+        -------
+        Optional[float]
+            Score, or None if the member is not in the set.
+        """
+        result = await cls._execute_metered(
+            "ZSCORE", key, lambda: cls.client().zscore(key, member)
+        )
+        return None if result is None else float(result)
+
+    @classmethod
+    async def zcard(cls, key: str) -> int:
+        """Get the number of members in a sorted set."""
+        result = await cls._execute_metered(
+            "ZCARD", key, lambda: cls.client().zcard(key)
+        )
+        return int(result or 0)
+
+    @classmethod
+    async def hset(cls, key: str, mapping: dict[str, Any]) -> int:
+        """
+        Set one or more hash fields.
+
+        Returns
+        -------
+        int
+            Number of fields newly created.
+        """
+        if not mapping:
+            return 0
+        result = await cls._execute_metered(
+            "HSET", key, lambda: cls.client().hset(key, mapping=mapping)
+        )
+        return int(result or 0)
+
+    @classmethod
+    async def hmget(cls, key: str, fields: list[str]) -> list[Optional[str]]:
+        """
+        Get several hash fields in one round trip.
+
+        Returns
+        -------
+        list[Optional[str]]
+            Values in field order (None for missing fields).
+        """
+        if not fields:
+            return []
+        result = await cls._execute_metered(
+            "HMGET", key, lambda: cls.client().hmget(key, fields)
+        )
+        return list(result or [])
+
+    @classmethod
+    async def hgetall(cls, key: str) -> dict[str, str]:
+        """Get every field of a hash."""
+        result = await cls._execute_metered(
+            "HGETALL", key, lambda: cls.client().hgetall(key)
+        )
+        return dict(result or {})
+
+    @classmethod
+    async def hdel(cls, key: str, fields: list[str]) -> int:
+        """
+        Delete one or more hash fields.
+
+        Returns
+        -------
+        int
+            Number of fields removed.
+        """
+        if not fields:
+            return 0
+        result = await cls._execute_metered(
+            "HDEL", key, lambda: cls.client().hdel(key, *fields)
+        )
+        return int(result or 0)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # MULTI-KEY & SCRIPTED OPERATIONS (RESILIENCE + METRICS)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    @classmethod
+    async def mget(cls, keys: list[str]) -> list[Optional[str]]:
+        """
+        Get several string keys in one round trip.
+
+        Returns
+        -------
+        list[Optional[str]]
+            Values in key order (None for missing keys).
+        """
+        if not keys:
+            return []
+        result = await cls._execute_metered(
+            "MGET", keys[0], lambda: cls.client().mget(keys)
+        )
+        return list(result or [])
+
+    @classmethod
+    async def run_script(
+        cls,
+        name: str,
+        keys: list[str],
+        args: list[Any],
+    ) -> Any:
+        """
+        Run a registered Lua script atomically in one round trip.
+
+        Scripts are registered by the owning component via
+        `get_script_registry().register()` and executed by EVALSHA
+        (reloaded transparently on NOSCRIPT).
+
+        Parameters
+        ----------
+        name : str
+            Registered script name.
+        keys : list[str]
+            KEYS for the script (the first key is used for logs).
+        args : list[Any]
+            ARGV for the script.
+
+        Returns
+        -------
+        Any
+            Raw script result.
+        """
+        return await cls._execute_metered(
+            "EVALSHA",
+            keys[0] if keys else name,
+            lambda: cls._scripts.execute(cls.client(), name, keys=keys, args=args),
+        )
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # DISTRIBUTED LOCKING (WITH METRICS)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    @classmethod
+    def _lock_script_keys(cls, lock_key: str) -> list[str]:
+        """KEYS for the acquire/release scripts: lock, tracking hash, index."""
+        return [lock_key, f"{cls._LOCK_TRACKING_PREFIX}{lock_key}", cls._LOCK_INDEX_KEY]
+
+    @classmethod
+    async def _try_acquire_lock(
+        cls,
+        client: AsyncRedis,
+        lock_key: str,
+        token: str,
+        timeout: int,
+        operation: Optional[str] = None,
+        owner_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Attempt SET NX and record ownership in one round trip.
+
+        The lock, its tracking hash (token, acquired_at, expires_at, timeout,
+        operation, owner_id) and its entry in the expiry index are written
+        atomically by the acquire script.
+
+        Returns
+        -------
+        bool
+            True if the lock was acquired.
+        """
+        now = time.time()
+        acquired = await cls._scripts.execute(
+            client,
+            cls._ACQUIRE_SCRIPT,
+            keys=cls._lock_script_keys(lock_key),
+            args=[
+                token,
+                timeout,
+                now,
+                now + timeout,
+                timeout + cls._LOCK_TRACKING_GRACE_SECONDS,
+                operation or "",
+                owner_id or "",
+            ],
+        )
+        return bool(acquired)
+
+    @staticmethod
+    def _parse_lock_tracking(data: dict[str, Any]) -> dict[str, Any]:
+        """Convert a tracking hash into lock owner info."""
+        acquired_at = float(data.get("acquired_at", 0)) if data.get("acquired_at") else 0.0
+        held_duration = time.time() - acquired_at if acquired_at else 0.0
+
+        result: dict[str, Any] = {
+            "token": data.get("token"),
+            "acquired_at": acquired_at,
+            "expires_at": float(data.get("expires_at", 0)) if data.get("expires_at") else 0.0,
+            "timeout": int(data.get("timeout", 0)) if data.get("timeout") else 0,
+            "held_duration": round(held_duration, 2),
+        }
+
+        if "operation" in data:
+            result["operation"] = data["operation"]
+
+        if "owner_id" in data:
+            result["owner_id"] = data["owner_id"]
+
+        return result
 
     @classmethod
     async def get_lock_owner(cls, lock_key: str) -> Optional[dict[str, Any]]:
@@ -1374,32 +1762,13 @@ class RedisService:
             Returns None if lock not held or tracking data not available.
         """
         client = cls.client()
-        tracking_key = f"lock:tracking:{lock_key}"
+        tracking_key = f"{cls._LOCK_TRACKING_PREFIX}{lock_key}"
 
         try:
             data = await client.hgetall(tracking_key)  # type: ignore[misc]
             if not data:
                 return None
-
-            # Calculate held duration
-            acquired_at = float(data.get("acquired_at", 0)) if data.get("acquired_at") else 0.0
-            held_duration = time.time() - acquired_at if acquired_at else 0.0
-
-            result: dict[str, Any] = {
-                "token": data.get("token"),
-                "acquired_at": acquired_at,
-                "expires_at": float(data.get("expires_at", 0)) if data.get("expires_at") else 0.0,
-                "timeout": int(data.get("timeout", 0)) if data.get("timeout") else 0,
-                "held_duration": round(held_duration, 2),
-            }
-
-            if "operation" in data:
-                result["operation"] = data["operation"]
-
-            if "owner_id" in data:
-                result["owner_id"] = data["owner_id"]
-
-            return result
+            return cls._parse_lock_tracking(data)
 
         except Exception as exc:
             logger.error(
@@ -1418,6 +1787,9 @@ class RedisService:
         """
         Get all currently held locks for debugging.
 
+        Reads the expiry index (one ZRANGEBYSCORE over unexpired entries) and
+        fetches every tracking hash in a single pipeline; no keyspace scan.
+
         Returns
         -------
         list[dict[str, Any]]
@@ -1428,19 +1800,21 @@ class RedisService:
         client = cls.client()
 
         try:
-            # Scan for all lock tracking keys
-            tracking_keys: list[str] = []
-            async for key in client.scan_iter(match="lock:tracking:*"):
-                tracking_keys.append(key)
+            lock_keys: list[str] = await client.zrangebyscore(  # type: ignore[misc]
+                cls._LOCK_INDEX_KEY, time.time(), "+inf"
+            )
+            if not lock_keys:
+                return []
 
-            # Retrieve ownership info for each
-            locks: list[dict[str, Any]] = []
-            for tracking_key in tracking_keys:
-                # Extract original lock key
-                lock_key = tracking_key.replace("lock:tracking:", "")
+            pipe = client.pipeline(transaction=False)
+            for lock_key in lock_keys:
+                pipe.hgetall(f"{cls._LOCK_TRACKING_PREFIX}{lock_key}")
+            tracking = await pipe.execute()
 
-                owner_info = await cls.get_lock_owner(lock_key)
-                if owner_info:
+            locks: list[dict[str, Any]] = []
+            for lock_key, data in zip(lock_keys, tracking):
+                if data:
+                    owner_info = cls._parse_lock_tracking(data)
                     owner_info["lock_key"] = lock_key
                     locks.append(owner_info)
 
@@ -1471,11 +1845,15 @@ class RedisService:
         """
         Acquire a distributed lock using Redis SET NX with unique token.
 
-        Uses a UUID token and Lua script for safe release. The lock will
-        automatically expire if not released (e.g., due to crash).
+        Uses a UUID token and Lua scripts for acquisition and safe release.
+        The lock will automatically expire if not released (e.g., due to crash).
 
         Lock ownership is tracked in Redis for debugging purposes, allowing
-        inspection of which locks are held, by whom, and for how long.
+        inspection of which locks are held, by whom, and for how long. Each
+        attempt (SET NX + tracking) is a single round trip.
+
+        Contended waiters sleep until the holder's release is published
+        (RedisLockNotifier), falling back to jittered polling.
 
         Parameters
         ----------
@@ -1486,7 +1864,8 @@ class RedisService:
         wait_timeout : Optional[int]
             Maximum time to wait for lock acquisition (default from config).
         retry_interval : Optional[float]
-            Sleep duration between acquisition attempts (default from config).
+            Polling interval between acquisition attempts when release
+            notifications are unavailable (default from config, jittered).
         operation : Optional[str]
             Optional operation name for debugging (e.g., "fusion", "summon").
         owner_id : Optional[str]
@@ -1537,6 +1916,13 @@ class RedisService:
                 0.1,
             )
 
+        notifier = cls._lock_notifier
+        waiter: Optional[asyncio.Future[None]] = None
+        fallback_interval = cls._get_config_float(
+            "core.redis.lock.notify.fallback_interval_sec",
+            0.5,
+        )
+
         token = str(uuid.uuid4())
         deadline = time.monotonic() + max(0, wait_timeout)
         acquired = False
@@ -1547,12 +1933,19 @@ class RedisService:
         try:
             # Acquisition loop with timeout
             while True:
+                # Register before attempting, so a release landing between a
+                # failed SET NX and the wait below still wakes this waiter
+                if notifier is not None and (waiter is None or waiter.done()):
+                    waiter = notifier.register(key)
+
                 try:
-                    acquired = await client.set(
-                        name=key,
-                        value=token,
-                        nx=True,
-                        ex=timeout,
+                    acquired = await cls._try_acquire_lock(
+                        client,
+                        key,
+                        token,
+                        timeout,
+                        operation=operation,
+                        owner_id=owner_id,
                     )
 
                     if acquired:
@@ -1563,15 +1956,6 @@ class RedisService:
                             success=True,
                         )
 
-                        # Track lock ownership for debugging
-                        await cls._track_lock_ownership(
-                            lock_key=key,
-                            token=token,
-                            timeout=timeout,
-                            operation=operation,
-                            owner_id=owner_id,
-                        )
-
                         logger.debug(
                             "Redis lock acquired",
                             extra={
@@ -1619,22 +2003,42 @@ class RedisService:
                         f"within {wait_timeout}s"
                     )
 
-                await asyncio.sleep(retry_interval)
+                # Wait for a release notification, re-polling after a
+                # jittered interval (lock expiry publishes nothing)
+                remaining = deadline - time.monotonic()
+                if notifier is not None and waiter is not None:
+                    interval = fallback_interval if notifier.is_subscribed else retry_interval
+                    await notifier.wait(
+                        waiter, min(remaining, RedisLockNotifier.jittered(interval))
+                    )
+                else:
+                    await asyncio.sleep(
+                        min(remaining, RedisLockNotifier.jittered(retry_interval))
+                    )
+
+            if notifier is not None and waiter is not None:
+                notifier.unregister(key, waiter)
+                waiter = None
 
             # Critical section
             yield
 
         finally:
+            if notifier is not None and waiter is not None:
+                notifier.unregister(key, waiter)
+
             # Safe release via Lua script (only if we hold the lock)
             if acquired:
                 try:
                     release_start_time = time.monotonic()
-                    released = await client.eval(  # type: ignore[misc]
-                        cls._LUA_UNLOCK_SCRIPT,
-                        1,
-                        key,
-                        token,
+                    released = await cls._scripts.execute(
+                        client,
+                        cls._UNLOCK_SCRIPT,
+                        keys=cls._lock_script_keys(key),
+                        args=[token, RedisLockNotifier.channel_for(key)],
                     )
+                    if released and cls._lock_notifier is not None:
+                        cls._lock_notifier.notify_local(key)
                     release_time_ms = (time.monotonic() - release_start_time) * 1000
 
                     # Record hold metrics if we know when the lock was acquired
@@ -1644,9 +2048,6 @@ class RedisService:
                         hold_ms = None  # pragma: no cover - defensive
 
                     if released:
-                        # Remove lock ownership tracking
-                        await cls._remove_lock_tracking(key)
-
                         logger.debug(
                             "Redis lock released",
                             extra={
@@ -1656,9 +2057,8 @@ class RedisService:
                             },
                         )
                     else:
-                        # Lock expired or stolen, but still remove tracking
-                        await cls._remove_lock_tracking(key)
-
+                        # Lock expired or stolen (our tracking, if any, was
+                        # removed by the release script)
                         logger.warning(
                             "Redis lock already expired or stolen",
                             extra={
@@ -56,6 +56,7 @@ from src.modules.player import (
 # Maiden services
 from src.modules.maiden import (
     MaidenBaseService,
+    MaidenCatalog,
     MaidenService,
     PowerCalculationService,
     LeaderSkillService,
@@ -267,6 +268,17 @@ class ServiceContainer:
                 MaidenBaseService,
             )
 
+            # Maiden base catalog (in-memory templates, version-stamped in Redis)
+            start = time.perf_counter()
+            MaidenCatalog.configure(self._config_manager)
+            try:
+                await MaidenCatalog.reload()
+            except Exception:
+                self._logger.warning(
+                    "Maiden catalog preload failed; loading on first use", exc_info=True
+                )
+            self._service_init_times["maiden_catalog"] = time.perf_counter() - start
+
             # Power and leader skill services (config-only)
             start = time.perf_counter()
             self._power_calculation = PowerCalculationService(self._config_manager)
@@ -548,6 +560,27 @@ class ServiceContainer:
 
         self._logger.info("Shutting down service container...")
 
+        # Flush buffered daily quest progress
+        if self._daily_quest is not None:
+            try:
+                await self._daily_quest.shutdown()
+            except Exception:
+                self._logger.error("Failed to shut down daily_quest", exc_info=True)
+
+        # Flush resolved combat encounters still in the write-behind buffer
+        if self._combat is not None:
+            try:
+                await self._combat.shutdown()
+            except Exception:
+                self._logger.error("Failed to shut down combat", exc_info=True)
+
+        # Write live leaderboard scores not yet snapshotted to Postgres
+        if self._leaderboard is not None:
+            try:
+                await self._leaderboard.shutdown()
+            except Exception:
+                self._logger.error("Failed to shut down leaderboard", exc_info=True)
+
         # Hook for future service-level cleanup
 
         self._initialized = False
@@ -27,9 +27,13 @@ Design Notes
 """
 
 from src.core.validation.input_validator import InputValidator
-from src.core.validation.transaction_validator import TransactionValidator
+from src.core.validation.transaction_validator import (
+    TransactionValidator,
+    ValidatedDetails,
+)
 
 __all__ = [
     "InputValidator",
     "TransactionValidator",
+    "ValidatedDetails",
 ]
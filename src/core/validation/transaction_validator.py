@@ -11,6 +11,8 @@ Features
 - Schema validation for transaction log details by transaction type
 - Size limit enforcement (10KB max per transaction's JSON payload)
 - PII scrubbing for sensitive data fields and nested structures
+- Single-pass validate/scrub/serialize returning the JSON bytes, so
+  downstream writers reuse them instead of re-encoding
 - Clear, domain-specific error messages for validation failures
 - Structured logging for schema drift and validation issues
 
@@ -42,6 +44,7 @@ Dependencies
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set, NoReturn
 import json
 
@@ -50,6 +53,32 @@ from src.core.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Shared encoder (json.dumps builds a new encoder per call when given options)
+_DETAILS_ENCODER = json.JSONEncoder(
+    default=str,
+    separators=(",", ":"),
+    ensure_ascii=False,
+)
+
+# PII decision per key name; audit payloads reuse a small set of keys
+_PII_KEY_CACHE: Dict[Any, bool] = {}
+_PII_KEY_CACHE_MAX_ENTRIES = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatedDetails:
+    """
+    Result of TransactionValidator.validate_and_serialize().
+
+    Attributes:
+        details: Scrubbed details dictionary
+        details_json: UTF-8 JSON encoding of `details` (compact separators),
+            ready to store without re-encoding
+    """
+
+    details: Dict[str, Any]
+    details_json: bytes
+
 
 def _raise_validation_error(field_name: str, value: Any, message: str) -> NoReturn:
     """
@@ -159,6 +188,34 @@ class TransactionValidator:
         Returns:
             Sanitized details dictionary
 
+        Raises:
+            ValidationError: If validation fails
+        """
+        return TransactionValidator.validate_and_serialize(
+            transaction_type, details, allow_unknown_types
+        ).details
+
+    @staticmethod
+    def validate_and_serialize(
+        transaction_type: str,
+        details: Dict[str, Any],
+        allow_unknown_types: bool = True,
+    ) -> ValidatedDetails:
+        """
+        Validate, scrub and serialize transaction details in one pass.
+
+        The details are walked once (scrubbing PII with cached per-key
+        decisions) and encoded once; the size limit is checked on the
+        encoded bytes, which are returned for reuse by the audit writer.
+
+        Args:
+            transaction_type: Type of transaction (e.g., "resource_change_lumees")
+            details: Transaction details dictionary (not modified)
+            allow_unknown_types: If False, unknown transaction types raise ValidationError
+
+        Returns:
+            ValidatedDetails with the scrubbed dict and its JSON bytes
+
         Raises:
             ValidationError: If validation fails
         """
@@ -180,9 +237,12 @@ class TransactionValidator:
         if not isinstance(details, dict):
             _raise_validation_error("details", details, "Transaction details must be a dictionary")
 
-        # 3. Check size limit (10KB)
-        details_json = json.dumps(details, default=str)
-        size_bytes = len(details_json.encode("utf-8"))
+        # 3. Scrub PII and serialize (single walk, single encode)
+        sanitized_details = TransactionValidator._scrub_pii(details)
+        details_json = _DETAILS_ENCODER.encode(sanitized_details).encode("utf-8")
+
+        # 4. Check size limit (10KB) on the bytes that will be stored
+        size_bytes = len(details_json)
 
         if size_bytes > TransactionValidator.MAX_DETAILS_SIZE_BYTES:
             size_kb = size_bytes / 1024
@@ -194,9 +254,6 @@ class TransactionValidator:
                 "Please reduce the amount of data being logged.",
             )
 
-        # 4. Scrub PII
-        sanitized_details = TransactionValidator._scrub_pii(details)
-
         # 5. Validate schema if transaction type is known
         if transaction_type in TransactionValidator.TRANSACTION_SCHEMAS:
             allowed_fields = TransactionValidator.TRANSACTION_SCHEMAS[transaction_type]
@@ -229,7 +286,7 @@ class TransactionValidator:
                 f"Unknown transaction type: {transaction_type}. Known types: {', '.join(known_types)}",
             )
 
-        return sanitized_details
+        return ValidatedDetails(details=sanitized_details, details_json=details_json)
 
     @staticmethod
     def _scrub_pii(details: Dict[str, Any]) -> Dict[str, Any]:
@@ -239,7 +296,7 @@ class TransactionValidator:
         This function is recursive and will scrub:
         - Direct PII fields on the root dict
         - Nested dicts
-        - Lists of dicts
+        - Dicts inside (nested) lists
 
         Args:
             details: Transaction details dictionary
@@ -247,30 +304,55 @@ class TransactionValidator:
         Returns:
             Sanitized dictionary with PII removed/redacted
         """
+        is_pii_key = TransactionValidator._is_pii_key
         sanitized: Dict[str, Any] = {}
 
         for key, value in details.items():
-            lower_key = key.lower()
-
-            if any(pii_field in lower_key for pii_field in TransactionValidator.PII_FIELDS):
+            if is_pii_key(key):
                 sanitized[key] = "[REDACTED]"
-                continue
-
-            if isinstance(value, dict):
+            elif isinstance(value, dict):
                 sanitized[key] = TransactionValidator._scrub_pii(value)
             elif isinstance(value, list):
-                sanitized_list: List[Any] = []
-                for item in value:
-                    if isinstance(item, dict):
-                        sanitized_list.append(TransactionValidator._scrub_pii(item))
-                    else:
-                        sanitized_list.append(item)
-                sanitized[key] = sanitized_list
+                sanitized[key] = TransactionValidator._scrub_list(value)
             else:
                 sanitized[key] = value
 
         return sanitized
 
+    @staticmethod
+    def _scrub_list(items: List[Any]) -> List[Any]:
+        return [
+            TransactionValidator._scrub_pii(item) if isinstance(item, dict)
+            else TransactionValidator._scrub_list(item) if isinstance(item, list)
+            else item
+            for item in items
+        ]
+
+    @staticmethod
+    def _is_pii_key(key: Any) -> bool:
+        """Whether a key names a PII field (substring match, cached per key)."""
+        decision = _PII_KEY_CACHE.get(key)
+        if decision is None:
+            lower_key = str(key).lower()
+            decision = any(
+                pii_field in lower_key for pii_field in TransactionValidator.PII_FIELDS
+            )
+            if len(_PII_KEY_CACHE) >= _PII_KEY_CACHE_MAX_ENTRIES:
+                _PII_KEY_CACHE.clear()
+            _PII_KEY_CACHE[key] = decision
+        return decision
+
+    @staticmethod
+    def add_pii_field(field_name: str) -> None:
+        """
+        Register an additional PII field pattern at runtime.
+
+        Clears cached per-key decisions so the new pattern applies to keys
+        already seen.
+        """
+        TransactionValidator.PII_FIELDS.add(field_name.lower())
+        _PII_KEY_CACHE.clear()
+
     @staticmethod
     def validate_context(context: Optional[str]) -> str:
         """
@@ -8,7 +8,7 @@ Schema-only representation of:
 - Resource pools (energy, stamina, hp)
 - Resource regeneration timestamps
 - Drop charges
-- Combat power aggregates (attack, defense, total power)
+- Combat power aggregates (attack, defense, total power, best per element)
 - Stat allocation tracking (JSON)
 - Battle statistics (JSON)
 
@@ -190,6 +190,15 @@ class PlayerStats(Base, IdMixin):
         doc="Total combat power (attack + defense)",
     )
 
+    # Added by migrations/002_add_player_stats_best_by_element.sql (nullable,
+    # no backfill: NULL triggers a rebuild on first read)
+    best_by_element: Mapped[Optional[Dict[str, dict]]] = mapped_column(
+        JSONB,
+        nullable=True,
+        default=None,
+        doc="Strongest maiden stack per element (NULL until the power index is built)",
+    )
+
     # ========================================================================
     # STAT ALLOCATION TRACKING
     # ========================================================================
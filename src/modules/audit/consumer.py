@@ -20,6 +20,7 @@ Primary event:
         "player_id": int,
         "transaction_type": str,  # e.g., "fusion_attempt", "resource_change_lumees"
         "details": dict,          # transaction-specific data
+        "details_json": bytes,    # optional pre-serialized details (stored as-is)
         "context": str,           # e.g., "/fuse", "background_task"
         "meta": dict,             # optional metadata (guild_id, shard_id, etc.)
     }
@@ -60,14 +61,28 @@ Configuration Keys
 - audit.consumer.flush_interval_seconds: int (default 5)
 - audit.consumer.max_buffer_size      : int (default 10000)
 - audit.consumer.retry_attempts       : int (default 3)
+- audit.consumer.spill_enabled        : bool (default True)
+- audit.consumer.spill_dir            : str (default "data/audit_spill")
+- audit.consumer.max_spill_bytes      : int (default 268435456)
 
 Architecture Notes
 ------------------
-- Uses in-memory buffer for batching
-- Flushes on interval or buffer size threshold
-- Automatically retries on transient DB failures
-- Drops events if buffer overflows (logs warning)
-- Runs as background asyncio task
+- Uses in-memory buffer of plain row dicts (AUDIT_COLUMNS) for batching
+- Rows go to AuditRepository.create_batch, which bulk-writes them
+  (COPY / multi-row INSERT / executemany) without ORM unit-of-work
+- Every accepted row is also appended to a local spill segment
+  (AuditSpillLog); segments are deleted only after their rows persist
+- Spill appends are batched by a writer task and run in a worker thread
+  (one write + flush per batch), so event handlers never block on disk
+- A single flusher task owns all database writes; batch-size triggers
+  are coalesced into one wake-up event instead of spawning flush tasks
+- When the in-memory buffer is full, rows stay on disk only and the
+  flusher reads the sealed segment back (bounded memory, no drops)
+- Every database write is at most batch_size rows, including replayed and
+  overflow segments
+- Segments left by a crash are replayed on start(); failed flushes keep
+  their segment for the next cycle instead of dropping events
+- Without spilling, overflow drops the oldest event (logs warning)
 - Maps TransactionLogger payload to AuditLog schema
 - EventBus callback signature: single argument (payload dict)
 
@@ -85,11 +100,14 @@ from __future__ import annotations
 import asyncio
 import time
 from collections import deque
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from src.core.histogram import LatencyHistogram
 from src.core.logging.logger import get_logger
 from src.core.config import ConfigManager
-from src.modules.audit.model import AuditLog
+from src.modules.audit.spill import AuditSpillLog
 
 if TYPE_CHECKING:
     from src.core.event.bus import EventBus
@@ -98,6 +116,16 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+class _BufferedRow:
+    """An accepted audit row; durable while it is (or is queued to be) on disk."""
+    
+    __slots__ = ("row", "durable")
+    
+    def __init__(self, row: Dict[str, Any], durable: bool) -> None:
+        self.row = row
+        self.durable = durable
+
+
 class AuditConsumer:
     """
     Event consumer that persists TransactionLogger events to audit database.
@@ -131,26 +159,49 @@ class AuditConsumer:
         self._audit_repo = audit_repository
         self._config_manager = config_manager
         
-        # Buffer for batching
-        self._buffer: deque = deque()
-        self._buffer_lock: asyncio.Lock = asyncio.Lock()
+        # Buffer for batching; durable rows are also in (or queued for) the
+        # active spill segment
+        self._buffer: Deque[_BufferedRow] = deque()
+        self._overflowed: bool = False
         
-        # Background task
+        # Single flusher task and its coalesced wake-up trigger
         self._is_running: bool = False
         self._flush_task: Optional[asyncio.Task] = None
+        self._flush_wakeup: asyncio.Event = asyncio.Event()
         
         # Configuration
         self._batch_size = self._get_config_int("audit.consumer.batch_size", 100)
         self._flush_interval = self._get_config_int("audit.consumer.flush_interval_seconds", 5)
         self._max_buffer_size = self._get_config_int("audit.consumer.max_buffer_size", 10000)
         self._retry_attempts = self._get_config_int("audit.consumer.retry_attempts", 3)
+        self._max_spill_bytes = self._get_config_int("audit.consumer.max_spill_bytes", 256 * 1024 * 1024)
+        
+        # Durable spill segments (None = memory-only)
+        self._spill: Optional[AuditSpillLog] = None
+        if self._get_config_bool("audit.consumer.spill_enabled", True):
+            self._spill = AuditSpillLog(
+                Path(self._get_config_str("audit.consumer.spill_dir", "data/audit_spill"))
+            )
+        self._pending_segments: Deque[Path] = deque()
+        # Rows already persisted from a segment whose flush failed part-way
+        self._segment_progress: Dict[Path, int] = {}
+        
+        # Spill writer: (row, in memory buffer) pairs waiting for disk
+        self._spill_queue: List[Tuple[_BufferedRow, bool]] = []
+        self._spill_wakeup: asyncio.Event = asyncio.Event()
+        self._spill_lock: asyncio.Lock = asyncio.Lock()
+        self._spill_task: Optional[asyncio.Task] = None
         
         # Metrics
         self._events_received: int = 0
         self._events_persisted: int = 0
         self._events_dropped: int = 0
+        self._events_spilled: int = 0
+        self._events_replayed: int = 0
         self._flush_count: int = 0
+        self._flush_failures: int = 0
         self._last_flush_time: Optional[float] = None
+        self._flush_latency = LatencyHistogram()
         
         logger.info(
             "AuditConsumer initialized",
@@ -159,6 +210,7 @@ class AuditConsumer:
                 "flush_interval_seconds": self._flush_interval,
                 "max_buffer_size": self._max_buffer_size,
                 "retry_attempts": self._retry_attempts,
+                "spill_enabled": self._spill is not None,
             },
         )
     
@@ -167,20 +219,42 @@ class AuditConsumer:
     # ═══════════════════════════════════════════════════════════════════════
     
     async def start(self) -> None:
-        """Start the audit consumer and subscribe to events."""
+        """Start the audit consumer, replay spilled events and subscribe."""
         if self._is_running:
             logger.warning("AuditConsumer already running")
             return
         
         self._is_running = True
         
+        # Recover segments left unflushed by a previous run
+        if self._spill is not None:
+            try:
+                self._pending_segments.extend(self._spill.open())
+            except OSError as exc:
+                logger.error(
+                    "Audit spill unavailable, continuing memory-only",
+                    extra={
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                    },
+                    exc_info=True,
+                )
+                self._spill = None
+        
         # Subscribe to TransactionLogger's canonical event
         await self._subscribe_to_events()
         
-        # Start background flush task
+        # Start the single background flusher and the spill writer
         self._flush_task = asyncio.create_task(self._flush_loop())
+        if self._spill is not None:
+            self._spill_task = asyncio.create_task(self._spill_loop())
+        if self._pending_segments:
+            self._flush_wakeup.set()
         
-        logger.info("AuditConsumer started")
+        logger.info(
+            "AuditConsumer started",
+            extra={"replay_segments": len(self._pending_segments)},
+        )
     
     async def stop(self) -> None:
         """Stop the audit consumer and flush remaining events."""
@@ -189,17 +263,28 @@ class AuditConsumer:
         
         self._is_running = False
         
-        # Stop background task
+        # Let the flusher finish its current cycle (never cancel mid-write)
         if self._flush_task:
-            self._flush_task.cancel()
+            self._flush_wakeup.set()
             try:
                 await self._flush_task
             except asyncio.CancelledError:
                 pass
             self._flush_task = None
         
-        # Flush remaining events
+        if self._spill_task:
+            self._spill_wakeup.set()
+            try:
+                await self._spill_task
+            except asyncio.CancelledError:
+                pass
+            self._spill_task = None
+        
+        # Flush remaining events (drains queued spill writes first);
+        # anything that fails stays on disk
         await self._flush_buffer()
+        if self._spill is not None:
+            self._spill.close()
         
         logger.info(
             "AuditConsumer stopped",
@@ -208,6 +293,8 @@ class AuditConsumer:
                 "events_persisted": self._events_persisted,
                 "events_dropped": self._events_dropped,
                 "flush_count": self._flush_count,
+                "pending_segments": len(self._pending_segments),
+                "spill_bytes": self._spill.size_bytes() if self._spill else 0,
             },
         )
     
@@ -317,63 +404,40 @@ class AuditConsumer:
             # Categorize the transaction type
             category = self._categorize_transaction_type(transaction_type)
             
-            # Create audit log entry
-            audit_entry = AuditLog(
-                user_id=player_id,
-                guild_id=guild_id,
-                channel_id=channel_id,
-                category=category,
-                operation_type=transaction_type.upper(),
-                operation_name=transaction_type,
-                event_data=details,
-                metadata={
+            # Create audit row (plain dict for the bulk writer)
+            audit_entry = {
+                "created_at": datetime.utcnow(),
+                "user_id": player_id,
+                "guild_id": guild_id,
+                "channel_id": channel_id,
+                "category": category,
+                "operation_type": transaction_type.upper(),
+                "operation_name": transaction_type,
+                # Validated events carry their JSON bytes; no re-encoding
+                "event_data": payload.get("details_json") or details,
+                "metadata": {
                     "context": context_str,
                     "source": "TransactionLogger",
                     "original_event_type": event_type,
                     **meta,
                 },
-                success=success,
-                error_type=error_type,
-                error_message=error_message,
-                duration_ms=duration_ms,
-            )
+                "success": success,
+                "error_type": error_type,
+                "error_message": error_message,
+                "duration_ms": duration_ms,
+            }
             
-            # Add to buffer
-            async with self._buffer_lock:
-                if len(self._buffer) >= self._max_buffer_size:
-                    # Buffer overflow, drop oldest event
-                    dropped = self._buffer.popleft()
-                    self._events_dropped += 1
-                    
-                    logger.warning(
-                        "Audit buffer overflow, dropping oldest event",
-                        extra={
-                            "buffer_size": len(self._buffer),
-                            "max_buffer_size": self._max_buffer_size,
-                            "events_dropped": self._events_dropped,
-                            "dropped_transaction_type": dropped.operation_type,
-                        },
-                    )
-                
-                self._buffer.append(audit_entry)
-                
-                logger.debug(
-                    "Audit event buffered",
-                    extra={
-                        "transaction_type": transaction_type,
-                        "player_id": player_id,
-                        "buffer_size": len(self._buffer),
-                        "success": success,
-                    },
-                )
-                
-                # Flush if batch size reached
-                if len(self._buffer) >= self._batch_size:
-                    logger.debug(
-                        "Batch size reached, triggering flush",
-                        extra={"buffer_size": len(self._buffer)},
-                    )
-                    asyncio.create_task(self._flush_buffer())
+            self._enqueue(audit_entry)
+            
+            logger.debug(
+                "Audit event buffered",
+                extra={
+                    "transaction_type": transaction_type,
+                    "player_id": player_id,
+                    "buffer_size": len(self._buffer),
+                    "success": success,
+                },
+            )
         
         except Exception as exc:
             logger.error(
@@ -428,36 +492,26 @@ class AuditConsumer:
                 operation_type = "UNKNOWN"
                 category = "OTHER"
             
-            # Create audit log entry
-            audit_entry = AuditLog(
-                user_id=user_id,
-                guild_id=guild_id,
-                category=category,
-                operation_type=operation_type,
-                operation_name=event_type,
-                event_data=payload,
-                metadata={
+            # Create audit row (plain dict for the bulk writer)
+            audit_entry = {
+                "created_at": datetime.utcnow(),
+                "user_id": user_id,
+                "guild_id": guild_id,
+                "category": category,
+                "operation_type": operation_type,
+                "operation_name": event_type,
+                "event_data": payload,
+                "metadata": {
                     "source": "DomainEvent",
                     "original_event_type": event_type,
                 },
-                success=success,
-                error_type=type(error).__name__ if error else None,
-                error_message=str(error) if error else None,
-                duration_ms=duration_ms,
-            )
+                "success": success,
+                "error_type": type(error).__name__ if error else None,
+                "error_message": str(error) if error else None,
+                "duration_ms": duration_ms,
+            }
             
-            # Add to buffer
-            async with self._buffer_lock:
-                if len(self._buffer) >= self._max_buffer_size:
-                    self._buffer.popleft()
-                    self._events_dropped += 1
-                    logger.warning("Audit buffer overflow, dropping oldest event")
-                
-                self._buffer.append(audit_entry)
-                
-                # Flush if batch size reached
-                if len(self._buffer) >= self._batch_size:
-                    asyncio.create_task(self._flush_buffer())
+            self._enqueue(audit_entry)
         
         except Exception as exc:
             logger.error(
@@ -576,13 +630,125 @@ class AuditConsumer:
     # BUFFER FLUSHING
     # ═══════════════════════════════════════════════════════════════════════
     
+    def _enqueue(self, row: Dict[str, Any]) -> None:
+        """
+        Accept a row: queue it for the spill segment, buffer it in memory
+        (unless the buffer is full and the row is headed for disk), and wake
+        the flusher once a batch is ready.
+        """
+        spilled = self._spill_accepts()
+        entry = _BufferedRow(row, durable=spilled)
+        in_buffer = True
+        
+        if len(self._buffer) < self._max_buffer_size:
+            self._buffer.append(entry)
+        elif spilled:
+            # Backpressure: keep the row on disk only, flusher reads it back
+            self._overflowed = True
+            in_buffer = False
+        else:
+            # Memory-only mode: drop oldest event
+            dropped = self._buffer.popleft()
+            self._events_dropped += 1
+            self._buffer.append(entry)
+            
+            logger.warning(
+                "Audit buffer overflow, dropping oldest event",
+                extra={
+                    "buffer_size": len(self._buffer),
+                    "max_buffer_size": self._max_buffer_size,
+                    "events_dropped": self._events_dropped,
+                    "dropped_transaction_type": dropped.row["operation_type"],
+                },
+            )
+        
+        if spilled:
+            self._spill_queue.append((entry, in_buffer))
+            self._spill_wakeup.set()
+        
+        if self._overflowed or len(self._buffer) >= self._batch_size:
+            self._flush_wakeup.set()
+    
+    def _spill_accepts(self) -> bool:
+        """True if a new row can go to the spill segment."""
+        return (
+            self._spill is not None
+            and self._spill.size_bytes() < self._max_spill_bytes
+        )
+    
+    async def _spill_loop(self) -> None:
+        """Spill writer: appends queued rows in batches off the event loop."""
+        while self._is_running:
+            try:
+                await self._spill_wakeup.wait()
+                self._spill_wakeup.clear()
+                await self._drain_spill()
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                logger.error(
+                    "Error in audit spill loop",
+                    extra={
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                    },
+                    exc_info=True,
+                )
+    
+    async def _drain_spill(self) -> None:
+        """
+        Append every queued row to the active segment.
+        
+        Each batch is one write + flush in a worker thread. Returns only
+        once the queue is empty, without yielding after the last check, so
+        a caller can seal the segment knowing every durable row is in it.
+        Rows whose write fails lose their durable flag; disk-only rows are
+        moved back into the memory buffer.
+        """
+        async with self._spill_lock:
+            while self._spill_queue:
+                batch, self._spill_queue = self._spill_queue, []
+                assert self._spill is not None
+                try:
+                    await asyncio.to_thread(
+                        self._spill.append, [entry.row for entry, _ in batch]
+                    )
+                except (OSError, TypeError, ValueError) as exc:
+                    logger.error(
+                        "Failed to append audit rows to spill segment",
+                        extra={
+                            "count": len(batch),
+                            "error": str(exc),
+                            "error_type": type(exc).__name__,
+                        },
+                    )
+                    for entry, in_buffer in batch:
+                        entry.durable = False
+                        if not in_buffer:
+                            self._buffer.append(entry)
+                    continue
+                
+                self._events_spilled += len(batch)
+    
     async def _flush_loop(self) -> None:
-        """Background task that flushes buffer periodically."""
+        """Single flusher: wakes on batch trigger or interval, whichever first."""
         logger.debug("Audit flush loop started")
         
         while self._is_running:
             try:
-                await asyncio.sleep(self._flush_interval)
+                try:
+                    await asyncio.wait_for(
+                        self._flush_wakeup.wait(),
+                        timeout=self._flush_interval,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                
+                self._flush_wakeup.clear()
+                
+                if not self._is_running:
+                    break
+                
                 await self._flush_buffer()
                 
             except asyncio.CancelledError:
@@ -601,16 +767,109 @@ class AuditConsumer:
                 # Continue loop despite errors
     
     async def _flush_buffer(self) -> None:
-        """Flush buffered audit entries to database."""
-        async with self._buffer_lock:
-            if not self._buffer:
-                return
+        """
+        Flush pending segments, then the active buffer, to the database.
+        
+        Only ever called from the flusher task (or stop() after it exits),
+        so database writes never overlap. Rows are written in chunks of at
+        most batch_size; a segment that fails part-way resumes after its
+        last persisted chunk.
+        """
+        # Replayed / previously failed segments first, oldest first
+        while self._pending_segments:
+            segment = self._pending_segments[0]
+            assert self._spill is not None
+            rows = await asyncio.to_thread(self._spill.read, segment)
+            
+            done = await self._persist_in_batches(
+                rows, skip=self._segment_progress.get(segment, 0)
+            )
+            if done < len(rows):
+                self._segment_progress[segment] = done
+                return  # Keep on disk, retry next cycle
             
-            # Extract entries from buffer
-            entries = list(self._buffer)
-            self._buffer.clear()
+            self._events_replayed += len(rows)
+            self._segment_progress.pop(segment, None)
+            self._spill.delete(segment)
+            self._pending_segments.popleft()
+        
+        # Every queued spill write lands before the segment is sealed. Always
+        # drain: the spill writer empties the queue before its append
+        # finishes, and draining waits for that append under _spill_lock
+        await self._drain_spill()
+        
+        # Take the active buffer and seal its segment (no awaits: atomic)
+        buffered = list(self._buffer)
+        self._buffer.clear()
+        overflowed, self._overflowed = self._overflowed, False
+        sealed = self._spill.seal() if self._spill is not None else None
+        
+        # Segment order first (durable rows), then rows that never hit disk
+        memory_only = [entry.row for entry in buffered if not entry.durable]
+        if overflowed and sealed is not None:
+            # Some rows were disk-only: the segment holds every durable row
+            assert self._spill is not None
+            entries = await asyncio.to_thread(self._spill.read, sealed)
+        else:
+            entries = [entry.row for entry in buffered if entry.durable]
+        durable_count = len(entries)
+        entries.extend(memory_only)
         
-        # Persist with retry
+        if not entries:
+            if sealed is not None and self._spill is not None:
+                self._spill.delete(sealed)
+            return
+        
+        done = await self._persist_in_batches(entries)
+        if done == len(entries):
+            if sealed is not None and self._spill is not None:
+                self._spill.delete(sealed)
+        elif sealed is not None:
+            self._pending_segments.append(sealed)
+            self._segment_progress[sealed] = min(done, durable_count)
+            lost = len(memory_only) - max(done - durable_count, 0)
+            self._events_dropped += lost
+            logger.warning(
+                "Audit flush failed, events retained in spill segment",
+                extra={
+                    "count": len(entries) - done,
+                    "dropped_memory_only": lost,
+                    "segment": sealed.name,
+                    "pending_segments": len(self._pending_segments),
+                },
+            )
+        else:
+            self._events_dropped += len(entries) - done
+            logger.critical(
+                "Dropped audit events after all retry attempts",
+                extra={
+                    "count": len(entries) - done,
+                    "total_dropped": self._events_dropped,
+                },
+            )
+    
+    async def _persist_in_batches(
+        self, entries: List[Dict[str, Any]], skip: int = 0
+    ) -> int:
+        """
+        Write rows[skip:] in chunks of at most batch_size.
+        
+        Returns
+        -------
+        int
+            Rows persisted counting from the start of `entries` (including
+            `skip`); stops at the first chunk that fails all retries.
+        """
+        done = skip
+        while done < len(entries):
+            chunk = entries[done:done + self._batch_size]
+            if not await self._persist(chunk):
+                break
+            done += len(chunk)
+        return done
+    
+    async def _persist(self, entries: List[Dict[str, Any]]) -> bool:
+        """Write rows with retry/backoff; True on success."""
         for attempt in range(1, self._retry_attempts + 1):
             try:
                 start_time = time.monotonic()
@@ -618,6 +877,7 @@ class AuditConsumer:
                 count = await self._audit_repo.create_batch(entries)
                 
                 latency_ms = (time.monotonic() - start_time) * 1000
+                self._flush_latency.record(latency_ms)
                 
                 self._events_persisted += count
                 self._flush_count += 1
@@ -635,9 +895,10 @@ class AuditConsumer:
                     },
                 )
                 
-                return  # Success
+                return True
                 
             except Exception as exc:
+                self._flush_failures += 1
                 logger.error(
                     "Failed to flush audit buffer",
                     extra={
@@ -651,16 +912,7 @@ class AuditConsumer:
                 )
                 
                 if attempt >= self._retry_attempts:
-                    # All retries exhausted, drop events
-                    self._events_dropped += len(entries)
-                    logger.critical(
-                        "Dropped audit events after all retry attempts",
-                        extra={
-                            "count": len(entries),
-                            "total_dropped": self._events_dropped,
-                        },
-                    )
-                    return
+                    return False
                 
                 # Wait before retry (exponential backoff)
                 backoff_seconds = 2 ** attempt
@@ -672,6 +924,8 @@ class AuditConsumer:
                     },
                 )
                 await asyncio.sleep(backoff_seconds)
+        
+        return False
     
     # ═══════════════════════════════════════════════════════════════════════
     # STATUS & METRICS
@@ -701,7 +955,16 @@ class AuditConsumer:
         return {
             "is_running": self._is_running,
             "buffer_size": len(self._buffer),
+            "queue_depth": len(self._buffer),
             "max_buffer_size": self._max_buffer_size,
+            "spill_enabled": self._spill is not None,
+            "spill_bytes": self._spill.size_bytes() if self._spill else 0,
+            "spill_overflowed": self._overflowed,
+            "pending_segments": len(self._pending_segments),
+            "events_spilled": self._events_spilled,
+            "events_replayed": self._events_replayed,
+            "flush_failures": self._flush_failures,
+            "flush_latency_ms": self._flush_latency.summary(),
             "batch_size": self._batch_size,
             "flush_interval_seconds": self._flush_interval,
             "events_received": self._events_received,
@@ -727,4 +990,28 @@ class AuditConsumer:
                 return val
         except Exception:
             pass
-        return default
\ No newline at end of file
+        return default
+    
+    def _get_config_bool(self, key: str, default: bool) -> bool:
+        """Get boolean config value with fallback."""
+        if self._config_manager is None:
+            return default
+        try:
+            val = self._config_manager.get(key)
+            if isinstance(val, bool):
+                return val
+        except Exception:
+            pass
+        return default
+    
+    def _get_config_str(self, key: str, default: str) -> str:
+        """Get string config value with fallback."""
+        if self._config_manager is None:
+            return default
+        try:
+            val = self._config_manager.get(key)
+            if isinstance(val, str):
+                return val
+        except Exception:
+            pass
+        return default
@@ -29,7 +29,10 @@ Lumen 2025 Compliance
 
 Architecture Notes
 ------------------
-- Uses batch inserts for high-throughput writes
+- Batch writes take plain row dicts (see AUDIT_COLUMNS), not ORM objects
+- PostgreSQL + psycopg: rows are streamed with COPY FROM STDIN
+- Other PostgreSQL drivers: one multi-row INSERT ... VALUES per chunk
+- SQLite / others: a single executemany INSERT
 - All queries use indexes for performance
 - Supports pagination for large result sets
 - Automatic retry on transient DB failures
@@ -38,11 +41,12 @@ Architecture Notes
 
 from __future__ import annotations
 
+import json
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING, Union
 
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import and_, desc, func, insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logging.logger import get_logger
@@ -54,6 +58,34 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+# Column order used by bulk writes (COPY and multi-row INSERT)
+AUDIT_COLUMNS: Tuple[str, ...] = (
+    "created_at",
+    "user_id",
+    "guild_id",
+    "channel_id",
+    "category",
+    "operation_type",
+    "operation_name",
+    "event_data",
+    "metadata",
+    "success",
+    "error_type",
+    "error_message",
+    "ip_address",
+    "user_agent",
+    "session_id",
+    "duration_ms",
+)
+
+_JSON_COLUMNS = frozenset({"event_data", "metadata"})
+
+# Rows per multi-row INSERT (16 columns stays well under the 65535 bind limit)
+_INSERT_CHUNK_ROWS = 1000
+
+AuditRow = Mapping[str, Any]
+
+
 class AuditRepository:
     """
     Data access layer for audit logs.
@@ -128,15 +160,29 @@ class AuditRepository:
             )
             raise
     
-    async def create_batch(self, audit_entries: List[AuditLog]) -> int:
+    async def create_batch(
+        self,
+        audit_entries: Sequence[Union[AuditRow, AuditLog]],
+    ) -> int:
         """
-        Create multiple audit log entries in a single transaction.
-        
+        Bulk-insert audit rows in a single transaction.
+
+        Rows are plain dicts keyed by AUDIT_COLUMNS (missing keys are NULL,
+        `created_at` defaults to now and `success` to True). AuditLog
+        instances are still accepted and are read as plain rows; they are
+        never added to the session. JSON columns may hold pre-serialized
+        JSON (bytes or str), which COPY sends without re-encoding.
+
+        Write strategy by backend:
+        - PostgreSQL + psycopg: COPY audit_logs (...) FROM STDIN
+        - Other PostgreSQL drivers: multi-row INSERT ... VALUES per chunk
+        - SQLite / others: executemany INSERT
+
         Parameters
         ----------
-        audit_entries : List[AuditLog]
-            List of audit log entries to create
-            
+        audit_entries : Sequence[Union[AuditRow, AuditLog]]
+            Rows to insert
+
         Returns
         -------
         int
@@ -144,38 +190,127 @@ class AuditRepository:
         """
         if not audit_entries:
             return 0
-        
+
         start_time = time.monotonic()
-        
+        rows = [self._normalize_row(entry) for entry in audit_entries]
+        method = "unknown"
+
         try:
             async with self._db_service.get_transaction() as session:
-                session.add_all(audit_entries)
-                await session.flush()
-            
+                dialect = session.get_bind().dialect
+
+                if dialect.name == "postgresql" and dialect.driver == "psycopg":
+                    method = "copy"
+                    await self._copy_rows(session, rows)
+                elif dialect.name == "postgresql":
+                    method = "multi_values"
+                    table = AuditLog.__table__
+                    values = [self._parsed_json_row(row) for row in rows]
+                    for offset in range(0, len(values), _INSERT_CHUNK_ROWS):
+                        await session.execute(
+                            insert(table).values(values[offset:offset + _INSERT_CHUNK_ROWS])
+                        )
+                else:
+                    method = "executemany"
+                    await session.execute(
+                        insert(AuditLog.__table__),
+                        [self._parsed_json_row(row) for row in rows],
+                    )
+
             latency_ms = (time.monotonic() - start_time) * 1000
-            
+
             logger.info(
                 "Batch audit log entries created",
                 extra={
-                    "count": len(audit_entries),
+                    "count": len(rows),
+                    "method": method,
                     "latency_ms": round(latency_ms, 2),
-                    "throughput_per_sec": round(len(audit_entries) / (latency_ms / 1000), 2),
+                    "throughput_per_sec": round(len(rows) / (latency_ms / 1000), 2) if latency_ms > 0 else 0,
                 },
             )
-            
-            return len(audit_entries)
-            
+
+            return len(rows)
+
         except Exception as exc:
             logger.error(
                 "Failed to create batch audit log entries",
                 extra={
-                    "count": len(audit_entries),
+                    "count": len(rows),
+                    "method": method,
                     "error": str(exc),
                     "error_type": type(exc).__name__,
                 },
                 exc_info=True,
             )
             raise
+
+    async def _copy_rows(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        """
+        Stream rows into audit_logs with COPY FROM STDIN (psycopg 3).
+
+        Runs on the session's own connection, so it shares the surrounding
+        transaction. JSON columns are sent as text and cast by the server.
+        """
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        copy_sql = (
+            f"COPY {AuditLog.__tablename__} ({', '.join(AUDIT_COLUMNS)}) FROM STDIN"
+        )
+
+        async with driver_connection.cursor() as cursor:
+            async with cursor.copy(copy_sql) as copy:
+                for row in rows:
+                    await copy.write_row(
+                        tuple(
+                            self._json_text(row[column]) if column in _JSON_COLUMNS else row[column]
+                            for column in AUDIT_COLUMNS
+                        )
+                    )
+
+    @staticmethod
+    def _normalize_row(entry: Union[AuditRow, AuditLog]) -> Dict[str, Any]:
+        """Project an entry onto AUDIT_COLUMNS with write-time defaults."""
+        if isinstance(entry, AuditLog):
+            row = {column: getattr(entry, column, None) for column in AUDIT_COLUMNS}
+        else:
+            row = {column: entry.get(column) for column in AUDIT_COLUMNS}
+
+        if row["created_at"] is None:
+            row["created_at"] = datetime.utcnow()
+        if row["success"] is None:
+            row["success"] = True
+
+        return row
+
+    @staticmethod
+    def _parsed_json_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse pre-serialized JSON columns for drivers that bind JSON values
+        (the JSON column type serializes them itself).
+        """
+        if not any(isinstance(row[column], (bytes, str)) for column in _JSON_COLUMNS):
+            return row
+        return {
+            **row,
+            **{
+                column: json.loads(row[column])
+                for column in _JSON_COLUMNS
+                if isinstance(row[column], (bytes, str))
+            },
+        }
+
+    @staticmethod
+    def _json_text(value: Any) -> Optional[str]:
+        """Serialize a JSON column value for COPY (str/bytes are pre-serialized JSON)."""
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        if isinstance(value, str):
+            return value
+        return json.dumps(value, default=str, separators=(",", ":"))
     
     # ═══════════════════════════════════════════════════════════════════════
     # QUERY OPERATIONS
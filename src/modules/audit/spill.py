@@ -0,0 +1,268 @@
+"""
+Audit Spill Log for Lumen (2025)
+
+Purpose
+-------
+Durable, append-only local segment files for audit rows that have been
+accepted by AuditConsumer but not yet written to the database. A crash or
+restart no longer loses buffered audit events: unflushed segments are
+replayed on the next start().
+
+Responsibilities
+----------------
+- Append audit rows to the active segment (JSON lines)
+- Seal the active segment when the flusher takes a batch
+- Read sealed / leftover segments back as rows
+- Delete segments once their rows are persisted
+- Report on-disk size for status/metrics
+
+Non-Responsibilities
+--------------------
+- No database writes (handled by AuditRepository)
+- No batching or retry policy (handled by AuditConsumer)
+- No event subscription
+
+Lumen 2025 Compliance
+---------------------
+- Strict layering: local file I/O only
+- Observability: structured logging for segment lifecycle
+- Graceful degradation: corrupt lines are skipped and counted
+
+Architecture Notes
+------------------
+- Segment files are named `audit-<seq>.seg` and sorted by sequence number
+- Appends are flushed to the OS per append() call (survives process
+  crashes; power-loss durability would additionally need fsync)
+- append() may run in a worker thread while the event loop deletes other
+  segments; the shared byte counter is guarded by a lock
+- Only one segment is ever active; sealed segments are immutable
+- `created_at` is stored as ISO-8601 and parsed back on read
+- Pre-serialized JSON columns (bytes) are written verbatim and read back
+  as parsed JSON
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional
+
+from src.core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AuditSpillLog:
+    """
+    Append-only segment files backing the AuditConsumer buffer.
+
+    Example
+    -------
+    >>> spill = AuditSpillLog(Path("data/audit_spill"))
+    >>> leftover = spill.open()          # segments left by a previous run
+    >>> spill.append([row])
+    >>> sealed = spill.seal()            # flusher takes the active segment
+    >>> spill.delete(sealed)             # after the rows are persisted
+    """
+
+    SEGMENT_PREFIX = "audit-"
+    SEGMENT_SUFFIX = ".seg"
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Initialize the spill log.
+
+        Parameters
+        ----------
+        directory : Path
+            Directory holding segment files (created on open()).
+        """
+        self._directory = directory
+        self._active_path: Optional[Path] = None
+        self._active_file: Optional[IO[str]] = None
+        self._active_rows: int = 0
+        self._next_sequence: int = 1
+        self._corrupt_lines: int = 0
+        self._total_bytes: int = 0
+        self._size_lock = threading.Lock()
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # LIFECYCLE
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def open(self) -> List[Path]:
+        """
+        Prepare the directory and return segments left by a previous run.
+
+        Returns
+        -------
+        List[Path]
+            Leftover segment paths in write order (to be replayed).
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        leftover: List[Path] = []
+        for path in self._directory.glob(f"{self.SEGMENT_PREFIX}*{self.SEGMENT_SUFFIX}"):
+            if path.stat().st_size == 0:
+                path.unlink(missing_ok=True)
+            else:
+                leftover.append(path)
+
+        leftover.sort(key=self._sequence_of)
+        self._total_bytes = sum(path.stat().st_size for path in leftover)
+
+        if leftover:
+            self._next_sequence = self._sequence_of(leftover[-1]) + 1
+            logger.warning(
+                "Audit spill segments found from previous run",
+                extra={
+                    "segments": len(leftover),
+                    "spill_bytes": self._total_bytes,
+                    "directory": str(self._directory),
+                },
+            )
+
+        return leftover
+
+    def close(self) -> None:
+        """Close the active segment (removing it if empty)."""
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+        if self._active_path is not None and self._active_rows == 0:
+            self._active_path.unlink(missing_ok=True)
+        self._active_path = None
+        self._active_rows = 0
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # WRITE PATH
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def append(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Append rows to the active segment and flush them to the OS."""
+        if self._active_file is None:
+            self._open_active()
+        assert self._active_file is not None
+
+        lines = [self._encode(row) for row in rows]
+        payload = "".join(lines)
+        self._active_file.write(payload)
+        self._active_file.flush()
+        self._active_rows += len(lines)
+        with self._size_lock:
+            self._total_bytes += len(payload.encode("utf-8"))
+
+    def seal(self) -> Optional[Path]:
+        """
+        Seal the active segment so new appends go to a fresh one.
+
+        Returns
+        -------
+        Optional[Path]
+            The sealed segment, or None if nothing was appended.
+        """
+        if self._active_file is None or self._active_rows == 0:
+            return None
+
+        sealed = self._active_path
+        self._active_file.close()
+        self._active_file = None
+        self._active_path = None
+        self._active_rows = 0
+        return sealed
+
+    def delete(self, path: Path) -> None:
+        """Remove a segment whose rows have been persisted."""
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return
+        path.unlink(missing_ok=True)
+        with self._size_lock:
+            self._total_bytes = max(self._total_bytes - size, 0)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # READ PATH
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def read(self, path: Path) -> List[Dict[str, Any]]:
+        """Load every row from a sealed segment (corrupt lines skipped)."""
+        rows: List[Dict[str, Any]] = []
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(self._decode(line))
+                except (ValueError, TypeError) as exc:
+                    self._corrupt_lines += 1
+                    logger.error(
+                        "Skipping corrupt audit spill line",
+                        extra={
+                            "segment": path.name,
+                            "error": str(exc),
+                            "error_type": type(exc).__name__,
+                        },
+                    )
+        return rows
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # STATUS
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def size_bytes(self) -> int:
+        """Total bytes across all segment files (tracked, no disk scan)."""
+        return self._total_bytes
+
+    @property
+    def corrupt_lines(self) -> int:
+        return self._corrupt_lines
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # INTERNAL HELPERS
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _open_active(self) -> None:
+        self._active_path = self._directory / (
+            f"{self.SEGMENT_PREFIX}{self._next_sequence:012d}{self.SEGMENT_SUFFIX}"
+        )
+        self._next_sequence += 1
+        self._active_file = self._active_path.open("a", encoding="utf-8")
+        self._active_rows = 0
+
+    def _sequence_of(self, path: Path) -> int:
+        stem = path.name[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)]
+        try:
+            return int(stem)
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def _encode(row: Dict[str, Any]) -> str:
+        created_at = row.get("created_at")
+        if isinstance(created_at, datetime):
+            row = {**row, "created_at": created_at.isoformat()}
+
+        # Pre-serialized JSON columns (bytes) are spliced in verbatim
+        raw = {key: value for key, value in row.items() if isinstance(value, bytes)}
+        if not raw:
+            return json.dumps(row, default=str, separators=(",", ":")) + "\n"
+
+        rest = {key: value for key, value in row.items() if key not in raw}
+        head = json.dumps(rest, default=str, separators=(",", ":"))[:-1]
+        fields = ",".join(
+            f"{json.dumps(key)}:{value.decode('utf-8')}" for key, value in raw.items()
+        )
+        return f"{head}{',' if rest else ''}{fields}}}\n"
+
+    @staticmethod
+    def _decode(line: str) -> Dict[str, Any]:
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise TypeError("spill line is not an object")
+        created_at = row.get("created_at")
+        if isinstance(created_at, str):
+            row["created_at"] = datetime.fromisoformat(created_at)
+        return row
@@ -14,6 +14,7 @@ Domain
 - Multi-hit attacks (configurable hits per turn)
 - Configurable retaliation (bosses can counter-attack)
 - Leader skill application to aggregate stats
+- Stat snapshot capture (once per encounter)
 
 LUMEN 2025 COMPLIANCE
 ---------------------
@@ -32,6 +33,11 @@ Design Decisions
 - Optional boss retaliation (exploration: yes, world boss: optional)
 - Victory: Boss HP reaches 0
 - Defeat: Player HP reaches 0 (if retaliation enabled)
+- Player stats captured once in build_encounter as a CombatStatSnapshot
+  carried on the Encounter; turn simulation is pure CPU (no DB queries)
+- Resolve mode: fixed stats make the fight a closed-form calculation,
+  so simulate_full_combat(resolve=True) skips the per-turn loop and
+  writes a compact summary log
 
 Dependencies
 ------------
@@ -40,6 +46,7 @@ Dependencies
 - ElementResolver: For element advantages (optional)
 - CombatFormulas: For damage calculation
 - HPScalingCalculator: For player HP damage
+- resolve_fixed_exchange: For O(1) combat resolution
 - ConfigManager: For PvE rules
 """
 
@@ -49,7 +56,13 @@ from typing import TYPE_CHECKING, Tuple
 
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
-from src.modules.combat.shared.encounter import Encounter, EncounterType, EnemyStats
+from src.modules.combat.shared.encounter import (
+    CombatStatSnapshot,
+    Encounter,
+    EncounterType,
+    EnemyStats,
+)
+from src.modules.combat.shared.resolver import ResolvedCombat, resolve_fixed_exchange
 
 if TYPE_CHECKING:
     from src.core.config.manager import ConfigManager
@@ -77,11 +90,13 @@ class AggregateEngine:
     Public Methods
     --------------
     - build_encounter(player_id, enemy_stats, enable_retaliation) -> Create encounter
+    - capture_stat_snapshot(player_id) -> Snapshot total power with leader bonus
     - calculate_player_stats(player_id) -> Get total power with leader bonus
     - calculate_player_damage(total_atk, boss_def, boss_elem) -> Damage to boss
     - calculate_boss_retaliation(boss_atk, total_def) -> Damage to player
     - simulate_turn(encounter) -> Execute one combat turn
     - simulate_full_combat(encounter) -> Run combat to completion
+    - resolve_combat(encounter) -> Resolve combat in O(1) (closed form)
     """
 
     def __init__(
@@ -164,15 +179,8 @@ class AggregateEngine:
         # Calculate player HP
         player_max_hp = self._player_base_hp + (player_level * self._player_hp_per_level)
 
-        # Get player's total power
-        total_atk, total_def, total_power = await self._power.get_player_total_power(
-            player_id
-        )
-
-        # Apply leader modifiers
-        leader_mods = await self._leader.get_leader_modifiers(player_id)
-        modified_atk = int(total_atk * leader_mods.atk_multiplier)
-        modified_def = int(total_def * leader_mods.def_multiplier)
+        # Capture player's total power with leader modifiers (once per encounter)
+        snapshot = await self.capture_stat_snapshot(player_id)
 
         # Create encounter
         encounter = Encounter(
@@ -186,6 +194,7 @@ class AggregateEngine:
             enemy_max_hp=enemy_stats.max_hp,
             player_team=[],  # No individual maidens tracked
             enemy_team=[enemy_stats],
+            stat_snapshot=snapshot,
         )
 
         self._logger.info(
@@ -194,8 +203,8 @@ class AggregateEngine:
                 "encounter_id": str(encounter.encounter_id),
                 "player_id": player_id,
                 "enemy_id": enemy_stats.enemy_id,
-                "player_atk": modified_atk,
-                "player_def": modified_def,
+                "player_atk": snapshot.attack,
+                "player_def": snapshot.defense,
                 "enemy_hp": enemy_stats.max_hp,
                 "retaliation": enable_retaliation,
             },
@@ -207,23 +216,45 @@ class AggregateEngine:
     # PUBLIC API - Combat Calculations
     # ========================================================================
 
-    async def calculate_player_stats(self, player_id: int) -> Tuple[int, int]:
+    async def capture_stat_snapshot(self, player_id: int) -> CombatStatSnapshot:
         """
-        Calculate total ATK/DEF with leader bonuses.
+        Capture immutable combat stats (total power with leader bonuses).
+        
+        This is the only place the engine touches the database; every
+        turn afterwards reads the snapshot carried on the Encounter.
         
         Args:
             player_id: Discord ID
         
         Returns:
-            Tuple of (total_atk, total_def) with leader bonuses
+            CombatStatSnapshot with leader bonuses applied
         """
-        total_atk, total_def, _ = await self._power.get_player_total_power(player_id)
+        total_atk, total_def, total_power = await self._power.get_player_total_power(
+            player_id
+        )
 
         leader_mods = await self._leader.get_leader_modifiers(player_id)
-        modified_atk = int(total_atk * leader_mods.atk_multiplier)
-        modified_def = int(total_def * leader_mods.def_multiplier)
 
-        return modified_atk, modified_def
+        return CombatStatSnapshot(
+            attack=int(total_atk * leader_mods.atk_multiplier),
+            defense=int(total_def * leader_mods.def_multiplier),
+            power=total_power,
+            atk_multiplier=leader_mods.atk_multiplier,
+            def_multiplier=leader_mods.def_multiplier,
+        )
+
+    async def calculate_player_stats(self, player_id: int) -> Tuple[int, int]:
+        """
+        Calculate total ATK/DEF with leader bonuses.
+        
+        Args:
+            player_id: Discord ID
+        
+        Returns:
+            Tuple of (total_atk, total_def) with leader bonuses
+        """
+        snapshot = await self.capture_stat_snapshot(player_id)
+        return snapshot.attack, snapshot.defense
 
     def calculate_player_damage(
         self, total_atk: int, boss_def: int, boss_elem: str = "neutral"
@@ -328,8 +359,9 @@ class AggregateEngine:
             )
             return encounter
 
-        # Calculate player stats
-        total_atk, total_def = await self.calculate_player_stats(encounter.player_id)
+        # Player stats from encounter snapshot (captured once, no DB per turn)
+        snapshot = await self._get_stat_snapshot(encounter)
+        total_atk, total_def = snapshot.attack, snapshot.defense
 
         # Player attacks boss
         player_damage = self.calculate_player_damage(
@@ -418,6 +450,7 @@ class AggregateEngine:
         encounter: Encounter,
         enable_retaliation: bool = True,
         max_turns: int = 1000,
+        resolve: bool = False,
     ) -> Encounter:
         """
         Simulate PvE combat to completion.
@@ -426,10 +459,14 @@ class AggregateEngine:
             encounter: Starting encounter state
             enable_retaliation: Whether boss counter-attacks
             max_turns: Maximum turns before forced end
+            resolve: Use closed-form resolution instead of turn loop
         
         Returns:
             Final encounter state
         """
+        if resolve:
+            return await self.resolve_combat(encounter, enable_retaliation, max_turns)
+
         self._logger.info(
             "Starting PvE combat simulation",
             extra={
@@ -457,4 +494,157 @@ class AggregateEngine:
             },
         )
 
-        return encounter
\ No newline at end of file
+        return encounter
+
+    async def resolve_combat(
+        self,
+        encounter: Encounter,
+        enable_retaliation: bool = True,
+        max_turns: int = 1000,
+    ) -> Encounter:
+        """
+        Resolve PvE combat in O(1) without simulating each turn.
+        
+        Produces the same outcome, final HP and turn count as
+        simulate_full_combat, but writes a single summary log entry
+        (plus victory/defeat) instead of one entry per attack.
+        
+        Args:
+            encounter: Starting encounter state
+            enable_retaliation: Whether boss counter-attacks
+            max_turns: Maximum turns before forced end
+        
+        Returns:
+            Final encounter state
+        """
+        if encounter.is_over:
+            return encounter
+
+        if not encounter.enemy_team or len(encounter.enemy_team) == 0:
+            self._logger.error(
+                "No enemy in encounter",
+                extra={"encounter_id": str(encounter.encounter_id)},
+            )
+            return encounter
+
+        boss = encounter.enemy_team[0]
+        if not isinstance(boss, EnemyStats):
+            self._logger.error(
+                "Enemy is not EnemyStats",
+                extra={"encounter_id": str(encounter.encounter_id)},
+            )
+            return encounter
+
+        snapshot = await self._get_stat_snapshot(encounter)
+        player_damage = self.calculate_player_damage(
+            snapshot.attack, boss.defense, boss.element
+        )
+        boss_damage = (
+            self.calculate_boss_retaliation(boss.attack, snapshot.defense)
+            if enable_retaliation
+            else 0
+        )
+
+        result = resolve_fixed_exchange(
+            player_hp=encounter.player_hp,
+            enemy_hp=encounter.enemy_hp,
+            player_damage=player_damage,
+            enemy_damage=boss_damage,
+            start_turn=encounter.turn,
+            max_turns=max_turns,
+            retaliation=enable_retaliation,
+            count_victory_turn=True,
+        )
+
+        self._apply_resolution(encounter, result, player_damage, boss_damage)
+
+        if result.turns_elapsed > 0 and not encounter.is_over:
+            self._logger.warning(
+                "PvE combat reached max turns",
+                extra={"encounter_id": str(encounter.encounter_id)},
+            )
+
+        self._logger.info(
+            "PvE combat resolved",
+            extra={
+                "encounter_id": str(encounter.encounter_id),
+                "winner": encounter.winner,
+                "turns": encounter.turn,
+                "player_damage": player_damage,
+                "boss_damage": boss_damage,
+            },
+        )
+
+        return encounter
+
+    # ========================================================================
+    # INTERNAL HELPERS
+    # ========================================================================
+
+    async def _get_stat_snapshot(self, encounter: Encounter) -> CombatStatSnapshot:
+        """
+        Get the encounter's stat snapshot, capturing it once if missing.
+        
+        Encounters restored from older serialized state may not carry a
+        snapshot; it is captured on first use and attached so later turns
+        stay DB-free.
+        """
+        if encounter.stat_snapshot is None:
+            encounter.stat_snapshot = await self.capture_stat_snapshot(
+                encounter.player_id
+            )
+        return encounter.stat_snapshot
+
+    def _apply_resolution(
+        self,
+        encounter: Encounter,
+        result: ResolvedCombat,
+        player_damage: int,
+        boss_damage: int,
+    ) -> None:
+        """Write closed-form result onto encounter with a compact log."""
+        if result.turns_elapsed == 0:
+            return
+
+        # Log entries carry the last turn actually fought
+        encounter.turn = encounter.turn + result.turns_elapsed - 1
+        encounter.enemy_hp = result.enemy_hp
+        encounter.player_hp = result.player_hp
+
+        encounter.add_log(
+            event_type="combat_summary",
+            actor="player",
+            target="boss",
+            damage=result.damage_dealt,
+            hp_remaining=encounter.enemy_hp,
+            metadata={
+                "turns": result.turns_elapsed,
+                "player_attacks": result.player_attacks,
+                "boss_attacks": result.enemy_attacks,
+                "damage_per_attack": player_damage,
+                "boss_damage_per_attack": boss_damage,
+                "damage_taken": result.damage_taken,
+                "hits": self._hits_per_attack,
+            },
+        )
+
+        if encounter.enemy_hp <= 0:
+            encounter.add_log(
+                event_type="victory",
+                actor="player",
+                target="boss",
+                damage=0,
+                hp_remaining=0,
+                metadata={"reason": "boss_defeated"},
+            )
+        elif encounter.player_hp <= 0:
+            encounter.add_log(
+                event_type="defeat",
+                actor="boss",
+                target="player",
+                damage=0,
+                hp_remaining=0,
+                metadata={"reason": "player_defeated"},
+            )
+
+        encounter.turn = result.final_turn
@@ -33,6 +33,10 @@ Design Decisions
 - Turn order: Player attacks first, then monster
 - Victory: Monster HP reaches 0
 - Defeat: Player HP reaches 0
+- Team stats captured once in build_encounter as a CombatStatSnapshot;
+  turns never re-query leader modifiers
+- Resolve mode: fixed stats make the fight a closed-form calculation,
+  so simulate_full_combat(resolve=True) skips the per-turn loop
 
 Dependencies
 ------------
@@ -41,21 +45,24 @@ Dependencies
 - ElementResolver: For element advantages
 - CombatFormulas: For damage calculation
 - HPScalingCalculator: For player HP damage
+- resolve_fixed_exchange: For O(1) combat resolution
 - ConfigManager: For monster stats and scaling
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+from typing import TYPE_CHECKING, List, Sequence, Tuple
 
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
 from src.modules.combat.shared.encounter import (
+    CombatStatSnapshot,
     Encounter,
     EncounterType,
     EnemyStats,
     MaidenStats,
 )
+from src.modules.combat.shared.resolver import ResolvedCombat, resolve_fixed_exchange
 
 if TYPE_CHECKING:
     from src.core.config.manager import ConfigManager
@@ -85,11 +92,13 @@ class ElementalTeamEngine:
     --------------
     - build_player_team(player_id) -> Build elemental team
     - build_encounter(player_id, floor) -> Create encounter state
+    - capture_stat_snapshot(team, player_id) -> Snapshot team stats
     - calculate_team_stats(team, leader_mods) -> Aggregate stats
     - calculate_player_damage(team_atk, monster_def, monster_elem) -> Damage to monster
     - calculate_monster_damage(monster_atk, team_def) -> Damage to player
     - simulate_turn(encounter) -> Execute one combat turn
     - simulate_full_combat(encounter) -> Run combat to completion
+    - resolve_combat(encounter) -> Resolve combat in O(1) (closed form)
     """
 
     def __init__(
@@ -192,38 +201,33 @@ class ElementalTeamEngine:
             extra={"player_id": player_id, "operation": "build_player_team"},
         )
 
-        # Get full power breakdown
-        breakdown = await self._power.get_power_breakdown(player_id, top_n=100)
-
-        # Group by element and select strongest per element
-        element_best: Dict[str, MaidenStats] = {}
+        # Best maiden per element from the materialized power index
+        index = await self._power.get_player_power_index(player_id)
         target_elements = {"infernal", "umbral", "earth", "tempest", "radiant", "abyssal"}
 
-        for maiden_data in breakdown.top_contributors:
-            element = maiden_data["element"].lower()
-
-            if element not in target_elements:
-                continue
-
-            if element in element_best:
-                # Already have a maiden for this element
-                continue
-
-            # Create MaidenStats
-            maiden_stats = MaidenStats(
-                maiden_id=maiden_data["maiden_id"],
-                maiden_base_id=maiden_data["maiden_base_id"],
-                element=element,
-                attack=maiden_data["attack"],
-                defense=maiden_data["defense"],
-                power=maiden_data["power"],
-                tier=maiden_data["tier"],
-                quantity=maiden_data["quantity"],
-            )
-
-            element_best[element] = maiden_stats
+        best_entries = sorted(
+            (
+                entry
+                for element, entry in index.best_by_element.items()
+                if element in target_elements
+            ),
+            key=lambda entry: entry["power"],
+            reverse=True,
+        )
 
-        team = list(element_best.values())
+        team = [
+            MaidenStats(
+                maiden_id=entry["maiden_id"],
+                maiden_base_id=entry["maiden_base_id"],
+                element=entry["element"],
+                attack=entry["attack"],
+                defense=entry["defense"],
+                power=entry["power"],
+                tier=entry["tier"],
+                quantity=entry["quantity"],
+            )
+            for entry in best_entries
+        ]
 
         self._logger.info(
             "Elemental team built",
@@ -257,8 +261,9 @@ class ElementalTeamEngine:
         player_id = InputValidator.validate_discord_id(player_id)
         floor = InputValidator.validate_positive_integer(floor, "floor")
 
-        # Build player team
+        # Build player team and capture its stats (once per encounter)
         team = await self.build_player_team(player_id)
+        snapshot = await self.capture_stat_snapshot(team, player_id)
 
         # Calculate player HP from player level
         player_level = await self._player_progression.get_player_level(player_id)
@@ -292,6 +297,7 @@ class ElementalTeamEngine:
             enemy_max_hp=monster_hp,
             player_team=team,
             enemy_team=[monster],
+            stat_snapshot=snapshot,
         )
 
         self._logger.info(
@@ -312,6 +318,29 @@ class ElementalTeamEngine:
     # PUBLIC API - Combat Calculations
     # ========================================================================
 
+    async def capture_stat_snapshot(
+        self, team: Sequence[MaidenStats], player_id: int
+    ) -> CombatStatSnapshot:
+        """
+        Capture immutable team stats with leader bonuses.
+        
+        Args:
+            team: List of maiden stats
+            player_id: For fetching leader modifiers
+        
+        Returns:
+            CombatStatSnapshot with leader bonuses applied
+        """
+        leader_mods = await self._leader.get_leader_modifiers(player_id)
+
+        return CombatStatSnapshot(
+            attack=int(sum(m.attack for m in team) * leader_mods.atk_multiplier),
+            defense=int(sum(m.defense for m in team) * leader_mods.def_multiplier),
+            power=sum(m.power for m in team),
+            atk_multiplier=leader_mods.atk_multiplier,
+            def_multiplier=leader_mods.def_multiplier,
+        )
+
     async def calculate_team_stats(
         self, team: Sequence[MaidenStats], player_id: int
     ) -> Tuple[int, int]:
@@ -447,10 +476,9 @@ class ElementalTeamEngine:
             self._logger.error("Enemy is not EnemyStats", extra={"encounter_id": str(encounter.encounter_id)})
             return encounter
 
-        # Calculate team stats
-        team_atk, team_def = await self.calculate_team_stats(
-            encounter.player_team, encounter.player_id
-        )
+        # Team stats from encounter snapshot (captured once, no DB per turn)
+        snapshot = await self._get_stat_snapshot(encounter)
+        team_atk, team_def = snapshot.attack, snapshot.defense
 
         # Player attacks monster
         player_damage = self.calculate_player_damage(
@@ -528,17 +556,23 @@ class ElementalTeamEngine:
 
         return encounter
 
-    async def simulate_full_combat(self, encounter: Encounter, max_turns: int = 100) -> Encounter:
+    async def simulate_full_combat(
+        self, encounter: Encounter, max_turns: int = 100, resolve: bool = False
+    ) -> Encounter:
         """
         Simulate combat to completion.
         
         Args:
             encounter: Starting encounter state
             max_turns: Maximum turns before forced draw (safety)
+            resolve: Use closed-form resolution instead of turn loop
         
         Returns:
             Final encounter state
         """
+        if resolve:
+            return await self.resolve_combat(encounter, max_turns)
+
         self._logger.info(
             "Starting full combat simulation",
             extra={
@@ -568,4 +602,140 @@ class ElementalTeamEngine:
             },
         )
 
-        return encounter
\ No newline at end of file
+        return encounter
+
+    async def resolve_combat(self, encounter: Encounter, max_turns: int = 100) -> Encounter:
+        """
+        Resolve combat in O(1) without simulating each turn.
+        
+        Produces the same outcome, final HP and turn count as
+        simulate_full_combat, but writes a single summary log entry
+        (plus victory/defeat) instead of one entry per attack.
+        
+        Args:
+            encounter: Starting encounter state
+            max_turns: Maximum turns before forced draw (safety)
+        
+        Returns:
+            Final encounter state
+        """
+        if encounter.is_over:
+            return encounter
+
+        if not encounter.enemy_team or len(encounter.enemy_team) == 0:
+            self._logger.error("No enemy in encounter", extra={"encounter_id": str(encounter.encounter_id)})
+            return encounter
+
+        monster = encounter.enemy_team[0]
+        if not isinstance(monster, EnemyStats):
+            self._logger.error("Enemy is not EnemyStats", extra={"encounter_id": str(encounter.encounter_id)})
+            return encounter
+
+        snapshot = await self._get_stat_snapshot(encounter)
+        player_damage = self.calculate_player_damage(
+            snapshot.attack, monster.defense, monster.element
+        )
+        monster_damage = self.calculate_monster_damage(monster.attack, snapshot.defense)
+
+        result = resolve_fixed_exchange(
+            player_hp=encounter.player_hp,
+            enemy_hp=encounter.enemy_hp,
+            player_damage=player_damage,
+            enemy_damage=monster_damage,
+            start_turn=encounter.turn,
+            max_turns=max_turns,
+            retaliation=True,
+            count_victory_turn=False,
+        )
+
+        self._apply_resolution(encounter, result, player_damage, monster_damage)
+
+        if result.turns_elapsed > 0 and not encounter.is_over:
+            self._logger.warning(
+                "Combat reached max turns",
+                extra={"encounter_id": str(encounter.encounter_id), "max_turns": max_turns},
+            )
+
+        self._logger.info(
+            "Combat resolved",
+            extra={
+                "encounter_id": str(encounter.encounter_id),
+                "winner": encounter.winner,
+                "turns": encounter.turn,
+                "final_player_hp": encounter.player_hp,
+                "final_enemy_hp": encounter.enemy_hp,
+            },
+        )
+
+        return encounter
+
+    # ========================================================================
+    # INTERNAL HELPERS
+    # ========================================================================
+
+    async def _get_stat_snapshot(self, encounter: Encounter) -> CombatStatSnapshot:
+        """
+        Get the encounter's stat snapshot, capturing it once if missing.
+        
+        Encounters restored from older serialized state may not carry a
+        snapshot; it is captured on first use and attached so later turns
+        stay DB-free.
+        """
+        if encounter.stat_snapshot is None:
+            encounter.stat_snapshot = await self.capture_stat_snapshot(
+                encounter.player_team, encounter.player_id
+            )
+        return encounter.stat_snapshot
+
+    def _apply_resolution(
+        self,
+        encounter: Encounter,
+        result: ResolvedCombat,
+        player_damage: int,
+        monster_damage: int,
+    ) -> None:
+        """Write closed-form result onto encounter with a compact log."""
+        if result.turns_elapsed == 0:
+            return
+
+        # Log entries carry the last turn actually fought
+        encounter.turn = encounter.turn + result.turns_elapsed - 1
+        encounter.enemy_hp = result.enemy_hp
+        encounter.player_hp = result.player_hp
+
+        encounter.add_log(
+            event_type="combat_summary",
+            actor="player",
+            target="monster",
+            damage=result.damage_dealt,
+            hp_remaining=encounter.enemy_hp,
+            metadata={
+                "turns": result.turns_elapsed,
+                "player_attacks": result.player_attacks,
+                "monster_attacks": result.enemy_attacks,
+                "damage_per_attack": player_damage,
+                "monster_damage_per_attack": monster_damage,
+                "damage_taken": result.damage_taken,
+            },
+        )
+
+        if encounter.enemy_hp <= 0:
+            encounter.add_log(
+                event_type="victory",
+                actor="player",
+                target="monster",
+                damage=0,
+                hp_remaining=0,
+                metadata={"reason": "monster_defeated"},
+            )
+        elif encounter.player_hp <= 0:
+            encounter.add_log(
+                event_type="defeat",
+                actor="monster",
+                target="player",
+                damage=0,
+                hp_remaining=0,
+                metadata={"reason": "player_defeated"},
+            )
+
+        encounter.turn = result.final_turn
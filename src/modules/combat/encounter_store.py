@@ -0,0 +1,362 @@
+"""
+Combat Encounter Store - LES 2025 Compliant
+===========================================
+
+Purpose
+-------
+Keeps ongoing combat encounters in Redis and writes resolved encounters to
+Postgres in batches, so turn-by-turn fights do not cost a Postgres
+transaction per saved turn.
+
+Domain
+------
+- Ongoing encounter state in Redis (JSON, TTL = ongoing encounter TTL)
+- Write-behind buffer of resolved encounters, flushed on a timer, when too
+  many are pending, or on shutdown
+- Restore a batch if its flush fails or is cancelled, so resolved
+  encounters are retried
+
+LUMEN 2025 COMPLIANCE
+---------------------
+✓ Pure storage - encounter rules and the Postgres write live in CombatService
+✓ Infrastructure via RedisService (resilience + metrics)
+✓ Config-driven - TTLs and flush cadence passed in by the service
+✓ Graceful degradation - a failed Redis save is reported so the caller can
+  write straight to Postgres
+✓ Observable - flush counters and structured logging
+
+Design Decisions
+----------------
+- Key layout:
+    combat:encounter:{encounter_id}   STRING (JSON)   EXPIRE ongoing TTL
+- A resolved encounter leaves Redis and waits in the buffer until flushed;
+  load() checks the buffer and the in-flight batch before Redis, so there is
+  no window where a just-resolved encounter cannot be read
+- Newer saves of the same encounter replace older buffered ones; a failed
+  batch is restored without overwriting anything saved since
+- When the caller persists an ongoing encounter elsewhere (Redis save
+  failed), its older Redis snapshot is discarded; if that delete fails too,
+  load() skips Redis for the encounter until a delete or newer save lands
+- delete() also removes the encounter from an in-flight batch (so a failed
+  flush does not restore it) and waits for that flush to finish, so the
+  caller's Postgres delete is ordered after the flush's insert
+- A crash loses at most one flush interval of resolved encounters; they are
+  replay/audit records, rewards are granted by the finalize_* calls
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set
+from uuid import UUID
+
+from src.core.logging.logger import get_logger
+from src.core.redis.service import RedisService
+from src.modules.shared.write_behind import WriteBehindFlusher
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+# ============================================================================
+# Data Models
+# ============================================================================
+
+
+@dataclass
+class EncounterRecord:
+    """
+    One encounter snapshot, as stored in Redis or written to Postgres.
+
+    Attributes:
+        encounter_id: Encounter UUID
+        player_id: Player's Discord ID
+        encounter_type: Combat type value (ascension, pvp, pve, ...)
+        encounter_data: Encounter.to_dict() payload
+        resolved_at: When combat resolved (None while ongoing)
+        expires_at: Expiration time for cleanup
+    """
+
+    encounter_id: UUID
+    player_id: int
+    encounter_type: str
+    encounter_data: Dict[str, Any]
+    resolved_at: Optional[datetime]
+    expires_at: datetime
+
+
+FlushCallback = Callable[[List[EncounterRecord]], Awaitable[None]]
+
+
+# ============================================================================
+# EncounterStore
+# ============================================================================
+
+
+class EncounterStore:
+    """
+    Redis hot-state store with write-behind for resolved encounters.
+
+    Public Methods
+    --------------
+    - save() -> Store an ongoing encounter in Redis or buffer a resolved one
+    - load() -> Encounter data from the buffer or Redis (None on miss)
+    - delete() -> Drop an encounter from Redis and the buffer
+    - discard_hot_state() -> Drop a superseded Redis snapshot
+    - flush() -> Write buffered resolved encounters
+    - start() / stop() -> Background flush loop lifecycle
+    - get_stats() -> Buffer and flush counters
+    """
+
+    KEY_PREFIX = "combat:encounter"
+
+    def __init__(
+        self,
+        flush_callback: FlushCallback,
+        ongoing_ttl_seconds: int = 3600,
+        flush_interval_seconds: float = 5.0,
+        max_pending: int = 500,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        self.log = logger or get_logger(__name__)
+        self._flush_callback = flush_callback
+        self._ongoing_ttl = max(1, ongoing_ttl_seconds)
+        self._max_pending = max(1, max_pending)
+
+        self._pending: Dict[UUID, EncounterRecord] = {}
+        self._in_flight: Dict[UUID, EncounterRecord] = {}
+        # Ongoing encounters whose Redis snapshot is older than Postgres
+        self._stale_hot_state: Set[UUID] = set()
+
+        self._flush_lock = asyncio.Lock()
+        self._flusher = WriteBehindFlusher(
+            self.flush,
+            lambda: len(self._pending),
+            flush_interval_seconds,
+            name="resolved encounter",
+            logger=self.log,
+        )
+
+        self._redis_saves: int = 0
+        self._redis_save_failures: int = 0
+        self._resolved_buffered: int = 0
+        self._flushes: int = 0
+        self._rows_flushed: int = 0
+        self._flush_failures: int = 0
+
+    # ========================================================================
+    # KEYS
+    # ========================================================================
+
+    def key_for(self, encounter_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}:{encounter_id}"
+
+    # ========================================================================
+    # READS / WRITES
+    # ========================================================================
+
+    async def save(self, record: EncounterRecord) -> bool:
+        """
+        Store an encounter snapshot.
+
+        Ongoing encounters are written to Redis with the ongoing TTL.
+        Resolved encounters are buffered for the next Postgres flush and
+        their Redis hot state is dropped.
+
+        Returns:
+            False only if an ongoing encounter could not be written to Redis
+            (the caller should persist it another way)
+        """
+        key = self.key_for(record.encounter_id)
+
+        if record.resolved_at is not None:
+            self._pending[record.encounter_id] = record
+            self._resolved_buffered += 1
+            self._flusher.ensure_started()
+            if len(self._pending) >= self._max_pending:
+                self._flusher.request()
+
+            try:
+                await RedisService.delete(key)
+            except Exception as exc:
+                # Harmless: the key expires with the ongoing TTL
+                self.log.debug(
+                    "Encounter hot state cleanup failed (non-critical)",
+                    extra={"encounter_id": str(record.encounter_id), "error": str(exc)},
+                )
+            return True
+
+        try:
+            saved = await RedisService.json_set(
+                key, "$", record.encounter_data, ttl_seconds=self._ongoing_ttl
+            )
+        except Exception as exc:
+            self.log.warning(
+                "Encounter hot state write failed",
+                extra={
+                    "encounter_id": str(record.encounter_id),
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                },
+            )
+            saved = False
+
+        if saved:
+            self._redis_saves += 1
+            self._stale_hot_state.discard(record.encounter_id)
+        else:
+            self._redis_save_failures += 1
+        return bool(saved)
+
+    async def load(self, encounter_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Encounter data from the write-behind buffer or Redis.
+
+        Returns:
+            Encounter.to_dict() payload, or None if neither holds it (the
+            caller should fall back to Postgres)
+        """
+        record = self._pending.get(encounter_id) or self._in_flight.get(encounter_id)
+        if record is not None:
+            return record.encounter_data
+
+        if encounter_id in self._stale_hot_state:
+            await self.discard_hot_state(encounter_id)
+            return None
+
+        try:
+            data = await RedisService.json_get(self.key_for(encounter_id))
+        except Exception as exc:
+            self.log.debug(
+                "Encounter hot state read failed (falling back to database)",
+                extra={
+                    "encounter_id": str(encounter_id),
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                },
+            )
+            return None
+
+        return data if isinstance(data, dict) else None
+
+    async def delete(self, encounter_id: UUID) -> bool:
+        """
+        Drop an encounter from Redis, the write-behind buffer and any
+        in-flight batch.
+
+        If the encounter is being flushed, waits for that flush to finish
+        before returning.
+
+        Returns:
+            True if the encounter was held by the store
+        """
+        removed = self._pending.pop(encounter_id, None) is not None
+        # _in_flight is the flushing batch itself: a failed flush won't restore it
+        in_flight = self._in_flight.pop(encounter_id, None) is not None
+        self._stale_hot_state.discard(encounter_id)
+
+        if in_flight:
+            removed = True
+            async with self._flush_lock:
+                pass
+
+        try:
+            removed = bool(await RedisService.delete(self.key_for(encounter_id))) or removed
+        except Exception as exc:
+            self.log.warning(
+                "Encounter hot state delete failed",
+                extra={
+                    "encounter_id": str(encounter_id),
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                },
+            )
+        return removed
+
+    async def discard_hot_state(self, encounter_id: UUID) -> None:
+        """
+        Drop an ongoing encounter's Redis snapshot that is now superseded
+        (e.g. a newer turn was written straight to Postgres).
+
+        If Redis is unreachable, load() ignores the snapshot until the
+        delete succeeds or a newer save replaces it.
+        """
+        try:
+            await RedisService.delete(self.key_for(encounter_id))
+        except Exception as exc:
+            self._stale_hot_state.add(encounter_id)
+            self.log.warning(
+                "Encounter hot state discard failed (ignored on load until retried)",
+                extra={
+                    "encounter_id": str(encounter_id),
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                },
+            )
+            return
+        self._stale_hot_state.discard(encounter_id)
+
+    # ========================================================================
+    # FLUSHING
+    # ========================================================================
+
+    async def flush(self) -> int:
+        """
+        Write buffered resolved encounters via the flush callback.
+
+        Returns:
+            Number of encounters flushed
+
+        Raises:
+            Exception: Whatever the flush callback raised (the batch is
+                restored first, so it is retried on the next flush)
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, {}
+            self._in_flight = batch
+
+            try:
+                await self._flush_callback(list(batch.values()))
+            except BaseException:
+                # Failed or cancelled (shutdown): the batch is retried
+                self._flush_failures += 1
+                for encounter_id, record in batch.items():
+                    self._pending.setdefault(encounter_id, record)
+                raise
+            finally:
+                self._in_flight = {}
+
+            self._flushes += 1
+            self._rows_flushed += len(batch)
+            return len(batch)
+
+    def start(self) -> None:
+        """Start the background flush loop (requires a running event loop)."""
+        self._flusher.start()
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write everything still buffered."""
+        await self._flusher.stop()
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Buffer size and save/flush counters."""
+        return {
+            "pending_encounters": len(self._pending),
+            "redis_saves": self._redis_saves,
+            "redis_save_failures": self._redis_save_failures,
+            "resolved_buffered": self._resolved_buffered,
+            "flushes": self._flushes,
+            "rows_flushed": self._rows_flushed,
+            "flush_failures": self._flush_failures,
+            "stale_hot_state": len(self._stale_hot_state),
+            "running": self._flusher.is_running,
+        }
@@ -161,38 +161,33 @@ class PvPEngine:
             extra={"player_id": player_id, "operation": "build_player_team"},
         )
 
-        # Get full power breakdown
-        breakdown = await self._power.get_power_breakdown(player_id, top_n=100)
-
-        # Group by element and select strongest per element
-        from typing import Dict
-
-        element_best: Dict[str, MaidenStats] = {}
+        # Best maiden per element from the materialized power index
+        index = await self._power.get_player_power_index(player_id)
         target_elements = {"infernal", "umbral", "earth", "tempest", "radiant", "abyssal"}
 
-        for maiden_data in breakdown.top_contributors:
-            element = maiden_data["element"].lower()
-
-            if element not in target_elements:
-                continue
-
-            if element in element_best:
-                continue
+        best_entries = sorted(
+            (
+                entry
+                for element, entry in index.best_by_element.items()
+                if element in target_elements
+            ),
+            key=lambda entry: entry["power"],
+            reverse=True,
+        )
 
-            maiden_stats = MaidenStats(
-                maiden_id=maiden_data["maiden_id"],
-                maiden_base_id=maiden_data["maiden_base_id"],
-                element=element,
-                attack=maiden_data["attack"],
-                defense=maiden_data["defense"],
-                power=maiden_data["power"],
-                tier=maiden_data["tier"],
-                quantity=maiden_data["quantity"],
+        team = [
+            MaidenStats(
+                maiden_id=entry["maiden_id"],
+                maiden_base_id=entry["maiden_base_id"],
+                element=entry["element"],
+                attack=entry["attack"],
+                defense=entry["defense"],
+                power=entry["power"],
+                tier=entry["tier"],
+                quantity=entry["quantity"],
             )
-
-            element_best[element] = maiden_stats
-
-        team = list(element_best.values())
+            for entry in best_entries
+        ]
 
         self._logger.info(
             "PvP team built",
@@ -29,7 +29,8 @@ LUMEN 2025 COMPLIANCE
 Design Decisions
 ----------------
 - Engines are pure logic, service handles I/O
-- Encounter state serialized to DB for mid-battle saves
+- Ongoing encounter state kept in Redis for mid-battle saves; resolved
+  encounters written to DB in batches (EncounterStore write-behind)
 - Rewards calculated from config, not hardcoded
 - Ascension progress auto-advances on victory
 - Tokens automatically awarded via AscensionTokenService
@@ -50,7 +51,7 @@ Dependencies
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy.dialects.postgresql import insert  # SAFETY: For idempotency ON CONFLICT
@@ -62,6 +63,7 @@ from src.core.validation.input_validator import InputValidator
 from src.database.models.economy.reward_claim import RewardClaim  # SAFETY: Idempotency
 from src.modules.combat.aggregate_engine import AggregateEngine
 from src.modules.combat.elemental_engine import ElementalTeamEngine
+from src.modules.combat.encounter_store import EncounterRecord, EncounterStore
 from src.modules.combat.pvp_engine import PvPEngine
 from src.modules.combat.shared.encounter import Encounter, EnemyStats
 from src.modules.shared.base_repository import BaseRepository
@@ -111,9 +113,10 @@ class CombatService(BaseService):
     - finalize_pve_victory(player_id, enemy_id, encounter_id) -> Award rewards
     
     State Management:
-    - save_encounter(encounter) -> Persist to DB (future)
-    - load_encounter(encounter_id) -> Load from DB (future)
-    - delete_encounter(encounter_id) -> Clean up (future)
+    - save_encounter(encounter) -> Redis (ongoing) / batched DB write (resolved)
+    - load_encounter(encounter_id) -> Load from Redis, buffer or DB
+    - delete_encounter(encounter_id) -> Clean up
+    - flush_encounters() / shutdown() -> Write buffered resolved encounters
     """
 
     def __init__(
@@ -169,6 +172,24 @@ class CombatService(BaseService):
             self._config.get("combat.encounter_ttl_resolved_hours", default=24)
         )
 
+        # Ongoing encounters in Redis, resolved ones written behind in batches
+        self._encounter_store = EncounterStore(
+            flush_callback=self._persist_encounters,
+            ongoing_ttl_seconds=self._encounter_ttl_ongoing * 3600,
+            flush_interval_seconds=float(
+                self._config.get("combat.encounter_flush.interval_seconds", default=5.0)
+            ),
+            max_pending=int(
+                self._config.get("combat.encounter_flush.max_pending", default=500)
+            ),
+            logger=self.log,
+        )
+
+        # Auto-battle PvE fights resolve in closed form (compact log)
+        self._pve_resolve_mode = bool(
+            self._config.get("combat.pve.resolve_mode", default=True)
+        )
+
         self.log.info("CombatService initialized with encounter persistence")
 
     # ========================================================================
@@ -809,7 +830,7 @@ class CombatService(BaseService):
 
         # Simulate combat
         encounter = await self._aggregate_engine.simulate_full_combat(
-            encounter, enable_retaliation
+            encounter, enable_retaliation, resolve=self._pve_resolve_mode
         )
 
         # Mark resolved
@@ -988,70 +1009,47 @@ class CombatService(BaseService):
             raise
 
     # ========================================================================
-    # FUTURE: Encounter State Persistence
+    # PUBLIC API - Encounter State Persistence
     # ========================================================================
 
     async def save_encounter(self, encounter: Encounter) -> bool:
         """
-        Save encounter state to database for resumption.
+        Save encounter state for resumption and replay.
 
-        Enables mid-battle save/resume and combat log replay.
+        Ongoing encounters live in Redis (TTL = ongoing encounter TTL), so
+        saving a turn does not touch Postgres. Resolved encounters are
+        buffered and written to CombatEncounter in batches. If Redis is
+        unavailable, ongoing encounters are written to Postgres directly and
+        their older Redis snapshot is discarded, so loads see the new turn.
 
         Args:
             encounter: Encounter to save
 
         Returns:
-            True if saved successfully
+            True if saved (or buffered) successfully
         """
-        from src.database.models.combat.encounter import CombatEncounter
-
         self.log_operation("save_encounter", encounter_id=str(encounter.encounter_id))
 
-        try:
-            async with DatabaseService.get_transaction() as session:
-                # Calculate expiration time
-                if encounter.resolved_at:
-                    ttl_hours = self._encounter_ttl_resolved
-                else:
-                    ttl_hours = self._encounter_ttl_ongoing
-
-                expires_at = datetime.now(timezone.utc) + timedelta(hours=ttl_hours)
-
-                # Check if encounter already exists
-                existing = await self._encounter_repo.find_one_where(
-                    session,
-                    CombatEncounter.encounter_id == encounter.encounter_id,
-                )
-
-                if existing:
-                    # Update existing encounter
-                    existing.encounter_data = encounter.to_dict()
-                    existing.resolved_at = encounter.resolved_at
-                    existing.expires_at = expires_at
-                else:
-                    # Create new encounter record
-                    encounter_record = CombatEncounter(
-                        encounter_id=encounter.encounter_id,
-                        player_id=encounter.player_id,
-                        encounter_type=encounter.type.value,
-                        encounter_data=encounter.to_dict(),
-                        resolved_at=encounter.resolved_at,
-                        expires_at=expires_at,
-                    )
-                    session.add(encounter_record)
+        record = self._build_encounter_record(encounter)
 
-                self.log.info(
-                    "Encounter saved successfully",
-                    extra={
-                        "encounter_id": str(encounter.encounter_id),
-                        "player_id": encounter.player_id,
-                        "type": encounter.type.value,
-                        "resolved": encounter.resolved_at is not None,
-                        "expires_at": expires_at.isoformat(),
-                    },
-                )
+        if await self._encounter_store.save(record):
+            self.log.debug(
+                "Encounter saved",
+                extra={
+                    "encounter_id": str(encounter.encounter_id),
+                    "player_id": encounter.player_id,
+                    "type": encounter.type.value,
+                    "resolved": encounter.resolved_at is not None,
+                    "expires_at": record.expires_at.isoformat(),
+                },
+            )
+            return True
 
-                return True
+        # Redis unavailable: persist the ongoing encounter directly
+        try:
+            await self._persist_encounters([record])
+            await self._encounter_store.discard_hot_state(record.encounter_id)
+            return True
 
         except Exception as e:
             self.log.error(
@@ -1063,7 +1061,7 @@ class CombatService(BaseService):
 
     async def load_encounter(self, encounter_id: UUID) -> Optional[Encounter]:
         """
-        Load encounter state from database.
+        Load encounter state from Redis, the write-behind buffer or database.
 
         Enables resuming battles from saved state.
 
@@ -1078,6 +1076,10 @@ class CombatService(BaseService):
         self.log_operation("load_encounter", encounter_id=str(encounter_id))
 
         try:
+            data = await self._encounter_store.load(encounter_id)
+            if data is not None:
+                return Encounter.from_dict(data)
+
             async with DatabaseService.get_session() as session:
                 encounter_record = await self._encounter_repo.find_one_where(
                     session,
@@ -1129,7 +1131,7 @@ class CombatService(BaseService):
 
     async def delete_encounter(self, encounter_id: UUID) -> bool:
         """
-        Delete encounter from database.
+        Delete encounter from Redis, the write-behind buffer and database.
 
         Used for cleanup of expired or completed encounters.
 
@@ -1144,6 +1146,8 @@ class CombatService(BaseService):
         self.log_operation("delete_encounter", encounter_id=str(encounter_id))
 
         try:
+            held_by_store = await self._encounter_store.delete(encounter_id)
+
             async with DatabaseService.get_transaction() as session:
                 encounter_record = await self._encounter_repo.find_one_where(
                     session,
@@ -1151,11 +1155,12 @@ class CombatService(BaseService):
                 )
 
                 if not encounter_record:
-                    self.log.info(
-                        "Encounter not found for deletion",
-                        extra={"encounter_id": str(encounter_id)},
-                    )
-                    return False
+                    if not held_by_store:
+                        self.log.info(
+                            "Encounter not found for deletion",
+                            extra={"encounter_id": str(encounter_id)},
+                        )
+                    return held_by_store
 
                 await session.delete(encounter_record)
 
@@ -1173,3 +1178,85 @@ class CombatService(BaseService):
                 exc_info=True,
             )
             return False
+
+    async def flush_encounters(self) -> int:
+        """
+        Write buffered resolved encounters to the database now.
+
+        Returns:
+            Number of encounters written
+        """
+        return await self._encounter_store.flush()
+
+    async def shutdown(self) -> None:
+        """Stop the encounter flusher and write everything still buffered."""
+        await self._encounter_store.stop()
+
+    def get_encounter_store_stats(self) -> Dict[str, Any]:
+        """Encounter store buffer and flush counters."""
+        return self._encounter_store.get_stats()
+
+    # ========================================================================
+    # PRIVATE HELPERS - Encounter Persistence
+    # ========================================================================
+
+    def _build_encounter_record(self, encounter: Encounter) -> EncounterRecord:
+        """Snapshot an encounter with its TTL-based expiration time."""
+        if encounter.resolved_at:
+            ttl_hours = self._encounter_ttl_resolved
+        else:
+            ttl_hours = self._encounter_ttl_ongoing
+
+        return EncounterRecord(
+            encounter_id=encounter.encounter_id,
+            player_id=encounter.player_id,
+            encounter_type=encounter.type.value,
+            encounter_data=encounter.to_dict(),
+            resolved_at=encounter.resolved_at,
+            expires_at=datetime.now(timezone.utc) + timedelta(hours=ttl_hours),
+        )
+
+    async def _persist_encounters(self, records: List[EncounterRecord]) -> None:
+        """
+        Upsert encounter snapshots in one transaction and statement.
+
+        Flush callback for the encounter store (and the direct path when
+        Redis is unavailable).
+
+        Args:
+            records: Encounter snapshots, at most one per encounter_id
+        """
+        from src.database.models.combat.encounter import CombatEncounter
+
+        stmt = insert(CombatEncounter).values(
+            [
+                {
+                    "encounter_id": record.encounter_id,
+                    "player_id": record.player_id,
+                    "encounter_type": record.encounter_type,
+                    "encounter_data": record.encounter_data,
+                    "resolved_at": record.resolved_at,
+                    "expires_at": record.expires_at,
+                }
+                for record in records
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CombatEncounter.encounter_id],
+            set_={
+                "encounter_data": stmt.excluded.encounter_data,
+                "resolved_at": stmt.excluded.resolved_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+
+        async with DatabaseService.get_transaction() as session:
+            await session.execute(stmt)
+
+        self.log.info(
+            "Encounters persisted",
+            extra={
+                "count": len(records),
+                "resolved": sum(1 for record in records if record.resolved_at is not None),
+            },
+        )
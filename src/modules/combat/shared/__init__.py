@@ -9,6 +9,7 @@ from src.modules.combat.shared.elements import ElementResolver
 from src.modules.combat.shared.encounter import (
     CombatLogEntry,
     CombatOutcome,
+    CombatStatSnapshot,
     Encounter,
     EncounterType,
     EnemyStats,
@@ -16,6 +17,7 @@ from src.modules.combat.shared.encounter import (
 )
 from src.modules.combat.shared.formulas import CombatFormulas, DamageInput, DamageResult
 from src.modules.combat.shared.hp_scaling import HPScalingCalculator
+from src.modules.combat.shared.resolver import ResolvedCombat, resolve_fixed_exchange
 
 __all__ = [
     # Encounter
@@ -25,6 +27,7 @@ __all__ = [
     "MaidenStats",
     "EnemyStats",
     "CombatLogEntry",
+    "CombatStatSnapshot",
     # Formulas
     "CombatFormulas",
     "DamageInput",
@@ -33,4 +36,7 @@ __all__ = [
     "ElementResolver",
     # HP Scaling
     "HPScalingCalculator",
+    # Resolver
+    "ResolvedCombat",
+    "resolve_fixed_exchange",
 ]
\ No newline at end of file
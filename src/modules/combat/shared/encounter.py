@@ -110,6 +110,23 @@ class EnemyStats:
     level: Optional[int] = None
 
 
+@dataclass(frozen=True)
+class CombatStatSnapshot:
+    """
+    Player combat stats snapshot.
+    
+    Immutable snapshot of the player's aggregate stats (with leader
+    bonuses applied) captured once at encounter creation, so turn
+    simulation never has to go back to the database.
+    """
+
+    attack: int
+    defense: int
+    power: int
+    atk_multiplier: float = 1.0
+    def_multiplier: float = 1.0
+
+
 @dataclass
 class CombatLogEntry:
     """
@@ -154,6 +171,7 @@ class Encounter:
         enemy_max_hp: Maximum enemy/monster HP
         player_team: List of maiden stats for player
         enemy_team: Optional list of enemy maiden stats (PvP) or None (PvE)
+        stat_snapshot: Player combat stats captured at encounter creation
         log: Turn-by-turn combat log
         created_at: Encounter creation timestamp
         resolved_at: Encounter resolution timestamp (None if ongoing)
@@ -179,6 +197,9 @@ class Encounter:
     floor: Optional[int] = None  # For Ascension
     node_id: Optional[str] = None  # For Exploration
     
+    # Stats captured at creation (None = resolve lazily)
+    stat_snapshot: Optional[CombatStatSnapshot] = None
+    
     # Log
     log: List[CombatLogEntry] = field(default_factory=list)
     
@@ -310,6 +331,17 @@ class Encounter:
                 if self.enemy_team
                 else None
             ),
+            "stat_snapshot": (
+                {
+                    "attack": self.stat_snapshot.attack,
+                    "defense": self.stat_snapshot.defense,
+                    "power": self.stat_snapshot.power,
+                    "atk_multiplier": self.stat_snapshot.atk_multiplier,
+                    "def_multiplier": self.stat_snapshot.def_multiplier,
+                }
+                if self.stat_snapshot
+                else None
+            ),
             "log": [
                 {
                     "turn": entry.turn,
@@ -386,6 +418,18 @@ class Encounter:
                         )
                     )
 
+        # Reconstruct stat snapshot
+        stat_snapshot = None
+        if data.get("stat_snapshot"):
+            snap = data["stat_snapshot"]
+            stat_snapshot = CombatStatSnapshot(
+                attack=snap["attack"],
+                defense=snap["defense"],
+                power=snap.get("power", 0),
+                atk_multiplier=snap.get("atk_multiplier", 1.0),
+                def_multiplier=snap.get("def_multiplier", 1.0),
+            )
+
         # Reconstruct log
         log = [
             CombatLogEntry(
@@ -415,6 +459,7 @@ class Encounter:
             enemy_max_hp=data["enemy_max_hp"],
             player_team=player_team,
             enemy_team=enemy_team,
+            stat_snapshot=stat_snapshot,
             log=log,
             created_at=datetime.fromisoformat(data["created_at"]),
             resolved_at=(
@@ -0,0 +1,213 @@
+"""
+Closed-Form Combat Resolver - LES 2025 Compliant
+=================================================
+
+Purpose
+-------
+Resolves fixed-stat combat in O(1) instead of looping turn by turn.
+When player and enemy damage per turn are constant for a whole fight,
+turns-to-kill on each side are simple ceiling divisions.
+
+Domain
+------
+- Turns-to-kill calculation (both sides)
+- Outcome, final HP and turn count resolution
+- Max-turn cutoff handling
+
+LUMEN 2025 COMPLIANCE
+---------------------
+✓ Pure calculation - no side effects
+✓ Type-safe - complete type hints
+✓ Stateless - can be called from any context
+✓ Deterministic - same inputs = same outputs
+
+Design Decisions
+----------------
+- Player always strikes first each turn (matches the engines)
+- Non-positive damage means that side never lands a kill
+- count_victory_turn mirrors whether the iterative engine increments
+  the turn counter on the killing blow (AggregateEngine does,
+  ElementalTeamEngine does not)
+- Results must match iterative simulation exactly (differential tested)
+
+Dependencies
+------------
+None - pure calculation
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.modules.combat.shared.encounter import CombatOutcome
+
+
+# ============================================================================
+# Data Models
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class ResolvedCombat:
+    """
+    Closed-form combat result.
+
+    Attributes:
+        outcome: VICTORY, DEFEAT, or ONGOING (max turns reached)
+        turns_elapsed: Turns advanced from the starting turn
+        final_turn: Turn counter after resolution
+        player_hp: Final player HP
+        enemy_hp: Final enemy HP
+        damage_dealt: Total damage dealt to enemy
+        damage_taken: Total damage taken by player
+        player_attacks: Number of player attacks landed
+        enemy_attacks: Number of enemy attacks landed
+    """
+
+    outcome: CombatOutcome
+    turns_elapsed: int
+    final_turn: int
+    player_hp: int
+    enemy_hp: int
+    damage_dealt: int
+    damage_taken: int
+    player_attacks: int
+    enemy_attacks: int
+
+
+# ============================================================================
+# Resolver
+# ============================================================================
+
+
+def turns_to_kill(hp: int, damage_per_turn: int) -> Optional[int]:
+    """
+    Number of hits needed to bring hp to zero.
+
+    Args:
+        hp: Remaining HP
+        damage_per_turn: Damage landed per hit
+
+    Returns:
+        Hit count, or None if damage can never kill
+    """
+    if hp <= 0:
+        return 0
+    if damage_per_turn <= 0:
+        return None
+    return -(-hp // damage_per_turn)
+
+
+def resolve_fixed_exchange(
+    player_hp: int,
+    enemy_hp: int,
+    player_damage: int,
+    enemy_damage: int,
+    start_turn: int,
+    max_turns: int,
+    retaliation: bool = True,
+    count_victory_turn: bool = True,
+) -> ResolvedCombat:
+    """
+    Resolve a fixed-damage exchange without iterating.
+
+    Each turn the player hits first; if the enemy survives and
+    retaliation is enabled, the enemy hits back.
+
+    Args:
+        player_hp: Starting player HP
+        enemy_hp: Starting enemy HP
+        player_damage: Damage player deals per turn
+        enemy_damage: Damage enemy deals per turn
+        start_turn: Current turn counter
+        max_turns: Turn counter limit (exclusive)
+        retaliation: Whether the enemy strikes back
+        count_victory_turn: Whether the killing turn increments the counter
+
+    Returns:
+        ResolvedCombat with final state
+
+    Example:
+        >>> r = resolve_fixed_exchange(100, 1000, 300, 20, 0, 1000)
+        >>> (r.outcome.value, r.final_turn, r.player_hp)
+        ('victory', 4, 40)
+    """
+    if player_hp <= 0 or enemy_hp <= 0:
+        return ResolvedCombat(
+            outcome=_outcome_from_hp(player_hp, enemy_hp),
+            turns_elapsed=0,
+            final_turn=start_turn,
+            player_hp=player_hp,
+            enemy_hp=enemy_hp,
+            damage_dealt=0,
+            damage_taken=0,
+            player_attacks=0,
+            enemy_attacks=0,
+        )
+
+    available = max(max_turns - start_turn, 0)
+    kill_turn = turns_to_kill(enemy_hp, player_damage)
+    death_turn = turns_to_kill(player_hp, enemy_damage) if retaliation else None
+
+    # Player strikes first, so a tie goes to the player
+    if kill_turn is not None and kill_turn <= available and (
+        death_turn is None or kill_turn <= death_turn
+    ):
+        enemy_attacks = kill_turn - 1 if retaliation else 0
+        final_player_hp = max(player_hp - enemy_attacks * enemy_damage, 0)
+        return ResolvedCombat(
+            outcome=CombatOutcome.VICTORY,
+            turns_elapsed=kill_turn,
+            final_turn=start_turn + (kill_turn if count_victory_turn else kill_turn - 1),
+            player_hp=final_player_hp,
+            enemy_hp=0,
+            damage_dealt=enemy_hp,
+            damage_taken=player_hp - final_player_hp,
+            player_attacks=kill_turn,
+            enemy_attacks=enemy_attacks,
+        )
+
+    if death_turn is not None and death_turn <= available:
+        final_enemy_hp = max(enemy_hp - death_turn * player_damage, 0)
+        return ResolvedCombat(
+            outcome=CombatOutcome.DEFEAT,
+            turns_elapsed=death_turn,
+            final_turn=start_turn + death_turn,
+            player_hp=0,
+            enemy_hp=final_enemy_hp,
+            damage_dealt=enemy_hp - final_enemy_hp,
+            damage_taken=player_hp,
+            player_attacks=death_turn,
+            enemy_attacks=death_turn,
+        )
+
+    # Max turns reached with both sides standing
+    enemy_attacks = available if retaliation else 0
+    final_enemy_hp = max(enemy_hp - available * max(player_damage, 0), 0)
+    final_player_hp = max(player_hp - enemy_attacks * max(enemy_damage, 0), 0)
+    return ResolvedCombat(
+        outcome=CombatOutcome.ONGOING,
+        turns_elapsed=available,
+        final_turn=start_turn + available,
+        player_hp=final_player_hp,
+        enemy_hp=final_enemy_hp,
+        damage_dealt=enemy_hp - final_enemy_hp,
+        damage_taken=player_hp - final_player_hp,
+        player_attacks=available,
+        enemy_attacks=enemy_attacks,
+    )
+
+
+# ============================================================================
+# INTERNAL HELPERS
+# ============================================================================
+
+
+def _outcome_from_hp(player_hp: int, enemy_hp: int) -> CombatOutcome:
+    """Outcome for an already-finished (or unstarted) exchange."""
+    if player_hp <= 0:
+        return CombatOutcome.DEFEAT
+    if enemy_hp <= 0:
+        return CombatOutcome.VICTORY
+    return CombatOutcome.ONGOING
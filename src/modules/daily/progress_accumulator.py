@@ -0,0 +1,329 @@
+"""
+Daily Quest Progress Accumulator - LES 2025 Compliant
+=====================================================
+
+Purpose
+-------
+Coalesces high-frequency daily quest progress increments (combat,
+exploration) in memory and writes them to Postgres in batches, instead of
+one locked row update per increment.
+
+Domain
+------
+- Buffer increments per (player, quest, day)
+- Keep the last durable progress/completion state per (player, day) so
+  reads and goal checks merge durable + pending without a query
+- Hand batches to a flush callback on a timer, when too many players are
+  pending, or on demand (goal crossed, reward claim, shutdown)
+- Restore a batch if its flush fails or is cancelled, so increments are
+  retried
+
+LUMEN 2025 COMPLIANCE
+---------------------
+✓ Pure buffering - persistence and quest rules live in DailyQuestService
+✓ Config-driven - flush interval and batch trigger passed in by the service
+✓ Observable - flush counters and structured logging
+✓ Graceful degradation - failed flushes keep their increments pending
+
+Design Decisions
+----------------
+- In-process buffer: every increment is applied by exactly one process, so
+  no cross-process hand-off is needed. A crash loses at most one flush
+  interval of progress (never completions or rewards, which flush
+  immediately)
+- A flush takes (swaps out) the pending increments before awaiting the
+  database, so increments arriving mid-flush land in the next batch
+- Durable state is refreshed from the locked rows on every flush
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.core.logging.logger import get_logger
+from src.modules.shared.write_behind import WriteBehindFlusher
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+# ============================================================================
+# Data Models
+# ============================================================================
+
+
+@dataclass
+class QuestProgressState:
+    """
+    Durable and pending quest progress for one player on one day.
+
+    Attributes:
+        player_id: Player's Discord ID
+        quest_date: Quest day
+        progress: Durable progress (as of the last load or flush)
+        completed: Durable completion flags
+        pending: Increments not yet written to Postgres
+        pending_context: Command/system context of the latest pending
+            increment per quest (recorded in the flush audit entry)
+    """
+
+    player_id: int
+    quest_date: date
+    progress: Dict[str, int] = field(default_factory=dict)
+    completed: Dict[str, bool] = field(default_factory=dict)
+    pending: Dict[str, int] = field(default_factory=dict)
+    pending_context: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    def current_progress(self, quest_id: str) -> int:
+        """Durable + pending progress for a quest."""
+        return self.progress.get(quest_id, 0) + self.pending.get(quest_id, 0)
+
+    def merged_progress(self) -> Dict[str, int]:
+        """Durable progress with pending increments applied."""
+        merged = dict(self.progress)
+        for quest_id, amount in self.pending.items():
+            merged[quest_id] = merged.get(quest_id, 0) + amount
+        return merged
+
+
+StateKey = Tuple[int, date]
+
+# (player_id, quest_date, pending increments, context per quest)
+PendingBatchEntry = Tuple[int, date, Dict[str, int], Dict[str, Optional[str]]]
+
+FlushCallback = Callable[[List[PendingBatchEntry]], Awaitable[None]]
+
+
+# ============================================================================
+# QuestProgressAccumulator
+# ============================================================================
+
+
+class QuestProgressAccumulator:
+    """
+    In-memory write-coalescing buffer for daily quest progress.
+
+    Public Methods
+    --------------
+    - get_state() / put_state() -> Cached durable + pending state
+    - add() -> Buffer an increment
+    - flush() -> Write pending increments (all, or selected players)
+    - mark_flushed() -> Refresh durable state after a successful write
+    - start() / stop() -> Background flush loop lifecycle
+    - get_stats() -> Buffer and flush counters
+    """
+
+    def __init__(
+        self,
+        flush_callback: FlushCallback,
+        flush_interval_seconds: float = 5.0,
+        max_pending_players: int = 1000,
+        max_cached_states: int = 10_000,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        self.log = logger or get_logger(__name__)
+        self._flush_callback = flush_callback
+        self._max_pending_players = max(1, max_pending_players)
+        self._max_cached_states = max(1, max_cached_states)
+
+        self._states: Dict[StateKey, QuestProgressState] = {}
+        self._dirty: Dict[StateKey, None] = {}  # insertion-ordered set
+
+        self._flush_lock = asyncio.Lock()
+        self._flusher = WriteBehindFlusher(
+            self.flush,
+            lambda: len(self._dirty),
+            flush_interval_seconds,
+            name="daily quest progress",
+            logger=self.log,
+        )
+
+        self._increments_buffered: int = 0
+        self._flushes: int = 0
+        self._rows_flushed: int = 0
+        self._flush_failures: int = 0
+
+    # ========================================================================
+    # STATE
+    # ========================================================================
+
+    def get_state(self, player_id: int, quest_date: date) -> Optional[QuestProgressState]:
+        """Cached state for a player/day, or None if not loaded."""
+        return self._states.get((player_id, quest_date))
+
+    def put_state(
+        self,
+        player_id: int,
+        quest_date: date,
+        progress: Dict[str, int],
+        completed: Dict[str, bool],
+    ) -> QuestProgressState:
+        """
+        Cache durable state loaded from Postgres.
+
+        Pending increments already buffered for the player/day are kept.
+        """
+        key = (player_id, quest_date)
+        state = self._states.get(key)
+        if state is None:
+            self._evict_idle_states()
+            state = QuestProgressState(player_id=player_id, quest_date=quest_date)
+            self._states[key] = state
+        state.progress = dict(progress)
+        state.completed = dict(completed)
+        return state
+
+    def pending_for(self, player_id: int, quest_date: date) -> Dict[str, int]:
+        """Pending increments for a player/day (empty if none)."""
+        state = self._states.get((player_id, quest_date))
+        return dict(state.pending) if state is not None else {}
+
+    def _evict_idle_states(self) -> None:
+        """Drop cached states without pending increments once over capacity."""
+        if len(self._states) < self._max_cached_states:
+            return
+        for key in [key for key, state in self._states.items() if not state.pending]:
+            del self._states[key]
+            if len(self._states) < self._max_cached_states // 2:
+                break
+
+    # ========================================================================
+    # BUFFERING
+    # ========================================================================
+
+    def add(
+        self,
+        state: QuestProgressState,
+        quest_id: str,
+        amount: int,
+        context: Optional[str] = None,
+    ) -> int:
+        """
+        Buffer an increment.
+
+        Args:
+            context: Caller's command/system context; the latest one per
+                quest is passed to the flush callback
+
+        Returns:
+            Durable + pending progress for the quest after the increment
+        """
+        state.pending[quest_id] = state.pending.get(quest_id, 0) + amount
+        state.pending_context[quest_id] = context
+        self._dirty[(state.player_id, state.quest_date)] = None
+        self._increments_buffered += 1
+
+        self._flusher.ensure_started()
+        if len(self._dirty) >= self._max_pending_players:
+            self._flusher.request()
+
+        return state.current_progress(quest_id)
+
+    def _take(self, keys: Optional[List[StateKey]] = None) -> List[PendingBatchEntry]:
+        """Swap out pending increments for the given (or all dirty) states."""
+        selected = list(self._dirty) if keys is None else [k for k in keys if k in self._dirty]
+        batch: List[PendingBatchEntry] = []
+        for key in selected:
+            del self._dirty[key]
+            state = self._states.get(key)
+            if state is None or not state.pending:
+                continue
+            batch.append((key[0], key[1], state.pending, state.pending_context))
+            state.pending = {}
+            state.pending_context = {}
+        return batch
+
+    def _restore(self, batch: List[PendingBatchEntry]) -> None:
+        """Put a failed batch's increments back in front of newer ones."""
+        for player_id, quest_date, pending, contexts in batch:
+            key = (player_id, quest_date)
+            state = self._states.get(key)
+            if state is None:
+                state = QuestProgressState(player_id=player_id, quest_date=quest_date)
+                self._states[key] = state
+            for quest_id, amount in pending.items():
+                state.pending[quest_id] = state.pending.get(quest_id, 0) + amount
+                # Contexts of newer increments win
+                state.pending_context.setdefault(quest_id, contexts.get(quest_id))
+            self._dirty[key] = None
+
+    def mark_flushed(
+        self,
+        player_id: int,
+        quest_date: date,
+        progress: Dict[str, int],
+        completed: Dict[str, bool],
+    ) -> None:
+        """Refresh durable state from a row written by the flush callback."""
+        state = self._states.get((player_id, quest_date))
+        if state is not None:
+            state.progress = dict(progress)
+            state.completed = dict(completed)
+
+    def discard(self, player_id: int, quest_date: date) -> None:
+        """Forget a cached state (e.g. its row no longer exists)."""
+        key = (player_id, quest_date)
+        self._states.pop(key, None)
+        self._dirty.pop(key, None)
+
+    # ========================================================================
+    # FLUSHING
+    # ========================================================================
+
+    async def flush(self, keys: Optional[List[StateKey]] = None) -> int:
+        """
+        Write pending increments via the flush callback.
+
+        Args:
+            keys: (player_id, quest_date) pairs to flush; all dirty if None
+
+        Returns:
+            Number of player/day rows flushed
+
+        Raises:
+            Exception: Whatever the flush callback raised (the batch is
+                restored first, so it is retried on the next flush)
+        """
+        async with self._flush_lock:
+            batch = self._take(keys)
+            if not batch:
+                return 0
+
+            try:
+                await self._flush_callback(batch)
+            except BaseException:
+                # Failed or cancelled (shutdown): the batch is retried
+                self._flush_failures += 1
+                self._restore(batch)
+                raise
+
+            self._flushes += 1
+            self._rows_flushed += len(batch)
+            return len(batch)
+
+    def start(self) -> None:
+        """Start the background flush loop (requires a running event loop)."""
+        self._flusher.start()
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write everything still pending."""
+        await self._flusher.stop()
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Buffer size and flush counters."""
+        return {
+            "cached_states": len(self._states),
+            "pending_players": len(self._dirty),
+            "increments_buffered": self._increments_buffered,
+            "flushes": self._flushes,
+            "rows_flushed": self._rows_flushed,
+            "flush_failures": self._flush_failures,
+            "running": self._flusher.is_running,
+        }
@@ -26,12 +26,21 @@ LUMEN 2025 COMPLIANCE
 ✓ Event-driven - emits daily_quest.* events
 ✓ Observable - structured logging, audit trail
 ✓ Pessimistic locking - uses SELECT FOR UPDATE for writes
+
+Performance
+-----------
+- Progress increments are buffered per (player, quest, day) in
+  QuestProgressAccumulator and written in batched SELECT FOR UPDATE +
+  UPDATE flushes (timer, pending-player cap, goal crossed, reward claim,
+  shutdown). Reads merge durable and pending progress
+- The quest pool is indexed by quest id, rebuilt only when the config
+  list changes
 """
 
 from __future__ import annotations
 
 from datetime import date, datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -39,6 +48,11 @@ from src.core.database.service import DatabaseService
 from src.core.infra.audit_logger import AuditLogger
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
+from src.modules.daily.progress_accumulator import (
+    PendingBatchEntry,
+    QuestProgressAccumulator,
+    QuestProgressState,
+)
 from src.modules.shared.base_repository import BaseRepository
 from src.modules.shared.base_service import BaseService
 from src.modules.shared.exceptions import (
@@ -88,6 +102,8 @@ class DailyQuestService(BaseService):
     - claim_daily_rewards() -> Claim rewards for all completed quests
     - get_or_create_today_quests() -> Get or generate today's quest set
     - reset_expired_quests() -> Reset quests from previous days
+    - flush_quest_progress() -> Write buffered progress increments now
+    - shutdown() -> Flush buffered progress and stop the flush loop
     """
 
     def __init__(
@@ -121,6 +137,23 @@ class DailyQuestService(BaseService):
         self._player_currencies = player_currencies_service
         self._player_progression = player_progression_service
 
+        # Quest pool indexed by id: (source config list, id -> definition)
+        self._quest_index: Optional[
+            Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]
+        ] = None
+
+        # Write-coalescing progress buffer
+        self._progress = QuestProgressAccumulator(
+            flush_callback=self._flush_progress_batch,
+            flush_interval_seconds=float(
+                self.get_config("daily_quests.progress_flush.interval_seconds", default=5.0)
+            ),
+            max_pending_players=int(
+                self.get_config("daily_quests.progress_flush.max_pending_players", default=1000)
+            ),
+            logger=self.log,
+        )
+
     # ========================================================================
     # PUBLIC API - Read Operations
     # ========================================================================
@@ -190,7 +223,7 @@ class DailyQuestService(BaseService):
                 "player_id": daily_quest.player_id,
                 "quest_date": str(daily_quest.quest_date),
                 "quests_completed": daily_quest.quests_completed,
-                "quest_progress": daily_quest.quest_progress,
+                "quest_progress": self._merge_pending_progress(daily_quest),
                 "rewards_claimed": daily_quest.rewards_claimed,
                 "bonus_streak": daily_quest.bonus_streak,
                 "all_complete": all_complete,
@@ -249,14 +282,14 @@ class DailyQuestService(BaseService):
                     "player_id": daily_quest.player_id,
                     "quest_date": str(daily_quest.quest_date),
                     "quests_completed": daily_quest.quests_completed,
-                    "quest_progress": daily_quest.quest_progress,
+                    "quest_progress": self._merge_pending_progress(daily_quest),
                     "rewards_claimed": daily_quest.rewards_claimed,
                     "bonus_streak": daily_quest.bonus_streak,
                     "all_complete": all_complete,
                 }
 
             # Generate new quest set
-            quest_definitions = self.get_config("daily_quests.quest_pool", default=[])
+            quest_definitions = list(self._get_quest_definitions().values())
             if not quest_definitions:
                 raise ValidationError("quest_pool", "not configured")
 
@@ -356,9 +389,10 @@ class DailyQuestService(BaseService):
         """
         Update progress for a specific quest.
 
-        This is a **write operation** using get_transaction() with pessimistic locking.
-
-        Automatically completes the quest when progress reaches the goal.
+        This is a **buffered write**: the increment is held in the progress
+        accumulator and written by a batched flush. When progress reaches the
+        goal the player's buffered progress is flushed immediately (with
+        pessimistic locking) and the quest is completed.
 
         Args:
             player_id: Discord ID of the player
@@ -403,8 +437,7 @@ class DailyQuestService(BaseService):
         )
 
         # Get quest configuration
-        quest_pool = self.get_config("daily_quests.quest_pool", default=[])
-        quest_config = next((q for q in quest_pool if q["id"] == quest_id), None)
+        quest_config = self._get_quest_definitions().get(quest_id)
         if not quest_config:
             raise ValidationError("quest_id", f"Invalid: {quest_id}")
 
@@ -412,81 +445,79 @@ class DailyQuestService(BaseService):
 
         today = date.today()
 
-        async with DatabaseService.get_transaction() as session:
-            from src.database.models.progression.daily_quest import DailyQuest
-
-            # Lock daily quest record
-            daily_quest = await self._daily_quest_repo.find_one_where(
-                session,
-                DailyQuest.player_id == player_id,
-                DailyQuest.quest_date == today,
-                for_update=True,
-            )
-
-            if not daily_quest:
-                raise NotFoundError("DailyQuest", f"player_id={player_id}, date={today}")
-
-            # Check if already completed
-            if daily_quest.quests_completed.get(quest_id, False):
-                raise InvalidOperationError("complete_quest", f"Quest '{quest_id}' is already completed")
-
-            # Update progress
-            old_progress = daily_quest.quest_progress.get(quest_id, 0)
-            new_progress = old_progress + progress_amount
-
-            daily_quest.quest_progress[quest_id] = new_progress
-            flag_modified(daily_quest, "quest_progress")
-
-            # Check if quest is now complete
-            is_complete = new_progress >= quest_goal
-
-            if is_complete:
-                daily_quest.quests_completed[quest_id] = True
-                flag_modified(daily_quest, "quests_completed")
-
-                # Event emission for quest completion
-                await self.emit_event(
-                    event_type="daily_quest.quest_completed",
-                    data={
+        state = self._progress.get_state(player_id, today)
+        if state is None:
+            state = await self._load_progress_state(player_id, today)
+
+        # Check if already completed
+        if state.completed.get(quest_id, False):
+            raise InvalidOperationError("complete_quest", f"Quest '{quest_id}' is already completed")
+
+        # Buffer the increment (written by the next batched flush)
+        old_progress = state.current_progress(quest_id)
+        new_progress = self._progress.add(state, quest_id, progress_amount, context=context)
+
+        # Goal crossed: write now so completion is durable and announced
+        is_complete = False
+        if new_progress >= quest_goal:
+            try:
+                await self._progress.flush([(player_id, today)])
+            except Exception as exc:
+                # Increments stay buffered; the flush loop retries
+                self.log.warning(
+                    f"Deferred quest completion write for {quest_id}",
+                    extra={
                         "player_id": player_id,
                         "quest_id": quest_id,
-                        "progress": new_progress,
-                        "goal": quest_goal,
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
                     },
                 )
+            is_complete = state.completed.get(quest_id, False)
 
-            # Audit logging
-            await AuditLogger.log(
-                player_id=player_id,
-                transaction_type="daily_quest_progress_updated",
-                details={
-                    "quest_id": quest_id,
-                    "old_progress": old_progress,
-                    "new_progress": new_progress,
-                    "progress_amount": progress_amount,
-                    "is_complete": is_complete,
-                },
-                context=context,
-            )
-
-            self.log.info(
-                f"Quest progress updated: {quest_id} ({old_progress} -> {new_progress}/{quest_goal})",
-                extra={
-                    "player_id": player_id,
-                    "quest_id": quest_id,
-                    "old_progress": old_progress,
-                    "new_progress": new_progress,
-                    "is_complete": is_complete,
-                },
-            )
-
-            return {
+        self.log.debug(
+            f"Quest progress buffered: {quest_id} ({old_progress} -> {new_progress}/{quest_goal})",
+            extra={
+                "player_id": player_id,
                 "quest_id": quest_id,
                 "old_progress": old_progress,
                 "new_progress": new_progress,
-                "goal": quest_goal,
                 "is_complete": is_complete,
-            }
+            },
+        )
+
+        return {
+            "quest_id": quest_id,
+            "old_progress": old_progress,
+            "new_progress": new_progress,
+            "goal": quest_goal,
+            "is_complete": is_complete,
+        }
+
+    async def flush_quest_progress(self, player_id: Optional[int] = None) -> int:
+        """
+        Write buffered quest progress to the database now.
+
+        Args:
+            player_id: Only flush this player's progress (all players if None)
+
+        Returns:
+            Number of player/day rows written
+
+        Raises:
+            Exception: If the batched write fails (increments stay buffered)
+        """
+        if player_id is None:
+            return await self._progress.flush()
+        return await self._progress.flush([(player_id, date.today())])
+
+    async def shutdown(self) -> None:
+        """Flush buffered quest progress and stop the background flush loop."""
+        await self._progress.stop()
+
+    def get_progress_buffer_stats(self) -> Dict[str, Any]:
+        """Progress accumulator buffer and flush counters."""
+        return self._progress.get_stats()
 
     async def claim_daily_rewards(
         self,
@@ -528,6 +559,9 @@ class DailyQuestService(BaseService):
 
         # SAFETY: Observability - Wrap in try-except for error path logging
         try:
+            # Buffered progress must be durable before completions are counted
+            await self._progress.flush([(player_id, today)])
+
             async with DatabaseService.get_transaction() as session:
                 from src.database.models.progression.daily_quest import DailyQuest
 
@@ -667,3 +701,163 @@ class DailyQuestService(BaseService):
                 exc_info=True,
             )
             raise
+
+    # ========================================================================
+    # PRIVATE - Quest Pool & Progress Buffer
+    # ========================================================================
+
+    def _get_quest_definitions(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Quest pool indexed by quest id.
+
+        Rebuilt only when the configured pool list changes (config reload).
+        """
+        quest_pool = self.get_config("daily_quests.quest_pool", default=[]) or []
+        if self._quest_index is None or self._quest_index[0] is not quest_pool:
+            self._quest_index = (quest_pool, {q["id"]: q for q in quest_pool})
+        return self._quest_index[1]
+
+    def _merge_pending_progress(self, daily_quest: DailyQuest) -> Dict[str, int]:
+        """Durable quest progress with buffered increments applied."""
+        pending = self._progress.pending_for(daily_quest.player_id, daily_quest.quest_date)
+        if not pending:
+            return daily_quest.quest_progress
+        merged = dict(daily_quest.quest_progress)
+        for quest_id, amount in pending.items():
+            merged[quest_id] = merged.get(quest_id, 0) + amount
+        return merged
+
+    async def _load_progress_state(self, player_id: int, quest_date: date) -> QuestProgressState:
+        """
+        Load durable progress into the accumulator (read-only, no lock).
+
+        Raises:
+            NotFoundError: If no daily quest record exists for the date
+        """
+        async with DatabaseService.get_session() as session:
+            from src.database.models.progression.daily_quest import DailyQuest
+
+            daily_quest = await self._daily_quest_repo.find_one_where(
+                session,
+                DailyQuest.player_id == player_id,
+                DailyQuest.quest_date == quest_date,
+            )
+
+            if not daily_quest:
+                raise NotFoundError("DailyQuest", f"player_id={player_id}, date={quest_date}")
+
+            return self._progress.put_state(
+                player_id,
+                quest_date,
+                daily_quest.quest_progress,
+                daily_quest.quests_completed,
+            )
+
+    async def _flush_progress_batch(self, batch: List[PendingBatchEntry]) -> None:
+        """
+        Apply buffered increments in one transaction (accumulator callback).
+
+        Rows are locked with one SELECT FOR UPDATE per quest date; completion
+        is evaluated against the locked values, so increments from several
+        processes can never complete a quest twice. Locks are taken in
+        (quest_date, player_id) order, so concurrent flushes cannot deadlock.
+        """
+        from src.database.models.progression.daily_quest import DailyQuest
+
+        quest_definitions = self._get_quest_definitions()
+        pending_by_date: Dict[date, Dict[int, PendingBatchEntry]] = {}
+        for entry in batch:
+            player_id, quest_date = entry[0], entry[1]
+            pending_by_date.setdefault(quest_date, {})[player_id] = entry
+
+        flushed: List[DailyQuest] = []
+
+        async with DatabaseService.get_transaction() as session:
+            for quest_date, pending_by_player in sorted(pending_by_date.items()):
+                rows = await self._daily_quest_repo.find_many_where(
+                    session,
+                    DailyQuest.player_id.in_(list(pending_by_player)),
+                    DailyQuest.quest_date == quest_date,
+                    for_update=True,
+                    order_by=[DailyQuest.player_id],
+                )
+                rows_by_player = {row.player_id: row for row in rows}
+
+                for player_id, (_, _, pending, contexts) in pending_by_player.items():
+                    daily_quest = rows_by_player.get(player_id)
+                    if daily_quest is None:
+                        self.log.warning(
+                            "Dropping buffered quest progress for missing daily quest record",
+                            extra={"player_id": player_id, "quest_date": str(quest_date)},
+                        )
+                        self._progress.discard(player_id, quest_date)
+                        continue
+
+                    await self._apply_pending_progress(
+                        daily_quest, pending, contexts, quest_definitions
+                    )
+                    flushed.append(daily_quest)
+
+        for daily_quest in flushed:
+            self._progress.mark_flushed(
+                daily_quest.player_id,
+                daily_quest.quest_date,
+                daily_quest.quest_progress,
+                daily_quest.quests_completed,
+            )
+
+    async def _apply_pending_progress(
+        self,
+        daily_quest: DailyQuest,
+        pending: Dict[str, int],
+        contexts: Dict[str, Optional[str]],
+        quest_definitions: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Apply one player's buffered increments to a locked row.
+
+        Each audit entry carries the context of the quest's latest buffered
+        increment.
+        """
+        player_id = daily_quest.player_id
+
+        for quest_id, progress_amount in pending.items():
+            if daily_quest.quests_completed.get(quest_id, False):
+                continue  # Completed by a concurrent flush; extra progress is moot
+
+            quest_goal = quest_definitions.get(quest_id, {}).get("goal", 1)
+            old_progress = daily_quest.quest_progress.get(quest_id, 0)
+            new_progress = old_progress + progress_amount
+            daily_quest.quest_progress[quest_id] = new_progress
+
+            is_complete = new_progress >= quest_goal
+            if is_complete:
+                daily_quest.quests_completed[quest_id] = True
+
+                # Event emission for quest completion
+                await self.emit_event(
+                    event_type="daily_quest.quest_completed",
+                    data={
+                        "player_id": player_id,
+                        "quest_id": quest_id,
+                        "progress": new_progress,
+                        "goal": quest_goal,
+                    },
+                )
+
+            # Audit logging (one entry per flushed quest)
+            await AuditLogger.log(
+                player_id=player_id,
+                transaction_type="daily_quest_progress_updated",
+                details={
+                    "quest_id": quest_id,
+                    "old_progress": old_progress,
+                    "new_progress": new_progress,
+                    "progress_amount": progress_amount,
+                    "is_complete": is_complete,
+                },
+                context=contexts.get(quest_id),
+            )
+
+        flag_modified(daily_quest, "quest_progress")
+        flag_modified(daily_quest, "quests_completed")
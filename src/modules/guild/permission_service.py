@@ -8,6 +8,14 @@ Handles:
 - Config-driven permission trees
 - Action gating and validation
 
+Performance:
+- Role permission lists are compiled into integer bitsets (one bit per
+  action), recompiled only when the config snapshot changes
+- Member roles are cached in GuildRoleCache (in-process TTL LRU backed by
+  per-member Redis keys fenced by a per-guild epoch) and invalidated by guild.member_promoted /
+  member_demoted / member_kicked / member_left / disbanded events, so
+  repeated checks do not query Postgres
+
 All operations follow LUMEN LAW (2025):
 - Pure business logic, no Discord/UI concerns
 - Config-driven permission definitions
@@ -17,7 +25,7 @@ All operations follow LUMEN LAW (2025):
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from src.core.database.service import DatabaseService
 from src.modules.shared.base_repository import BaseRepository
@@ -27,6 +35,7 @@ from src.core.validation.input_validator import InputValidator
 from src.database.models.social.guild import Guild
 from src.database.models.social.guild_member import GuildMember
 from src.database.models.social.guild_role import GuildRole
+from src.modules.guild.role_cache import GuildRoleCache
 
 if TYPE_CHECKING:
     from logging import Logger
@@ -57,6 +66,24 @@ class GuildPermissionService(BaseService):
         self._guild_repo = BaseRepository[Guild](Guild, self.log)
         self._member_repo = BaseRepository[GuildMember](GuildMember, self.log)
 
+        # Compiled permission bitsets: action -> bit, role -> (source list, mask)
+        self._action_bits: Dict[str, int] = {}
+        self._role_masks: Dict[str, Tuple[List[str], int]] = {}
+        for role in GuildRole:
+            self._get_role_mask(role.value)
+
+        self._role_cache = GuildRoleCache(
+            max_entries=int(self.get_config("guilds.permission_cache.max_entries", default=10_000)),
+            local_ttl_seconds=float(
+                self.get_config("guilds.permission_cache.local_ttl_seconds", default=30)
+            ),
+            redis_ttl_seconds=int(
+                self.get_config("guilds.permission_cache.redis_ttl_seconds", default=300)
+            ),
+            logger=self.log,
+        )
+        self._subscribe_cache_invalidation()
+
     # -------------------------------------------------------------------------
     # Permission Constants (can be overridden by config)
     # -------------------------------------------------------------------------
@@ -122,41 +149,15 @@ class GuildPermissionService(BaseService):
         player_id = InputValidator.validate_discord_id(player_id)
         action = InputValidator.validate_string(action, "action", min_length=1, max_length=50)
 
-        async with DatabaseService.get_transaction() as session:
-            # Get guild
-            guild = await self._guild_repo.find_one_where(
-                session,
-                Guild.id == guild_id,
-            )
-
-            if not guild:
-                raise NotFoundError(f"Guild {guild_id} not found")
+        role = await self._resolve_member_role(guild_id, player_id)
 
-            # Get player membership
-            member = await self._member_repo.find_one_where(
-                session,
-                GuildMember.guild_id == guild_id,
-                GuildMember.player_id == player_id,
-            )
-
-            if not member:
-                raise NotFoundError(
-                    f"Player {player_id} is not a member of guild {guild_id}"
-                )
-
-            # Get permission tree for role
-            permissions = self._get_permissions_for_role(member.role)
-
-            # Check if action is permitted
-            has_permission = action in permissions
-
-            return {
-                "guild_id": guild_id,
-                "player_id": player_id,
-                "action": action,
-                "role": member.role,
-                "has_permission": has_permission,
-            }
+        return {
+            "guild_id": guild_id,
+            "player_id": player_id,
+            "action": action,
+            "role": role,
+            "has_permission": self._role_allows(role, action),
+        }
 
     async def require_permission(
         self,
@@ -220,37 +221,14 @@ class GuildPermissionService(BaseService):
         guild_id = InputValidator.validate_positive_integer(guild_id, "guild_id")
         player_id = InputValidator.validate_discord_id(player_id)
 
-        async with DatabaseService.get_transaction() as session:
-            # Get guild
-            guild = await self._guild_repo.find_one_where(
-                session,
-                Guild.id == guild_id,
-            )
-
-            if not guild:
-                raise NotFoundError(f"Guild {guild_id} not found")
-
-            # Get player membership
-            member = await self._member_repo.find_one_where(
-                session,
-                GuildMember.guild_id == guild_id,
-                GuildMember.player_id == player_id,
-            )
-
-            if not member:
-                raise NotFoundError(
-                    f"Player {player_id} is not a member of guild {guild_id}"
-                )
+        role = await self._resolve_member_role(guild_id, player_id)
 
-            # Get all permissions for role
-            permissions = self._get_permissions_for_role(member.role)
-
-            return {
-                "guild_id": guild_id,
-                "player_id": player_id,
-                "role": member.role,
-                "permissions": permissions,
-            }
+        return {
+            "guild_id": guild_id,
+            "player_id": player_id,
+            "role": role,
+            "permissions": self._get_permissions_for_role(role),
+        }
 
     async def get_role_permissions(
         self,
@@ -351,8 +329,7 @@ class GuildPermissionService(BaseService):
                 )
 
             # Check basic permission
-            actor_permissions = self._get_permissions_for_role(actor_member.role)
-            if action not in actor_permissions:
+            if not self._role_allows(actor_member.role, action):
                 raise InvalidOperationError(
                     "can_manage_member",
                     f"Player {actor_id} does not have permission to '{action}'"
@@ -394,10 +371,127 @@ class GuildPermissionService(BaseService):
                 "target_role": target_member.role,
             }
 
+    # -------------------------------------------------------------------------
+    # Role Resolution & Cache Invalidation
+    # -------------------------------------------------------------------------
+
+    # Event -> payload field naming the affected player (None = whole guild)
+    CACHE_INVALIDATION_EVENTS = {
+        "guild.member_promoted": "target_player_id",
+        "guild.member_demoted": "target_player_id",
+        "guild.member_kicked": "target_player_id",
+        "guild.member_left": "player_id",
+        "guild.disbanded": None,
+    }
+
+    async def _resolve_member_role(self, guild_id: int, player_id: int) -> str:
+        """
+        Get a member's role, from the role cache when possible.
+
+        Args:
+            guild_id: Guild ID (validated)
+            player_id: Discord ID of player (validated)
+
+        Returns:
+            Role name
+
+        Raises:
+            NotFoundError: Guild or membership not found
+        """
+        role = await self._role_cache.get(guild_id, player_id)
+        if role is not None:
+            return role
+
+        fill_token = await self._role_cache.fill_token(guild_id)
+
+        async with DatabaseService.get_transaction() as session:
+            # Get guild
+            guild = await self._guild_repo.find_one_where(
+                session,
+                Guild.id == guild_id,
+            )
+
+            if not guild:
+                raise NotFoundError(f"Guild {guild_id} not found")
+
+            # Get player membership
+            member = await self._member_repo.find_one_where(
+                session,
+                GuildMember.guild_id == guild_id,
+                GuildMember.player_id == player_id,
+            )
+
+            if not member:
+                raise NotFoundError(
+                    f"Player {player_id} is not a member of guild {guild_id}"
+                )
+
+            role = member.role
+
+        await self._role_cache.put(guild_id, player_id, role, fill_token)
+        return role
+
+    def _subscribe_cache_invalidation(self) -> None:
+        """Invalidate cached roles on membership changes."""
+        for event_name, player_field in self.CACHE_INVALIDATION_EVENTS.items():
+            self._events.subscribe(
+                event_name,
+                self._make_invalidation_listener(player_field),
+                identifier=f"guild_permission.role_cache:{event_name}",
+            )
+
+    def _make_invalidation_listener(self, player_field: Optional[str]) -> Any:
+        """Build an EventBus listener that drops the roles an event affects."""
+
+        async def listener(payload: Dict[str, Any]) -> None:
+            guild_id = payload.get("guild_id")
+            if guild_id is None:
+                return
+
+            player_id = payload.get(player_field) if player_field else None
+            if player_id is None:
+                await self._role_cache.invalidate_guild(int(guild_id))
+            else:
+                await self._role_cache.invalidate(int(guild_id), int(player_id))
+
+        return listener
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Role cache hit/miss counters."""
+        return self._role_cache.get_stats()
+
     # -------------------------------------------------------------------------
     # Helper Methods
     # -------------------------------------------------------------------------
 
+    def _role_allows(self, role: str, action: str) -> bool:
+        """Check an action against a role's compiled permission bitset."""
+        bit = self._action_bits.get(action)
+        return bit is not None and bool(self._get_role_mask(role) & bit)
+
+    def _get_role_mask(self, role: str) -> int:
+        """
+        Get the permission bitset for a role.
+
+        Recompiled only when the role's permission list object changes
+        (i.e. the config snapshot was rebuilt).
+        """
+        permissions = self._get_permissions_for_role(role)
+        compiled = self._role_masks.get(role)
+        if compiled is not None and compiled[0] is permissions:
+            return compiled[1]
+
+        mask = 0
+        for action in permissions:
+            bit = self._action_bits.get(action)
+            if bit is None:
+                bit = 1 << len(self._action_bits)
+                self._action_bits[action] = bit
+            mask |= bit
+
+        self._role_masks[role] = (permissions, mask)
+        return mask
+
     def _get_permissions_for_role(self, role: str) -> List[str]:
         """
         Get permission list for a role.
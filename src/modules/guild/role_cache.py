@@ -0,0 +1,290 @@
+"""
+Guild Role Cache - LES 2025 Compliant
+=====================================
+
+Purpose
+-------
+Caches (guild_id, player_id) -> guild role so permission checks, which run
+before nearly every guild command, do not query Postgres.
+
+Domain
+------
+- Small in-process LRU with a per-entry TTL (first tier)
+- One Redis key per member shared across shards (second tier)
+- Explicit invalidation of one member or a whole guild
+
+LUMEN 2025 COMPLIANCE
+---------------------
+✓ Pure data access - no permission rules
+✓ Infrastructure via RedisService (resilience + metrics)
+✓ Graceful degradation - Redis failures fall through to the database
+✓ Observable - hit/miss counters and structured logging
+
+Design Decisions
+----------------
+- Key layout:
+    guild:roles:{guild_id}:{player_id}  STRING  "{epoch}:{role}"  (EX redis_ttl)
+    guild:roles:epoch:{guild_id}        STRING  invalidation counter (no TTL)
+- Each member key carries its own TTL, so a fill never extends the life of
+  another member's entry
+- Only memberships that exist are cached; "not a member" always goes to
+  the database, so joins never need invalidation
+- Invalidation is event-driven (promote / demote / kick / leave / disband):
+  it clears the local tier in this process and INCRs the guild epoch, which
+  retires every Redis entry of the guild in all processes. Other processes
+  drop their local copy within local_ttl_seconds
+- Fills are fenced by the epoch read before the database read: a Lua script
+  writes the role only if the epoch is unchanged, and reads (MGET of the
+  epoch and the member key) reject entries tagged with an older epoch, so a
+  slow read in any process cannot re-cache a stale role
+- The epoch key never expires; an expired counter would restart at 0 and
+  could re-validate entries written before the first invalidation
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from src.core.logging.logger import get_logger
+from src.core.redis.service import RedisService
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+class GuildRoleCache:
+    """
+    Two-tier (local LRU + per-member Redis keys) cache of guild member roles.
+
+    Public Methods
+    --------------
+    - get() -> Cached role or None
+    - fill_token() -> Token to pass to put() after a database read
+    - put() -> Cache a role read from the database
+    - invalidate() -> Drop one member's role
+    - invalidate_guild() -> Drop every role for a guild
+    - get_stats() -> Hit/miss counters
+    """
+
+    KEY_PREFIX = "guild:roles"
+
+    # KEYS[1] epoch key, KEYS[2] member key; ARGV: expected epoch, role, ttl
+    _LUA_FILL = """
+    local epoch = redis.call("GET", KEYS[1]) or "0"
+    if epoch ~= ARGV[1] then
+        return 0
+    end
+    redis.call("SET", KEYS[2], epoch .. ":" .. ARGV[2], "EX", ARGV[3])
+    return 1
+    """
+    _FILL_SCRIPT = "guild_role_cache_fill"
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        local_ttl_seconds: float = 30.0,
+        redis_ttl_seconds: int = 300,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        self.log = logger or get_logger(__name__)
+        self._max_entries = max(1, max_entries)
+        self._local_ttl = max(0.0, local_ttl_seconds)
+        self._redis_ttl = max(1, redis_ttl_seconds)
+
+        # (guild_id, player_id) -> (role, expires_at monotonic)
+        self._entries: OrderedDict[Tuple[int, int], Tuple[str, float]] = OrderedDict()
+        self._invalidations: int = 0
+
+        self._local_hits: int = 0
+        self._redis_hits: int = 0
+        self._misses: int = 0
+        self._stale_fills: int = 0
+
+        RedisService.get_script_registry().register(self._FILL_SCRIPT, self._LUA_FILL)
+
+    # ========================================================================
+    # KEYS
+    # ========================================================================
+
+    def member_key(self, guild_id: int, player_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{guild_id}:{player_id}"
+
+    def epoch_key(self, guild_id: int) -> str:
+        return f"{self.KEY_PREFIX}:epoch:{guild_id}"
+
+    # ========================================================================
+    # READS
+    # ========================================================================
+
+    async def get(self, guild_id: int, player_id: int) -> Optional[str]:
+        """
+        Cached role for a member, or None on miss.
+
+        Checks the local LRU, then the member's Redis key (a Redis hit is
+        copied into the local tier). Redis entries written under an older
+        guild epoch are treated as misses.
+        """
+        key = (guild_id, player_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            role, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._local_hits += 1
+                return role
+            del self._entries[key]
+
+        token = self._invalidations
+        try:
+            epoch, entry_value = await RedisService.mget(
+                [self.epoch_key(guild_id), self.member_key(guild_id, player_id)]
+            )
+        except Exception as exc:
+            self.log.debug(
+                "Guild role cache Redis read failed (falling back to database)",
+                extra={"guild_id": guild_id, "error": str(exc), "error_type": type(exc).__name__},
+            )
+            entry_value = None
+
+        role = None
+        if entry_value is not None:
+            entry_epoch, _, cached_role = entry_value.partition(":")
+            if entry_epoch == (epoch or "0"):
+                role = cached_role
+
+        if role is None:
+            self._misses += 1
+            return None
+
+        self._redis_hits += 1
+        if token == self._invalidations:
+            self._store_local(key, role)
+        return role
+
+    # ========================================================================
+    # WRITES
+    # ========================================================================
+
+    async def fill_token(self, guild_id: int) -> Tuple[int, Optional[str]]:
+        """
+        Token to take before a database read and pass to put().
+
+        Captures this process's invalidation count and the guild's Redis
+        epoch (None if Redis is unavailable).
+        """
+        token = self._invalidations
+        try:
+            epoch = await RedisService.get(self.epoch_key(guild_id))
+        except Exception as exc:
+            self.log.debug(
+                "Guild role cache epoch read failed (fill stays local)",
+                extra={"guild_id": guild_id, "error": str(exc), "error_type": type(exc).__name__},
+            )
+            return token, None
+        return token, epoch or "0"
+
+    async def put(
+        self,
+        guild_id: int,
+        player_id: int,
+        role: str,
+        token: Tuple[int, Optional[str]],
+    ) -> None:
+        """
+        Cache a role read from the database.
+
+        Skipped if an invalidation happened since `token` was taken: in this
+        process (local counter) or in any process (guild epoch, checked
+        atomically with the write).
+        """
+        local_token, epoch = token
+        if local_token != self._invalidations:
+            return
+
+        if epoch is None:
+            self._store_local((guild_id, player_id), role)
+            return
+
+        try:
+            written = await RedisService.run_script(
+                self._FILL_SCRIPT,
+                keys=[self.epoch_key(guild_id), self.member_key(guild_id, player_id)],
+                args=[epoch, role, self._redis_ttl],
+            )
+        except Exception as exc:
+            self.log.debug(
+                "Guild role cache Redis write failed (non-critical)",
+                extra={"guild_id": guild_id, "error": str(exc), "error_type": type(exc).__name__},
+            )
+            written = 1  # Redis unavailable: only the local guard applies
+
+        if not written:
+            self._stale_fills += 1
+            return
+        if local_token == self._invalidations:
+            self._store_local((guild_id, player_id), role)
+
+    async def invalidate(self, guild_id: int, player_id: int) -> None:
+        """
+        Drop one member's cached role from both tiers.
+
+        Bumps the guild epoch, so pending fills for the guild are rejected
+        and its other Redis entries are re-read from the database once.
+        """
+        self._invalidations += 1
+        self._entries.pop((guild_id, player_id), None)
+
+        try:
+            await RedisService.incr(self.epoch_key(guild_id))
+            await RedisService.delete(self.member_key(guild_id, player_id))
+        except Exception as exc:
+            self.log.warning(
+                "Guild role cache Redis invalidation failed",
+                extra={
+                    "guild_id": guild_id,
+                    "player_id": player_id,
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                },
+            )
+
+    async def invalidate_guild(self, guild_id: int) -> None:
+        """Drop every cached role for a guild from both tiers."""
+        self._invalidations += 1
+        for key in [key for key in self._entries if key[0] == guild_id]:
+            del self._entries[key]
+
+        try:
+            await RedisService.incr(self.epoch_key(guild_id))
+        except Exception as exc:
+            self.log.warning(
+                "Guild role cache Redis invalidation failed",
+                extra={"guild_id": guild_id, "error": str(exc), "error_type": type(exc).__name__},
+            )
+
+    def _store_local(self, key: Tuple[int, int], role: str) -> None:
+        self._entries[key] = (role, time.monotonic() + self._local_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and local tier size."""
+        lookups = self._local_hits + self._redis_hits + self._misses
+        return {
+            "local_entries": len(self._entries),
+            "local_hits": self._local_hits,
+            "redis_hits": self._redis_hits,
+            "misses": self._misses,
+            "hit_rate": (
+                round((self._local_hits + self._redis_hits) / lookups, 4) if lookups else 0.0
+            ),
+            "invalidations": self._invalidations,
+            "stale_fills_rejected": self._stale_fills,
+        }
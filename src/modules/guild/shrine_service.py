@@ -207,7 +207,8 @@ class GuildShrineService(BaseService):
                     )
 
             # Calculate yield (includes guild member count bonus)
-            yield_amount = await self._calculate_guild_yield(session, shrine, guild_id)
+            member_count = await self._get_guild_member_count(session, guild_id)
+            yield_amount = self._calculate_guild_yield(shrine, member_count)
 
             # Update shrine state
             shrine.last_collected_at = now
@@ -448,6 +449,11 @@ class GuildShrineService(BaseService):
             result = await session.execute(stmt)
             shrines = list(result.scalars().all())
 
+            # One member count for the guild, shared by every shrine's yield
+            member_count = (
+                await self._get_guild_member_count(session, guild_id) if shrines else 1
+            )
+
             # Convert to dicts
             result = []
             now = datetime.now(timezone.utc)
@@ -457,6 +463,7 @@ class GuildShrineService(BaseService):
                     "shrine_type": shrine.shrine_type,
                     "level": shrine.level,
                     "is_active": shrine.is_active,
+                    "current_yield": self._calculate_guild_yield(shrine, member_count),
                     "last_collected_at": shrine.last_collected_at,
                     "yield_history_count": len(shrine.yield_history),
                 }
@@ -508,7 +515,8 @@ class GuildShrineService(BaseService):
                 raise NotFoundError(f"Guild shrine {shrine_id} not found")
 
             # Calculate current yield and cooldown info
-            current_yield = await self._calculate_guild_yield(session, shrine, shrine.guild_id)
+            member_count = await self._get_guild_member_count(session, shrine.guild_id)
+            current_yield = self._calculate_guild_yield(shrine, member_count)
             now = datetime.now(timezone.utc)
             cooldown_hours = self.get_config(
                 f"guild_shrines.{shrine.shrine_type}.cooldown_hours", default=12
@@ -541,18 +549,37 @@ class GuildShrineService(BaseService):
     # Helper Methods
     # -------------------------------------------------------------------------
 
-    async def _calculate_guild_yield(
-        self, session, shrine: GuildShrine, guild_id: int
-    ) -> int:
+    async def _get_guild_member_count(self, session, guild_id: int) -> int:
+        """
+        Count a guild's members for the yield member bonus.
+
+        Run once per guild and pass the result to _calculate_guild_yield, so
+        multi-shrine operations do not repeat the count for every shrine.
+
+        Args:
+            session: Database session
+            guild_id: Guild ID
+
+        Returns:
+            Member count (1 if no members found)
+        """
+        from sqlalchemy import func
+        from src.database.models.social.guild_member import GuildMember
+
+        member_count_result = await session.execute(
+            select(func.count(GuildMember.id)).where(GuildMember.guild_id == guild_id)
+        )
+        return member_count_result.scalar() or 1  # Default to 1 if no members found
+
+    def _calculate_guild_yield(self, shrine: GuildShrine, member_count: int) -> int:
         """
         Calculate the current yield for a guild shrine based on level and member count.
 
         Formula: base_yield * (1 + (level - 1) * level_multiplier) * (1 + member_count * member_bonus)
 
         Args:
-            session: Database session
             shrine: GuildShrine instance
-            guild_id: Guild ID for member count lookup
+            member_count: Guild member count from _get_guild_member_count
 
         Returns:
             Calculated yield amount (lumees)
@@ -567,16 +594,6 @@ class GuildShrineService(BaseService):
             "guild_shrines.member_bonus_per_member", default=0.02
         )
 
-        # Get guild member count (optional - may not have guild service yet)
-        # For now, use a default or fetch from guild_members table
-        from sqlalchemy import func
-        from src.database.models.social.guild_member import GuildMember
-
-        member_count_result = await session.execute(
-            select(func.count(GuildMember.id)).where(GuildMember.guild_id == guild_id)
-        )
-        member_count = member_count_result.scalar() or 1  # Default to 1 if no members found
-
         # Calculate yield with level and member scaling
         level_bonus = 1 + (shrine.level - 1) * level_multiplier
         member_multiplier = 1 + (member_count * member_bonus)
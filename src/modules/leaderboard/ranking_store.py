@@ -0,0 +1,318 @@
+"""
+Leaderboard Ranking Store - LES 2025 Compliant
+===============================================
+
+Purpose
+-------
+Maintains live leaderboard rankings in Redis sorted sets so score updates
+are O(log N) and rank / page reads never touch Postgres.
+
+Domain
+------
+- Record player scores per category (one atomic script: ZADD, username,
+  rank)
+- Page reads by descending score (ZREVRANGE)
+- Exact player rank lookups (ZREVRANK)
+- Username and last-snapshot rank side tables (hashes)
+- Warm-up from persisted Postgres snapshots, and detection of sets that
+  were never warmed, partly evicted or lost
+
+LUMEN 2025 COMPLIANCE
+---------------------
+✓ Pure data access - no business rules or validation
+✓ Infrastructure via RedisService (resilience + metrics)
+✓ Type-safe - complete type hints
+✓ Observable - structured logging
+
+Design Decisions
+----------------
+- Key layout per category:
+    leaderboard:{category}:scores          ZSET  player_id -> value
+    leaderboard:{category}:names           HASH  player_id -> username
+    leaderboard:{category}:snapshot_ranks  HASH  player_id -> rank at last snapshot
+    leaderboard:{category}:meta            HASH  snapshot_version, warmed, members
+- `members` counts players ever added to the live set (by warm-up or a new
+  player's first score); fewer ZSET members than that, or no `warmed`
+  marker, means the set must be re-warmed. Both live in Redis, so every
+  process sees the same answer
+- Live rank_change is measured against the last persisted snapshot, so
+  movement between snapshots is visible immediately
+- Ties are ordered by Redis (member order), which is stable between reads
+- Values are integers well below 2**53, so float scores are exact
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from src.core.logging.logger import get_logger
+from src.core.redis.service import RedisService
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+# ============================================================================
+# Data Models
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class RankedEntry:
+    """
+    One live leaderboard row.
+
+    Attributes:
+        rank: 1-based live rank
+        player_id: Player's Discord ID
+        username: Last recorded username
+        value: Current score
+        rank_change: Positions gained since the last snapshot (0 if unranked)
+    """
+
+    rank: int
+    player_id: int
+    username: str
+    value: int
+    rank_change: int
+
+
+# ============================================================================
+# LeaderboardRankingStore
+# ============================================================================
+
+
+class LeaderboardRankingStore:
+    """
+    Redis sorted-set backed live rankings for every leaderboard category.
+
+    Public Methods
+    --------------
+    - record_score() -> Set a player's score and username
+    - get_page() -> Ranked entries for an offset/limit window
+    - get_entry() -> Exact rank entry for a single player
+    - get_all_scores() -> Full ordered score list (for snapshots)
+    - record_snapshot() -> Record ranks/version of the latest persisted snapshot
+    - get_snapshot_version() -> Version of the latest persisted snapshot
+    - needs_warm() -> Whether a category was never warmed or lost members
+    - warm() -> Seed a category from persisted snapshot rows
+    """
+
+    KEY_PREFIX = "leaderboard"
+
+    # KEYS: scores, names, meta; ARGV: member, value, username
+    _LUA_RECORD_SCORE = """
+    local added = redis.call("ZADD", KEYS[1], ARGV[2], ARGV[1])
+    redis.call("HSET", KEYS[2], ARGV[1], ARGV[3])
+    if added == 1 then
+        redis.call("HINCRBY", KEYS[3], "members", 1)
+    end
+    return redis.call("ZREVRANK", KEYS[1], ARGV[1])
+    """
+    _RECORD_SCORE_SCRIPT = "leaderboard_record_score"
+
+    # KEYS: scores, meta
+    _LUA_NEEDS_WARM = """
+    if not redis.call("HGET", KEYS[2], "warmed") then
+        return 1
+    end
+    local members = tonumber(redis.call("HGET", KEYS[2], "members") or "0")
+    if redis.call("ZCARD", KEYS[1]) < members then
+        return 1
+    end
+    return 0
+    """
+    _NEEDS_WARM_SCRIPT = "leaderboard_needs_warm"
+
+    def __init__(self, logger: Optional[Logger] = None) -> None:
+        self.log = logger or get_logger(__name__)
+
+        scripts = RedisService.get_script_registry()
+        scripts.register(self._RECORD_SCORE_SCRIPT, self._LUA_RECORD_SCORE)
+        scripts.register(self._NEEDS_WARM_SCRIPT, self._LUA_NEEDS_WARM)
+
+    # ========================================================================
+    # KEYS
+    # ========================================================================
+
+    def scores_key(self, category: str) -> str:
+        return f"{self.KEY_PREFIX}:{category}:scores"
+
+    def names_key(self, category: str) -> str:
+        return f"{self.KEY_PREFIX}:{category}:names"
+
+    def snapshot_ranks_key(self, category: str) -> str:
+        return f"{self.KEY_PREFIX}:{category}:snapshot_ranks"
+
+    def meta_key(self, category: str) -> str:
+        return f"{self.KEY_PREFIX}:{category}:meta"
+
+    # ========================================================================
+    # WRITES
+    # ========================================================================
+
+    async def record_score(
+        self, category: str, player_id: int, username: str, value: int
+    ) -> int:
+        """
+        Set a player's live score and username (O(log N), one round trip).
+
+        Returns:
+            Player's 1-based live rank after the update
+        """
+        position = await RedisService.run_script(
+            self._RECORD_SCORE_SCRIPT,
+            keys=[
+                self.scores_key(category),
+                self.names_key(category),
+                self.meta_key(category),
+            ],
+            args=[str(player_id), value, username],
+        )
+        return 0 if position is None else int(position) + 1
+
+    async def record_snapshot(
+        self, category: str, ranks: Dict[int, int], snapshot_version: int
+    ) -> None:
+        """Record the ranks and version written by the latest persisted snapshot."""
+        await RedisService.hset(
+            self.snapshot_ranks_key(category),
+            {str(player_id): rank for player_id, rank in ranks.items()},
+        )
+        await RedisService.hset(
+            self.meta_key(category), {"snapshot_version": snapshot_version}
+        )
+
+    async def warm(
+        self,
+        category: str,
+        rows: Iterable[Tuple[int, str, int, int]],
+        snapshot_version: int,
+    ) -> int:
+        """
+        Seed a category from persisted (player_id, username, value, rank) rows.
+
+        Uses ZADD NX so scores recorded concurrently are never overwritten
+        by older snapshot values. Marks the set warmed and resets the member
+        count to the set's size.
+
+        Returns:
+            Number of players newly added to the live set
+        """
+        scores: Dict[str, float] = {}
+        names: Dict[str, str] = {}
+        ranks: Dict[str, int] = {}
+
+        for player_id, username, value, rank in rows:
+            member = str(player_id)
+            scores[member] = value
+            names[member] = username
+            if rank > 0:
+                ranks[member] = rank
+
+        added = await RedisService.zadd(self.scores_key(category), scores, nx=True)
+        await RedisService.hset(self.names_key(category), names)
+        await RedisService.hset(self.snapshot_ranks_key(category), ranks)
+        members = await RedisService.zcard(self.scores_key(category))
+        await RedisService.hset(
+            self.meta_key(category),
+            {"snapshot_version": snapshot_version, "warmed": 1, "members": members},
+        )
+
+        self.log.info(
+            f"Leaderboard live rankings warmed: {category}",
+            extra={
+                "category": category,
+                "rows": len(scores),
+                "added": added,
+                "members": members,
+            },
+        )
+        return added
+
+    # ========================================================================
+    # READS
+    # ========================================================================
+
+    async def needs_warm(self, category: str) -> bool:
+        """True if the live set was never warmed or has lost members."""
+        result = await RedisService.run_script(
+            self._NEEDS_WARM_SCRIPT,
+            keys=[self.scores_key(category), self.meta_key(category)],
+            args=[],
+        )
+        return bool(int(result or 0))
+
+    async def get_snapshot_version(self, category: str) -> int:
+        [version] = await RedisService.hmget(self.meta_key(category), ["snapshot_version"])
+        return int(version) if version else 0
+
+    async def get_page(
+        self, category: str, limit: int, offset: int
+    ) -> List[RankedEntry]:
+        """Ranked entries for [offset, offset + limit) by descending score."""
+        page = await RedisService.zrevrange(
+            self.scores_key(category), offset, offset + limit - 1
+        )
+        if not page:
+            return []
+
+        members = [member for member, _ in page]
+        names = await RedisService.hmget(self.names_key(category), members)
+        previous = await RedisService.hmget(self.snapshot_ranks_key(category), members)
+
+        return [
+            RankedEntry(
+                rank=offset + index + 1,
+                player_id=int(member),
+                username=names[index] or "",
+                value=int(score),
+                rank_change=self._rank_change(previous[index], offset + index + 1),
+            )
+            for index, (member, score) in enumerate(page)
+        ]
+
+    async def get_entry(
+        self, category: str, player_id: int
+    ) -> Optional[RankedEntry]:
+        """Exact live rank for one player, or None if not ranked."""
+        member = str(player_id)
+        position = await RedisService.zrevrank(self.scores_key(category), member)
+        if position is None:
+            return None
+
+        score = await RedisService.zscore(self.scores_key(category), member)
+        [name] = await RedisService.hmget(self.names_key(category), [member])
+        [previous] = await RedisService.hmget(
+            self.snapshot_ranks_key(category), [member]
+        )
+
+        return RankedEntry(
+            rank=position + 1,
+            player_id=player_id,
+            username=name or "",
+            value=int(score or 0),
+            rank_change=self._rank_change(previous, position + 1),
+        )
+
+    async def get_all_scores(self, category: str) -> List[Tuple[int, str, int]]:
+        """Every (player_id, username, value) in rank order."""
+        scores = await RedisService.zrevrange(self.scores_key(category), 0, -1)
+        names = await RedisService.hgetall(self.names_key(category))
+        return [
+            (int(member), names.get(member, ""), int(score))
+            for member, score in scores
+        ]
+
+    # ========================================================================
+    # PRIVATE HELPERS
+    # ========================================================================
+
+    @staticmethod
+    def _rank_change(previous_rank: Optional[str], current_rank: int) -> int:
+        """Positions gained since the last snapshot (positive = moved up)."""
+        if not previous_rank:
+            return 0
+        previous = int(previous_rank)
+        return previous - current_rank if previous > 0 else 0
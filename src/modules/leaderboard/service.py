@@ -25,23 +25,44 @@ LUMEN 2025 COMPLIANCE
 ✓ Event-driven - emits leaderboard.* events
 ✓ Observable - structured logging
 ✓ Efficient queries - optimized for leaderboard rankings
+
+Design Decisions
+----------------
+- With `leaderboards.live_ranking.enabled`, Redis sorted sets are the live
+  source of truth: score updates are a single ZADD (O(log N)), pages are
+  ZREVRANGE and player ranks are exact ZREVRANK lookups
+- Postgres rows become periodic bulk snapshots that carry rank-change
+  history; regeneration reads the sorted set and writes rows by primary key
+  without a category-wide FOR UPDATE lock
+- A background snapshot job persists every category with live updates each
+  `leaderboards.live_ranking.snapshot_interval_seconds` (and once more on
+  shutdown), so losing the Redis data rolls back at most one interval
+- Live sets are (re-)warmed from Postgres whenever Redis reports them
+  never warmed or missing members (checked at most every
+  `leaderboards.live_ranking.warm_check_seconds` per process)
+- Any Redis failure falls back to the Postgres path for that call; a score
+  written to Postgres that way is replayed into Redis on the next live
+  access, so regeneration never overwrites it with the stale live score
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import desc, select
+from sqlalchemy import case, func, insert, select, update
 
 from src.core.database.service import DatabaseService
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
+from src.modules.leaderboard.ranking_store import LeaderboardRankingStore
 from src.modules.shared.base_repository import BaseRepository
 from src.modules.shared.base_service import BaseService
 from src.modules.shared.exceptions import (
     NotFoundError,
     ValidationError,
 )
+from src.modules.shared.write_behind import WriteBehindFlusher
 
 if TYPE_CHECKING:
     from logging import Logger
@@ -57,9 +78,70 @@ if TYPE_CHECKING:
 
 
 class LeaderboardSnapshotRepository(BaseRepository["LeaderboardSnapshot"]):
-    """Repository for LeaderboardSnapshot model."""
+    """Repository for LeaderboardSnapshot model with set-based rank queries."""
+
+    async def regenerate_ranks(
+        self,
+        session: Any,
+        category: str,
+    ) -> Tuple[int, int]:
+        """
+        Re-rank a whole category in the database with one UPDATE statement.
+
+        Ranks come from ROW_NUMBER() OVER (ORDER BY value DESC, id), joined
+        back by primary key via UPDATE ... FROM, so rows are never loaded
+        into the process. rank_change is computed against the stored rank
+        in the same statement (0 for previously unranked rows).
+
+        Returns:
+            Tuple of (rows_updated, new_snapshot_version)
+        """
+        model = self.model_class
+
+        version_result = await session.execute(
+            select(func.coalesce(func.max(model.snapshot_version), 0)).where(
+                model.category == category
+            )
+        )
+        new_version = int(version_result.scalar_one()) + 1
+
+        ranked = (
+            select(
+                model.id.label("snapshot_id"),
+                func.row_number()
+                .over(order_by=(model.value.desc(), model.id))
+                .label("new_rank"),
+            )
+            .where(model.category == category)
+            .subquery("ranked")
+        )
 
-    pass
+        stmt = (
+            update(model)
+            .where(model.id == ranked.c.snapshot_id)
+            .values(
+                rank=ranked.c.new_rank,
+                rank_change=case(
+                    (model.rank > 0, model.rank - ranked.c.new_rank),
+                    else_=0,
+                ),
+                snapshot_version=new_version,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+
+        self.log.debug(
+            f"Repository.regenerate_ranks: {model.__name__}",
+            extra={
+                "model": model.__name__,
+                "category": category,
+                "rows_updated": result.rowcount,
+                "snapshot_version": new_version,
+            },
+        )
+
+        return result.rowcount, new_version
 
 
 # ============================================================================
@@ -80,6 +162,7 @@ class LeaderboardService(BaseService):
     - get_player_rank() -> Get specific player's rank in a category
     - update_player_snapshot() -> Update player's leaderboard entry
     - generate_category_snapshot() -> Regenerate entire category leaderboard
+    - shutdown() -> Write the final live snapshots and stop the snapshot job
     - get_rank_display() -> Format rank with change indicator
     """
 
@@ -106,6 +189,34 @@ class LeaderboardService(BaseService):
             logger=get_logger(f"{__name__}.LeaderboardSnapshotRepository"),
         )
 
+        self._ranking_store = LeaderboardRankingStore(
+            logger=get_logger(f"{__name__}.LeaderboardRankingStore"),
+        )
+        self._live_ranking = bool(
+            self.get_config("leaderboards.live_ranking.enabled", default=False)
+        )
+        self._warm_check_seconds = float(
+            self.get_config("leaderboards.live_ranking.warm_check_seconds", default=5)
+        )
+        # category -> monotonic time of the last successful warm check
+        self._warm_checked_at: Dict[str, float] = {}
+        # category -> player_id -> (username, value) written to Postgres while
+        # Redis was unavailable, replayed into the live set on next access
+        self._pending_live_scores: Dict[str, Dict[int, Tuple[str, int]]] = {}
+        # Categories with live score updates not yet written to Postgres
+        self._unsnapshotted_categories: Dict[str, None] = {}  # insertion-ordered set
+        self._snapshot_flusher = WriteBehindFlusher(
+            self._snapshot_live_categories,
+            lambda: len(self._unsnapshotted_categories),
+            float(
+                self.get_config(
+                    "leaderboards.live_ranking.snapshot_interval_seconds", default=60
+                )
+            ),
+            name="live leaderboard snapshot",
+            logger=self.log,
+        )
+
     # ========================================================================
     # PUBLIC API - Read Operations
     # ========================================================================
@@ -159,6 +270,11 @@ class LeaderboardService(BaseService):
             offset=offset,
         )
 
+        if self._live_ranking:
+            live = await self._get_live_page(category, limit, offset)
+            if live is not None:
+                return live
+
         async with DatabaseService.get_session() as session:
             from src.database.models.progression.leaderboard import (
                 LeaderboardSnapshot,
@@ -225,6 +341,11 @@ class LeaderboardService(BaseService):
             category=category,
         )
 
+        if self._live_ranking:
+            live = await self._get_live_entry(player_id, category)
+            if live is not None:
+                return live
+
         async with DatabaseService.get_session() as session:
             from src.database.models.progression.leaderboard import (
                 LeaderboardSnapshot,
@@ -268,8 +389,11 @@ class LeaderboardService(BaseService):
 
         This is a **write operation** using get_transaction().
 
-        Note: This updates the individual entry but does NOT recalculate ranks
-        across the entire leaderboard. Use generate_category_snapshot() for that.
+        With live ranking enabled this is a single sorted-set update and the
+        returned rank is exact; Postgres is written in bulk by the background
+        snapshot job within snapshot_interval_seconds (or by the next
+        generate_category_snapshot()). Otherwise this updates the individual
+        row but does NOT recalculate ranks across the entire leaderboard.
 
         Args:
             player_id: Discord ID of the player
@@ -309,6 +433,15 @@ class LeaderboardService(BaseService):
             value=value,
         )
 
+        if self._live_ranking:
+            live = await self._record_live_score(player_id, username, category, value)
+            if live is not None:
+                return live
+            self._pending_live_scores.setdefault(category, {})[player_id] = (
+                username,
+                value,
+            )
+
         async with DatabaseService.get_transaction() as session:
             from src.database.models.progression.leaderboard import (
                 LeaderboardSnapshot,
@@ -393,7 +526,10 @@ class LeaderboardService(BaseService):
         This is a **write operation** using get_transaction().
 
         Recalculates all ranks based on current values and updates rank_change
-        based on previous ranks.
+        based on previous ranks. With live ranking enabled, ranks are read
+        from the sorted set and persisted in bulk by primary key; otherwise
+        Postgres is the source of truth and ranks are computed in a single
+        set-based UPDATE without loading rows into the process.
 
         Args:
             category: Leaderboard category to regenerate
@@ -403,7 +539,9 @@ class LeaderboardService(BaseService):
             Dict containing:
                 - category: Leaderboard category
                 - total_entries: Number of entries ranked
+                - rows_updated: Number of snapshot rows written
                 - snapshot_version: New snapshot version number
+                - elapsed_ms: Wall time of the regeneration
 
         Example:
             >>> result = await service.generate_category_snapshot("ascension")
@@ -413,61 +551,379 @@ class LeaderboardService(BaseService):
 
         self.log_operation("generate_category_snapshot", category=category)
 
+        if self._live_ranking:
+            scores = await self._read_live_scores(category)
+            if scores is not None:
+                return await self._persist_live_snapshot(category, scores)
+
+        start_time = time.perf_counter()
+
         async with DatabaseService.get_transaction() as session:
+            rows_updated, new_version = await self._leaderboard_repo.regenerate_ranks(
+                session, category
+            )
+
+            # Event emission
+            await self.emit_event(
+                event_type="leaderboard.category_regenerated",
+                data={
+                    "category": category,
+                    "total_entries": rows_updated,
+                    "snapshot_version": new_version,
+                },
+            )
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        self.log.info(
+            f"Leaderboard category regenerated: {category}",
+            extra={
+                "category": category,
+                "rows_updated": rows_updated,
+                "snapshot_version": new_version,
+                "elapsed_ms": round(elapsed_ms, 2),
+            },
+        )
+
+        return {
+            "category": category,
+            "total_entries": rows_updated,
+            "rows_updated": rows_updated,
+            "snapshot_version": new_version,
+            "elapsed_ms": round(elapsed_ms, 2),
+        }
+
+    async def shutdown(self) -> None:
+        """Write the final live snapshots and stop the background snapshot job."""
+        await self._snapshot_flusher.stop()
+
+    # ========================================================================
+    # LIVE RANKING (REDIS SORTED SETS)
+    # ========================================================================
+
+    async def _ensure_warm(self, category: str) -> None:
+        """
+        Make the live sorted set safe to read or extend.
+
+        - Replays scores that fell back to Postgres while Redis was down
+        - Re-seeds the set from Postgres if Redis reports it was never
+          warmed or has lost members (eviction, flush, partial population);
+          checked at most every warm_check_seconds per category
+        """
+        await self._replay_pending_scores(category)
+
+        checked_at = self._warm_checked_at.get(category)
+        now = time.monotonic()
+        if checked_at is not None and now - checked_at < self._warm_check_seconds:
+            return
+
+        if await self._ranking_store.needs_warm(category):
             from src.database.models.progression.leaderboard import (
                 LeaderboardSnapshot,
             )
 
-            # Get all snapshots for this category, ordered by value descending
-            stmt = (
-                select(LeaderboardSnapshot)
-                .where(LeaderboardSnapshot.category == category)
-                .order_by(desc(LeaderboardSnapshot.value))
-                .with_for_update()
+            async with DatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(
+                        LeaderboardSnapshot.player_id,
+                        LeaderboardSnapshot.username,
+                        LeaderboardSnapshot.value,
+                        LeaderboardSnapshot.rank,
+                        LeaderboardSnapshot.snapshot_version,
+                    ).where(LeaderboardSnapshot.category == category)
+                )
+                rows = result.all()
+
+            await self._ranking_store.warm(
+                category,
+                ((r.player_id, r.username, r.value, r.rank) for r in rows),
+                snapshot_version=max((r.snapshot_version for r in rows), default=0),
             )
 
-            result = await session.execute(stmt)
-            snapshots = result.scalars().all()
+        self._warm_checked_at[category] = now
+
+    async def _replay_pending_scores(self, category: str) -> None:
+        """Write scores recorded during a Redis outage into the live set."""
+        pending = self._pending_live_scores.get(category)
+        while pending:
+            player_id, (username, value) = next(iter(pending.items()))
+            await self._ranking_store.record_score(category, player_id, username, value)
+            # A newer fallback may have replaced the entry while awaiting
+            if pending.get(player_id) == (username, value):
+                del pending[player_id]
+
+    async def _get_live_page(
+        self, category: str, limit: int, offset: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Leaderboard page from Redis, or None to fall back to Postgres."""
+        try:
+            await self._ensure_warm(category)
+            entries = await self._ranking_store.get_page(category, limit, offset)
+            version = await self._ranking_store.get_snapshot_version(category)
+        except Exception as e:
+            self._log_live_fallback("get_leaderboard", category, e)
+            return None
+
+        return [
+            {
+                "rank": entry.rank,
+                "player_id": entry.player_id,
+                "username": entry.username,
+                "value": entry.value,
+                "rank_change": entry.rank_change,
+                "snapshot_version": version,
+            }
+            for entry in entries
+        ]
 
-            # Calculate new ranks
-            new_version = 1
-            if snapshots:
-                new_version = max(s.snapshot_version for s in snapshots) + 1
+    async def _get_live_entry(
+        self, player_id: int, category: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Exact player rank from Redis, or None to fall back to Postgres.
 
-            for i, snapshot in enumerate(snapshots, start=1):
-                old_rank = snapshot.rank
-                new_rank = i
+        Raises:
+            NotFoundError: If the player has no live score
+        """
+        try:
+            await self._ensure_warm(category)
+            entry = await self._ranking_store.get_entry(category, player_id)
+        except Exception as e:
+            self._log_live_fallback("get_player_rank", category, e)
+            return None
+
+        if entry is None:
+            raise NotFoundError(
+                "LeaderboardSnapshot",
+                f"player_id={player_id}, category={category}",
+            )
+
+        return {
+            "rank": entry.rank,
+            "player_id": entry.player_id,
+            "username": entry.username,
+            "value": entry.value,
+            "rank_change": entry.rank_change,
+            "category": category,
+        }
+
+    async def _record_live_score(
+        self, player_id: int, username: str, category: str, value: int
+    ) -> Optional[Dict[str, Any]]:
+        """Apply a score update to Redis, or None to fall back to Postgres."""
+        try:
+            await self._ensure_warm(category)
+            rank = await self._ranking_store.record_score(
+                category, player_id, username, value
+            )
+        except Exception as e:
+            self._log_live_fallback("update_player_snapshot", category, e)
+            return None
+
+        # This score supersedes any older one still waiting for replay
+        self._pending_live_scores.get(category, {}).pop(player_id, None)
+        self._unsnapshotted_categories[category] = None
+        self._snapshot_flusher.ensure_started()
+
+        await self.emit_event(
+            event_type="leaderboard.snapshot_updated",
+            data={
+                "player_id": player_id,
+                "category": category,
+                "value": value,
+            },
+        )
 
-                rank_change = old_rank - new_rank if old_rank > 0 else 0
+        return {
+            "player_id": player_id,
+            "username": username,
+            "category": category,
+            "rank": rank,
+            "value": value,
+        }
+
+    async def _read_live_scores(
+        self, category: str
+    ) -> Optional[List[Tuple[int, str, int]]]:
+        """Full live ranking from Redis, or None to fall back to Postgres."""
+        try:
+            await self._ensure_warm(category)
+            return await self._ranking_store.get_all_scores(category)
+        except Exception as e:
+            self._log_live_fallback("generate_category_snapshot", category, e)
+            return None
+
+    async def _persist_live_snapshot(
+        self,
+        category: str,
+        scores: List[Tuple[int, str, int]],
+    ) -> Dict[str, Any]:
+        """
+        Write the live ranking to Postgres as one bulk snapshot.
+
+        Existing rows are updated by primary key in a single executemany and
+        new players are inserted in one multi-row INSERT. Rows for players
+        missing from the live set keep their stored value and are ranked
+        among the live scores in the same UPDATE, so every row of the
+        category carries the new version and ranks stay unique. No
+        category-wide row lock is taken; live reads never depend on these
+        rows.
+        """
+        from src.database.models.progression.leaderboard import LeaderboardSnapshot
 
-                snapshot.rank = new_rank
-                snapshot.rank_change = rank_change
-                snapshot.snapshot_version = new_version
+        start_time = time.perf_counter()
+
+        async with DatabaseService.get_transaction() as session:
+            result = await session.execute(
+                select(
+                    LeaderboardSnapshot.id,
+                    LeaderboardSnapshot.player_id,
+                    LeaderboardSnapshot.username,
+                    LeaderboardSnapshot.value,
+                    LeaderboardSnapshot.rank,
+                    LeaderboardSnapshot.snapshot_version,
+                ).where(LeaderboardSnapshot.category == category)
+            )
+            existing = {row.player_id: row for row in result.all()}
+
+            live_players = {player_id for player_id, _, _ in scores}
+            missing = sorted(
+                (
+                    (row.player_id, row.username, row.value)
+                    for row in existing.values()
+                    if row.player_id not in live_players
+                ),
+                key=lambda entry: (-entry[2], existing[entry[0]].id),
+            )
+            if missing:
+                # Stable sort: live order is kept, ties rank live players first
+                scores = sorted([*scores, *missing], key=lambda entry: -entry[2])
+
+            new_version = (
+                max((row.snapshot_version for row in existing.values()), default=0) + 1
+            )
+
+            updates: List[Dict[str, Any]] = []
+            inserts: List[Dict[str, Any]] = []
+            ranks: Dict[int, int] = {}
+
+            for rank, (player_id, username, value) in enumerate(scores, start=1):
+                ranks[player_id] = rank
+                row = existing.get(player_id)
+
+                if row is not None:
+                    updates.append(
+                        {
+                            "id": row.id,
+                            "username": username or row.username,
+                            "value": value,
+                            "rank": rank,
+                            "rank_change": row.rank - rank if row.rank > 0 else 0,
+                            "snapshot_version": new_version,
+                        }
+                    )
+                else:
+                    inserts.append(
+                        {
+                            "player_id": player_id,
+                            "username": username,
+                            "category": category,
+                            "rank": rank,
+                            "rank_change": 0,
+                            "value": value,
+                            "snapshot_version": new_version,
+                        }
+                    )
+
+            if updates:
+                await session.execute(update(LeaderboardSnapshot), updates)
+            if inserts:
+                await session.execute(insert(LeaderboardSnapshot), inserts)
 
-            # Event emission
             await self.emit_event(
                 event_type="leaderboard.category_regenerated",
                 data={
                     "category": category,
-                    "total_entries": len(snapshots),
+                    "total_entries": len(scores),
                     "snapshot_version": new_version,
                 },
             )
 
-            self.log.info(
-                f"Leaderboard category regenerated: {category}",
-                extra={
-                    "category": category,
-                    "total_entries": len(snapshots),
-                    "snapshot_version": new_version,
-                },
-            )
+        try:
+            await self._ranking_store.record_snapshot(category, ranks, new_version)
+        except Exception as e:
+            self._log_live_fallback("record_snapshot", category, e)
 
-            return {
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        self.log.info(
+            f"Leaderboard category regenerated: {category}",
+            extra={
                 "category": category,
-                "total_entries": len(snapshots),
+                "total_entries": len(scores),
+                "rows_updated": len(updates),
+                "rows_inserted": len(inserts),
+                "rows_missing_from_live": len(missing),
                 "snapshot_version": new_version,
-            }
+                "elapsed_ms": round(elapsed_ms, 2),
+            },
+        )
+
+        return {
+            "category": category,
+            "total_entries": len(scores),
+            "rows_updated": len(updates) + len(inserts),
+            "snapshot_version": new_version,
+            "elapsed_ms": round(elapsed_ms, 2),
+        }
+
+    async def _snapshot_live_categories(self) -> int:
+        """
+        Persist every category with live updates since its last scheduled
+        snapshot (the snapshot job's flush).
+
+        A category whose live set cannot be read (Redis down) or written
+        stays marked and is retried on the next run.
+
+        Returns:
+            Number of categories persisted
+
+        Raises:
+            Exception: If a snapshot write fails (remaining categories are
+                marked again first)
+        """
+        categories = list(self._unsnapshotted_categories)
+        self._unsnapshotted_categories = {}
+        persisted = 0
+
+        try:
+            for index, category in enumerate(categories):
+                scores = await self._read_live_scores(category)
+                if scores is None:
+                    self._unsnapshotted_categories[category] = None
+                    continue
+                await self._persist_live_snapshot(category, scores)
+                persisted += 1
+        except BaseException:
+            for category in categories[index:]:
+                self._unsnapshotted_categories[category] = None
+            raise
+
+        return persisted
+
+    def _log_live_fallback(
+        self, operation: str, category: str, error: Exception
+    ) -> None:
+        """Log a Redis failure that falls back to the Postgres path."""
+        self.log.warning(
+            f"Live leaderboard unavailable, using database: {operation}",
+            extra={
+                "operation": operation,
+                "category": category,
+                "error": str(error),
+                "error_type": type(error).__name__,
+            },
+        )
 
     # ========================================================================
     # PRIVATE HELPERS
@@ -11,11 +11,13 @@ Services
 - MaidenBaseService: Maiden templates, gacha pools, power calculations
 - PowerCalculationService: Maiden stat calculations and tier scaling
 - LeaderSkillService: Leader effect calculations for combat
+- MaidenCatalog: In-memory MaidenBase catalog with version-stamped reloads
 
 All services are transaction-safe, config-driven, and event-driven.
 """
 
 from .base_service import MaidenBaseService
+from .catalog import MaidenBaseCatalog, MaidenBaseRecord, MaidenCatalog
 from .service import MaidenService
 from .power_service import PowerCalculationService
 from .leader_skill_service import LeaderSkillService
@@ -25,4 +27,7 @@ __all__ = [
     "MaidenBaseService",
     "PowerCalculationService",
     "LeaderSkillService",
+    "MaidenCatalog",
+    "MaidenBaseCatalog",
+    "MaidenBaseRecord",
 ]
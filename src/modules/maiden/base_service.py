@@ -26,6 +26,11 @@ LUMEN 2025 COMPLIANCE
 ✓ Event-driven - emits events for template changes
 ✓ Observable - structured logging
 ✓ Pessimistic locking - uses SELECT FOR UPDATE when needed
+
+Design Decisions
+----------------
+- Template reads are served from the in-memory MaidenCatalog (reloaded
+  when its Redis version stamp changes), not from Postgres
 """
 
 from __future__ import annotations
@@ -34,9 +39,9 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from sqlalchemy import and_, select
 
-from src.core.database.service import DatabaseService
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
+from src.modules.maiden.catalog import MaidenCatalog
 from src.modules.shared.base_repository import BaseRepository
 from src.modules.shared.base_service import BaseService
 from src.modules.shared.exceptions import (
@@ -50,6 +55,7 @@ if TYPE_CHECKING:
     from src.core.config.manager import ConfigManager
     from src.core.event.bus import EventBus
     from src.database.models.core.maiden_base import MaidenBase
+    from src.modules.maiden.catalog import MaidenBaseRecord
 
 
 # ============================================================================
@@ -132,7 +138,7 @@ class MaidenBaseService(BaseService):
     - ConfigManager: For tier scaling formulas
     - EventBus: For emitting template events
     - Logger: For structured logging
-    - DatabaseService: For transaction management (injected via context)
+    - MaidenCatalog: In-memory template catalog (version-stamped in Redis)
 
     Public Methods
     --------------
@@ -178,7 +184,7 @@ class MaidenBaseService(BaseService):
         """
         Get maiden base by ID.
 
-        This is a **read-only** operation using get_session().
+        This is a **read-only** operation served from the MaidenCatalog.
 
         Args:
             maiden_base_id: Maiden base template ID
@@ -199,13 +205,13 @@ class MaidenBaseService(BaseService):
 
         self.log_operation("get_maiden_base", maiden_base_id=maiden_base_id)
 
-        async with DatabaseService.get_session() as session:
-            maiden_base = await self._maiden_base_repo.get(session, maiden_base_id)
+        catalog = await MaidenCatalog.get()
+        maiden_base = catalog.get(maiden_base_id)
 
-            if not maiden_base:
-                raise NotFoundError("MaidenBase", maiden_base_id)
+        if not maiden_base:
+            raise NotFoundError("MaidenBase", maiden_base_id)
 
-            return self._maiden_base_to_dict(maiden_base)
+        return self._maiden_base_to_dict(maiden_base)
 
     async def get_maiden_base_by_name(self, name: str) -> Dict[str, Any]:
         """
@@ -232,13 +238,13 @@ class MaidenBaseService(BaseService):
 
         self.log_operation("get_maiden_base_by_name", name=name)
 
-        async with DatabaseService.get_session() as session:
-            maiden_base = await self._maiden_base_repo.find_by_name(session, name)
+        catalog = await MaidenCatalog.get()
+        maiden_base = catalog.get_by_name(name)
 
-            if not maiden_base:
-                raise NotFoundError("MaidenBase", name)
+        if not maiden_base:
+            raise NotFoundError("MaidenBase", name)
 
-            return self._maiden_base_to_dict(maiden_base)
+        return self._maiden_base_to_dict(maiden_base)
 
     async def get_maiden_bases_by_element(self, element: str) -> List[Dict[str, Any]]:
         """
@@ -255,12 +261,8 @@ class MaidenBaseService(BaseService):
         """
         self.log_operation("get_maiden_bases_by_element", element=element)
 
-        async with DatabaseService.get_session() as session:
-            maiden_bases = await self._maiden_base_repo.find_by_element(
-                session, element
-            )
-
-            return [self._maiden_base_to_dict(mb) for mb in maiden_bases]
+        catalog = await MaidenCatalog.get()
+        return [self._maiden_base_to_dict(mb) for mb in catalog.by_element(element)]
 
     async def get_all_maiden_bases(self) -> List[Dict[str, Any]]:
         """
@@ -274,10 +276,8 @@ class MaidenBaseService(BaseService):
         """
         self.log_operation("get_all_maiden_bases")
 
-        async with DatabaseService.get_session() as session:
-            maiden_bases = await self._maiden_base_repo.find_many_where(session)
-
-            return [self._maiden_base_to_dict(mb) for mb in maiden_bases]
+        catalog = await MaidenCatalog.get()
+        return [self._maiden_base_to_dict(mb) for mb in catalog.all()]
 
     async def get_gacha_pool(
         self, include_premium: bool = False
@@ -299,13 +299,11 @@ class MaidenBaseService(BaseService):
             include_premium=include_premium,
         )
 
-        async with DatabaseService.get_session() as session:
-            maiden_bases = await self._maiden_base_repo.get_gacha_pool(
-                session,
-                include_premium=include_premium,
-            )
-
-            return [self._maiden_base_to_dict(mb) for mb in maiden_bases]
+        catalog = await MaidenCatalog.get()
+        return [
+            self._maiden_base_to_dict(mb)
+            for mb in catalog.gacha_pool(include_premium=include_premium)
+        ]
 
     async def get_all_elements(self) -> List[str]:
         """
@@ -320,10 +318,8 @@ class MaidenBaseService(BaseService):
         """
         self.log_operation("get_all_elements")
 
-        async with DatabaseService.get_session() as session:
-            elements = await self._maiden_base_repo.get_all_elements(session)
-
-            return elements
+        catalog = await MaidenCatalog.get()
+        return list(catalog.elements)
 
     # ========================================================================
     # PUBLIC API - Power Calculation
@@ -374,46 +370,46 @@ class MaidenBaseService(BaseService):
             tier=tier,
         )
 
-        async with DatabaseService.get_session() as session:
-            maiden_base = await self._maiden_base_repo.get(session, maiden_base_id)
+        catalog = await MaidenCatalog.get()
+        maiden_base = catalog.get(maiden_base_id)
 
-            if not maiden_base:
-                raise NotFoundError("MaidenBase", maiden_base_id)
+        if not maiden_base:
+            raise NotFoundError("MaidenBase", maiden_base_id)
 
-            # Config-driven tier scaling
-            scaling_formula = self.get_config("TIER_SCALING_FORMULA", default="linear")
-            scaling_multiplier = self.get_config(
-                "TIER_SCALING_MULTIPLIER", default=1.2
-            )
+        # Config-driven tier scaling
+        scaling_formula = self.get_config("TIER_SCALING_FORMULA", default="linear")
+        scaling_multiplier = self.get_config(
+            "TIER_SCALING_MULTIPLIER", default=1.2
+        )
+
+        # Calculate stats based on formula
+        if scaling_formula == "linear":
+            # Linear: base * (1 + tier * multiplier)
+            attack = int(maiden_base.base_atk * (1 + (tier - 1) * 0.2))
+            defense = int(maiden_base.base_def * (1 + (tier - 1) * 0.2))
+        elif scaling_formula == "exponential":
+            # Exponential: base * (multiplier ^ (tier - 1))
+            attack = int(maiden_base.base_atk * (scaling_multiplier ** (tier - 1)))
+            defense = int(maiden_base.base_def * (scaling_multiplier ** (tier - 1)))
+        elif scaling_formula == "polynomial":
+            # Polynomial: base * (1 + tier^2 * multiplier)
+            attack = int(maiden_base.base_atk * (1 + (tier**2) * 0.05))
+            defense = int(maiden_base.base_def * (1 + (tier**2) * 0.05))
+        else:
+            # Default to linear
+            attack = int(maiden_base.base_atk * (1 + (tier - 1) * 0.2))
+            defense = int(maiden_base.base_def * (1 + (tier - 1) * 0.2))
 
-            # Calculate stats based on formula
-            if scaling_formula == "linear":
-                # Linear: base * (1 + tier * multiplier)
-                attack = int(maiden_base.base_atk * (1 + (tier - 1) * 0.2))
-                defense = int(maiden_base.base_def * (1 + (tier - 1) * 0.2))
-            elif scaling_formula == "exponential":
-                # Exponential: base * (multiplier ^ (tier - 1))
-                attack = int(maiden_base.base_atk * (scaling_multiplier ** (tier - 1)))
-                defense = int(maiden_base.base_def * (scaling_multiplier ** (tier - 1)))
-            elif scaling_formula == "polynomial":
-                # Polynomial: base * (1 + tier^2 * multiplier)
-                attack = int(maiden_base.base_atk * (1 + (tier**2) * 0.05))
-                defense = int(maiden_base.base_def * (1 + (tier**2) * 0.05))
-            else:
-                # Default to linear
-                attack = int(maiden_base.base_atk * (1 + (tier - 1) * 0.2))
-                defense = int(maiden_base.base_def * (1 + (tier - 1) * 0.2))
-
-            total_power = attack + defense
-
-            return {
-                "maiden_base_id": maiden_base_id,
-                "maiden_name": maiden_base.name,
-                "tier": tier,
-                "attack": attack,
-                "defense": defense,
-                "total_power": total_power,
-            }
+        total_power = attack + defense
+
+        return {
+            "maiden_base_id": maiden_base_id,
+            "maiden_name": maiden_base.name,
+            "tier": tier,
+            "attack": attack,
+            "defense": defense,
+            "total_power": total_power,
+        }
 
     # ========================================================================
     # PUBLIC API - Leader Effect Parsing
@@ -452,27 +448,27 @@ class MaidenBaseService(BaseService):
 
         self.log_operation("parse_leader_effect", maiden_base_id=maiden_base_id)
 
-        async with DatabaseService.get_session() as session:
-            maiden_base = await self._maiden_base_repo.get(session, maiden_base_id)
+        catalog = await MaidenCatalog.get()
+        maiden_base = catalog.get(maiden_base_id)
 
-            if not maiden_base:
-                raise NotFoundError("MaidenBase", maiden_base_id)
+        if not maiden_base:
+            raise NotFoundError("MaidenBase", maiden_base_id)
 
-            leader_effect = maiden_base.leader_effect or {}
+        leader_effect = maiden_base.leader_effect or {}
 
-            # Parse leader effect structure
-            has_effect = bool(leader_effect and leader_effect.get("type"))
+        # Parse leader effect structure
+        has_effect = bool(leader_effect and leader_effect.get("type"))
 
-            return {
-                "maiden_base_id": maiden_base_id,
-                "maiden_name": maiden_base.name,
-                "has_leader_effect": has_effect,
-                "effect_type": leader_effect.get("type") if has_effect else None,
-                "effect_value": leader_effect.get("value") if has_effect else None,
-                "effect_target": leader_effect.get("target") if has_effect else None,
-                "description": leader_effect.get("description") if has_effect else None,
-                "raw_effect": leader_effect,
-            }
+        return {
+            "maiden_base_id": maiden_base_id,
+            "maiden_name": maiden_base.name,
+            "has_leader_effect": has_effect,
+            "effect_type": leader_effect.get("type") if has_effect else None,
+            "effect_value": leader_effect.get("value") if has_effect else None,
+            "effect_target": leader_effect.get("target") if has_effect else None,
+            "description": leader_effect.get("description") if has_effect else None,
+            "raw_effect": leader_effect,
+        }
 
     # ========================================================================
     # PUBLIC API - Rarity & Gacha Logic
@@ -499,25 +495,21 @@ class MaidenBaseService(BaseService):
             include_premium=include_premium,
         )
 
-        async with DatabaseService.get_session() as session:
-            maiden_bases = await self._maiden_base_repo.get_gacha_pool(
-                session,
-                include_premium=include_premium,
-            )
-
-            total_weight = sum(mb.rarity_weight for mb in maiden_bases)
+        catalog = await MaidenCatalog.get()
 
-            return {
-                "total_weight": total_weight,
-                "pool_size": len(maiden_bases),
-                "include_premium": include_premium,
-            }
+        return {
+            "total_weight": catalog.total_rarity_weight(include_premium=include_premium),
+            "pool_size": len(catalog.gacha_pool(include_premium=include_premium)),
+            "include_premium": include_premium,
+        }
 
     # ========================================================================
     # PRIVATE HELPERS
     # ========================================================================
 
-    def _maiden_base_to_dict(self, maiden_base: "MaidenBase") -> Dict[str, Any]:
+    def _maiden_base_to_dict(
+        self, maiden_base: "MaidenBase | MaidenBaseRecord"
+    ) -> Dict[str, Any]:
         """Convert maiden base model to dict."""
         return {
             "id": maiden_base.id,
@@ -0,0 +1,392 @@
+"""
+Maiden Base Catalog - LES 2025 Compliant
+========================================
+
+Purpose
+-------
+Holds MaidenBase templates (static game data) in memory so template reads,
+gacha pools and power calculations do not query or join `maiden_bases`.
+
+Domain
+------
+- Immutable snapshot of every MaidenBase as slotted records
+- Indexes by id, name, element, base tier, and gacha pool (with and
+  without premium maidens)
+- Reload only when the catalog version stamp in Redis changes
+
+LUMEN 2025 COMPLIANCE
+---------------------
+✓ Pure data access - no game rules beyond ordering
+✓ Infrastructure via RedisService and DatabaseService
+✓ Config-driven - version check interval via ConfigManager
+✓ Graceful degradation - Redis failures keep the loaded snapshot; reload
+  failures keep the previous snapshot
+✓ Observable - reload counters and structured logging
+
+Configuration Keys
+------------------
+- maiden.catalog.version_check_interval_seconds : float (default 30)
+
+Design Decisions
+----------------
+- Key layout:
+    maiden:catalog:version   STRING   opaque stamp, changed by publish_version()
+- Anything that edits maiden_bases (seeding, admin tools) calls
+  MaidenCatalog.publish_version(); every process picks the change up within
+  one check interval
+- The stamp is read before the rows, so an edit that lands mid-load is
+  picked up by the next check rather than lost
+- Snapshots are never mutated; a reload swaps in a new one, so readers
+  holding the old snapshot stay consistent
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from src.core.database.service import DatabaseService
+from src.core.logging.logger import get_logger
+from src.core.redis.service import RedisService
+
+if TYPE_CHECKING:
+    from src.core.config.manager import ConfigManager
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# Data Models
+# ============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class MaidenBaseRecord:
+    """
+    Immutable in-memory copy of one MaidenBase row.
+
+    Attribute names match the model, so helpers that read a MaidenBase
+    (e.g. _maiden_base_to_dict) accept either.
+    """
+
+    id: int
+    name: str
+    element: str
+    base_tier: int
+    base_atk: int
+    base_def: int
+    leader_effect: Dict[str, Any]
+    description: str
+    image_url: str
+    rarity_weight: float
+    is_premium: bool
+
+
+class MaidenBaseCatalog:
+    """
+    Immutable, indexed snapshot of all maiden base templates.
+
+    Public Methods
+    --------------
+    - get() / require_all() -> Records by id
+    - get_by_name() -> Record by unique name
+    - by_element() -> Records for an element (base_tier desc, name)
+    - by_base_tier() -> Records for a base tier (name)
+    - gacha_pool() / total_rarity_weight() -> Gacha pool views
+    - elements -> All distinct elements
+    """
+
+    __slots__ = (
+        "version",
+        "loaded_at",
+        "_by_id",
+        "_by_name",
+        "_by_element",
+        "_by_base_tier",
+        "_standard_pool",
+        "_full_pool",
+        "_standard_weight",
+        "_full_weight",
+        "_elements",
+    )
+
+    def __init__(self, records: Iterable[MaidenBaseRecord], version: Optional[str]) -> None:
+        self.version = version
+        self.loaded_at = time.time()
+
+        ordered = sorted(records, key=lambda r: r.id)
+        self._by_id: Dict[int, MaidenBaseRecord] = {r.id: r for r in ordered}
+        self._by_name: Dict[str, MaidenBaseRecord] = {r.name: r for r in ordered}
+
+        by_element: Dict[str, List[MaidenBaseRecord]] = {}
+        by_base_tier: Dict[int, List[MaidenBaseRecord]] = {}
+        for record in ordered:
+            by_element.setdefault(record.element, []).append(record)
+            by_base_tier.setdefault(record.base_tier, []).append(record)
+
+        self._by_element: Dict[str, Tuple[MaidenBaseRecord, ...]] = {
+            element: tuple(sorted(group, key=lambda r: (-r.base_tier, r.name)))
+            for element, group in by_element.items()
+        }
+        self._by_base_tier: Dict[int, Tuple[MaidenBaseRecord, ...]] = {
+            tier: tuple(sorted(group, key=lambda r: r.name))
+            for tier, group in by_base_tier.items()
+        }
+
+        self._full_pool = tuple(sorted(ordered, key=lambda r: r.rarity_weight))
+        self._standard_pool = tuple(r for r in self._full_pool if not r.is_premium)
+        self._full_weight = sum(r.rarity_weight for r in self._full_pool)
+        self._standard_weight = sum(r.rarity_weight for r in self._standard_pool)
+        self._elements = tuple(sorted(self._by_element))
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get(self, maiden_base_id: int) -> Optional[MaidenBaseRecord]:
+        return self._by_id.get(maiden_base_id)
+
+    def require_all(self, maiden_base_ids: Iterable[int]) -> bool:
+        """True if every id is in the catalog."""
+        return all(base_id in self._by_id for base_id in maiden_base_ids)
+
+    def get_by_name(self, name: str) -> Optional[MaidenBaseRecord]:
+        return self._by_name.get(name)
+
+    def by_element(self, element: str) -> Tuple[MaidenBaseRecord, ...]:
+        return self._by_element.get(element, ())
+
+    def by_base_tier(self, base_tier: int) -> Tuple[MaidenBaseRecord, ...]:
+        return self._by_base_tier.get(base_tier, ())
+
+    def all(self) -> Tuple[MaidenBaseRecord, ...]:
+        return tuple(self._by_id.values())
+
+    def gacha_pool(self, include_premium: bool = False) -> Tuple[MaidenBaseRecord, ...]:
+        """Gacha pool ordered by rarity weight."""
+        return self._full_pool if include_premium else self._standard_pool
+
+    def total_rarity_weight(self, include_premium: bool = False) -> float:
+        return self._full_weight if include_premium else self._standard_weight
+
+    @property
+    def elements(self) -> Tuple[str, ...]:
+        return self._elements
+
+
+# ============================================================================
+# MaidenCatalog (process-wide holder)
+# ============================================================================
+
+
+class MaidenCatalog:
+    """
+    Process-wide holder for the current MaidenBaseCatalog snapshot.
+
+    Example
+    -------
+    >>> catalog = await MaidenCatalog.get()
+    >>> record = catalog.get(maiden_base_id)
+    """
+
+    VERSION_KEY = "maiden:catalog:version"
+
+    _catalog: Optional[MaidenBaseCatalog] = None
+    _check_interval: float = 30.0
+    _last_check: float = 0.0
+    _reload_lock: Optional[asyncio.Lock] = None
+
+    _reloads: int = 0
+    _reload_failures: int = 0
+    _version_checks: int = 0
+
+    @classmethod
+    def configure(cls, config_manager: ConfigManager) -> None:
+        """Read the version check interval from config."""
+        cls._check_interval = max(
+            0.0,
+            float(
+                config_manager.get(
+                    "maiden.catalog.version_check_interval_seconds", default=30.0
+                )
+            ),
+        )
+
+    # ========================================================================
+    # READS
+    # ========================================================================
+
+    @classmethod
+    async def get(cls) -> MaidenBaseCatalog:
+        """
+        Current snapshot, loading it on first use and reloading it if the
+        Redis version stamp changed since the last check.
+        """
+        catalog = cls._catalog
+        if catalog is None:
+            return await cls.reload()
+
+        now = time.monotonic()
+        if now - cls._last_check < cls._check_interval:
+            return catalog
+
+        cls._last_check = now
+        cls._version_checks += 1
+        try:
+            version = await RedisService.get(cls.VERSION_KEY)
+        except Exception as exc:
+            logger.debug(
+                "Maiden catalog version check failed (keeping snapshot)",
+                extra={"error": str(exc), "error_type": type(exc).__name__},
+            )
+            return catalog
+
+        if version is not None and version != catalog.version:
+            try:
+                return await cls.reload()
+            except Exception:
+                return catalog
+        return catalog
+
+    @classmethod
+    async def get_covering(cls, maiden_base_ids: Iterable[int]) -> MaidenBaseCatalog:
+        """
+        Snapshot containing every given id, reloading once if any is missing
+        (a template added without a version bump).
+        """
+        ids = set(maiden_base_ids)
+        catalog = await cls.get()
+        if catalog.require_all(ids):
+            return catalog
+
+        try:
+            catalog = await cls.reload()
+        except Exception:
+            return catalog
+
+        if not catalog.require_all(ids):
+            logger.warning(
+                "Maiden catalog missing templates after reload",
+                extra={"missing_ids": sorted(i for i in ids if catalog.get(i) is None)},
+            )
+        return catalog
+
+    # ========================================================================
+    # LOADING
+    # ========================================================================
+
+    @classmethod
+    async def reload(cls) -> MaidenBaseCatalog:
+        """
+        Load a fresh snapshot from Postgres and swap it in.
+
+        Raises:
+            Exception: Whatever the load raised, if there is no previous
+                snapshot to fall back to
+        """
+        if cls._reload_lock is None:
+            cls._reload_lock = asyncio.Lock()
+
+        previous = cls._catalog
+        async with cls._reload_lock:
+            # Another coroutine reloaded while we waited
+            if cls._catalog is not None and cls._catalog is not previous:
+                return cls._catalog
+
+            start = time.perf_counter()
+            try:
+                try:
+                    version = await RedisService.get(cls.VERSION_KEY)
+                except Exception:
+                    version = None
+
+                records = await cls._load_records()
+                catalog = MaidenBaseCatalog(records, version)
+
+            except Exception as exc:
+                cls._reload_failures += 1
+                logger.error(
+                    "Maiden catalog load failed",
+                    extra={
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                        "has_previous_snapshot": previous is not None,
+                    },
+                    exc_info=True,
+                )
+                if previous is None:
+                    raise
+                return previous
+
+            cls._catalog = catalog
+            cls._last_check = time.monotonic()
+            cls._reloads += 1
+
+            logger.info(
+                "Maiden catalog loaded",
+                extra={
+                    "templates": len(catalog),
+                    "elements": len(catalog.elements),
+                    "version": version,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                },
+            )
+            return catalog
+
+    @classmethod
+    async def publish_version(cls) -> str:
+        """
+        Stamp a new catalog version in Redis and reload locally.
+
+        Call after changing maiden_bases rows; other processes reload within
+        one check interval.
+        """
+        version = uuid.uuid4().hex
+        await RedisService.set(cls.VERSION_KEY, version)
+        await cls.reload()
+        return version
+
+    @staticmethod
+    async def _load_records() -> List[MaidenBaseRecord]:
+        from src.database.models.core.maiden_base import MaidenBase
+
+        async with DatabaseService.get_session() as session:
+            result = await session.execute(select(MaidenBase))
+            return [
+                MaidenBaseRecord(
+                    id=row.id,
+                    name=row.name,
+                    element=row.element,
+                    base_tier=row.base_tier,
+                    base_atk=row.base_atk,
+                    base_def=row.base_def,
+                    leader_effect=row.leader_effect or {},
+                    description=row.description,
+                    image_url=row.image_url,
+                    rarity_weight=row.rarity_weight,
+                    is_premium=row.is_premium,
+                )
+                for row in result.scalars().all()
+            ]
+
+    # ========================================================================
+    # STATUS
+    # ========================================================================
+
+    @classmethod
+    def get_status(cls) -> Dict[str, Any]:
+        """Snapshot size/version and reload counters."""
+        catalog = cls._catalog
+        return {
+            "loaded": catalog is not None,
+            "templates": len(catalog) if catalog is not None else 0,
+            "version": catalog.version if catalog is not None else None,
+            "loaded_at": catalog.loaded_at if catalog is not None else None,
+            "reloads": cls._reloads,
+            "reload_failures": cls._reload_failures,
+            "version_checks": cls._version_checks,
+        }
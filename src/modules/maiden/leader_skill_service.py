@@ -21,7 +21,8 @@ LUMEN 2025 COMPLIANCE
 ✓ Config-driven - leader_effects from config
 ✓ Domain exceptions - raises NotFoundError when leader invalid
 ✓ Observable - structured logging for effect application
-✓ Read-only operations - uses get_session() pattern
+✓ Read-only operations - uses get_session() pattern; the player row is
+  read through the command's UnitOfWork identity map
 ✓ Type-safe - complete type hints with Literal types
 
 Design Decisions
@@ -48,6 +49,7 @@ from sqlalchemy import select
 
 from src.core.config.manager import ConfigManager
 from src.core.database.service import DatabaseService
+from src.core.database.unit_of_work import load_player_row
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
 from src.modules.shared.exceptions import NotFoundError
@@ -215,22 +217,21 @@ class LeaderSkillService:
             extra={"player_id": player_id, "operation": "get_leader_modifiers"},
         )
 
+        from src.database.models.core.player.player_core import PlayerCore
+
+        # Get player's leader maiden ID (shared with the command's other reads)
+        player_core: Optional[PlayerCore] = await load_player_row(PlayerCore, player_id)
+
+        if not player_core or not player_core.leader_maiden_id:
+            self._logger.debug(
+                "No leader set for player",
+                extra={"player_id": player_id},
+            )
+            return LeaderModifiers()
+
         async with DatabaseService.get_session() as session:
             from src.database.models.core.maiden import Maiden
             from src.database.models.core.maiden_base import MaidenBase
-            from src.database.models.core.player.player_core import PlayerCore
-
-            # Get player's leader maiden ID
-            player_query = select(PlayerCore).where(PlayerCore.discord_id == player_id)
-            player_result = await session.execute(player_query)
-            player_core: Optional[PlayerCore] = player_result.scalar_one_or_none()
-
-            if not player_core or not player_core.leader_maiden_id:
-                self._logger.debug(
-                    "No leader set for player",
-                    extra={"player_id": player_id},
-                )
-                return LeaderModifiers()
 
             # Get leader maiden and base
             maiden_query = (
@@ -298,17 +299,16 @@ class LeaderSkillService:
         """
         player_id = InputValidator.validate_discord_id(player_id)
 
+        from src.database.models.core.player.player_core import PlayerCore
+
+        player_core: Optional[PlayerCore] = await load_player_row(PlayerCore, player_id)
+
+        if not player_core or not player_core.leader_maiden_id:
+            return None
+
         async with DatabaseService.get_session() as session:
             from src.database.models.core.maiden import Maiden
             from src.database.models.core.maiden_base import MaidenBase
-            from src.database.models.core.player.player_core import PlayerCore
-
-            player_query = select(PlayerCore).where(PlayerCore.discord_id == player_id)
-            player_result = await session.execute(player_query)
-            player_core: Optional[PlayerCore] = player_result.scalar_one_or_none()
-
-            if not player_core or not player_core.leader_maiden_id:
-                return None
 
             maiden_query = (
                 select(Maiden, MaidenBase)
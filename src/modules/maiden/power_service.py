@@ -13,6 +13,7 @@ Domain
 - Tier scaling with milestone bonuses
 - Quantity multipliers for maiden stacks
 - Team aggregate power calculation
+- Materialized per-player power index (totals + best maiden per element)
 - Power breakdown analysis
 
 LUMEN 2025 COMPLIANCE
@@ -21,7 +22,8 @@ LUMEN 2025 COMPLIANCE
 ✓ Config-driven - all formulas from maiden.power.tier_scaling
 ✓ Domain exceptions - raises NotFoundError, ValidationError
 ✓ Observable - structured logging for all calculations
-✓ Read-only operations - uses get_session() pattern
+✓ Read-only operations - uses get_session() pattern (index writes use
+  the caller's or their own transaction)
 ✓ Type-safe - complete type hints throughout
 
 Design Decisions
@@ -31,33 +33,48 @@ Design Decisions
 - Quantity multiplier applied after tier scaling
 - Power = ATK + DEF (future: configurable weighting)
 - Zero quantity/tier treated as zero contribution (no negative stats)
+- Base stats come from the in-memory MaidenCatalog; queries select only
+  Maiden columns
+- Power index lives on PlayerStats (total_attack/total_defense/total_power +
+  best_by_element). MaidenService applies stack deltas in its own
+  transaction; best_by_element NULL means "not built" and triggers a
+  rebuild on first read
 
 Dependencies
 ------------
 - ConfigManager: For tier scaling formulas and bonuses
 - DatabaseService: For session management
-- Maiden, MaidenBase models: For stat queries
+- Maiden model: For stat queries (Maiden columns only)
+- MaidenCatalog: In-memory MaidenBase templates (joined in Python)
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Tuple, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, TypedDict
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, update
 
 from src.core.config.manager import ConfigManager
 from src.core.database.service import DatabaseService
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
+from src.modules.maiden.catalog import MaidenCatalog
 from src.modules.shared.exceptions import NotFoundError, ValidationError
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from src.database.models.core.maiden import Maiden
     from src.database.models.core.maiden_base import MaidenBase
+    from src.database.models.core.player.player_stats import PlayerStats
+    from src.modules.maiden.catalog import MaidenBaseCatalog, MaidenBaseRecord
 
 logger = get_logger(__name__)
 
+# PlayerStats columns holding the materialized power index
+_POWER_INDEX_COLUMNS = ("total_attack", "total_defense", "total_power", "best_by_element")
+
 
 # ============================================================================
 # Data Models
@@ -83,6 +100,20 @@ class MaidenContributor(TypedDict):
     contribution_pct: float
 
 
+class ElementBest(TypedDict):
+    """
+    Strongest maiden stack of one element, as stored in the power index.
+    """
+    maiden_id: int
+    maiden_base_id: int
+    element: str
+    tier: int
+    quantity: int
+    attack: int
+    defense: int
+    power: int
+
+
 @dataclass(frozen=True)
 class MaidenStats:
     """
@@ -119,6 +150,19 @@ class TeamPowerBreakdown:
     top_contributors: List[MaidenContributor]  # Top N by power
 
 
+@dataclass(frozen=True)
+class PlayerPowerIndex:
+    """
+    Materialized power aggregate for a player's collection.
+    """
+
+    player_id: int
+    total_attack: int
+    total_defense: int
+    total_power: int
+    best_by_element: Dict[str, ElementBest]  # Keyed by lowercase element
+
+
 # ============================================================================
 # PowerCalculationService
 # ============================================================================
@@ -136,6 +180,10 @@ class PowerCalculationService:
     - get_maiden_stats(maiden_id) -> Calculate stats for single maiden
     - get_player_total_power(player_id) -> Aggregate team power
     - get_power_breakdown(player_id, top_n) -> Detailed power analysis
+    - get_player_power_index(player_id) -> Materialized totals + best per element
+    - apply_maiden_stack_change(session, ...) -> Incremental index update
+    - rebuild_power_index(player_ids) -> Bulk rebuild from maiden rows
+    - refresh_power_index(session, stats) -> Rebuild one locked row in place
     - calculate_raw_stats(base_atk, base_def, tier, quantity) -> Pure math
     
     Configuration Keys
@@ -184,6 +232,11 @@ class PowerCalculationService:
         if not self._tier_bonuses:
             self._tier_bonuses = {5: 0.05, 10: 0.15, 12: 0.25}
 
+        # Precomputed tier multiplier table, indexed by tier (0-12)
+        self._tier_multipliers: Tuple[float, ...] = tuple(
+            self._compute_tier_multiplier(tier) for tier in range(13)
+        )
+
         self._logger.info(
             "PowerCalculationService initialized",
             extra={
@@ -226,23 +279,24 @@ class PowerCalculationService:
 
         async with DatabaseService.get_session() as session:
             from src.database.models.core.maiden import Maiden
-            from src.database.models.core.maiden_base import MaidenBase
 
             query = (
-                select(Maiden, MaidenBase)
-                .join(MaidenBase, Maiden.maiden_base_id == MaidenBase.id)
+                select(Maiden)
                 .where(Maiden.id == maiden_id)
                 .where(Maiden.deleted_at.is_(None))
             )
 
             result = await session.execute(query)
-            row = result.one_or_none()
+            maiden = result.scalar_one_or_none()
 
-            if row is None:
+            if maiden is None:
                 raise NotFoundError("Maiden", maiden_id)
 
-            maiden: Maiden = row[0]
-            maiden_base: MaidenBase = row[1]
+            catalog = await MaidenCatalog.get_covering([maiden.maiden_base_id])
+            maiden_base = catalog.get(maiden.maiden_base_id)
+
+            if maiden_base is None:
+                raise NotFoundError("MaidenBase", maiden.maiden_base_id)
 
             atk, defense, tier_mult = self._calculate_maiden_atk_def(
                 base_atk=maiden_base.base_atk,
@@ -287,8 +341,8 @@ class PowerCalculationService:
         """
         Calculate total_attack, total_defense, total_power for a player.
         
-        Aggregates all owned maidens using config-driven formulas.
-        This is a **read-only operation** using get_session().
+        Reads the materialized power index (one row), building it first if
+        this player's index has never been built.
         
         Args:
             player_id: Discord ID
@@ -300,54 +354,236 @@ class PowerCalculationService:
             >>> atk, defense, power = await power_service.get_player_total_power(123)
             >>> print(f"Total Power: {power}")
         """
-        player_id = InputValidator.validate_discord_id(player_id)
+        index = await self.get_player_power_index(player_id)
 
         self._logger.debug(
-            "Calculating player total power",
-            extra={"player_id": player_id, "operation": "get_player_total_power"},
+            "Player total power read",
+            extra={
+                "player_id": index.player_id,
+                "total_attack": index.total_attack,
+                "total_defense": index.total_defense,
+                "total_power": index.total_power,
+            },
         )
 
+        return index.total_attack, index.total_defense, index.total_power
+
+    # ========================================================================
+    # PUBLIC API - Materialized Power Index
+    # ========================================================================
+
+    async def get_player_power_index(self, player_id: int) -> PlayerPowerIndex:
+        """
+        Get a player's materialized power totals and best maiden per element.
+        
+        This is a **read-only operation** on one PlayerStats row. If the
+        index has not been built yet (best_by_element is NULL), it is
+        rebuilt from the player's maidens first.
+        
+        Args:
+            player_id: Discord ID
+        
+        Returns:
+            PlayerPowerIndex (all zeros if the player has no stats row)
+        
+        Example:
+            >>> index = await power_service.get_player_power_index(123)
+            >>> index.best_by_element["infernal"]["power"]
+        """
+        player_id = InputValidator.validate_discord_id(player_id)
+
         async with DatabaseService.get_session() as session:
-            from src.database.models.core.maiden import Maiden
-            from src.database.models.core.maiden_base import MaidenBase
+            from src.database.models.core.player.player_stats import PlayerStats
+
+            result = await session.execute(
+                select(
+                    PlayerStats.total_attack,
+                    PlayerStats.total_defense,
+                    PlayerStats.total_power,
+                    PlayerStats.best_by_element,
+                ).where(PlayerStats.player_id == player_id)
+            )
+            row = result.one_or_none()
 
-            query = (
-                select(Maiden, MaidenBase)
-                .join(MaidenBase, Maiden.maiden_base_id == MaidenBase.id)
-                .where(Maiden.player_id == player_id)
-                .where(Maiden.deleted_at.is_(None))
+        if row is None:
+            return PlayerPowerIndex(player_id, 0, 0, 0, {})
+
+        if row.best_by_element is None:
+            indexes = await self.rebuild_power_index([player_id])
+            return indexes.get(player_id, PlayerPowerIndex(player_id, 0, 0, 0, {}))
+
+        return PlayerPowerIndex(
+            player_id=player_id,
+            total_attack=row.total_attack,
+            total_defense=row.total_defense,
+            total_power=row.total_power,
+            best_by_element=row.best_by_element,
+        )
+
+    async def apply_maiden_stack_change(
+        self,
+        session: AsyncSession,
+        maiden: Maiden,
+        maiden_base: MaidenBase | MaidenBaseRecord,
+        old_quantity: int,
+    ) -> None:
+        """
+        Apply one maiden stack's quantity change to the owner's power index.
+        
+        Runs inside the caller's transaction, after the stack has been
+        updated (or soft-deleted). Totals are adjusted by the stack's stat
+        delta; the element's best entry is replaced if this stack now beats
+        it, and re-scanned (that element only) if this stack was the best
+        and got weaker.
+        
+        Args:
+            session: Caller's transaction session
+            maiden: Updated maiden stack (deleted_at set if removed)
+            maiden_base: Maiden base template of the stack
+            old_quantity: Stack quantity before the change (0 if new)
+        """
+        from src.database.models.core.player.player_stats import PlayerStats
+
+        result = await session.execute(
+            select(PlayerStats)
+            .where(PlayerStats.player_id == maiden.player_id)
+            .with_for_update()
+        )
+        stats = result.scalar_one_or_none()
+
+        if stats is None or stats.best_by_element is None:
+            # Not built yet - the next read rebuilds it from scratch
+            return
+
+        new_quantity = 0 if maiden.deleted_at is not None else maiden.quantity
+        old_atk, old_def, _ = self._calculate_maiden_atk_def(
+            maiden_base.base_atk, maiden_base.base_def, maiden.tier, old_quantity
+        )
+        new_atk, new_def, _ = self._calculate_maiden_atk_def(
+            maiden_base.base_atk, maiden_base.base_def, maiden.tier, new_quantity
+        )
+
+        stats.total_attack += new_atk - old_atk
+        stats.total_defense += new_def - old_def
+        stats.total_power = stats.total_attack + stats.total_defense
+
+        element = maiden.element.lower()
+        best_by_element = dict(stats.best_by_element)
+        current = best_by_element.get(element)
+        new_power = new_atk + new_def
+
+        if current is not None and current["maiden_id"] == maiden.id and new_power < current["power"]:
+            # The element's best stack got weaker: another stack may now lead
+            best = await self._find_best_for_element(session, maiden.player_id, element)
+            if best is None:
+                best_by_element.pop(element, None)
+            else:
+                best_by_element[element] = best
+        elif new_quantity > 0 and (
+            current is None or current["maiden_id"] == maiden.id or new_power > current["power"]
+        ):
+            best_by_element[element] = self._element_best(
+                maiden.id, maiden.maiden_base_id, element, maiden.tier, new_quantity,
+                new_atk, new_def,
             )
 
-            result = await session.execute(query)
-            rows = result.all()
+        stats.best_by_element = best_by_element
 
-            total_atk = 0
-            total_def = 0
+    async def rebuild_power_index(
+        self,
+        player_ids: Optional[List[int]] = None,
+        batch_size: int = 500,
+    ) -> Dict[int, PlayerPowerIndex]:
+        """
+        Rebuild power indexes from maiden rows in bulk.
+        
+        Players are processed in batches: one maiden query (joined with the
+        in-memory catalog) and one executemany UPDATE per batch, each in its
+        own transaction.
+        
+        Args:
+            player_ids: Players to rebuild (all players with stats if None)
+            batch_size: Players per batch
+        
+        Returns:
+            Rebuilt indexes keyed by player_id
+        """
+        from src.database.models.core.player.player_stats import PlayerStats
 
-            for maiden, maiden_base in rows:
-                atk, defense, _ = self._calculate_maiden_atk_def(
-                    base_atk=maiden_base.base_atk,
-                    base_def=maiden_base.base_def,
-                    tier=maiden.tier,
-                    quantity=maiden.quantity,
+        batch_size = InputValidator.validate_positive_integer(batch_size, "batch_size")
+
+        if player_ids is None:
+            async with DatabaseService.get_session() as session:
+                result = await session.execute(
+                    select(PlayerStats.player_id).order_by(PlayerStats.player_id)
                 )
-                total_atk += atk
-                total_def += defense
+                player_ids = list(result.scalars().all())
+
+        stats_table = PlayerStats.__table__
+        update_stmt = (
+            update(stats_table)
+            .where(stats_table.c.player_id == bindparam("b_player_id"))
+            .values(
+                {column: bindparam(f"b_{column}") for column in _POWER_INDEX_COLUMNS}
+            )
+        )
 
-            total_power = total_atk + total_def
+        rebuilt: Dict[int, PlayerPowerIndex] = {}
+
+        for offset in range(0, len(player_ids), batch_size):
+            batch = player_ids[offset:offset + batch_size]
+
+            async with DatabaseService.get_transaction() as session:
+                indexes = await self._compute_power_indexes(session, batch)
+
+                await session.execute(
+                    update_stmt,
+                    [
+                        {
+                            "b_player_id": index.player_id,
+                            **{
+                                f"b_{column}": value
+                                for column, value in self._power_index_values(index).items()
+                            },
+                        }
+                        for index in indexes.values()
+                    ],
+                )
 
-            self._logger.info(
-                "Player total power calculated",
-                extra={
-                    "player_id": player_id,
-                    "total_attack": total_atk,
-                    "total_defense": total_def,
-                    "total_power": total_power,
-                    "maiden_count": len(rows),
-                },
-            )
+            rebuilt.update(indexes)
 
-            return total_atk, total_def, total_power
+        self._logger.info(
+            "Power index rebuilt",
+            extra={"players": len(rebuilt), "batch_size": batch_size},
+        )
+
+        return rebuilt
+
+    async def refresh_power_index(
+        self, session: AsyncSession, stats: PlayerStats
+    ) -> PlayerPowerIndex:
+        """
+        Recompute one player's power index inside the caller's transaction.
+        
+        Totals and best_by_element are written together onto the (locked)
+        stats row, so the two can never disagree.
+        
+        Args:
+            session: Caller's transaction session
+            stats: PlayerStats row locked by the caller
+        
+        Returns:
+            The recomputed index
+        """
+        index = (await self._compute_power_indexes(session, [stats.player_id]))[stats.player_id]
+        self.apply_power_index(stats, index)
+        return index
+
+    @staticmethod
+    def apply_power_index(stats: PlayerStats, index: PlayerPowerIndex) -> None:
+        """Write totals and best_by_element onto a PlayerStats row."""
+        for column, value in PowerCalculationService._power_index_values(index).items():
+            setattr(stats, column, value)
 
     # ========================================================================
     # PUBLIC API - Detailed Power Breakdown
@@ -378,17 +614,22 @@ class PowerCalculationService:
 
         async with DatabaseService.get_session() as session:
             from src.database.models.core.maiden import Maiden
-            from src.database.models.core.maiden_base import MaidenBase
 
             query = (
-                select(Maiden, MaidenBase)
-                .join(MaidenBase, Maiden.maiden_base_id == MaidenBase.id)
+                select(Maiden)
                 .where(Maiden.player_id == player_id)
                 .where(Maiden.deleted_at.is_(None))
             )
 
             result = await session.execute(query)
-            rows = result.all()
+            maidens = list(result.scalars().all())
+
+            catalog = await MaidenCatalog.get_covering(m.maiden_base_id for m in maidens)
+            rows = [
+                (maiden, catalog.get(maiden.maiden_base_id))
+                for maiden in maidens
+                if catalog.get(maiden.maiden_base_id) is not None
+            ]
 
             if not rows:
                 return TeamPowerBreakdown(
@@ -509,6 +750,8 @@ class PowerCalculationService:
             2. Milestone bonuses: Multiplicative (e.g., tier 5: *1.05)
             3. Quantity multiplier: Applied last
         
+        Steps 1-2 are read from the precomputed tier multiplier table.
+        
         Args:
             base_atk: Base attack stat
             base_def: Base defense stat
@@ -518,6 +761,21 @@ class PowerCalculationService:
         Returns:
             Tuple of (attack, defense, tier_multiplier)
         """
+        if 0 <= tier < len(self._tier_multipliers):
+            tier_multiplier = self._tier_multipliers[tier]
+        else:
+            tier_multiplier = self._compute_tier_multiplier(tier)
+
+        # Apply quantity multiplier
+        final_multiplier = tier_multiplier * max(quantity, 0)
+
+        atk = int(base_atk * final_multiplier)
+        defense = int(base_def * final_multiplier)
+
+        return atk, defense, tier_multiplier
+
+    def _compute_tier_multiplier(self, tier: int) -> float:
+        """Tier progression with milestone bonuses (used to build the table)."""
         # Start with base tier progression
         tier_multiplier = 1.0 + self._tier_step * max(tier - 1, 0)
 
@@ -526,10 +784,130 @@ class PowerCalculationService:
             if tier >= milestone_tier:
                 tier_multiplier *= 1.0 + bonus_pct
 
-        # Apply quantity multiplier
-        final_multiplier = tier_multiplier * max(quantity, 0)
+        return tier_multiplier
+
+    def _element_best(
+        self,
+        maiden_id: int,
+        maiden_base_id: int,
+        element: str,
+        tier: int,
+        quantity: int,
+        attack: int,
+        defense: int,
+    ) -> ElementBest:
+        """Build a best-per-element index entry."""
+        return {
+            "maiden_id": maiden_id,
+            "maiden_base_id": maiden_base_id,
+            "element": element,
+            "tier": tier,
+            "quantity": quantity,
+            "attack": attack,
+            "defense": defense,
+            "power": attack + defense,
+        }
+
+    def _build_power_indexes(
+        self, player_ids: Iterable[int], rows: Iterable[Any], catalog: MaidenBaseCatalog
+    ) -> Dict[int, PlayerPowerIndex]:
+        """
+        Fold maiden rows into one power index per player in a single pass.
+        
+        Args:
+            player_ids: Players to produce indexes for (empty ones get zeros)
+            rows: Maiden rows with id, player_id, maiden_base_id, tier,
+                quantity, element
+            catalog: Maiden base catalog for base stats
+        
+        Returns:
+            Indexes keyed by player_id
+        """
+        totals: Dict[int, List[int]] = {player_id: [0, 0] for player_id in player_ids}
+        best: Dict[int, Dict[str, ElementBest]] = {player_id: {} for player_id in totals}
+
+        for row in rows:
+            maiden_base = catalog.get(row.maiden_base_id)
+            if maiden_base is None:
+                continue
+            atk, defense, _ = self._calculate_maiden_atk_def(
+                maiden_base.base_atk, maiden_base.base_def, row.tier, row.quantity
+            )
+            player_totals = totals.setdefault(row.player_id, [0, 0])
+            player_totals[0] += atk
+            player_totals[1] += defense
+
+            element = row.element.lower()
+            player_best = best.setdefault(row.player_id, {})
+            current = player_best.get(element)
+            if current is None or atk + defense > current["power"]:
+                player_best[element] = self._element_best(
+                    row.id, row.maiden_base_id, element, row.tier, row.quantity,
+                    atk, defense,
+                )
 
-        atk = int(base_atk * final_multiplier)
-        defense = int(base_def * final_multiplier)
+        return {
+            player_id: PlayerPowerIndex(
+                player_id=player_id,
+                total_attack=atk,
+                total_defense=defense,
+                total_power=atk + defense,
+                best_by_element=best[player_id],
+            )
+            for player_id, (atk, defense) in totals.items()
+        }
+
+    @staticmethod
+    def _power_index_values(index: PlayerPowerIndex) -> Dict[str, Any]:
+        """PlayerStats column values of a power index."""
+        return {column: getattr(index, column) for column in _POWER_INDEX_COLUMNS}
+
+    async def _compute_power_indexes(
+        self, session: AsyncSession, player_ids: List[int]
+    ) -> Dict[int, PlayerPowerIndex]:
+        """Build power indexes for players from their live maiden rows."""
+        from src.database.models.core.maiden import Maiden
+
+        result = await session.execute(
+            select(
+                Maiden.id,
+                Maiden.player_id,
+                Maiden.maiden_base_id,
+                Maiden.tier,
+                Maiden.quantity,
+                Maiden.element,
+            )
+            .where(Maiden.player_id.in_(player_ids))
+            .where(Maiden.deleted_at.is_(None))
+        )
+        rows = result.all()
+        catalog = await MaidenCatalog.get_covering(row.maiden_base_id for row in rows)
+        return self._build_power_indexes(player_ids, rows, catalog)
 
-        return atk, defense, tier_multiplier
\ No newline at end of file
+    async def _find_best_for_element(
+        self, session: AsyncSession, player_id: int, element: str
+    ) -> Optional[ElementBest]:
+        """
+        Scan one element of a player's collection for its strongest stack.
+        
+        Used only when the current best stack of that element got weaker.
+        """
+        from src.database.models.core.maiden import Maiden
+
+        result = await session.execute(
+            select(
+                Maiden.id,
+                Maiden.player_id,
+                Maiden.maiden_base_id,
+                Maiden.tier,
+                Maiden.quantity,
+                Maiden.element,
+            )
+            .where(Maiden.player_id == player_id)
+            .where(func.lower(Maiden.element) == element)
+            .where(Maiden.deleted_at.is_(None))
+        )
+        rows = result.all()
+        catalog = await MaidenCatalog.get_covering(row.maiden_base_id for row in rows)
+        index = self._build_power_indexes([player_id], rows, catalog)[player_id]
+        return index.best_by_element.get(element)
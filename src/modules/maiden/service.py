@@ -38,6 +38,7 @@ from src.core.infra.audit_logger import AuditLogger
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
 from src.domain.models.base import DomainValidationError
+from src.modules.maiden.power_service import PowerCalculationService
 from src.modules.shared.base_repository import BaseRepository
 from src.modules.shared.base_service import BaseService
 from src.modules.shared.exceptions import (
@@ -196,6 +197,9 @@ class MaidenService(BaseService):
             logger=get_logger(f"{__name__}.MaidenRepository"),
         )
 
+        # Keeps the materialized power index in step with stack changes
+        self._power = PowerCalculationService(config_manager)
+
     # ========================================================================
     # PUBLIC API - Read Operations
     # ========================================================================
@@ -482,6 +486,10 @@ class MaidenService(BaseService):
                 # Publish domain events
                 for event in maiden_domain.get_pending_events():
                     await self.emit_event(event.event_name, event.payload)
+
+                await self._power.apply_maiden_stack_change(
+                    session, maiden_db, maiden_base, old_quantity
+                )
             else:
                 # Create new maiden stack
                 from src.database.models.core.maiden import Maiden
@@ -501,6 +509,16 @@ class MaidenService(BaseService):
                 await session.flush()  # Get the ID
                 operation = "created"
 
+                from src.database.models.core.maiden_base import MaidenBase
+                maiden_base = await session.get(MaidenBase, maiden_base_id)
+
+                if not maiden_base:
+                    raise NotFoundError("MaidenBase", maiden_base_id)
+
+                await self._power.apply_maiden_stack_change(
+                    session, maiden_db, maiden_base, old_quantity=0
+                )
+
                 self.log.info(
                     f"Maiden stack created: {quantity} maidens",
                     extra={
@@ -666,6 +684,10 @@ class MaidenService(BaseService):
                     setattr(maiden_db, key, value)
                 operation = "quantity_decreased"
 
+            await self._power.apply_maiden_stack_change(
+                session, maiden_db, maiden_base, old_quantity
+            )
+
             # Publish domain events
             for event in maiden_domain.get_pending_events():
                 await self.emit_event(event.event_name, event.payload)
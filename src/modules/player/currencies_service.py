@@ -30,6 +30,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from src.core.database.service import DatabaseService
+from src.core.database.unit_of_work import load_player_row
 from src.core.infra.audit_logger import AuditLogger
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
@@ -92,6 +93,8 @@ class PlayerCurrenciesService(BaseService):
     - get_shards() -> Get shard balance for a specific tier
     """
 
+    _VALID_RESOURCE_TYPES = ("lumees", "lumenite", "auric_coin")
+
     def __init__(
         self,
         config_manager: ConfigManager,
@@ -118,6 +121,14 @@ class PlayerCurrenciesService(BaseService):
             logger=get_logger(f"{__name__}.PlayerCurrenciesRepository"),
         )
 
+        # Pre-bound accessors for per-resource caps (hot path in add_resource)
+        self._max_limits = {
+            resource_type: config_manager.accessor(
+                f"MAX_{resource_type.upper()}", default=999_999_999
+            )
+            for resource_type in self._VALID_RESOURCE_TYPES
+        }
+
     # ========================================================================
     # PUBLIC API - Read Operations
     # ========================================================================
@@ -128,7 +139,8 @@ class PlayerCurrenciesService(BaseService):
         """
         Get current balance for a specific resource.
 
-        This is a **read-only** operation using get_session().
+        This is a **read-only** operation, read through the command's
+        UnitOfWork identity map (see load_player_row).
 
         Args:
             player_id: Discord ID of the player
@@ -160,23 +172,19 @@ class PlayerCurrenciesService(BaseService):
             resource_type=resource_type,
         )
 
-        # Read-only operation - use get_session()
-        async with DatabaseService.get_session() as session:
-            currencies = await self._currencies_repo.find_one_where(
-                session,
-                self._currencies_repo.model_class.player_id == player_id,
-            )
+        # Read-only operation - cached rows are shared across the command
+        currencies = await load_player_row(self._currencies_repo.model_class, player_id)
 
-            if not currencies:
-                raise NotFoundError("PlayerCurrencies", player_id)
+        if not currencies:
+            raise NotFoundError("PlayerCurrencies", player_id)
 
-            amount = getattr(currencies, resource_type, 0)
+        amount = getattr(currencies, resource_type, 0)
 
-            return {
-                "player_id": player_id,
-                "resource_type": resource_type,
-                "amount": amount,
-            }
+        return {
+            "player_id": player_id,
+            "resource_type": resource_type,
+            "amount": amount,
+        }
 
     async def has_sufficient_resources(
         self, player_id: int, resource_type: str, required_amount: int
@@ -267,7 +275,7 @@ class PlayerCurrenciesService(BaseService):
         )
 
         # SAFETY: Config-driven max resource limit (no hardcoded values)
-        max_limit = self.get_config(f"MAX_{resource_type.upper()}", default=999_999_999)
+        max_limit = self._max_limits[resource_type]()
 
         # SAFETY: Atomicity - Use provided session or create new transaction
         if session is not None:
@@ -1004,23 +1012,19 @@ class PlayerCurrenciesService(BaseService):
 
         self.log_operation("get_shards", player_id=player_id, tier=tier)
 
-        async with DatabaseService.get_session() as session:
-            currencies = await self._currencies_repo.find_one_where(
-                session,
-                self._currencies_repo.model_class.player_id == player_id,
-            )
+        currencies = await load_player_row(self._currencies_repo.model_class, player_id)
 
-            if not currencies:
-                raise NotFoundError("PlayerCurrencies", player_id)
+        if not currencies:
+            raise NotFoundError("PlayerCurrencies", player_id)
 
-            shard_key = f"tier_{tier}"
-            amount = currencies.shards.get(shard_key, 0)
+        shard_key = f"tier_{tier}"
+        amount = currencies.shards.get(shard_key, 0)
 
-            return {
-                "player_id": player_id,
-                "tier": tier,
-                "amount": amount,
-            }
+        return {
+            "player_id": player_id,
+            "tier": tier,
+            "amount": amount,
+        }
 
     # ========================================================================
     # PRIVATE HELPERS
@@ -1039,9 +1043,8 @@ class PlayerCurrenciesService(BaseService):
         Raises:
             ValidationError: If resource type is invalid
         """
-        valid_types = ("lumees", "lumenite", "auric_coin")
         return InputValidator.validate_choice(
             resource_type,
             field_name="resource_type",
-            valid_choices=valid_types,
+            valid_choices=self._VALID_RESOURCE_TYPES,
         )
@@ -35,6 +35,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from src.core.database.service import DatabaseService
+from src.core.database.unit_of_work import load_player_row
 from src.core.infra.audit_logger import AuditLogger
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
@@ -134,7 +135,8 @@ class PlayerProgressionService(BaseService):
         """
         Get player progression data.
 
-        This is a **read-only** operation using get_session().
+        This is a **read-only** operation, read through the command's
+        UnitOfWork identity map (see load_player_row).
 
         Args:
             player_id: Discord ID of the player
@@ -153,41 +155,40 @@ class PlayerProgressionService(BaseService):
 
         self.log_operation("get_progression", player_id=player_id)
 
-        # Read-only operation - use get_session()
-        async with DatabaseService.get_session() as session:
-            progression = await self._progression_repo.find_one_where(
-                session,
-                self._progression_repo.model_class.player_id == player_id,
-            )
-
-            if not progression:
-                raise NotFoundError("PlayerProgression", player_id)
+        # Read-only operation - cached rows are shared across the command
+        progression = await load_player_row(
+            self._progression_repo.model_class, player_id
+        )
 
-            return {
-                "player_id": progression.player_id,
-                "level": progression.level,
-                "xp": progression.xp,
-                "last_level_up": progression.last_level_up,
-                "class_name": progression.class_name,
-                "stat_points": progression.stat_points,
-                "highest_sector": progression.highest_sector,
-                "highest_floor": progression.highest_floor,
-                "highest_tier": progression.highest_tier,
-                "total_fusions": progression.total_fusions,
-                "successful_fusions": progression.successful_fusions,
-                "failed_fusions": progression.failed_fusions,
-                "total_summons": progression.total_summons,
-                "pity_counter": progression.pity_counter,
-                "tutorial_completed": progression.tutorial_completed,
-                "tutorial_step": progression.tutorial_step,
-                "state": progression.state or {},
-            }
+        if not progression:
+            raise NotFoundError("PlayerProgression", player_id)
+
+        return {
+            "player_id": progression.player_id,
+            "level": progression.level,
+            "xp": progression.xp,
+            "last_level_up": progression.last_level_up,
+            "class_name": progression.class_name,
+            "stat_points": progression.stat_points,
+            "highest_sector": progression.highest_sector,
+            "highest_floor": progression.highest_floor,
+            "highest_tier": progression.highest_tier,
+            "total_fusions": progression.total_fusions,
+            "successful_fusions": progression.successful_fusions,
+            "failed_fusions": progression.failed_fusions,
+            "total_summons": progression.total_summons,
+            "pity_counter": progression.pity_counter,
+            "tutorial_completed": progression.tutorial_completed,
+            "tutorial_step": progression.tutorial_step,
+            "state": progression.state or {},
+        }
 
     async def get_player_level(self, player_id: int) -> int:
         """
         Get player's current level.
 
-        This is a **read-only** operation using get_session().
+        This is a **read-only** operation, read through the command's
+        UnitOfWork identity map.
         Convenience method for services that only need the level.
 
         Args:
@@ -203,16 +204,14 @@ class PlayerProgressionService(BaseService):
 
         self.log_operation("get_player_level", player_id=player_id)
 
-        async with DatabaseService.get_session() as session:
-            progression = await self._progression_repo.find_one_where(
-                session,
-                self._progression_repo.model_class.player_id == player_id,
-            )
+        progression = await load_player_row(
+            self._progression_repo.model_class, player_id
+        )
 
-            if not progression:
-                raise NotFoundError("PlayerProgression", player_id)
+        if not progression:
+            raise NotFoundError("PlayerProgression", player_id)
 
-            return progression.level
+        return progression.level
 
     # ========================================================================
     # PUBLIC API - Write Operations (XP & Leveling)
@@ -33,9 +33,11 @@ from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from src.core.database.service import DatabaseService
+from src.core.database.unit_of_work import load_player_row
 from src.core.infra.audit_logger import AuditLogger
 from src.core.logging.logger import get_logger
 from src.core.validation.input_validator import InputValidator
+from src.modules.maiden.power_service import PowerCalculationService
 from src.modules.shared.base_repository import BaseRepository
 from src.modules.shared.base_service import BaseService
 from src.modules.shared.exceptions import (
@@ -82,6 +84,7 @@ class PlayerStatsService(BaseService):
     - Logger: For structured logging
     - DatabaseService: For transaction management (injected via context)
     - AuditLogger: For audit trail (static)
+    - PowerCalculationService: For the materialized power index
 
     Public Methods
     --------------
@@ -131,6 +134,7 @@ class PlayerStatsService(BaseService):
             model_class=PlayerStats,
             logger=get_logger(f"{__name__}.PlayerStatsRepository"),
         )
+        self._power = PowerCalculationService(config_manager)
 
     # ========================================================================
     # PUBLIC API - Read Operations
@@ -140,7 +144,8 @@ class PlayerStatsService(BaseService):
         """
         Get player stats.
 
-        This is a **read-only** operation using get_session().
+        This is a **read-only** operation, read through the command's
+        UnitOfWork identity map (see load_player_row).
 
         Args:
             player_id: Discord ID of the player
@@ -159,34 +164,30 @@ class PlayerStatsService(BaseService):
 
         self.log_operation("get_stats", player_id=player_id)
 
-        # Read-only operation - use get_session()
-        async with DatabaseService.get_session() as session:
-            stats = await self._stats_repo.find_one_where(
-                session,
-                self._stats_repo.model_class.player_id == player_id,
-            )
-
-            if not stats:
-                raise NotFoundError("PlayerStats", player_id)
-
-            return {
-                "player_id": stats.player_id,
-                "energy": stats.energy,
-                "max_energy": stats.max_energy,
-                "stamina": stats.stamina,
-                "max_stamina": stats.max_stamina,
-                "hp": stats.hp,
-                "max_hp": stats.max_hp,
-                "drop_charges": stats.drop_charges,
-                "max_drop_charges": stats.max_drop_charges,
-                "last_drop_regen": stats.last_drop_regen,
-                "total_attack": stats.total_attack,
-                "total_defense": stats.total_defense,
-                "total_power": stats.total_power,
-                "stat_points_spent": stats.stat_points_spent,
-                "stats": stats.stats,
-                "state": stats.state or {},
-            }
+        # Read-only operation - cached rows are shared across the command
+        stats = await load_player_row(self._stats_repo.model_class, player_id)
+
+        if not stats:
+            raise NotFoundError("PlayerStats", player_id)
+
+        return {
+            "player_id": stats.player_id,
+            "energy": stats.energy,
+            "max_energy": stats.max_energy,
+            "stamina": stats.stamina,
+            "max_stamina": stats.max_stamina,
+            "hp": stats.hp,
+            "max_hp": stats.max_hp,
+            "drop_charges": stats.drop_charges,
+            "max_drop_charges": stats.max_drop_charges,
+            "last_drop_regen": stats.last_drop_regen,
+            "total_attack": stats.total_attack,
+            "total_defense": stats.total_defense,
+            "total_power": stats.total_power,
+            "stat_points_spent": stats.stat_points_spent,
+            "stats": stats.stats,
+            "state": stats.state or {},
+        }
 
     async def get_stat(self, player_id: int, stat_key: str) -> int:
         """
@@ -204,16 +205,12 @@ class PlayerStatsService(BaseService):
         """
         player_id = InputValidator.validate_discord_id(player_id)
 
-        async with DatabaseService.get_session() as session:
-            stats = await self._stats_repo.find_one_where(
-                session,
-                self._stats_repo.model_class.player_id == player_id,
-            )
+        stats = await load_player_row(self._stats_repo.model_class, player_id)
 
-            if not stats:
-                raise NotFoundError("PlayerStats", player_id)
+        if not stats:
+            raise NotFoundError("PlayerStats", player_id)
 
-            return stats.stats.get(stat_key, 0)
+        return stats.stats.get(stat_key, 0)
 
     # ========================================================================
     # PUBLIC API - Resource Pool Operations (Energy)
@@ -791,24 +788,27 @@ class PlayerStatsService(BaseService):
     # PUBLIC API - Combat Power
     # ========================================================================
 
-    async def update_combat_power(
-        self,
-        player_id: int,
-        total_attack: int,
-        total_defense: int,
-    ) -> Dict[str, Any]:
+    async def update_combat_power(self, player_id: int) -> Dict[str, Any]:
         """
-        Update combat power aggregates.
+        Recalculate combat power aggregates from the player's maidens.
 
-        This is typically called by MaidenService when maiden collection changes.
+        Totals and best_by_element are rebuilt together through
+        PowerCalculationService.refresh_power_index, so the materialized
+        power index cannot drift from the totals.
+
+        Note: callers no longer pass total_attack/total_defense; the totals
+        are always derived from the player's maiden rows.
+
+        Args:
+            player_id: Discord ID of the player
+
+        Returns:
+            Dict with old_power, new_power, total_attack, total_defense
+
+        Raises:
+            NotFoundError: If player stats record not found
         """
         player_id = InputValidator.validate_discord_id(player_id)
-        total_attack = InputValidator.validate_non_negative_integer(
-            total_attack, "total_attack"
-        )
-        total_defense = InputValidator.validate_non_negative_integer(
-            total_defense, "total_defense"
-        )
 
         async with DatabaseService.get_transaction() as session:
             stats = await self._stats_repo.find_one_where(
@@ -821,27 +821,25 @@ class PlayerStatsService(BaseService):
                 raise NotFoundError("PlayerStats", player_id)
 
             old_power = stats.total_power
-            stats.total_attack = total_attack
-            stats.total_defense = total_defense
-            stats.total_power = total_attack + total_defense
+            index = await self._power.refresh_power_index(session, stats)
 
             await self.emit_event(
                 event_type="player.power_updated",
                 data={
                     "player_id": player_id,
                     "old_power": old_power,
-                    "new_power": stats.total_power,
-                    "total_attack": total_attack,
-                    "total_defense": total_defense,
+                    "new_power": index.total_power,
+                    "total_attack": index.total_attack,
+                    "total_defense": index.total_defense,
                 },
             )
 
             return {
                 "player_id": player_id,
                 "old_power": old_power,
-                "new_power": stats.total_power,
-                "total_attack": total_attack,
-                "total_defense": total_defense,
+                "new_power": index.total_power,
+                "total_attack": index.total_attack,
+                "total_defense": index.total_defense,
             }
 
     # ========================================================================
@@ -24,6 +24,7 @@ Architecture
 ------------
 - BaseService: Foundation for service classes (logging, config, events)
 - BaseRepository: Type-safe database access patterns
+- WriteBehindFlusher: Background flush loop for write-behind buffers
 - Domain exceptions: Game-facing errors and business rule violations
 - Formulas: Pure calculation functions for game mechanics
 - Validators: Domain validation with structured error raising
@@ -45,6 +46,7 @@ from __future__ import annotations
 # Base patterns
 from .base_repository import BaseRepository
 from .base_service import BaseService
+from .write_behind import WriteBehindFlusher
 
 # Domain exceptions
 from .exceptions import (
@@ -128,6 +130,7 @@ __all__ = [
     # Base patterns
     "BaseService",
     "BaseRepository",
+    "WriteBehindFlusher",
     # Exceptions
     "LumenDomainException",
     "ErrorSeverity",
@@ -294,6 +294,7 @@ class BaseRepository(Generic[T]):
         eager_load: Optional[List[InstrumentedAttribute]] = None,
         for_update: bool = False,
         limit: Optional[int] = None,
+        order_by: Optional[Sequence[Any]] = None,
     ) -> List[T]:
         """
         Find multiple records matching conditions.
@@ -304,6 +305,8 @@ class BaseRepository(Generic[T]):
             eager_load: Optional list of relationships to eagerly load
             for_update: If True, use SELECT FOR UPDATE
             limit: Optional maximum number of results
+            order_by: Optional ordering (with for_update, rows are locked
+                in this order; use it to keep lock order consistent)
 
         Returns:
             List of model instances
@@ -317,6 +320,9 @@ class BaseRepository(Generic[T]):
             for relationship in eager_load:
                 stmt = stmt.options(selectinload(relationship))
 
+        if order_by:
+            stmt = stmt.order_by(*order_by)
+
         if limit is not None:
             stmt = stmt.limit(limit)
 
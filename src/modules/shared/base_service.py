@@ -120,12 +120,25 @@ class BaseService:
         """
         Emit a domain event for cross-module communication.
 
+        Inside DatabaseService.get_transaction() the event is queued in the
+        transaction outbox and published after commit (dropped on rollback),
+        so listeners never run while row locks are held.
+
         Args:
             event_type: Type/name of the event
             data: Event payload data
             context: Optional additional context (user_id, guild_id, etc.)
         """
-        await self._events.publish(event_type, {**data, **(context or {})})
+        from src.core.database.outbox import current_outbox
+
+        payload = {**data, **(context or {})}
+
+        outbox = current_outbox()
+        if outbox is not None:
+            outbox.add(event_type, lambda: self._events.publish(event_type, payload))
+            return
+
+        await self._events.publish(event_type, payload)
 
     def bind_context(self, **context: Any) -> None:
         """
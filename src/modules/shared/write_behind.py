@@ -0,0 +1,139 @@
+"""
+Write-Behind Flusher - LES 2025 Compliant
+=========================================
+
+Purpose
+-------
+Background flush loop shared by the in-memory write-behind buffers (daily
+quest progress, resolved combat encounters): flush on an interval, early on
+request, and once more on shutdown.
+
+LUMEN 2025 COMPLIANCE
+---------------------
+✓ Pure scheduling - buffering and persistence live in the owning component
+✓ Observable - failed flushes logged with the pending count
+✓ Graceful degradation - a failed flush is retried on the next tick
+
+Design Decisions
+----------------
+- stop() wakes the loop and waits for it instead of cancelling it, so a
+  flush already in progress finishes before the final flush; owners must
+  still restore a batch on any BaseException (a cancelled task)
+- The loop starts lazily on the first buffered write (ensure_started), so
+  owners work without explicit startup wiring
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+from src.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+class WriteBehindFlusher:
+    """
+    Interval/on-demand flush loop for a write-behind buffer.
+
+    Public Methods
+    --------------
+    - request() -> Flush early (e.g. too many pending)
+    - ensure_started() / start() / stop() -> Loop lifecycle
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[], Awaitable[Any]],
+        pending_count: Callable[[], int],
+        interval_seconds: float,
+        name: str,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Args:
+            flush: Writes everything pending; raises on failure
+            pending_count: Number of buffered entries (0 skips a tick)
+            interval_seconds: Seconds between flushes
+            name: What is being flushed, for log messages
+            logger: Owner's logger
+        """
+        self.log = logger or get_logger(__name__)
+        self._flush = flush
+        self._pending_count = pending_count
+        self._interval = max(0.1, interval_seconds)
+        self._name = name
+
+        self._requested = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._is_running: bool = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    def request(self) -> None:
+        """Wake the loop for an early flush."""
+        self._requested.set()
+
+    def ensure_started(self) -> None:
+        if not self._is_running:
+            self.start()
+
+    def start(self) -> None:
+        """Start the background flush loop (requires a running event loop)."""
+        if self._is_running:
+            return
+        self._is_running = True
+        self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the loop, letting a running flush finish, then flush the rest."""
+        if self._is_running:
+            self._is_running = False
+            self._requested.set()
+            if self._task is not None:
+                await self._task
+                self._task = None
+
+        if self._pending_count():
+            try:
+                await self._flush()
+            except Exception as exc:
+                self.log.error(
+                    f"Final {self._name} flush failed; pending writes lost",
+                    extra={
+                        "pending": self._pending_count(),
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                    },
+                    exc_info=True,
+                )
+
+    async def _loop(self) -> None:
+        """Flush on the interval, or early when requested."""
+        while self._is_running:
+            try:
+                await asyncio.wait_for(self._requested.wait(), self._interval)
+            except asyncio.TimeoutError:
+                pass
+            self._requested.clear()
+
+            if not self._pending_count():
+                continue
+
+            try:
+                await self._flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.log.warning(
+                    f"{self._name.capitalize()} flush failed; will retry",
+                    extra={
+                        "pending": self._pending_count(),
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                    },
+                )
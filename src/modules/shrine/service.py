@@ -5,6 +5,7 @@ ShrineService - Business logic for player shrine management
 Handles:
 - Shrine yield calculation with level/type modifiers
 - Shrine collection with cooldown enforcement and anti-cheat
+- Bulk "collect all" across a player's shrines in one locked pass
 - Shrine upgrades with cost validation
 - Shrine activation/deactivation
 - Yield history ring buffer management
@@ -277,6 +278,129 @@ class ShrineService(BaseService):
                 "cooldown_hours": cooldown_hours,
             }
 
+    async def collect_all_shrines(
+        self,
+        player_id: int,
+        context: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Collect yield from every active, off-cooldown shrine a player owns.
+
+        Locks all of the player's active shrines in one SELECT ... FOR UPDATE
+        (ordered by id, so concurrent collects lock in the same order), skips
+        those still on cooldown, and emits a single aggregated event instead
+        of one "shrine.collected" per shrine.
+
+        Args:
+            player_id: Discord ID of player
+            context: Operation context for audit
+
+        Returns:
+            Dict with total_yield, yield_by_type, per-shrine results and the
+            earliest next_collectible_at among shrines still on cooldown
+        """
+        # Validation
+        player_id = InputValidator.validate_discord_id(player_id)
+
+        async with DatabaseService.get_transaction() as session:
+            # Lock every active shrine for this player in one round trip
+            stmt = (
+                select(PlayerShrine)
+                .where(PlayerShrine.player_id == player_id, PlayerShrine.is_active == True)
+                .order_by(PlayerShrine.id)
+                .with_for_update()
+            )
+            result = await session.execute(stmt)
+            shrines = list(result.scalars().all())
+
+            now = datetime.now(timezone.utc)
+            max_history = self.get_config("shrines.max_yield_history", default=50)
+            collected: List[Dict[str, Any]] = []
+            yield_by_type: Dict[str, int] = {}
+            next_pending: Optional[datetime] = None
+
+            for shrine in shrines:
+                # SAFETY: idempotency - same cooldown rule as collect_shrine_yield
+                cooldown_hours = self.get_config(
+                    f"shrines.{shrine.shrine_type}.cooldown_hours", default=8
+                )
+                if shrine.last_collected_at:
+                    next_collectible = shrine.last_collected_at + timedelta(hours=cooldown_hours)
+                    if now < next_collectible:
+                        if next_pending is None or next_collectible < next_pending:
+                            next_pending = next_collectible
+                        continue
+
+                yield_amount = self._calculate_yield(shrine)
+                shrine.last_collected_at = now
+
+                # Rebuild the ring buffer once instead of append-then-trim
+                shrine.yield_history = (
+                    shrine.yield_history[-(max_history - 1):] if max_history > 1 else []
+                ) + [
+                    {
+                        "collected_at": now.isoformat(),
+                        "amount": yield_amount,
+                        "level": shrine.level,
+                    }
+                ]
+                flag_modified(shrine, "yield_history")
+
+                yield_by_type[shrine.shrine_type] = (
+                    yield_by_type.get(shrine.shrine_type, 0) + yield_amount
+                )
+                collected.append(
+                    {
+                        "shrine_id": shrine.id,
+                        "shrine_type": shrine.shrine_type,
+                        "yield_collected": yield_amount,
+                        "level": shrine.level,
+                        "next_collectible_at": now + timedelta(hours=cooldown_hours),
+                    }
+                )
+
+            total_yield = sum(yield_by_type.values())
+
+            if collected:
+                # Emit one aggregated event for the whole collection
+                await self.emit_event(
+                    "shrine.collected_all",
+                    {
+                        "player_id": player_id,
+                        "shrine_ids": [entry["shrine_id"] for entry in collected],
+                        "shrines_collected": len(collected),
+                        "total_yield": total_yield,
+                        "yield_by_type": yield_by_type,
+                        "collected_at": now.isoformat(),
+                    },
+                )
+
+                # SAFETY: observability - Log success with full economic context
+                self.log.info(
+                    f"Shrine yields collected: player {player_id} earned {total_yield} "
+                    f"from {len(collected)} shrines",
+                    extra={
+                        "player_id": player_id,
+                        "shrines_collected": len(collected),
+                        "shrines_on_cooldown": len(shrines) - len(collected),
+                        "amount": total_yield,
+                        "yield_by_type": yield_by_type,
+                        "success": True,
+                        "reason": "shrine_yield_collection_all",
+                    },
+                )
+
+            return {
+                "player_id": player_id,
+                "shrines_collected": len(collected),
+                "shrines_on_cooldown": len(shrines) - len(collected),
+                "total_yield": total_yield,
+                "yield_by_type": yield_by_type,
+                "shrines": collected,
+                "collected_at": now,
+                "next_collectible_at": next_pending,
+            }
+
     async def upgrade_shrine(
         self,
         player_id: int,
@@ -14,9 +14,20 @@ Features:
 - LogContext integration for audit trails
 - Type-safe decorator patterns
 - Per-user or per-guild rate limiting modes
+- Single atomic round trip per check (token bucket Lua script via EVALSHA)
+- Optional in-process pre-filter for callers already known to be blocked
+
+Notes:
+- Limits are token buckets: `uses` is the burst capacity and tokens refill
+  continuously at `uses / per_seconds`.
+- The pre-filter only remembers Redis denials until their retry-after. A
+  bucket can only gain tokens by refilling, so a local rejection inside that
+  window never blocks a request Redis would have allowed (except after a
+  manual clear on another process).
 """
 
-from typing import Callable, Literal, Optional, TypeVar, cast
+import time
+from typing import Callable, Dict, Literal, Optional, TypeVar, cast
 from functools import wraps
 import discord
 from discord.ext import commands
@@ -35,15 +46,49 @@ _ratelimit_metrics = {
     "checks": 0,
     "blocks": 0,
     "fallbacks": 0,
-    "redis_errors": 0
+    "redis_errors": 0,
+    "prefilter_blocks": 0
 }
 
+# In-process pre-filter: rate limit key -> monotonic time the block expires
+_local_blocks: Dict[str, float] = {}
+_LOCAL_BLOCKS_MAX = 10_000
+
+
+def _ratelimit_key(cmd_name: str, scope: str, scope_id: int) -> str:
+    """Logical limiter key (stored by RedisRateLimiter as ratelimit:tb:<key>)."""
+    return f"{cmd_name}:{scope}:{scope_id}"
+
+
+def _local_retry_after(key: str) -> float:
+    """Seconds left on a remembered Redis denial, or 0.0 if not blocked."""
+    blocked_until = _local_blocks.get(key)
+    if blocked_until is None:
+        return 0.0
+    remaining = blocked_until - time.monotonic()
+    if remaining <= 0:
+        _local_blocks.pop(key, None)
+        return 0.0
+    return remaining
+
+
+def _remember_block(key: str, retry_after: float) -> None:
+    """Remember a Redis denial until its retry-after elapses."""
+    now = time.monotonic()
+    if len(_local_blocks) >= _LOCAL_BLOCKS_MAX:
+        for expired in [k for k, until in _local_blocks.items() if until <= now]:
+            del _local_blocks[expired]
+        if len(_local_blocks) >= _LOCAL_BLOCKS_MAX:
+            _local_blocks.clear()
+    _local_blocks[key] = now + retry_after
+
 
 def ratelimit(
     uses: int,
     per_seconds: int,
     command_name: Optional[str] = None,
-    scope: Literal["user", "guild"] = "user"
+    scope: Literal["user", "guild"] = "user",
+    prefilter: bool = True
 ) -> Callable[[F], F]:
     """
     Rate limit decorator for Discord commands (LUMEN LAW Article IV).
@@ -59,6 +104,8 @@ def ratelimit(
         per_seconds: Time window in seconds
         command_name: Name of the command (for logging), auto-detected if None
         scope: Rate limit scope - "user" (per-user) or "guild" (per-guild)
+        prefilter: Reject callers still inside a retry-after window returned
+            by Redis without another round trip
 
     Returns:
         Decorator function that enforces rate limiting
@@ -118,7 +165,7 @@ def ratelimit(
                 scope_id = user.id
                 scope_name = f"user:{user.name}"
 
-            key = f"ratelimit:{cmd_name}:{scope}:{scope_id}"
+            key = _ratelimit_key(cmd_name, scope, scope_id)
 
             # Increment metrics
             _ratelimit_metrics["checks"] += 1
@@ -132,50 +179,26 @@ def ratelimit(
                 context_kwargs["guild_id"] = guild.id
             
             async with LogContext(**context_kwargs):
-                try:
-                    # Check current usage
-                    current = await RedisService.get(key)
-                    
-                    if current and int(current) >= uses:
-                        # Rate limit exceeded
-                        ttl = await RedisService.ttl(key)
-                        retry_after = float(ttl) if ttl > 0 else per_seconds
-                        
+                if prefilter:
+                    local_retry_after = _local_retry_after(key)
+                    if local_retry_after > 0:
                         _ratelimit_metrics["blocks"] += 1
-                        
-                        logger.warning(
-                            f"Rate limit exceeded for {cmd_name} "
-                            f"({scope_name}, {int(current)}/{uses} uses, "
-                            f"retry in {retry_after:.0f}s)"
+                        _ratelimit_metrics["prefilter_blocks"] += 1
+                        logger.debug(
+                            f"Rate limit pre-filter blocked {cmd_name} "
+                            f"({scope_name}, retry in {local_retry_after:.0f}s)"
                         )
-
                         raise RateLimitError(
                             command=cmd_name,
-                            retry_after=retry_after
+                            retry_after=local_retry_after
                         )
 
-                    # Increment usage counter
-                    if current:
-                        new_count = await RedisService.incr(key)
-                        logger.debug(
-                            f"Rate limit check passed for {cmd_name} "
-                            f"({scope_name}, {new_count}/{uses} uses)"
-                        )
-                    else:
-                        # First use, set with TTL
-                        await RedisService.set(key, 1, ttl_seconds=per_seconds)
-                        logger.debug(
-                            f"Rate limit initialized for {cmd_name} "
-                            f"({scope_name}, 1/{uses} uses, {per_seconds}s window)"
-                        )
+                try:
+                    # Atomic consume: allowed, remaining and retry-after in one round trip
+                    decision = await RedisService.get_rate_limiter().acquire(
+                        key, rate=uses, period_seconds=per_seconds
+                    )
 
-                    # Execute command
-                    return await func(self, ctx_or_inter, *args, **kwargs)
-                    
-                except RateLimitError:
-                    # Re-raise rate limit errors (don't fall through)
-                    raise
-                    
                 except Exception as e:
                     # Redis failure or other error - graceful degradation
                     _ratelimit_metrics["redis_errors"] += 1
@@ -188,6 +211,31 @@ def ratelimit(
 
                     # Allow command to proceed despite Redis failure
                     return await func(self, ctx_or_inter, *args, **kwargs)
+
+                if not decision.allowed:
+                    retry_after = decision.retry_after or float(per_seconds)
+                    _ratelimit_metrics["blocks"] += 1
+                    if prefilter:
+                        _remember_block(key, retry_after)
+
+                    logger.warning(
+                        f"Rate limit exceeded for {cmd_name} "
+                        f"({scope_name}, {uses} uses per {per_seconds}s, "
+                        f"retry in {retry_after:.0f}s)"
+                    )
+
+                    raise RateLimitError(
+                        command=cmd_name,
+                        retry_after=retry_after
+                    )
+
+                logger.debug(
+                    f"Rate limit check passed for {cmd_name} "
+                    f"({scope_name}, {decision.remaining}/{uses} remaining)"
+                )
+
+                # Execute command
+                return await func(self, ctx_or_inter, *args, **kwargs)
         
         return cast(F, wrapper)
     return decorator
@@ -203,6 +251,7 @@ def get_ratelimit_metrics() -> dict:
         - blocks: Number of commands blocked by rate limit
         - fallbacks: Number of times rate limit fell back due to Redis error
         - redis_errors: Number of Redis errors encountered
+        - prefilter_blocks: Blocks served by the in-process pre-filter
         - block_rate: Percentage of checks that resulted in blocks
         - error_rate: Percentage of checks that encountered errors
     """
@@ -223,6 +272,7 @@ def reset_ratelimit_metrics() -> None:
     _ratelimit_metrics["blocks"] = 0
     _ratelimit_metrics["fallbacks"] = 0
     _ratelimit_metrics["redis_errors"] = 0
+    _ratelimit_metrics["prefilter_blocks"] = 0
 
 
 async def clear_ratelimit(
@@ -247,10 +297,11 @@ async def clear_ratelimit(
         >>> # Admin command to clear user's rate limit
         >>> await clear_ratelimit("fuse", user_id, scope="user")
     """
-    key = f"ratelimit:{command_name}:{scope}:{scope_id}"
+    key = _ratelimit_key(command_name, scope, scope_id)
+    _local_blocks.pop(key, None)
     
     try:
-        result = await RedisService.delete(key)
+        result = await RedisService.get_rate_limiter().reset_bucket(key)
         
         if result:
             logger.info(
@@ -258,7 +309,7 @@ async def clear_ratelimit(
                 f"({scope}:{scope_id})"
             )
 
-        return result > 0
+        return result
         
     except Exception as e:
         logger.error(
@@ -283,8 +334,8 @@ async def get_ratelimit_status(
     
     Returns:
         Dictionary with current status or None if no rate limit active:
-        - current_uses: Current number of uses
-        - time_remaining: Seconds until rate limit resets
+        - current_uses: Uses not yet refilled in the token bucket
+        - time_remaining: Seconds until the bucket is full again
         
     Example:
         >>> status = await get_ratelimit_status("fuse", user_id)
@@ -292,19 +343,21 @@ async def get_ratelimit_status(
         ...     print(f"Used {status['current_uses']} times, "
         ...           f"resets in {status['time_remaining']}s")
     """
-    key = f"ratelimit:{command_name}:{scope}:{scope_id}"
+    key = _ratelimit_key(command_name, scope, scope_id)
     
     try:
-        current = await RedisService.get(key)
+        bucket = await RedisService.get_rate_limiter().peek_bucket(key)
         
-        if not current:
+        if not bucket:
             return None
         
-        ttl = await RedisService.ttl(key)
+        current_uses = int(bucket["max_tokens"] - bucket["tokens"])
+        if current_uses <= 0:
+            return None
         
         return {
-            "current_uses": int(current),
-            "time_remaining": ttl if ttl > 0 else 0
+            "current_uses": current_uses,
+            "time_remaining": int(bucket["seconds_until_full"] + 0.999)
         }
         
     except Exception as e:
@@ -313,9 +366,3 @@ async def get_ratelimit_status(
             f"({scope}:{scope_id}): {e}"
         )
         return None
-
-
-
-
-
-
@@ -253,6 +253,29 @@ def mock_config_manager(mocker):
     return mock_config
 
 
+@pytest.fixture
+def config_factory(mocker):
+    """
+    Factory for ConfigManager mocks that return the caller's default unless
+    the key is overridden.
+
+    Scope: function
+    Uses: Unit tests constructing services/engines with specific config keys
+
+    Example:
+        >>> config = config_factory({"combat.pve.hits_per_attack": 3})
+        >>> config.get("combat.pve.hits_per_attack", default=1)  # 3
+    """
+
+    def _make(overrides=None):
+        values = overrides or {}
+        config = mocker.MagicMock()
+        config.get.side_effect = lambda key, default=None: values.get(key, default)
+        return config
+
+    return _make
+
+
 @pytest.fixture
 def mock_service_container(
     mocker,
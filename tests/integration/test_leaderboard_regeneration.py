@@ -0,0 +1,211 @@
+"""
+Integration Tests for Leaderboard Rank Regeneration (LES 2025)
+===============================================================
+
+Purpose
+-------
+Verify the set-based `UPDATE ... FROM (ROW_NUMBER() OVER ...)` regeneration
+against real PostgreSQL and compare it with the previous ORM loop.
+
+Test Coverage
+-------------
+- Ranks, rank_change and snapshot_version match the ORM loop exactly
+- Other categories are untouched
+- Statement count: one UPDATE for the set-based path vs one per row for
+  the ORM loop, producing identical rows
+
+Testing Strategy
+----------------
+- Integration tests (uses testcontainers for real PostgreSQL)
+- Same seeded dataset regenerated by both implementations
+- Each test gets clean database session (automatic rollback)
+"""
+
+import logging
+import random
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, insert, select
+
+from src.database.models.core.player import PlayerCore
+from src.database.models.progression.leaderboard import LeaderboardSnapshot
+from src.modules.leaderboard.service import LeaderboardSnapshotRepository
+
+
+STATEMENT_COUNT_ROWS = 2_000
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def _repository():
+    return LeaderboardSnapshotRepository(
+        model_class=LeaderboardSnapshot,
+        logger=logging.getLogger(__name__),
+    )
+
+
+async def _seed(session, rows, category="ascension", seed=2025):
+    """Insert players and unranked/ranked snapshot rows with random values."""
+    rng = random.Random(seed)
+    base_id = 100_000_000_000
+
+    await session.execute(
+        insert(PlayerCore),
+        [{"discord_id": base_id + i, "username": f"P{i}"} for i in range(rows)],
+    )
+    await session.execute(
+        insert(LeaderboardSnapshot),
+        [
+            {
+                "player_id": base_id + i,
+                "username": f"P{i}",
+                "category": category,
+                "rank": rng.choice([0, rng.randint(1, rows)]),
+                "rank_change": 0,
+                "value": rng.randint(0, rows // 4),
+                "snapshot_version": 3,
+            }
+            for i in range(rows)
+        ],
+    )
+
+
+async def _orm_loop(session, category):
+    """Previous implementation: load every row and rank in Python."""
+    result = await session.execute(
+        select(LeaderboardSnapshot)
+        .where(LeaderboardSnapshot.category == category)
+        .order_by(LeaderboardSnapshot.value.desc(), LeaderboardSnapshot.id)
+        .with_for_update()
+    )
+    snapshots = result.scalars().all()
+
+    new_version = max((s.snapshot_version for s in snapshots), default=0) + 1
+    for new_rank, snapshot in enumerate(snapshots, start=1):
+        old_rank = snapshot.rank
+        snapshot.rank_change = old_rank - new_rank if old_rank > 0 else 0
+        snapshot.rank = new_rank
+        snapshot.snapshot_version = new_version
+
+    await session.flush()
+    return len(snapshots), new_version
+
+
+@contextmanager
+def _count_updates(session):
+    """Count UPDATE statements sent to the database (executemany counts each row)."""
+    counts = {"updates": 0}
+
+    def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            counts["updates"] += len(parameters) if executemany else 1
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield counts
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+async def _ranking(session, category):
+    result = await session.execute(
+        select(
+            LeaderboardSnapshot.id,
+            LeaderboardSnapshot.rank,
+            LeaderboardSnapshot.rank_change,
+            LeaderboardSnapshot.snapshot_version,
+        )
+        .where(LeaderboardSnapshot.category == category)
+        .order_by(LeaderboardSnapshot.id)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+# ============================================================================
+# CORRECTNESS TESTS
+# ============================================================================
+
+
+@pytest.mark.integration
+@pytest.mark.database
+class TestSetBasedRegeneration:
+    """Set-based regeneration must match the ORM loop exactly."""
+
+    async def test_matches_orm_loop(self, db_session):
+        """Test rank, rank_change and version match the ORM loop."""
+        await _seed(db_session, 500)
+        savepoint = await db_session.begin_nested()
+
+        await _orm_loop(db_session, "ascension")
+        expected = await _ranking(db_session, "ascension")
+        await savepoint.rollback()
+        db_session.expunge_all()
+
+        rows_updated, version = await _repository().regenerate_ranks(
+            db_session, "ascension"
+        )
+
+        assert rows_updated == 500
+        assert version == 4
+        assert await _ranking(db_session, "ascension") == expected
+
+    async def test_other_categories_untouched(self, db_session):
+        """Test only the requested category is re-ranked."""
+        await _seed(db_session, 50)
+        await db_session.execute(
+            insert(LeaderboardSnapshot),
+            [
+                {
+                    "player_id": 100_000_000_000,
+                    "username": "P0",
+                    "category": "wealth",
+                    "rank": 7,
+                    "rank_change": 2,
+                    "value": 10,
+                    "snapshot_version": 9,
+                }
+            ],
+        )
+
+        await _repository().regenerate_ranks(db_session, "ascension")
+
+        wealth = await _ranking(db_session, "wealth")
+        assert [row[1:] for row in wealth] == [(7, 2, 9)]
+
+
+# ============================================================================
+# STATEMENT COUNT
+# ============================================================================
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.slow
+class TestRegenerationStatementCount:
+    """Set-based UPDATE vs ORM loop on the same dataset."""
+
+    async def test_single_update_replaces_per_row_updates(self, db_session):
+        """Test both paths produce the same rows, with one UPDATE instead of N."""
+        await _seed(db_session, STATEMENT_COUNT_ROWS)
+
+        savepoint = await db_session.begin_nested()
+        with _count_updates(db_session) as orm_counts:
+            orm_rows, _ = await _orm_loop(db_session, "ascension")
+        expected = await _ranking(db_session, "ascension")
+        await savepoint.rollback()
+        db_session.expunge_all()
+
+        with _count_updates(db_session) as sql_counts:
+            sql_rows, _ = await _repository().regenerate_ranks(db_session, "ascension")
+
+        assert sql_rows == orm_rows == STATEMENT_COUNT_ROWS
+        assert await _ranking(db_session, "ascension") == expected
+        assert sql_counts["updates"] == 1
+        assert orm_counts["updates"] == STATEMENT_COUNT_ROWS
@@ -0,0 +1,111 @@
+"""
+Unit Tests for LatencyHistogram (LES 2025)
+===========================================
+
+Purpose
+-------
+Verify the streaming log-bucketed histogram against exact sorted-sample
+percentiles and check merge / copy semantics.
+
+Test Coverage
+-------------
+- Percentiles within the documented relative error of exact values
+- Exact min / max / count / mean
+- Merging two histograms equals recording every sample into one
+- Copies are independent of the source
+- Empty histograms report zeros
+
+Testing Strategy
+----------------
+- Unit tests (fast, no I/O)
+- Seeded log-normal latency samples for reproducibility
+"""
+
+import random
+
+import pytest
+
+from src.core.histogram import SUB_BUCKETS, LatencyHistogram
+
+
+RELATIVE_ERROR = 2 / SUB_BUCKETS
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def _samples(count=20_000, seed=2025):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(1.0, 1.2) for _ in range(count)]
+
+
+def _exact(sorted_samples, percent):
+    rank = max(1, -(-len(sorted_samples) * percent // 100))
+    return sorted_samples[int(rank) - 1]
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Streaming histogram accuracy and semantics."""
+
+    def test_percentiles_within_relative_error(self):
+        """Test p50/p95/p99/p99.9 against exact sorted-sample values."""
+        samples = _samples()
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        ordered = sorted(samples)
+        for percent in (50, 95, 99, 99.9):
+            exact = _exact(ordered, percent)
+            estimate = histogram.quantile(percent)
+            assert abs(estimate - exact) <= exact * RELATIVE_ERROR + 0.001
+
+    def test_exact_aggregates(self):
+        """Test count, min, max and mean are exact."""
+        samples = _samples(1_000)
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        assert histogram.count == len(samples)
+        assert histogram.min_ms == min(samples)
+        assert histogram.max_ms == max(samples)
+        assert histogram.mean_ms == pytest.approx(sum(samples) / len(samples))
+
+    def test_merge_matches_single_histogram(self):
+        """Test merged halves equal one histogram over all samples."""
+        samples = _samples(5_000)
+        whole, left, right = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for index, sample in enumerate(samples):
+            whole.record(sample)
+            (left if index % 2 else right).record(sample)
+
+        merged = LatencyHistogram.merged([left, right])
+
+        assert merged.summary() == whole.summary()
+
+    def test_copy_is_independent(self):
+        """Test recording into the source does not affect a copy."""
+        histogram = LatencyHistogram()
+        histogram.record(5.0)
+        snapshot = histogram.copy()
+        histogram.record(500.0)
+
+        assert snapshot.count == 1
+        assert snapshot.max_ms == 5.0
+
+    def test_empty_summary_is_zero(self):
+        """Test an empty histogram reports zeros."""
+        summary = LatencyHistogram().summary()
+
+        assert summary["count"] == 0
+        assert summary["p99_ms"] == 0.0
+        assert summary["min_ms"] == 0.0
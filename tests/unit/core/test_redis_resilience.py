@@ -0,0 +1,209 @@
+"""
+Unit Tests for RedisResilience Fast Path (LES 2025)
+====================================================
+
+Purpose
+-------
+Verify the lock-free CLOSED-state fast path keeps circuit breaker semantics
+intact.
+
+Test Coverage
+-------------
+- CLOSED successes do not touch the lock
+- Failures still open the circuit at the threshold
+- OPEN rejects, HALF_OPEN recovers to CLOSED
+- Outcome counters exposed in get_status()
+- Sustained CLOSED traffic: one client call per execute(), zero lock
+  acquisitions; only the non-CLOSED path takes the lock
+
+Testing Strategy
+----------------
+- Unit tests (fast, no Redis)
+- ConfigManager mock from the shared `config_factory` fixture
+- Fake async client counting its calls
+- Lock stand-ins that fail or count on acquisition (no wall-clock timing)
+"""
+
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.core.redis.resilience import (
+    CircuitBreakerOpenError,
+    CircuitState,
+    RedisResilience,
+)
+
+
+SUSTAINED_CALLS = 5_000
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def _resilience(config_factory, **overrides):
+    return RedisResilience(config_factory({
+        "core.redis.resilience.retry.max_attempts": 1,
+        **overrides,
+    }))
+
+
+class _FakeClient:
+    """Async client standing in for redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        return key
+
+
+class _FailingLock:
+    """Lock that fails the test if the fast path acquires it."""
+
+    async def __aenter__(self):
+        raise AssertionError("lock acquired on CLOSED fast path")
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _CountingLock:
+    """asyncio.Lock wrapper counting acquisitions."""
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self.acquisitions = 0
+
+    async def __aenter__(self):
+        self.acquisitions += 1
+        await self._lock.acquire()
+
+    async def __aexit__(self, *exc):
+        self._lock.release()
+        return False
+
+
+async def _fail():
+    raise RedisConnectionError("down")
+
+
+# ============================================================================
+# CIRCUIT BREAKER SEMANTICS
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestClosedFastPath:
+    """CLOSED-state calls bypass the lock but keep breaker semantics."""
+
+    async def test_closed_success_is_lock_free(self, config_factory):
+        """Test successful CLOSED calls never acquire the lock."""
+        resilience = _resilience(config_factory)
+        resilience._lock = _FailingLock()
+        client = _FakeClient()
+
+        for _ in range(10):
+            assert await resilience.execute(lambda: client.get("k"), "GET:k") == "k"
+
+        status = resilience.get_status()
+        assert status["total_successes"] == 10
+        assert status["circuit_state"] == "CLOSED"
+
+    async def test_failures_open_circuit_at_threshold(self, config_factory):
+        """Test the failure threshold still opens the circuit."""
+        resilience = _resilience(
+            config_factory, **{"core.redis.resilience.circuit.failure_threshold": 3}
+        )
+
+        for _ in range(3):
+            with pytest.raises(RedisConnectionError):
+                await resilience.execute(_fail, "GET:k")
+
+        assert resilience.state is CircuitState.OPEN
+        with pytest.raises(CircuitBreakerOpenError):
+            await resilience.execute(lambda: _FakeClient().get("k"), "GET:k")
+
+        status = resilience.get_status()
+        assert status["total_failures"] == 3
+        assert status["total_rejections"] == 1
+
+    async def test_success_resets_consecutive_failures(self, config_factory):
+        """Test a fast-path success resets the consecutive failure count."""
+        resilience = _resilience(
+            config_factory, **{"core.redis.resilience.circuit.failure_threshold": 2}
+        )
+        client = _FakeClient()
+
+        with pytest.raises(RedisConnectionError):
+            await resilience.execute(_fail, "GET:k")
+        await resilience.execute(lambda: client.get("k"), "GET:k")
+        with pytest.raises(RedisConnectionError):
+            await resilience.execute(_fail, "GET:k")
+
+        assert resilience.state is CircuitState.CLOSED
+
+    async def test_half_open_recovers_to_closed(self, config_factory):
+        """Test HALF_OPEN successes close the circuit via the locked path."""
+        resilience = _resilience(config_factory, **{
+            "core.redis.resilience.circuit.timeout_seconds": 0,
+            "core.redis.resilience.circuit.success_threshold": 2,
+        })
+        client = _FakeClient()
+        await resilience.force_open()
+
+        await resilience.execute(lambda: client.get("k"), "GET:k")
+        assert resilience.state is CircuitState.HALF_OPEN
+
+        await resilience.execute(lambda: client.get("k"), "GET:k")
+        assert resilience.state is CircuitState.CLOSED
+
+
+# ============================================================================
+# SUSTAINED TRAFFIC
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestSustainedClosedTraffic:
+    """Lock usage and call counts under sustained CLOSED-state traffic."""
+
+    async def test_sustained_closed_calls_never_lock(self, config_factory):
+        """Test every CLOSED call reaches the client once and never locks."""
+        resilience = _resilience(config_factory)
+        resilience._lock = _FailingLock()
+        client = _FakeClient()
+
+        for _ in range(SUSTAINED_CALLS):
+            await resilience.execute(lambda: client.get("k"), "GET:k")
+
+        assert client.calls == SUSTAINED_CALLS
+        status = resilience.get_status()
+        assert status["total_successes"] == SUSTAINED_CALLS
+        assert status["circuit_state"] == "CLOSED"
+
+    async def test_only_non_closed_calls_take_the_lock(self, config_factory):
+        """Test the lock is acquired in HALF_OPEN but not once CLOSED again."""
+        resilience = _resilience(config_factory, **{
+            "core.redis.resilience.circuit.timeout_seconds": 0,
+            "core.redis.resilience.circuit.success_threshold": 1,
+        })
+        client = _FakeClient()
+        await resilience.force_open()
+        lock = _CountingLock()
+        resilience._lock = lock
+
+        await resilience.execute(lambda: client.get("k"), "GET:k")
+        assert resilience.state is CircuitState.CLOSED
+        recovery_acquisitions = lock.acquisitions
+        assert recovery_acquisitions > 0
+
+        for _ in range(SUSTAINED_CALLS):
+            await resilience.execute(lambda: client.get("k"), "GET:k")
+
+        assert lock.acquisitions == recovery_acquisitions
+        assert client.calls == SUSTAINED_CALLS + 1
@@ -0,0 +1,176 @@
+"""
+Unit Tests for UnitOfWork (LES 2025)
+====================================
+
+Purpose
+-------
+Verify the per-command identity map and its ContextVar binding.
+
+Test Coverage
+-------------
+- Binding and unbinding around a command (sync and async)
+- Cached rows, known-missing rows, and misses
+- Clearing on commit and closing on exit
+- Nested units restore the outer unit
+- Tasks spawned inside a command share its unit until it closes
+- load_player_row prefetches the aggregate once per commit
+
+Testing Strategy
+----------------
+- Unit tests (fast, no I/O)
+- DatabaseService.get_session stubbed with a counting fake session
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.core.database.service import DatabaseService
+from src.core.database.unit_of_work import (
+    UnitOfWork,
+    current_unit_of_work,
+    load_player_row,
+)
+from src.database.models.core.player.player_progression import PlayerProgression
+from src.database.models.core.player.player_stats import PlayerStats
+
+
+PLAYER_ID = 123456789
+
+
+class _Row:
+    pass
+
+
+async def _current():
+    return current_unit_of_work()
+
+
+async def _current_later():
+    await asyncio.sleep(0)
+    return current_unit_of_work()
+
+
+# ============================================================================
+# BINDING
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestBinding:
+    """The unit of work is bound to the command's context only."""
+
+    def test_no_unit_of_work_by_default(self):
+        """Test nothing is bound outside a command."""
+        assert current_unit_of_work() is None
+
+    def test_bound_inside_context_and_closed_after(self):
+        """Test the unit is bound inside its block and closed on exit."""
+        with UnitOfWork() as uow:
+            assert current_unit_of_work() is uow
+        assert current_unit_of_work() is None
+        assert not uow.is_open
+
+    def test_nested_unit_restores_outer(self):
+        """Test leaving a nested unit rebinds the outer one."""
+        with UnitOfWork() as outer:
+            with UnitOfWork() as inner:
+                assert current_unit_of_work() is inner
+            assert current_unit_of_work() is outer
+
+    async def test_spawned_task_shares_unit_until_closed(self):
+        """Test spawned tasks see the unit only while the command is open."""
+        async with UnitOfWork() as uow:
+            assert await asyncio.create_task(_current()) is uow
+            late = asyncio.get_running_loop().create_task(_current_later())
+
+        # A task that outlives the command sees no unit of work
+        assert await late is None
+
+
+# ============================================================================
+# IDENTITY MAP
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestIdentityMap:
+    """Cached rows, known-missing rows and commit clears."""
+
+    def test_lookup_miss_hit_and_known_missing(self):
+        """Test lookups distinguish misses, rows and known-missing rows."""
+        uow = UnitOfWork()
+        row = _Row()
+
+        assert uow.lookup(_Row, 1) == (False, None)
+
+        uow.put(_Row, 1, row)
+        uow.put(_Row, 2, None)
+
+        assert uow.lookup(_Row, 1) == (True, row)
+        assert uow.lookup(_Row, 2) == (True, None)
+        assert uow.contains(_Row, 2)
+        assert (uow.hits, uow.misses) == (2, 1)
+
+    def test_clear_drops_rows_and_counts_commits(self):
+        """Test clear() empties the map and counts only non-empty clears."""
+        uow = UnitOfWork()
+        uow.put(_Row, 1, _Row())
+
+        uow.clear()
+        uow.clear()  # nothing cached: not counted
+
+        assert len(uow) == 0
+        assert uow.clears == 1
+        assert uow.lookup(_Row, 1) == (False, None)
+
+
+# ============================================================================
+# READ-THROUGH LOADING
+# ============================================================================
+
+
+@pytest.fixture
+def aggregate_rows():
+    """Core, progression, stats and currencies rows of the fake query."""
+    return (_Row(), _Row(), _Row(), _Row())
+
+
+@pytest.fixture
+def get_session(mocker, aggregate_rows):
+    """Stub DatabaseService.get_session; call_count is the query count."""
+    result = mocker.MagicMock()
+    result.one_or_none.return_value = aggregate_rows
+    session = mocker.MagicMock()
+    session.execute = mocker.AsyncMock(return_value=result)
+
+    @asynccontextmanager
+    async def _session(**kwargs):
+        yield session
+
+    return mocker.patch.object(DatabaseService, "get_session", side_effect=_session)
+
+
+@pytest.mark.unit
+class TestLoadPlayerRow:
+    """load_player_row reads through the unit of work."""
+
+    async def test_miss_prefetches_aggregate_once_until_commit(
+        self, get_session, aggregate_rows
+    ):
+        """Test one aggregate query serves every component until a commit."""
+        _, progression, stats, _ = aggregate_rows
+
+        async with UnitOfWork() as uow:
+            assert await load_player_row(PlayerStats, PLAYER_ID) is stats
+            assert await load_player_row(PlayerProgression, PLAYER_ID) is progression
+            assert get_session.call_count == 1
+            assert uow.prefetches == 1
+
+            # What DatabaseService.get_transaction() does on commit
+            uow.clear()
+
+            assert await load_player_row(PlayerStats, PLAYER_ID) is stats
+            assert get_session.call_count == 2
+            assert uow.prefetches == 2
@@ -0,0 +1,109 @@
+"""
+Unit Tests for AuditConsumer spill handling (LES 2025)
+======================================================
+
+Purpose
+-------
+Verify the flusher never seals the active spill segment while the spill
+writer is still appending to it.
+
+Test Coverage
+-------------
+- A flush racing an in-flight spill append waits for the append, then
+  persists each row exactly once and deletes the sealed segment
+
+Testing Strategy
+----------------
+- Unit tests (spill segments in tmp_path, no database)
+- The spill append is held open in its worker thread by a threading.Event
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.modules.audit.consumer import AuditConsumer
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def _row(n):
+    return {"n": n, "operation_type": "test"}
+
+
+@pytest.fixture
+def persisted():
+    return []
+
+
+@pytest.fixture
+def consumer(mocker, config_factory, tmp_path, persisted):
+    async def create_batch(rows):
+        persisted.extend(row["n"] for row in rows)
+        return len(rows)
+
+    repo = mocker.MagicMock()
+    repo.create_batch = mocker.AsyncMock(side_effect=create_batch)
+    config = config_factory({
+        "audit.consumer.spill_dir": str(tmp_path),
+        "audit.consumer.flush_interval_seconds": 1000,
+    })
+
+    consumer = AuditConsumer(mocker.MagicMock(), repo, config)
+    consumer._spill.open()
+    return consumer
+
+
+# ============================================================================
+# SPILL / FLUSH RACE
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestSpillSealRace:
+    """Sealing waits for spill appends already handed to a worker thread."""
+
+    async def test_flush_waits_for_in_flight_append(self, consumer, persisted, tmp_path):
+        """Test a flush during an in-flight append seals only after it lands."""
+        spill = consumer._spill
+        entered, release = threading.Event(), threading.Event()
+        append_done = []
+        sealed_after_append = []
+
+        real_append, real_seal = spill.append, spill.seal
+
+        def slow_append(rows):
+            entered.set()
+            release.wait(timeout=5)
+            real_append(rows)
+            append_done.append(True)
+
+        def recording_seal():
+            sealed_after_append.append(bool(append_done))
+            return real_seal()
+
+        spill.append = slow_append
+        spill.seal = recording_seal
+
+        consumer._enqueue(_row(1))
+        # Spill writer takes the queue and blocks inside its append
+        writer = asyncio.create_task(consumer._drain_spill())
+        await asyncio.to_thread(entered.wait, 5)
+        assert consumer._spill_queue == []
+
+        flusher = asyncio.create_task(consumer._flush_buffer())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert sealed_after_append == []
+
+        release.set()
+        await asyncio.gather(writer, flusher)
+
+        assert sealed_after_append == [True]
+        assert persisted == [1]
+        assert not consumer._pending_segments
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,274 @@
+"""
+Unit Tests for Closed-Form Combat Resolution (LES 2025)
+========================================================
+
+Purpose
+-------
+Differential tests proving resolve mode matches the iterative engines
+exactly (outcome, final HP, turn count) for AggregateEngine and
+ElementalTeamEngine.
+
+Test Coverage
+-------------
+- resolve_fixed_exchange vs a brute-force turn loop
+- AggregateEngine.simulate_full_combat(resolve=True) vs iterative
+- ElementalTeamEngine.simulate_full_combat(resolve=True) vs iterative
+- Stat snapshot captured once per encounter (no per-turn queries)
+
+Testing Strategy
+----------------
+- Unit tests (fast, no database)
+- Mocked power/leader services
+- Seeded random scenarios for reproducibility
+"""
+
+import random
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.modules.combat.aggregate_engine import AggregateEngine
+from src.modules.combat.elemental_engine import ElementalTeamEngine
+from src.modules.combat.shared.encounter import (
+    CombatOutcome,
+    Encounter,
+    EncounterType,
+    EnemyStats,
+    MaidenStats,
+)
+from src.modules.combat.shared.hp_scaling import HPScalingCalculator
+from src.modules.combat.shared.resolver import resolve_fixed_exchange
+from src.modules.maiden.leader_skill_service import LeaderModifiers
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def _leader(atk_mult=1.0, def_mult=1.0):
+    leader = MagicMock()
+    leader.get_leader_modifiers = AsyncMock(
+        return_value=LeaderModifiers(atk_multiplier=atk_mult, def_multiplier=def_mult)
+    )
+    return leader
+
+
+def _power(total_atk, total_def):
+    power = MagicMock()
+    power.get_player_total_power = AsyncMock(
+        return_value=(total_atk, total_def, total_atk + total_def)
+    )
+    return power
+
+
+def _aggregate_engine(config_factory, total_atk, total_def, hits=1):
+    config = config_factory({"combat.pve.hits_per_attack": hits})
+    power = _power(total_atk, total_def)
+    leader = _leader(1.1, 1.05)
+    engine = AggregateEngine(
+        config_manager=config,
+        power_service=power,
+        leader_service=leader,
+        element_resolver=MagicMock(),
+        combat_formulas=MagicMock(),
+        hp_scaling=HPScalingCalculator(config),
+    )
+    return engine, power, leader
+
+
+def _elemental_engine(config_factory):
+    config = config_factory()
+    return ElementalTeamEngine(
+        config_manager=config,
+        power_service=MagicMock(),
+        leader_service=_leader(1.2, 1.1),
+        element_resolver=MagicMock(),
+        combat_formulas=MagicMock(),
+        hp_scaling=HPScalingCalculator(config),
+        player_progression_service=MagicMock(),
+    )
+
+
+def _encounter(player_hp, enemy, team=()):
+    return Encounter(
+        encounter_id=uuid4(),
+        type=EncounterType.PVE,
+        player_id=123456789,
+        turn=0,
+        player_hp=player_hp,
+        player_max_hp=player_hp,
+        enemy_hp=enemy.max_hp,
+        enemy_max_hp=enemy.max_hp,
+        player_team=list(team),
+        enemy_team=[enemy],
+    )
+
+
+def _brute_force(player_hp, enemy_hp, p_dmg, e_dmg, max_turns, retaliation, count_victory):
+    turn = 0
+    while player_hp > 0 and enemy_hp > 0 and turn < max_turns:
+        enemy_hp = max(enemy_hp - p_dmg, 0)
+        if enemy_hp <= 0:
+            if count_victory:
+                turn += 1
+            break
+        if retaliation:
+            player_hp = max(player_hp - e_dmg, 0)
+        turn += 1
+    return player_hp, enemy_hp, turn
+
+
+# ============================================================================
+# RESOLVER TESTS
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestResolveFixedExchange:
+    """Differential tests for the pure closed-form resolver."""
+
+    def test_matches_brute_force(self):
+        """Test closed form matches a turn loop across random scenarios."""
+        rng = random.Random(2025)
+
+        for _ in range(2000):
+            player_hp = rng.randint(1, 5000)
+            enemy_hp = rng.randint(1, 50000)
+            p_dmg = rng.randint(1, 3000)
+            e_dmg = rng.randint(0, 500)
+            max_turns = rng.randint(0, 200)
+            retaliation = rng.random() < 0.8
+            count_victory = rng.random() < 0.5
+
+            result = resolve_fixed_exchange(
+                player_hp, enemy_hp, p_dmg, e_dmg, 0, max_turns,
+                retaliation=retaliation, count_victory_turn=count_victory,
+            )
+
+            assert (result.player_hp, result.enemy_hp, result.final_turn) == _brute_force(
+                player_hp, enemy_hp, p_dmg, e_dmg, max_turns, retaliation, count_victory
+            )
+
+    def test_player_wins_tie(self):
+        """Test player striking first wins when both would die the same turn."""
+        result = resolve_fixed_exchange(100, 100, 50, 50, 0, 100)
+
+        assert result.outcome == CombatOutcome.VICTORY
+        assert result.player_hp == 50
+        assert result.final_turn == 2
+
+
+# ============================================================================
+# ENGINE DIFFERENTIAL TESTS
+# ============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestEngineResolveMode:
+    """Resolve mode must match iterative simulation exactly."""
+
+    @pytest.mark.parametrize("seed", range(25))
+    async def test_aggregate_resolve_matches_iterative(self, seed, config_factory):
+        """Test AggregateEngine resolve vs iterative simulation."""
+        rng = random.Random(seed)
+        engine, _, _ = _aggregate_engine(
+            config_factory,
+            rng.randint(100, 20000), rng.randint(100, 20000), hits=rng.randint(1, 3)
+        )
+        boss = EnemyStats(
+            enemy_id="boss",
+            name="Boss",
+            element="neutral",
+            attack=rng.randint(100, 200000),
+            defense=rng.randint(0, 20000),
+            max_hp=rng.randint(1000, 5_000_000),
+        )
+        player_hp = rng.randint(100, 3000)
+        retaliation = seed % 4 != 0
+
+        iterative = await engine.build_encounter(123456789, boss, retaliation)
+        iterative.player_hp = iterative.player_max_hp = player_hp
+        resolved = _encounter(player_hp, boss)
+        resolved.stat_snapshot = iterative.stat_snapshot
+
+        iterative = await engine.simulate_full_combat(iterative, retaliation, max_turns=1000)
+        resolved = await engine.simulate_full_combat(
+            resolved, retaliation, max_turns=1000, resolve=True
+        )
+
+        assert resolved.outcome == iterative.outcome
+        assert resolved.player_hp == iterative.player_hp
+        assert resolved.enemy_hp == iterative.enemy_hp
+        assert resolved.turn == iterative.turn
+        if iterative.is_over:
+            assert iterative.log[-1].event_type == resolved.log[-1].event_type
+
+    @pytest.mark.parametrize("seed", range(25))
+    async def test_elemental_resolve_matches_iterative(self, seed, config_factory):
+        """Test ElementalTeamEngine resolve vs iterative simulation."""
+        rng = random.Random(seed)
+        engine = _elemental_engine(config_factory)
+        team = [
+            MaidenStats(
+                maiden_id=i,
+                maiden_base_id=i,
+                element=element,
+                attack=rng.randint(50, 5000),
+                defense=rng.randint(50, 5000),
+                power=0,
+                tier=1,
+                quantity=1,
+            )
+            for i, element in enumerate(["infernal", "umbral", "earth"])
+        ]
+        monster = EnemyStats(
+            enemy_id="floor",
+            name="Guardian",
+            element="neutral",
+            attack=rng.randint(100, 500000),
+            defense=rng.randint(0, 10000),
+            max_hp=rng.randint(1000, 500000),
+        )
+        player_hp = rng.randint(100, 3000)
+
+        iterative = _encounter(player_hp, monster, team)
+        resolved = _encounter(player_hp, monster, team)
+
+        iterative = await engine.simulate_full_combat(iterative)
+        resolved = await engine.simulate_full_combat(resolved, resolve=True)
+
+        assert resolved.outcome == iterative.outcome
+        assert resolved.player_hp == iterative.player_hp
+        assert resolved.enemy_hp == iterative.enemy_hp
+        assert resolved.turn == iterative.turn
+
+    async def test_aggregate_turns_do_not_query_power(self, config_factory):
+        """Test stats are captured once in build_encounter, not per turn."""
+        engine, power, leader = _aggregate_engine(config_factory, 500, 500)
+        boss = EnemyStats(
+            enemy_id="boss", name="Boss", element="neutral",
+            attack=100, defense=100, max_hp=1_000_000,
+        )
+
+        encounter = await engine.build_encounter(123456789, boss)
+        encounter = await engine.simulate_full_combat(encounter, max_turns=50)
+
+        assert encounter.turn == 50
+        assert power.get_player_total_power.await_count == 1
+        assert leader.get_leader_modifiers.await_count == 1
+
+    async def test_resolve_writes_compact_log(self, config_factory):
+        """Test resolve mode writes a summary entry instead of one per turn."""
+        engine, _, _ = _aggregate_engine(config_factory, 1000, 1000)
+        boss = EnemyStats(
+            enemy_id="boss", name="Boss", element="neutral",
+            attack=100, defense=100, max_hp=1_000_000,
+        )
+
+        encounter = await engine.build_encounter(123456789, boss)
+        encounter = await engine.simulate_full_combat(encounter, resolve=True)
+
+        assert [entry.event_type for entry in encounter.log] == ["combat_summary", "victory"]
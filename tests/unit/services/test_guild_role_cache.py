@@ -0,0 +1,141 @@
+"""
+Unit Tests for GuildRoleCache (LES 2025)
+========================================
+
+Purpose
+-------
+Verify role cache fills are fenced by the per-guild epoch, so a stale
+database read can never re-cache a role after an invalidation in any
+process.
+
+Test Coverage
+-------------
+- Fill then hit from Redis in another process
+- Stale fill landing after a cross-process invalidation is rejected
+- Entries written under an older epoch are misses
+- Per-member keys carry their own TTL
+
+Testing Strategy
+----------------
+- Unit tests (fast, no Redis)
+- In-memory RedisService stand-in emulating the fill script
+- Two cache instances sharing it stand in for two processes
+"""
+
+import pytest
+
+from src.modules.guild import role_cache as role_cache_module
+from src.modules.guild.role_cache import GuildRoleCache
+
+
+GUILD_ID = 7
+PLAYER_ID = 42
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+class _FakeRegistry:
+    def register(self, name, source):
+        return None
+
+
+class _FakeRedis:
+    """Shared in-memory stand-in for RedisService."""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def get_script_registry(self):
+        return _FakeRegistry()
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def incr(self, key, amount=1):
+        self.values[key] = str(int(self.values.get(key, "0")) + amount)
+        return int(self.values[key])
+
+    async def delete(self, key):
+        return int(self.values.pop(key, None) is not None)
+
+    async def run_script(self, name, keys, args):
+        # Mirrors GuildRoleCache._LUA_FILL
+        epoch_key, member_key = keys
+        expected_epoch, role, ttl = args
+        epoch = self.values.get(epoch_key) or "0"
+        if epoch != expected_epoch:
+            return 0
+        self.values[member_key] = f"{epoch}:{role}"
+        self.ttls[member_key] = ttl
+        return 1
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(role_cache_module, "RedisService", redis)
+    return redis
+
+
+# ============================================================================
+# EPOCH FENCING
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestEpochFencing:
+    """Fills and reads are fenced by the per-guild epoch."""
+
+    async def test_fill_is_shared_across_processes(self, fake_redis):
+        """Test a fill in one process is a Redis hit in another."""
+        first, second = GuildRoleCache(), GuildRoleCache()
+
+        token = await first.fill_token(GUILD_ID)
+        await first.put(GUILD_ID, PLAYER_ID, "officer", token)
+
+        assert await second.get(GUILD_ID, PLAYER_ID) == "officer"
+        assert second.get_stats()["redis_hits"] == 1
+
+    async def test_stale_fill_after_invalidation_is_rejected(self, fake_redis):
+        """Test a slow read landing after another process demotes the member."""
+        reader, demoter = GuildRoleCache(), GuildRoleCache()
+
+        # reader takes its token and reads "officer" from the database...
+        token = await reader.fill_token(GUILD_ID)
+        # ...meanwhile another process demotes the member
+        await demoter.invalidate(GUILD_ID, PLAYER_ID)
+        # ...then the stale fill lands
+        await reader.put(GUILD_ID, PLAYER_ID, "officer", token)
+
+        assert await reader.get(GUILD_ID, PLAYER_ID) is None
+        assert await demoter.get(GUILD_ID, PLAYER_ID) is None
+        assert fake_redis.values.get(demoter.member_key(GUILD_ID, PLAYER_ID)) is None
+        assert reader.get_stats()["stale_fills_rejected"] == 1
+
+    async def test_entries_from_older_epoch_are_misses(self, fake_redis):
+        """Test a guild invalidation retires entries already in Redis."""
+        filler, other = GuildRoleCache(), GuildRoleCache()
+        await filler.put(GUILD_ID, PLAYER_ID, "leader", await filler.fill_token(GUILD_ID))
+
+        await filler.invalidate_guild(GUILD_ID)
+
+        assert await other.get(GUILD_ID, PLAYER_ID) is None
+
+    async def test_member_keys_have_their_own_ttl(self, fake_redis):
+        """Test each fill sets the TTL of its own member key only."""
+        cache = GuildRoleCache(redis_ttl_seconds=120)
+
+        await cache.put(GUILD_ID, 1, "member", await cache.fill_token(GUILD_ID))
+        await cache.put(GUILD_ID, 2, "member", await cache.fill_token(GUILD_ID))
+
+        assert fake_redis.ttls == {
+            cache.member_key(GUILD_ID, 1): 120,
+            cache.member_key(GUILD_ID, 2): 120,
+        }
@@ -0,0 +1,135 @@
+"""
+Unit Tests for WriteBehindFlusher (LES 2025)
+============================================
+
+Purpose
+-------
+Verify buffered writes survive a shutdown that lands while a flush is
+running.
+
+Test Coverage
+-------------
+- stop() lets an in-flight flush finish instead of cancelling it
+- Entries that fail to flush are retried by the final flush
+- A cancelled accumulator flush restores its batch
+
+Testing Strategy
+----------------
+- Unit tests (fast, no I/O)
+- Flush callbacks gated by asyncio events to hold a flush open
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from src.modules.daily.progress_accumulator import QuestProgressAccumulator
+from src.modules.shared.write_behind import WriteBehindFlusher
+
+
+QUEST_DAY = date(2025, 1, 1)
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+class _Buffer:
+    """List-backed buffer whose flush waits on a gate."""
+
+    def __init__(self):
+        self.pending = []
+        self.written = []
+        self.started = asyncio.Event()
+        self.gate = asyncio.Event()
+        self.failures_left = 0
+
+    async def flush(self):
+        batch, self.pending = self.pending, []
+        self.started.set()
+        try:
+            await self.gate.wait()
+            if self.failures_left:
+                self.failures_left -= 1
+                raise RuntimeError("database unavailable")
+        except BaseException:
+            self.pending = batch + self.pending
+            raise
+        self.written.extend(batch)
+
+
+def _flusher(buffer):
+    return WriteBehindFlusher(
+        buffer.flush, lambda: len(buffer.pending), 0.1, name="test rows"
+    )
+
+
+# ============================================================================
+# SHUTDOWN
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestShutdownDuringFlush:
+    """stop() never drops a batch that is being written."""
+
+    async def test_stop_waits_for_in_flight_flush(self):
+        """Test stop() lets the running flush finish rather than cancelling it."""
+        buffer = _Buffer()
+        flusher = _flusher(buffer)
+        buffer.pending.append("row")
+        flusher.start()
+        await buffer.started.wait()
+
+        stopping = asyncio.create_task(flusher.stop())
+        await asyncio.sleep(0)
+        buffer.gate.set()
+        await stopping
+
+        assert buffer.written == ["row"]
+        assert not flusher.is_running
+
+    async def test_failed_flush_is_retried_on_stop(self):
+        """Test rows from a failed in-flight flush are written by the final flush."""
+        buffer = _Buffer()
+        buffer.failures_left = 1
+        flusher = _flusher(buffer)
+        buffer.pending.append("row")
+        flusher.start()
+        await buffer.started.wait()
+
+        stopping = asyncio.create_task(flusher.stop())
+        await asyncio.sleep(0)
+        buffer.gate.set()
+        await stopping
+
+        assert buffer.written == ["row"]
+        assert buffer.pending == []
+
+    async def test_cancelled_accumulator_flush_restores_batch(self):
+        """Test a cancelled quest progress flush keeps its increments pending."""
+        gate = asyncio.Event()
+        written = []
+
+        async def flush_callback(batch):
+            await gate.wait()
+            written.extend(batch)
+
+        accumulator = QuestProgressAccumulator(flush_callback, flush_interval_seconds=60)
+        state = accumulator.put_state(1, QUEST_DAY, {}, {})
+        accumulator.add(state, "daily_combat", 3, context="/fight")
+
+        flushing = asyncio.create_task(accumulator.flush())
+        await asyncio.sleep(0)
+        flushing.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flushing
+
+        assert accumulator.pending_for(1, QUEST_DAY) == {"daily_combat": 3}
+
+        gate.set()
+        await accumulator.stop()
+
+        assert written == [(1, QUEST_DAY, {"daily_combat": 3}, {"daily_combat": "/fight"})]